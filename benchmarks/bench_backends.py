@@ -0,0 +1,123 @@
+"""
+Backend loading benchmark.
+
+Builds synthetic repositories of different shapes and measures how long loading all commits and references takes through each backend.
+Shapes are a long linear history, many short branches, many tags, and a history with large commit messages.
+
+With --jobs, the pygit2 backend is also measured decoding commits in that many processes.
+
+Run with: python benchmarks/bench_backends.py [--commits N] [--refs R] [--runs K] [--jobs J]
+"""
+
+import argparse
+import subprocess
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pygit2
+
+from gittergraph.access import BACKENDS, GitRepository
+from gittergraph.core.graph_data import GitGraphData
+
+SIGNATURE_TIME: int = 1_700_000_000
+
+
+def make_repo(
+    path: Path, commits: int, branches: int, tags: int, message_lines: int
+) -> None:
+    """
+    Create a synthetic repository.
+
+    Commits form a linear main line, with a one-commit branch off every branch point and a tag on every tag point. Objects are packed like in a cloned repository.
+    """
+    repo: pygit2.Repository = pygit2.init_repository(str(path))
+    tree: pygit2.Oid = repo.TreeBuilder().write()
+    body: str = "Detailed description of the change.\n" * message_lines
+    branch_every: int = max(1, commits // max(1, branches))
+    tag_every: int = max(1, commits // max(1, tags))
+
+    parent: list[pygit2.Oid] = []
+    for i in range(commits):
+        signature: pygit2.Signature = pygit2.Signature(
+            f"Author {i % 50}", f"author{i % 50}@example.com", SIGNATURE_TIME + i * 60
+        )
+        commit_id: pygit2.Oid = repo.create_commit(
+            None, signature, signature, f"Commit {i}\n\n{body}", tree, parent
+        )
+        parent = [commit_id]
+        if branches and i % branch_every == 0:
+            side_id: pygit2.Oid = repo.create_commit(
+                None, signature, signature, f"Side {i}", tree, [commit_id]
+            )
+            repo.references.create(f"refs/heads/side-{i}", side_id)
+        if tags and i % tag_every == 0:
+            repo.references.create(f"refs/tags/v{i}", commit_id)
+
+    repo.references.create("refs/heads/main", parent[0])
+    repo.set_head("refs/heads/main")
+    subprocess.run(
+        ["git", "-C", str(path), "gc", "--quiet", "--aggressive"],
+        check=True,
+    )
+
+
+def time_load(path: Path, backend: str, runs: int, jobs: int = 1) -> float:
+    """
+    Load all commits and references through a backend.
+
+    Returns the best elapsed time in seconds out of runs loads, each with a fresh repository.
+    """
+    times: list[float] = []
+    for _ in range(runs):
+        start: float = time.perf_counter()
+        GitGraphData.load_from(GitRepository(path, backend=backend, jobs=jobs))
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    """
+    Run the benchmark and print load times per shape and backend.
+
+    The fastest backend of each shape is marked.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--commits", type=int, default=20_000)
+    parser.add_argument("--refs", type=int, default=2_000)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--jobs", type=int, default=1)
+    args = parser.parse_args()
+
+    variants: dict[str, tuple[str, int]] = {name: (name, 1) for name in BACKENDS}
+    if args.jobs > 1:
+        variants[f"pygit2 -j{args.jobs}"] = ("pygit2", args.jobs)
+
+    shapes: dict[str, Callable[[Path], None]] = {
+        "linear": lambda path: make_repo(path, args.commits, 0, 0, 0),
+        "many branches": lambda path: make_repo(path, args.commits, args.refs, 0, 0),
+        "many tags": lambda path: make_repo(path, args.commits, 0, args.refs, 0),
+        "long messages": lambda path: make_repo(path, args.commits, 0, 0, 40),
+    }
+
+    print(f"commits: {args.commits}, refs: {args.refs}, best of {args.runs}")
+    print(f"{'shape':<16}" + "".join(f"{name:>13}" for name in variants))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for shape, build in shapes.items():
+            path: Path = Path(temp_dir) / shape.replace(" ", "-")
+            build(path)
+            results: dict[str, float] = {
+                name: time_load(path, backend, args.runs, jobs)
+                for name, (backend, jobs) in variants.items()
+            }
+            fastest: str = min(results, key=results.__getitem__)
+            row: str = "".join(
+                f"{seconds * 1000:>10.1f} ms" + ("*" if name == fastest else " ")
+                for name, seconds in results.items()
+            )
+            print(f"{shape:<16}{row}")
+
+
+if __name__ == "__main__":
+    main()
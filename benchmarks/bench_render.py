@@ -0,0 +1,122 @@
+"""
+Row rendering microbenchmark.
+
+Measures the cost of building commit history rows and commit detail text for the same commits across repeated repaints.
+The first pass computes every derived display value, later passes are served from the values cached on Commit and Signature.
+
+Run with: python benchmarks/bench_render.py [--commits N] [--repaints R]
+"""
+
+import argparse
+import time
+from datetime import timedelta, timezone
+
+from gittergraph.models import Commit, Signature
+from gittergraph.tui.widgets import CommitDetail, CommitHistory
+from gittergraph.utils.time import get_timezone
+
+MESSAGE: str = (
+    "Refactor the history walker to follow first parents lazily\n\n"
+    + "Long commit body explaining the change in detail.\n" * 40
+)
+
+
+def make_commits(count: int) -> list[Commit]:
+    """
+    Create synthetic commits.
+
+    Uses a handful of distinct timezone offsets, like a real repository.
+    """
+    commits: list[Commit] = []
+    for i in range(count):
+        author: Signature = Signature(
+            name=f"Author {i % 50}",
+            email=f"author{i % 50}@example.com",
+            time=1_700_000_000 + i * 60,
+            time_offset=(i % 5) * 60 - 120,
+        )
+        commits.append(
+            Commit(
+                id=f"{i:040x}",
+                message=MESSAGE,
+                author=author,
+                committer=author,
+                parent_ids=[f"{i + 1:040x}"],
+            )
+        )
+    return commits
+
+
+def render_rows(
+    history: CommitHistory, detail: CommitDetail, commits: list[Commit]
+) -> float:
+    """
+    Render every row and detail view once.
+
+    Returns the elapsed time in seconds.
+    """
+    start: float = time.perf_counter()
+    for commit in commits:
+        history._get_header_text(commit)  # pylint: disable=protected-access
+        CommitHistory._get_body_text(commit)  # pylint: disable=protected-access
+        detail.commit = commit
+        detail._get_text()  # pylint: disable=protected-access
+    return time.perf_counter() - start
+
+
+def bench_timezones(count: int) -> tuple[float, float]:
+    """
+    Compare building timezones per call with the shared per-offset cache.
+
+    Returns the elapsed times in seconds for both variants.
+    """
+    offsets: list[int] = [(i % 5) * 60 - 120 for i in range(count)]
+
+    start: float = time.perf_counter()
+    for offset in offsets:
+        timezone(timedelta(minutes=offset))
+    fresh: float = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for offset in offsets:
+        get_timezone(offset)
+    cached: float = time.perf_counter() - start
+    return fresh, cached
+
+
+def main() -> None:
+    """
+    Run the benchmark and print per-row costs.
+
+    The first repaint pays for computing derived values, the remaining ones measure the cached hot path.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--commits", type=int, default=20_000)
+    parser.add_argument("--repaints", type=int, default=5)
+    args = parser.parse_args()
+
+    commits: list[Commit] = make_commits(args.commits)
+    history: CommitHistory = CommitHistory()
+    detail: CommitDetail = CommitDetail()
+
+    first: float = render_rows(history, detail, commits)
+    repaints: list[float] = [
+        render_rows(history, detail, commits) for _ in range(args.repaints)
+    ]
+    repaint: float = min(repaints)
+
+    def per_row(seconds: float) -> float:
+        return seconds / args.commits * 1e6
+
+    print(f"rows rendered:        {args.commits}")
+    print(f"first paint:          {per_row(first):8.2f} us/row")
+    print(f"repaint (cached):     {per_row(repaint):8.2f} us/row")
+    print(f"speedup:              {first / repaint:8.2f}x")
+
+    fresh, cached = bench_timezones(args.commits)
+    print(f"timezone per call:    {per_row(fresh):8.3f} us")
+    print(f"timezone per offset:  {per_row(cached):8.3f} us")
+
+
+if __name__ == "__main__":
+    main()
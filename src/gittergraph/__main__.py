@@ -2,25 +2,52 @@
 """
 Entry point for the gittergraph CLI.
 
-Provides the main function for launching the TUI application.
+Provides the main function for launching the TUI application, and the headless log and export subcommands.
 """
 
 import argparse
+import os
+import sys
+from collections.abc import Callable
 from pathlib import Path
 
 from gittergraph import __version__
+from gittergraph.access import BACKENDS, GitRepository, RefFilter
+from gittergraph.commands import FORMATS, get_format, write_columns, write_log
+from gittergraph.core import GraphColumns, GraphOptions
+from gittergraph.core.graph_data import GitGraphData
+from gittergraph.core.graph_loader import load_commits_from_daemon, load_from_daemon
+from gittergraph.daemon import serve
 from gittergraph.tui import run
+from gittergraph.utils.memory import parse_size
+from gittergraph.utils.time import parse_date
 
 
 def main() -> None:
     """
     Main entry point for gittergraph CLI.
 
-    Launches the TUI application, optionally with a specified repository path.
+    Launches the TUI application, optionally with a specified repository path, or runs a daemon serving the repository.
+    With a command such as log or export as the first argument, runs that command instead. A repository path after -- is never taken for a command.
     """
+    if len(sys.argv) > 1 and sys.argv[1] in _COMMANDS:
+        command_main, _ = _COMMANDS[sys.argv[1]]
+        command_main(sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(
         prog="gittergraph",
+        usage="%(prog)s [options] [repo_path]\n       %(prog)s {"
+        + ",".join(_COMMANDS)
+        + "} ...",
         description="Git graph visualization in your terminal",
+        epilog="commands:\n"
+        + "".join(
+            f"  {name:<10}{summary}\n" for name, (_, summary) in _COMMANDS.items()
+        )
+        + "\nRun 'gittergraph COMMAND --help' for the options of a command. "
+        + "To open a repository in a directory named like a command, pass its path after '--'.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     parser.add_argument(
         "repo_path",
@@ -29,6 +56,86 @@ def main() -> None:
         default=None,
         help="Path to git repository (default: current directory)",
     )
+    parser.add_argument(
+        "--include-refs",
+        metavar="GLOB",
+        action="append",
+        default=[],
+        help="Only load references matching GLOB (repeatable, e.g. 'refs/heads/*')",
+    )
+    parser.add_argument(
+        "--exclude-refs",
+        metavar="GLOB",
+        action="append",
+        default=[],
+        help="Never load references matching GLOB (repeatable, e.g. 'refs/pull/*')",
+    )
+    parser.add_argument(
+        "--lazy",
+        action="store_true",
+        help="Load only the history of HEAD at startup and walk other refs on demand",
+    )
+    parser.add_argument(
+        "--max-commits",
+        metavar="N",
+        type=parse_positive_int,
+        default=None,
+        help="Load at most N commits per walk; older history is loaded on request",
+    )
+    parser.add_argument(
+        "--since",
+        metavar="DATE",
+        type=parse_date,
+        default=None,
+        help="Only load commits newer than DATE (ISO 8601, e.g. '2024-01-31')",
+    )
+    parser.add_argument(
+        "--memory-budget",
+        metavar="SIZE",
+        type=parse_size,
+        default=None,
+        help="Limit memory held by decoded commits to SIZE (e.g. '256M'); evicted commits are re-read on demand",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Watch the repository and reload automatically when references change",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=list(BACKENDS),
+        default=None,
+        help="Load commits and references through pygit2, by streaming git command output, or from packfiles directly; pack reads SHA-256 repositories through pygit2 (default: gittergraph.backend setting, or pygit2)",
+    )
+    parser.add_argument(
+        "--jobs",
+        metavar="N",
+        type=int,
+        default=1,
+        help="Decode commits in N processes with the pygit2 backend (default: 1; 0 uses one per CPU core)",
+    )
+    parser.add_argument(
+        "--loader-process",
+        action="store_true",
+        help="Load commits in a separate process and share them with the interface through memory-mapped arrays",
+    )
+    parser.add_argument(
+        "--workspace",
+        metavar="DIR",
+        type=Path,
+        default=None,
+        help="Load all repositories under DIR concurrently and choose one from a repository switcher",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep the graph loaded and serve queries over a Unix socket instead of starting the interface",
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Load the repository even if a daemon is serving it",
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -36,7 +143,254 @@ def main() -> None:
     )
 
     args = parser.parse_args()
-    run(args.repo_path)
+    options: GraphOptions = GraphOptions(
+        ref_filter=RefFilter(
+            include=tuple(args.include_refs),
+            exclude=tuple(args.exclude_refs),
+        ),
+        lazy=args.lazy,
+        max_commits=args.max_commits,
+        since=args.since,
+        memory_budget=args.memory_budget,
+        watch=args.watch,
+        backend=args.backend,
+        jobs=args.jobs or os.cpu_count() or 1,
+        loader_process=args.loader_process,
+        use_daemon=not args.no_daemon,
+    )
+    if args.daemon:
+        serve(args.repo_path or ".", options)
+        return
+    if args.workspace:
+        run(options=options, workspace_path=args.workspace)
+        return
+    run(args.repo_path, options)
+
+
+def log_main(argv: list[str]) -> None:
+    """
+    Entry point for the log subcommand.
+
+    Streams the history of a revision to standard output as text or JSON Lines, reading commits from a running daemon's commit table where it has them.
+    Exits quietly when the reader closes the pipe early.
+    """
+    parser = argparse.ArgumentParser(
+        prog="gittergraph log",
+        description=_COMMANDS["log"][1],
+    )
+    parser.add_argument(
+        "revision",
+        nargs="?",
+        default="HEAD",
+        help="Branch, tag or commit to start from (default: HEAD)",
+    )
+    parser.add_argument(
+        "--repo",
+        metavar="PATH",
+        type=Path,
+        default=Path("."),
+        help="Path to git repository (default: current directory)",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Walk the full history newest first, children before parents, instead of following first parents",
+    )
+    parser.add_argument(
+        "--graph",
+        action="store_true",
+        help="Draw branch and merge lines next to each commit (implies --full)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Write one line of text or one JSON object per commit (default: text)",
+    )
+    parser.add_argument(
+        "-n",
+        "--max-count",
+        metavar="N",
+        type=int,
+        default=None,
+        help="Write at most N commits",
+    )
+    parser.add_argument(
+        "--since",
+        metavar="DATE",
+        type=parse_date,
+        default=None,
+        help="Leave out commits older than DATE and the history behind them (ISO 8601, e.g. '2024-01-31')",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=list(BACKENDS),
+        default=None,
+        help="Read commits through the given backend (default: gittergraph.backend setting, or pygit2)",
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Read every commit from the repository even if a daemon is serving it",
+    )
+
+    args = parser.parse_args(argv)
+    if args.graph and args.format == "json":
+        parser.error("--graph cannot be used with --format json")
+    repo: GitRepository | None = GitRepository.discover(args.repo, backend=args.backend)
+    if repo is None:
+        parser.error(f"not a git repository: {args.repo}")
+
+    try:
+        write_log(
+            repo,
+            args.revision,
+            sys.stdout,
+            first_parent=not (args.full or args.graph),
+            graph=args.graph,
+            json_lines=args.format == "json",
+            max_count=args.max_count,
+            since=args.since,
+            commits=None if args.no_daemon else load_commits_from_daemon(repo),
+        )
+        sys.stdout.flush()
+    except ValueError as error:
+        parser.error(str(error))
+    except BrokenPipeError:
+        # Keep the interpreter from failing again when it flushes stdout at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+
+
+def export_main(argv: list[str]) -> None:
+    """
+    Entry point for the export subcommand.
+
+    Builds the commit graph of a repository as flat columns straight from commit headers, or from a running daemon's data,
+    and writes it to a NumPy .npz archive or an Arrow IPC file.
+    """
+    parser = argparse.ArgumentParser(
+        prog="gittergraph export",
+        description=_COMMANDS["export"][1],
+        epilog="Only commit headers are used, and columns are filled as history is walked, without building commit objects "
+        "or decoding messages. A running daemon's data is taken over without reading commits.",
+    )
+    parser.add_argument(
+        "output",
+        type=Path,
+        help="File to write (.npz, or .arrow, .arrows, .feather or .ipc for Arrow IPC)",
+    )
+    parser.add_argument(
+        "--repo",
+        metavar="PATH",
+        type=Path,
+        default=Path("."),
+        help="Path to git repository (default: current directory)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=list(FORMATS),
+        default=None,
+        help="File format (default: chosen by the output file suffix)",
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Compress the output (deflate for .npz, zstd for Arrow IPC)",
+    )
+    parser.add_argument(
+        "--include-refs",
+        metavar="GLOB",
+        action="append",
+        default=[],
+        help="Only export history of references matching GLOB (repeatable)",
+    )
+    parser.add_argument(
+        "--exclude-refs",
+        metavar="GLOB",
+        action="append",
+        default=[],
+        help="Never export history of references matching GLOB (repeatable)",
+    )
+    parser.add_argument(
+        "--max-commits",
+        metavar="N",
+        type=parse_positive_int,
+        default=None,
+        help="Export at most N commits per walk",
+    )
+    parser.add_argument(
+        "--since",
+        metavar="DATE",
+        type=parse_date,
+        default=None,
+        help="Only export commits newer than DATE (ISO 8601, e.g. '2024-01-31')",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=list(BACKENDS),
+        default=None,
+        help="Read references through the given backend (default: gittergraph.backend setting, or pygit2); commit headers are always walked with pygit2",
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Read the repository even if a daemon is serving it",
+    )
+
+    args = parser.parse_args(argv)
+    options: GraphOptions = GraphOptions(
+        ref_filter=RefFilter(
+            include=tuple(args.include_refs),
+            exclude=tuple(args.exclude_refs),
+        ),
+        max_commits=args.max_commits,
+        since=args.since,
+        backend=args.backend,
+    )
+    repo: GitRepository | None = GitRepository.discover(
+        args.repo, options.ref_filter, options.backend
+    )
+    if repo is None:
+        parser.error(f"not a git repository: {args.repo}")
+
+    data: GitGraphData | None = (
+        None if args.no_daemon else load_from_daemon(repo, options)
+    )
+    columns: GraphColumns = (
+        data.to_columns(repo.identities)
+        if data is not None
+        else GitGraphData.load_columns(repo, args.max_commits, args.since)
+    )
+    try:
+        write_columns(
+            columns,
+            args.output,
+            args.format or get_format(args.output),
+            args.compress,
+        )
+    except ImportError as error:
+        parser.error(str(error))
+    print(f"Exported {len(columns)} commits to {args.output}", file=sys.stderr)
+
+
+def parse_positive_int(value: str) -> int:
+    """
+    Parse a positive integer argument.
+
+    Raises ValueError for anything but a whole number of at least 1, so argparse reports the value as invalid.
+    """
+    number: int = int(value)
+    if number < 1:
+        raise ValueError(f"Expected a positive number, got {number}")
+    return number
+
+
+# Commands run instead of the interface, with the summary shown in the main help
+_COMMANDS: dict[str, tuple[Callable[[list[str]], None], str]] = {
+    "log": (log_main, "Write the history of a revision to standard output"),
+    "export": (export_main, "Write the commit graph as columnar arrays for analysis"),
+}
 
 
 if __name__ == "__main__":
@@ -5,4 +5,6 @@ Access layer for git repository data.
 Provides unified interfaces for retrieving and converting repository objects such as commits, branches, tags, and HEAD.
 """
 
+from .backend import BACKENDS, Backend
+from .ref_filter import RefFilter
 from .repository import GitRepository
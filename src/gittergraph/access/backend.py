@@ -0,0 +1,63 @@
+"""
+Repository data backends.
+
+Provides the Backend dataclass, which names the access layer classes used for bulk loading of commits and references, and the registry of available backends.
+"""
+
+from dataclasses import dataclass
+
+import pygit2
+
+from gittergraph.access.commit_access import CommitAccess
+from gittergraph.access.git_cli_commit_access import GitCliCommitAccess
+from gittergraph.access.git_cli_ref_access import GitCliRefAccess
+from gittergraph.access.pack_commit_access import PackCommitAccess
+from gittergraph.access.ref_access import RefAccess
+
+
+@dataclass(slots=True, frozen=True)
+class Backend:
+    """
+    Source of bulk repository data.
+
+    Holds the name of the backend and the access layer classes GitRepository uses to walk commits and list references.
+    """
+
+    name: str
+    commit_access: type[CommitAccess]
+    ref_access: type[RefAccess]
+
+
+BACKENDS: dict[str, Backend] = {
+    "pygit2": Backend("pygit2", CommitAccess, RefAccess),
+    "git": Backend("git", GitCliCommitAccess, GitCliRefAccess),
+    "pack": Backend("pack", PackCommitAccess, RefAccess),
+}
+DEFAULT_BACKEND: str = "pygit2"
+BACKEND_CONFIG_KEY: str = "gittergraph.backend"
+
+
+def get_backend(name: str) -> Backend:
+    """
+    Look up a backend by name.
+
+    Raises ValueError if no backend has the given name.
+    """
+    backend: Backend | None = BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(
+            f"Unknown backend '{name}' (expected one of: {', '.join(BACKENDS)})"
+        )
+    return backend
+
+
+def get_configured_backend(config: pygit2.Config) -> Backend:
+    """
+    Look up the backend set in git configuration.
+
+    Reads the gittergraph.backend key and falls back to the default backend if it is not set. Raises ValueError if it names no backend.
+    """
+    name: str | None = (
+        config[BACKEND_CONFIG_KEY] if BACKEND_CONFIG_KEY in config else None
+    )
+    return get_backend(name or DEFAULT_BACKEND)
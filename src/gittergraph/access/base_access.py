@@ -20,3 +20,16 @@ class BaseAccess:  # pylint: disable=too-few-public-methods
     def __init__(self, path: Path | str) -> None:
         self.path: Path = Path(path)
         self._repo: pygit2.Repository = pygit2.Repository(str(self.path))
+
+    def _get_common_dir(self) -> Path:
+        """
+        Get the directory holding shared references.
+
+        Linked worktrees store their refs in the main repository's git directory.
+        """
+        git_dir: Path = Path(self._repo.path)
+        try:
+            common: str = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+        except OSError:
+            return git_dir
+        return (git_dir / common).resolve()
@@ -9,6 +9,7 @@ Provides methods for retrieving and converting Git branch objects. Used to acces
 import pygit2
 
 from gittergraph.access.base_access import BaseAccess
+from gittergraph.access.ref_access import RefAccess, RefRecord
 from gittergraph.models import Branch
 
 
@@ -31,23 +32,21 @@ class BranchAccess(BaseAccess):
             name=branch.name,
         )
 
-    def get_all(self) -> dict[str, Branch]:
+    def get_all(self, refs: dict[str, RefRecord] | None = None) -> dict[str, Branch]:
         """
         Get all branches (local and remote).
 
-        Returns a dictionary of Branch objects for all branches in the repository.
+        Returns a dictionary of Branch objects for all branches in the repository. Uses the given reference records, or loads them in bulk if not provided.
         """
-        branches: dict[str, Branch] = {}
-
-        for shorthand in self._repo.branches.local:
-            if not shorthand.endswith("/HEAD"):
-                name_local: str = f"refs/heads/{shorthand}"
-                branches[name_local] = self.get(name_local)
+        if refs is None:
+            refs = RefAccess(self.path).get_all()
 
-        for shorthand in self._repo.branches.remote:
-            if not shorthand.endswith("/HEAD"):
-                name_remote: str = f"refs/remotes/{shorthand}"
-                branches[name_remote] = self.get(name_remote)
+        branches: dict[str, Branch] = {}
+        for name, record in refs.items():
+            if name.startswith(("refs/heads/", "refs/remotes/")) and not name.endswith(
+                "/HEAD"
+            ):
+                branches[name] = Branch(target_id=record.target_id, name=name)
 
         return branches
 
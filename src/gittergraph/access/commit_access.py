@@ -5,46 +5,88 @@ Commit access operations.
 Provides access layer for retrieving and converting git commit objects.
 """
 
+import multiprocessing
+from array import array
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+
 import pygit2
 
 from gittergraph.access.base_access import BaseAccess
+from gittergraph.access.identity_pool import IdentityPool
 from gittergraph.models import Commit, Signature
 
+# Number of commits decoded per task when loading in parallel
+_CHUNK_SIZE: int = 2048
+
+# Messages, parent IDs, distinct (name, email) pairs, and per commit the author and committer identity, time and offset
+_DecodedChunk = tuple[list[str], list[list[str]], list[tuple[str, str]], array]
+
+# Repositories opened by a decoding worker process, by path
+_WORKER_REPOS: dict[str, pygit2.Repository] = {}
+
 
 class CommitAccess(BaseAccess):
     """
     Access layer for commit operations.
 
-    Provides methods for retrieving and converting git commit objects.
+    Provides methods for retrieving and converting git commit objects. Author and committer identities are shared through an identity pool.
+    With more than one job, walks decode commits on a pool of worker processes, each with its own repository handle, which send back compact chunks.
     """
 
+    def __init__(
+        self, path: Path | str, identities: IdentityPool | None = None, jobs: int = 1
+    ) -> None:
+        """
+        Initialize commit access.
+
+        Uses the given identity pool, or a new one, and decodes commits on the given number of processes.
+        """
+        super().__init__(path)
+        self.identities: IdentityPool = (
+            identities if identities is not None else IdentityPool()
+        )
+        self.jobs: int = max(1, jobs)
+
     @staticmethod
-    def to_model(commit: pygit2.Commit) -> Commit:
+    def to_model(
+        commit: pygit2.Commit, identities: IdentityPool | None = None
+    ) -> Commit:
         """
         Convert pygit2.Commit to Commit model.
 
-        Transforms a pygit2.Commit object into a Commit dataclass instance.
+        Transforms a pygit2.Commit object into a Commit dataclass instance. Names and emails come from the identity pool,
+        and a single Signature instance is shared when author and committer are identical.
         """
-        author: Signature = Signature(
-            name=commit.author.name,
-            email=commit.author.email,
-            time=commit.author.time,
-            time_offset=commit.author.offset,
-        )
-        committer: Signature = Signature(
-            name=commit.committer.name,
-            email=commit.committer.email,
-            time=commit.committer.time,
-            time_offset=commit.committer.offset,
-        )
+        pool: IdentityPool = identities if identities is not None else IdentityPool()
+        raw_author: pygit2.Signature = commit.author
+        raw_committer: pygit2.Signature = commit.committer
+        author, author_identity = pool.make_signature(raw_author)
+
+        committer: Signature = author
+        committer_identity: int = author_identity
+        if raw_committer != raw_author:
+            committer, committer_identity = pool.make_signature(raw_committer)
+
         return Commit(
             id=str(commit.id),
             message=commit.message.strip(),
             author=author,
             committer=committer,
             parent_ids=[str(p) for p in commit.parent_ids],
+            author_identity=author_identity,
+            committer_identity=committer_identity,
         )
 
+    def close(self) -> None:
+        """
+        Release resources held for reading commits.
+
+        Commits can still be read afterwards, possibly more slowly. Nothing is held by the pygit2 access layer.
+        """
+
     def get(self, commit_id: str) -> Commit:
         """
         Get a commit by its ID.
@@ -59,27 +101,268 @@ class CommitAccess(BaseAccess):
         if not isinstance(obj, pygit2.Commit):
             raise ValueError(f"Object '{commit_id}' is not a commit")
 
-        return CommitAccess.to_model(obj)
+        return CommitAccess.to_model(obj, self.identities)
+
+    def get_all(
+        self,
+        start_ids: Iterable[str] | None = None,
+        exclude_ids: Iterable[str] = (),
+        max_count: int | None = None,
+        since: int | None = None,
+    ) -> dict[str, Commit]:
+        """
+        Get all commits reachable from the given starting points.
+
+        Walks from the given commit-ish IDs, or from every reference if none are given, and collects all reachable commits into a dictionary.
+        Commits reachable from exclude_ids are not walked. Starting points that do not resolve to commits are skipped.
+        If max_count or since (Unix timestamp) is given, commits are walked newest first and the walk stops at the first bound reached.
+        """
+        return {
+            commit.id: commit
+            for commit in self.iter_all(start_ids, exclude_ids, max_count, since)
+        }
+
+    def iter_all(
+        self,
+        start_ids: Iterable[str] | None = None,
+        exclude_ids: Iterable[str] = (),
+        max_count: int | None = None,
+        since: int | None = None,
+    ) -> Iterator[Commit]:
+        """
+        Iterate over all commits reachable from the given starting points.
+
+        Same walk as get_all, but yields commits one at a time so callers can store them without holding the whole history at once.
+        With more than one job, commits are decoded in parallel processes and yielded in walk order.
+        """
+        if start_ids is None:
+            start_ids = [str(ref.target) for ref in self._repo.references.objects]
+
+        bounded: bool = max_count is not None or since is not None
+        walker: pygit2.Walker | None = self._walk(
+            start_ids,
+            exclude_ids,
+            pygit2.enums.SortMode.TIME if bounded else pygit2.enums.SortMode.NONE,
+        )
+        if walker is None:
+            return
+
+        commits: Iterator[pygit2.Commit] = self._bound(walker, max_count, since)
+        if self.jobs > 1:
+            yield from self._iter_parallel(commits)
+            return
+
+        for commit in commits:
+            yield CommitAccess.to_model(commit, self.identities)
+
+    def iter_ids(
+        self, start_ids: Iterable[str], exclude_ids: Iterable[str] = ()
+    ) -> Iterator[str]:
+        """
+        Iterate over the IDs of commits reachable from the given starting points.
+
+        Same walk as iter_all without bounds, but commits are not converted to models.
+        """
+        walker: pygit2.Walker | None = self._walk(
+            start_ids, exclude_ids, pygit2.enums.SortMode.NONE
+        )
+        if walker is not None:
+            yield from (str(commit.id) for commit in walker)
+
+    def iter_headers(
+        self,
+        start_ids: Iterable[str],
+        max_count: int | None = None,
+        since: int | None = None,
+    ) -> Iterator[tuple[bytes, list[bytes], int, str, str]]:
+        """
+        Iterate over the headers of commits reachable from the given starting points.
+
+        Same walk as iter_all, through pygit2 with every backend. Yields the binary ID, binary parent IDs, committer time, and author name and email
+        of each commit, without converting it to a model or decoding its message.
+        """
+        bounded: bool = max_count is not None or since is not None
+        walker: pygit2.Walker | None = self._walk(
+            start_ids,
+            (),
+            pygit2.enums.SortMode.TIME if bounded else pygit2.enums.SortMode.NONE,
+        )
+        if walker is None:
+            return
+
+        for commit in self._bound(walker, max_count, since):
+            author: pygit2.Signature = commit.author
+            yield (
+                commit.id.raw,
+                [parent_id.raw for parent_id in commit.parent_ids],
+                commit.commit_time,
+                author.name,
+                author.email,
+            )
+
+    def iter_date_order(self, start_id: str) -> Iterator[tuple[str, int, list[str]]]:
+        """
+        Iterate over the commits reachable from a commit, newest first but never ahead of their children.
+
+        Same order as git log --date-order. Yields the ID, committer time and parent IDs of each commit without converting it to a model.
+        libgit2 sorts the whole history before the first commit is yielded, reading only the headers of commit objects.
+        """
+        walker: pygit2.Walker | None = self._walk(
+            [start_id],
+            (),
+            pygit2.enums.SortMode.TOPOLOGICAL | pygit2.enums.SortMode.TIME,
+        )
+        if walker is not None:
+            for commit in walker:
+                yield str(commit.id), commit.commit_time, [
+                    str(parent_id) for parent_id in commit.parent_ids
+                ]
+
+    @staticmethod
+    def _bound(
+        walker: pygit2.Walker, max_count: int | None, since: int | None
+    ) -> Iterator[pygit2.Commit]:
+        """
+        Apply count and date bounds to a walk.
+
+        Stops at the first bound reached.
+        """
+        count: int = 0
+        for commit in walker:
+            if max_count is not None and count >= max_count:
+                break
+            if since is not None and commit.commit_time < since:
+                break
+            count += 1
+            yield commit
+
+    def _iter_parallel(self, commits: Iterator[pygit2.Commit]) -> Iterator[Commit]:
+        """
+        Decode walked commits in worker processes.
+
+        The walk only collects commit IDs, which are handed to the workers in chunks. Chunks are turned into models in walk order,
+        so results and identity IDs do not depend on scheduling, and every name and email comes from the shared identity pool.
+        """
+        # Forking a process that runs threads is unsafe, so workers always start fresh
+        executor: ProcessPoolExecutor = ProcessPoolExecutor(
+            self.jobs, mp_context=multiprocessing.get_context("spawn")
+        )
+        pending: deque[tuple[list[str], Future[_DecodedChunk]]] = deque()
+        try:
+            chunk: list[str] = []
+            for commit in commits:
+                chunk.append(str(commit.id))
+                if len(chunk) < _CHUNK_SIZE:
+                    continue
+                pending.append(
+                    (chunk, executor.submit(_decode_chunk, str(self.path), chunk))
+                )
+                chunk = []
+                while pending and pending[0][1].done():
+                    commit_ids, future = pending.popleft()
+                    yield from self._build_chunk(commit_ids, future.result())
+
+            if chunk:
+                pending.append(
+                    (chunk, executor.submit(_decode_chunk, str(self.path), chunk))
+                )
+            while pending:
+                commit_ids, future = pending.popleft()
+                yield from self._build_chunk(commit_ids, future.result())
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
-    def get_all(self) -> dict[str, Commit]:
+    def _build_chunk(  # pylint: disable=too-many-locals
+        self, commit_ids: list[str], chunk: _DecodedChunk
+    ) -> Iterator[Commit]:
         """
-        Get all commits reachable from any reference.
+        Build models from a chunk decoded by a worker process.
 
-        Walks all references and collects all reachable commits into a dictionary.
+        Signatures are built through the shared identity pool, and a single Signature instance is shared when author and committer are identical, as in to_model.
         """
-        commits: dict[str, Commit] = {}
+        messages, parent_ids, identities, signatures = chunk
+        for index, commit_id in enumerate(commit_ids):
+            values: array = signatures[index * 6 : index * 6 + 6]
+            name, email = identities[values[0]]
+            author, author_identity = self.identities.get_signature(
+                name, email, values[1], values[2]
+            )
+            committer: Signature = author
+            committer_identity: int = author_identity
+            if values[3:] != values[:3]:
+                name, email = identities[values[3]]
+                committer, committer_identity = self.identities.get_signature(
+                    name, email, values[4], values[5]
+                )
+            yield Commit(
+                id=commit_id,
+                message=messages[index],
+                author=author,
+                committer=committer,
+                parent_ids=parent_ids[index],
+                author_identity=author_identity,
+                committer_identity=committer_identity,
+            )
 
-        for ref in self._repo.references.objects:
+    def _walk(
+        self,
+        start_ids: Iterable[str],
+        exclude_ids: Iterable[str],
+        sort_mode: pygit2.enums.SortMode,
+    ) -> pygit2.Walker | None:
+        """
+        Set up a walk from the given starting points.
+
+        Starting points and exclusions that do not resolve to commits are skipped. Returns None if no starting point resolves to a commit.
+        """
+        walker: pygit2.Walker = self._repo.walk(None, sort_mode)
+        pushed: bool = False
+        for start_id in start_ids:
             try:
-                start_id: str = str(ref.peel(pygit2.Commit).id)
+                walker.push(start_id)
+                pushed = True
 
             # Refs that do not point to commits are skipped
-            except pygit2.InvalidSpecError:
+            except (pygit2.InvalidSpecError, KeyError, ValueError):
                 pass
-            else:
-                for commit in self._repo.walk(start_id, pygit2.enums.SortMode.NONE):
-                    commit_id: str = str(commit.id)
-                    if commit_id not in commits:
-                        commits[commit_id] = CommitAccess.to_model(commit)
 
-        return commits
+        if not pushed:
+            return None
+
+        for exclude_id in exclude_ids:
+            try:
+                walker.hide(exclude_id)
+            except (pygit2.InvalidSpecError, KeyError, ValueError):
+                pass
+        return walker
+
+
+def _decode_chunk(path: str, commit_ids: list[str]) -> _DecodedChunk:
+    """
+    Decode commits in a worker process.
+
+    Builds no models, so the result is small to send back. Names and emails are listed once per chunk and referenced by index.
+    """
+    repo: pygit2.Repository | None = _WORKER_REPOS.get(path)
+    if repo is None:
+        repo = _WORKER_REPOS[path] = pygit2.Repository(path)
+
+    messages: list[str] = []
+    parent_ids: list[list[str]] = []
+    identities: dict[tuple[str, str], int] = {}
+    signatures: array = array("q")
+    for commit_id in commit_ids:
+        commit: pygit2.Commit = repo[commit_id].peel(pygit2.Commit)
+        messages.append(commit.message.strip())
+        parent_ids.append([str(parent_id) for parent_id in commit.parent_ids])
+        for signature in (commit.author, commit.committer):
+            signatures.extend(
+                (
+                    identities.setdefault(
+                        (signature.name, signature.email), len(identities)
+                    ),
+                    signature.time,
+                    signature.offset,
+                )
+            )
+    return messages, parent_ids, list(identities), signatures
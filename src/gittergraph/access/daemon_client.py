@@ -0,0 +1,263 @@
+"""
+Graph daemon client.
+
+Provides the DaemonClient class for querying a running gittergraph daemon over a Unix socket, and the parts of its JSON Lines protocol shared with the daemon.
+"""
+
+import hashlib
+import io
+import json
+import os
+import socket
+import stat
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from gittergraph.models import Commit, Signature
+
+PROTOCOL_VERSION: int = 1
+
+# Answers come from memory, so anything slower means the daemon is stuck
+_TIMEOUT: float = 30.0
+
+
+class DaemonClient:
+    """
+    Connection to a graph daemon.
+
+    Each request is one JSON object per line with an "op" field and the operation's parameters, and each answer is one JSON object per line
+    with either a "result" or an "error" field. Commits are sent as compact arrays, see encode_commit. Use as a context manager to close the connection.
+    """
+
+    def __init__(self, connection: socket.socket) -> None:
+        """
+        Initialize client on a connected socket.
+
+        Use connect to open a connection to the daemon serving a repository.
+        """
+        self._socket: socket.socket = connection
+        self._file: io.BufferedRWPair = connection.makefile("rwb")
+
+    @classmethod
+    def connect(cls, socket_path: Path | str) -> "DaemonClient | None":
+        """
+        Connect to the daemon listening on a socket.
+
+        Returns None if no daemon is listening, including when a daemon left a stale socket behind. Also returns None if the socket directory
+        is not private to the current user, or the daemon runs as another user, since its answers could not be trusted.
+        """
+        if not is_private_dir(Path(socket_path).parent):
+            return None
+
+        connection: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.settimeout(_TIMEOUT)
+        try:
+            connection.connect(str(socket_path))
+        except OSError:
+            connection.close()
+            return None
+        if get_peer_uid(connection) not in (None, os.getuid()):
+            connection.close()
+            return None
+        return cls(connection)
+
+    def request(self, op: str, **params: Any) -> Any:
+        """
+        Send a request and wait for the answer.
+
+        Returns the result of the operation. Raises ValueError if the daemon rejects the request and ConnectionError if the connection is closed.
+        """
+        self._file.write(json.dumps({"op": op, **params}).encode("utf-8") + b"\n")
+        self._file.flush()
+        line: bytes = self._file.readline()
+        if not line:
+            raise ConnectionError("Daemon closed the connection")
+
+        answer: dict[str, Any] = json.loads(line)
+        if "error" in answer:
+            raise ValueError(answer["error"])
+        return answer["result"]
+
+    def ping(self) -> dict[str, Any]:
+        """
+        Get information about the daemon.
+
+        Returns the protocol version, repository path, and the loading options the daemon's graph depends on.
+        """
+        return self.request("ping")
+
+    def resolve(self, ref: str) -> str | None:
+        """
+        Resolve a reference name to a commit ID.
+
+        Returns None if the reference cannot be resolved.
+        """
+        return self.request("resolve", ref=ref)
+
+    def get_linear_history(
+        self, start_ref: str = "HEAD", offset: int = 0, limit: int | None = None
+    ) -> list[Commit]:
+        """
+        Get a window of the linear first-parent history of a reference.
+
+        Returns up to limit commits, newest first, skipping the first offset ones.
+        """
+        return [
+            decode_commit(row)
+            for row in self.request(
+                "history", ref=start_ref, offset=offset, limit=limit
+            )
+        ]
+
+    def is_ancestor(self, ancestor_ref: str, ref: str) -> bool:
+        """
+        Check if one reference is an ancestor of another.
+
+        Returns False if either reference cannot be resolved.
+        """
+        return self.request("ancestry", ancestor=ancestor_ref, ref=ref)
+
+    def search(self, text: str, limit: int | None = None) -> list[Commit]:
+        """
+        Search loaded commits.
+
+        Returns up to limit commits whose message, author, or ID prefix matches the text.
+        """
+        return [
+            decode_commit(row) for row in self.request("search", text=text, limit=limit)
+        ]
+
+    def get_decorations(self, commit_id: str) -> tuple[list[str], list[str]]:
+        """
+        Get the references pointing to a commit.
+
+        Returns the full names of the branches and tags at the commit.
+        """
+        result: dict[str, list[str]] = self.request("decorations", commit_id=commit_id)
+        return result["branches"], result["tags"]
+
+    def get_snapshot(self) -> dict[str, Any]:
+        """
+        Get the daemon's current graph data.
+
+        Returns the path of a commit table holding its commits, along with its references, HEAD, and loading state.
+        """
+        return self.request("snapshot")
+
+    def close(self) -> None:
+        """
+        Close the connection.
+
+        The daemon keeps running.
+        """
+        self._file.close()
+        self._socket.close()
+
+    def __enter__(self) -> "DaemonClient":
+        """
+        Enter the connection context.
+
+        Returns the client itself.
+        """
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """
+        Leave the connection context.
+
+        Closes the connection.
+        """
+        self.close()
+
+
+def get_socket_path(repo_path: Path | str) -> Path:
+    """
+    Get the socket path of the daemon serving a repository.
+
+    Sockets live in $XDG_RUNTIME_DIR/gittergraph, or a per-user temporary directory, and are named after a hash of the resolved repository path,
+    since socket paths are limited in length.
+    """
+    runtime_dir: str | None = os.environ.get("XDG_RUNTIME_DIR")
+    base_dir: Path = (
+        Path(runtime_dir) / "gittergraph"
+        if runtime_dir
+        else Path(tempfile.gettempdir()) / f"gittergraph-{os.getuid()}"
+    )
+    digest: str = hashlib.sha256(
+        str(Path(repo_path).resolve()).encode("utf-8", "surrogateescape")
+    ).hexdigest()
+    return base_dir / f"{digest[:16]}.sock"
+
+
+def is_private_dir(path: Path | str) -> bool:
+    """
+    Check that a directory is only accessible to the current user.
+
+    Requires a real directory, not a symbolic link, owned by the current user with mode 0700, so no other user can place or replace sockets in it.
+    """
+    try:
+        info: os.stat_result = os.lstat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(info.st_mode)
+        and info.st_uid == os.getuid()
+        and stat.S_IMODE(info.st_mode) == 0o700
+    )
+
+
+def get_peer_uid(connection: socket.socket) -> int | None:
+    """
+    Get the user ID of the process at the other end of a Unix socket.
+
+    Returns None if the platform does not report peer credentials.
+    """
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    credentials: bytes = connection.getsockopt(
+        socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+    )
+    _, uid, _ = struct.unpack("3i", credentials)
+    return uid
+
+
+def encode_commit(commit: Commit) -> list[Any]:
+    """
+    Encode a commit for the daemon protocol.
+
+    Returns an array of the ID, parent IDs, author and committer as [name, email, time, offset] arrays, and message.
+    """
+    return [
+        commit.id,
+        commit.parent_ids,
+        _encode_signature(commit.author),
+        _encode_signature(commit.committer),
+        commit.message,
+    ]
+
+
+def decode_commit(row: list[Any]) -> Commit:
+    """
+    Decode a commit sent by the daemon.
+
+    Inverse of encode_commit. Identity IDs are not sent, so they are unknown.
+    """
+    commit_id, parent_ids, author, committer, message = row
+    return Commit(
+        id=commit_id,
+        message=message,
+        author=Signature(*author),
+        committer=Signature(*committer),
+        parent_ids=parent_ids,
+    )
+
+
+def _encode_signature(signature: Signature) -> list[Any]:
+    """
+    Encode a signature for the daemon protocol.
+
+    Returns an array of the name, email, time, and timezone offset.
+    """
+    return [signature.name, signature.email, signature.time, signature.time_offset]
@@ -0,0 +1,109 @@
+"""
+Diff access operations.
+
+Provides access layer for computing tree diff statistics, backed by a persistent diff cache stored in the git directory.
+"""
+
+from pathlib import Path
+
+import pygit2
+
+from gittergraph.access.base_access import BaseAccess
+from gittergraph.access.diff_cache import DiffCache
+from gittergraph.models import DiffStat
+
+
+class DiffAccess(BaseAccess):
+    """
+    Access layer for diff operations.
+
+    Computes diff statistics between trees and commits, reusing cached results across sessions.
+    """
+
+    def __init__(self, path: Path | str, cache: DiffCache | None = None) -> None:
+        """
+        Initialize diff access.
+
+        Uses the given cache, or a cache stored under the repository's git directory.
+        """
+        super().__init__(path)
+        self.cache: DiffCache = cache or DiffCache(
+            Path(self._repo.path) / "gittergraph" / "diff-cache"
+        )
+
+    @staticmethod
+    def to_model(diff: pygit2.Diff) -> DiffStat:
+        """
+        Convert pygit2.Diff to DiffStat model.
+
+        Collects line statistics and the new path of every changed file.
+        """
+        stats: pygit2.DiffStats = diff.stats
+        return DiffStat(
+            insertions=stats.insertions,
+            deletions=stats.deletions,
+            paths=[delta.new_file.path for delta in diff.deltas],
+        )
+
+    def get_tree_stat(
+        self,
+        old_tree_id: str | None,
+        new_tree_id: str,
+        flags: pygit2.enums.DiffOption = pygit2.enums.DiffOption.NORMAL,
+        find_renames: bool = False,
+    ) -> DiffStat:
+        """
+        Get diff statistics between two trees.
+
+        A missing old tree stands for the empty tree. Raises KeyError if a tree is not found.
+        """
+        key: str = DiffCache.make_key(
+            old_tree_id, new_tree_id, int(flags), find_renames
+        )
+        cached: DiffStat | None = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        new_tree: pygit2.Tree = self._get_tree(new_tree_id)
+        diff: pygit2.Diff
+        if old_tree_id is None:
+            diff = new_tree.diff_to_tree(flags=flags, swap=True)
+        else:
+            diff = self._get_tree(old_tree_id).diff_to_tree(new_tree, flags=flags)
+
+        if find_renames:
+            diff.find_similar()
+
+        stat: DiffStat = DiffAccess.to_model(diff)
+        self.cache.put(key, stat)
+        return stat
+
+    def get_commit_stat(self, commit_id: str, find_renames: bool = False) -> DiffStat:
+        """
+        Get diff statistics of a commit against its first parent.
+
+        Root commits are compared to the empty tree. Raises KeyError if not found, ValueError if not a commit.
+        """
+        commit: pygit2.Object | None = self._repo.get(commit_id)
+        if commit is None:
+            raise KeyError(f"Commit '{commit_id}' not found")
+        if not isinstance(commit, pygit2.Commit):
+            raise ValueError(f"Object '{commit_id}' is not a commit")
+
+        old_tree_id: str | None = (
+            str(commit.parents[0].tree_id) if commit.parent_ids else None
+        )
+        return self.get_tree_stat(
+            old_tree_id, str(commit.tree_id), find_renames=find_renames
+        )
+
+    def _get_tree(self, tree_id: str) -> pygit2.Tree:
+        """
+        Look up a tree object by ID.
+
+        Raises KeyError if the object is not found or is not a tree.
+        """
+        obj: pygit2.Object | None = self._repo.get(tree_id)
+        if not isinstance(obj, pygit2.Tree):
+            raise KeyError(f"Tree '{tree_id}' not found")
+        return obj
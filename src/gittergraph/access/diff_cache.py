@@ -0,0 +1,211 @@
+"""
+Persistent diff cache.
+
+Provides a content-addressed, size-bounded disk cache for tree diff statistics. Tree diffs never change for a given pair of tree IDs, so results are shared across sessions.
+"""
+
+import hashlib
+import os
+import struct
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+from gittergraph.models import DiffStat
+
+# Entry layout: insertions and deletions as little-endian uint32, then NUL-separated paths
+_HEADER: struct.Struct = struct.Struct("<II")
+
+
+@dataclass(slots=True)
+class DiffCacheStats:
+    """
+    Diff cache counters.
+
+    Tracks lookups, writes, and evictions for the current session.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Ratio of cache hits to lookups.
+
+        Returns 0.0 if no lookups have been made yet.
+        """
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class DiffCache:
+    """
+    Content-addressed disk cache for diff statistics.
+
+    Stores compressed entries keyed by (old tree ID, new tree ID, options) and evicts the least recently used entries once the cache grows beyond its size limit.
+    """
+
+    DEFAULT_MAX_BYTES: int = 64 * 1024 * 1024
+
+    def __init__(
+        self, directory: Path | str, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        """
+        Initialize diff cache.
+
+        Entries are stored below the given directory, which is created on first write.
+        """
+        self.directory: Path = Path(directory)
+        self.max_bytes: int = max_bytes
+        self.stats: DiffCacheStats = DiffCacheStats()
+        self._size: int | None = None
+
+    @staticmethod
+    def make_key(
+        old_tree_id: str | None,
+        new_tree_id: str,
+        flags: int = 0,
+        find_renames: bool = False,
+    ) -> str:
+        """
+        Build the cache key for a tree diff.
+
+        Returns a hex digest of the tree IDs and diff options. A missing old tree stands for the empty tree.
+        """
+        raw: str = f"{old_tree_id or ''}:{new_tree_id}:{flags}:{int(find_renames)}"
+        return hashlib.sha1(raw.encode("ascii")).hexdigest()
+
+    def get(self, key: str) -> DiffStat | None:
+        """
+        Look up a cached diff.
+
+        Returns the cached DiffStat, or None if the entry is missing or unreadable.
+        """
+        path: Path = self._entry_path(key)
+        try:
+            payload: bytes = zlib.decompress(path.read_bytes())
+            insertions, deletions = _HEADER.unpack_from(payload)
+        except (OSError, zlib.error, struct.error):
+            self.stats.misses += 1
+            return None
+
+        # Touch the entry so eviction order follows recent use
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        blob: bytes = payload[_HEADER.size :]
+        paths: list[str] = (
+            blob.decode("utf-8", "surrogateescape").split("\0") if blob else []
+        )
+        self.stats.hits += 1
+        return DiffStat(insertions=insertions, deletions=deletions, paths=paths)
+
+    def put(self, key: str, stat: DiffStat) -> None:
+        """
+        Store a diff in the cache.
+
+        Writes the entry atomically and evicts old entries if the size limit is exceeded. Write failures are ignored.
+        """
+        blob: bytes = "\0".join(stat.paths).encode("utf-8", "surrogateescape")
+        data: bytes = zlib.compress(
+            _HEADER.pack(stat.insertions, stat.deletions) + blob
+        )
+
+        path: Path = self._entry_path(key)
+        tmp_path: Path = path.with_suffix(f".tmp{os.getpid()}")
+
+        # The total is taken before writing, so the new entry is counted once and an overwritten one is replaced
+        size: int = self._current_size()
+        try:
+            old_size: int = path.stat().st_size
+        except OSError:
+            old_size = 0
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+
+        self.stats.writes += 1
+        self._size = size + len(data) - old_size
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def clear(self) -> None:
+        """
+        Remove all cache entries.
+
+        Deletes every entry file below the cache directory.
+        """
+        for path, _, _ in self._scan():
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        self._size = 0
+
+    def _entry_path(self, key: str) -> Path:
+        """
+        Get the file path for a cache key.
+
+        Entries are sharded by the first two characters of the key.
+        """
+        return self.directory / key[:2] / key[2:]
+
+    def _scan(self) -> list[tuple[Path, int, int]]:
+        """
+        List cache entries on disk.
+
+        Returns (path, size, mtime) tuples for all entry files.
+        """
+        entries: list[tuple[Path, int, int]] = []
+        if not self.directory.is_dir():
+            return entries
+
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if ".tmp" in entry.name:
+                    continue
+                stat: os.stat_result = entry.stat()
+                entries.append((Path(entry.path), stat.st_size, stat.st_mtime_ns))
+        return entries
+
+    def _current_size(self) -> int:
+        """
+        Get the total size of the cache in bytes.
+
+        Scans the cache directory on first use and tracks writes afterwards.
+        """
+        if self._size is None:
+            self._size = sum(size for _, size, _ in self._scan())
+        return self._size
+
+    def _evict(self) -> None:
+        """
+        Evict least recently used entries.
+
+        Removes entries until the cache drops below 90% of its size limit, so eviction is not triggered on every write.
+        """
+        target: int = self.max_bytes * 9 // 10
+        entries: list[tuple[Path, int, int]] = sorted(self._scan(), key=lambda e: e[2])
+        size: int = sum(size for _, size, _ in entries)
+
+        for path, entry_size, _ in entries:
+            if size <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            size -= entry_size
+            self.stats.evictions += 1
+
+        self._size = size
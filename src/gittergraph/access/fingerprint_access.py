@@ -0,0 +1,81 @@
+"""
+Repository fingerprint operations.
+
+Provides a cheap fingerprint of the reference state of a repository, used to skip reloads when nothing has changed.
+"""
+
+import hashlib
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from gittergraph.access.base_access import BaseAccess
+
+
+@dataclass(slots=True, frozen=True)
+class RepositoryFingerprint:
+    """
+    Fingerprint of a repository's reference state.
+
+    Digest of the modification times and sizes of HEAD, packed-refs, and the loose refs directories, plus the ref tips stored in HEAD and loose refs.
+    Two equal fingerprints mean no reference has moved.
+    """
+
+    digest: str
+    ref_file_count: int
+
+
+class FingerprintAccess(BaseAccess):  # pylint: disable=too-few-public-methods
+    """
+    Access layer for repository fingerprints.
+
+    Reads only file metadata and small ref files from the git directory, without opening any object.
+    """
+
+    def get(self) -> RepositoryFingerprint:
+        """
+        Compute the current fingerprint.
+
+        Covers HEAD of the working tree and the shared references of the repository, including reftable storage.
+        """
+        git_dir: Path = Path(self._repo.path)
+        common_dir: Path = self._get_common_dir()
+        digest = hashlib.sha1()
+        count: int = 0
+
+        for path in (git_dir / "HEAD", common_dir / "packed-refs"):
+            digest.update(_describe(path, read=path.name == "HEAD"))
+
+        for refs_dir in (common_dir / "refs", common_dir / "reftable"):
+            for dir_path, dir_names, file_names in os.walk(refs_dir):
+                dir_names.sort()
+                digest.update(_describe(Path(dir_path)))
+                for file_name in sorted(file_names):
+                    if file_name.endswith(".lock"):
+                        continue
+                    digest.update(_describe(Path(dir_path, file_name), read=True))
+                    count += 1
+
+        return RepositoryFingerprint(digest=digest.hexdigest(), ref_file_count=count)
+
+
+def _describe(path: Path, read: bool = False) -> bytes:
+    """
+    Describe a file for the fingerprint.
+
+    Returns the path, modification time, and size, followed by the file content if read is set. Missing files are described as such.
+    """
+    try:
+        stat: os.stat_result = path.stat()
+    except OSError:
+        return f"{path}:missing\0".encode("utf-8", "surrogateescape")
+
+    description: bytes = f"{path}:{stat.st_mtime_ns}:{stat.st_size}\0".encode(
+        "utf-8", "surrogateescape"
+    )
+    if read and stat.st_size <= 4096:
+        try:
+            description += path.read_bytes()
+        except OSError:
+            pass
+    return description
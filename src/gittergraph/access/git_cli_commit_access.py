@@ -0,0 +1,175 @@
+"""
+Commit access through the git command line.
+
+Provides a commit access layer that walks history with git log and parses its NUL separated output incrementally, instead of walking through pygit2.
+"""
+
+from collections.abc import Iterable, Iterator
+
+import pygit2
+
+from gittergraph.access.commit_access import CommitAccess
+from gittergraph.access.git_process import iter_git_output
+from gittergraph.models import Commit, Signature
+
+# One field per placeholder, terminated by NUL with -z
+_LOG_FORMAT: str = "%H%x00%P%x00%an%x00%ae%x00%ad%x00%cn%x00%ce%x00%cd%x00%B"
+_FIELD_COUNT: int = 9
+
+
+class GitCliCommitAccess(CommitAccess):
+    """
+    Access layer for commit operations through the git command line.
+
+    Walks history in a git log process and converts its output to Commit models as it streams in, so decompression and parsing of commit objects happen outside of Python.
+    Single commit lookups and resolution of starting points still go through pygit2.
+    """
+
+    def iter_all(
+        self,
+        start_ids: Iterable[str] | None = None,
+        exclude_ids: Iterable[str] = (),
+        max_count: int | None = None,
+        since: int | None = None,
+    ) -> Iterator[Commit]:
+        """
+        Iterate over all commits reachable from the given starting points.
+
+        Same walk as CommitAccess.iter_all. Bounded walks are in commit date order, and the git process is stopped as soon as a bound is reached.
+        """
+        if start_ids is None:
+            start_ids = [str(ref.target) for ref in self._repo.references.objects]
+
+        revisions: list[str] = self._get_revisions(start_ids, exclude_ids)
+        if not revisions:
+            return
+
+        args: list[str] = ["log", "-z", "--date=raw", f"--format={_LOG_FORMAT}"]
+        if max_count is not None:
+            args.append(f"--max-count={max_count}")
+        args.append("--stdin")
+
+        fields: list[bytes] = []
+        for field in iter_git_output(
+            self._repo.path, args, stdin=_get_stdin_text(revisions)
+        ):
+            fields.append(field)
+            if len(fields) < _FIELD_COUNT:
+                continue
+
+            commit: Commit = self._parse(fields)
+            fields = []
+            if since is not None and commit.committer.time < since:
+                break
+            yield commit
+
+    def iter_ids(
+        self, start_ids: Iterable[str], exclude_ids: Iterable[str] = ()
+    ) -> Iterator[str]:
+        """
+        Iterate over the IDs of commits reachable from the given starting points.
+
+        Lists commits with git rev-list without reading their contents.
+        """
+        revisions: list[str] = self._get_revisions(start_ids, exclude_ids)
+        if revisions:
+            for line in iter_git_output(
+                self._repo.path,
+                ["rev-list", "--stdin"],
+                separator=b"\n",
+                stdin=_get_stdin_text(revisions),
+            ):
+                yield line.decode("ascii")
+
+    def _get_revisions(
+        self, start_ids: Iterable[str], exclude_ids: Iterable[str]
+    ) -> list[str]:
+        """
+        Build the revision arguments of a walk.
+
+        Starting points and exclusions that do not resolve to commits are skipped, like in the pygit2 walk. Returns an empty list if no starting point resolves to a commit.
+        """
+        revisions: list[str] = [
+            commit_id for commit_id in map(self._resolve, start_ids) if commit_id
+        ]
+        if revisions:
+            revisions.extend(
+                f"^{commit_id}"
+                for commit_id in map(self._resolve, exclude_ids)
+                if commit_id
+            )
+        return revisions
+
+    def _resolve(self, commit_ish: str) -> str | None:
+        """
+        Resolve a commit-ish ID to the ID of the commit it points to.
+
+        Returns None if it does not resolve to a commit.
+        """
+        try:
+            obj: pygit2.Object = self._repo.revparse_single(commit_ish)
+            return str(obj.peel(pygit2.Commit).id)
+        except (pygit2.GitError, KeyError, ValueError):
+            return None
+
+    def _parse(self, fields: list[bytes]) -> Commit:
+        """
+        Convert the fields of one git log record to a Commit model.
+
+        Names and emails come from the identity pool, and a single Signature instance is shared when author and committer are identical.
+        """
+        (
+            commit_id,
+            parents,
+            author_name,
+            author_email,
+            author_date,
+            committer_name,
+            committer_email,
+            committer_date,
+            message,
+        ) = (field.decode("utf-8", "replace") for field in fields)
+
+        author, author_identity = self.identities.get_signature(
+            author_name, author_email, *_parse_date(author_date)
+        )
+        committer: Signature = author
+        committer_identity: int = author_identity
+        if (committer_name, committer_email, committer_date) != (
+            author_name,
+            author_email,
+            author_date,
+        ):
+            committer, committer_identity = self.identities.get_signature(
+                committer_name, committer_email, *_parse_date(committer_date)
+            )
+
+        return Commit(
+            id=commit_id,
+            message=message.strip(),
+            author=author,
+            committer=committer,
+            parent_ids=parents.split(),
+            author_identity=author_identity,
+            committer_identity=committer_identity,
+        )
+
+
+def _get_stdin_text(revisions: list[str]) -> str:
+    """
+    Join revision arguments for the --stdin option of git.
+
+    Returns one revision per line.
+    """
+    return "".join(f"{revision}\n" for revision in revisions)
+
+
+def _parse_date(value: str) -> tuple[int, int]:
+    """
+    Parse a raw git date.
+
+    Returns the Unix timestamp and the timezone offset in minutes of a '<timestamp> <+hhmm>' value.
+    """
+    timestamp, _, zone = value.partition(" ")
+    offset: int = int(zone[1:3]) * 60 + int(zone[3:5])
+    return int(timestamp), -offset if zone.startswith("-") else offset
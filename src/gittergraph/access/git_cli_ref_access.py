@@ -0,0 +1,51 @@
+"""
+Reference access through the git command line.
+
+Provides a bulk reference loader that lists references with git for-each-ref, including the commits annotated tags point to.
+"""
+
+from gittergraph.access.git_process import iter_git_output
+from gittergraph.access.ref_access import RefAccess, RefRecord
+
+# Fields are separated by NUL, references by newlines
+_REF_FORMAT: str = (
+    "%(refname)%00%(symref)%00%(objectname)%00%(*objectname)%00%(*objecttype)"
+)
+
+
+class GitCliRefAccess(RefAccess):  # pylint: disable=too-few-public-methods
+    """
+    Access layer for bulk reference loading through the git command line.
+
+    Parses the output of a single git for-each-ref process, which peels annotated tags, so tags need no object lookups afterwards.
+    Works with every reference storage format git supports.
+    """
+
+    def _load(self, hidden: set[str]) -> dict[str, RefRecord]:
+        """
+        Load references from git for-each-ref.
+
+        Collects names of filtered out references into hidden. Tags pointing to other tags are left unpeeled.
+        """
+        records: dict[str, RefRecord] = {}
+        for line in iter_git_output(
+            self._repo.path,
+            ["for-each-ref", f"--format={_REF_FORMAT}"],
+            separator=b"\n",
+        ):
+            name, symref, target_id, peeled_id, peeled_type = line.decode(
+                "utf-8", "surrogateescape"
+            ).split("\0")
+            if not self.ref_filter.matches(name):
+                hidden.add(name)
+                continue
+
+            # Symbolic refs are not branches or tags in their own right
+            if symref:
+                continue
+
+            name = self.pool.intern(name)
+            records[name] = RefRecord(
+                name, target_id, peeled_id or None, peeled_type in ("", "commit")
+            )
+        return dict(sorted(records.items()))
@@ -0,0 +1,78 @@
+"""
+Git command line processes.
+
+Provides helpers for running the git executable against a repository and streaming its output field by field as it is produced.
+"""
+
+import shutil
+import subprocess
+import tempfile
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+
+# Size of reads from the output pipe
+_CHUNK_SIZE: int = 256 * 1024
+
+
+def is_git_available() -> bool:
+    """
+    Check if the git executable can be found.
+
+    Returns True if git is on the PATH.
+    """
+    return shutil.which("git") is not None
+
+
+def iter_git_output(
+    git_dir: Path | str,
+    args: Sequence[str],
+    separator: bytes = b"\0",
+    stdin: str = "",
+) -> Iterator[bytes]:
+    """
+    Run git and yield its output split at separator.
+
+    Each yielded field is complete, so callers can parse output incrementally while git is still running. The stdin text is written before output is read.
+    The process is killed if the caller stops iterating early. Raises subprocess.CalledProcessError if git exits with an error.
+    """
+    command: list[str] = [
+        "git",
+        f"--git-dir={git_dir}",
+        "--no-replace-objects",
+        "-c",
+        "log.showSignature=false",
+        *args,
+    ]
+    # Errors go to a file, so git never blocks on a full stderr pipe while output is read
+    # Unbuffered pipes return output as soon as git writes it
+    with (
+        tempfile.TemporaryFile() as stderr_file,
+        subprocess.Popen(
+            command,
+            bufsize=0,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+        ) as process,
+    ):
+        assert process.stdin is not None and process.stdout is not None
+        try:
+            data: memoryview = memoryview(stdin.encode())
+            while data:
+                data = data[process.stdin.write(data) or 0 :]
+            process.stdin.close()
+
+            pending: bytes = b""
+            while chunk := process.stdout.read(_CHUNK_SIZE):
+                fields: list[bytes] = (pending + chunk).split(separator)
+                pending = fields.pop()
+                yield from fields
+
+            if process.wait() != 0:
+                stderr_file.seek(0)
+                raise subprocess.CalledProcessError(
+                    process.returncode, command, stderr=stderr_file.read()
+                )
+        finally:
+            if process.poll() is None:
+                process.kill()
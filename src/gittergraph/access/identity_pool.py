@@ -0,0 +1,121 @@
+"""
+Identity and string pooling.
+
+Provides the IdentityPool class, a flyweight pool that interns author names, emails, and reference names and assigns small integer IDs to identities.
+"""
+
+import threading
+
+import pygit2
+
+from gittergraph.models import Signature
+
+
+class IdentityPool:
+    """
+    Flyweight pool for identities and repeated strings.
+
+    A repository typically has a few thousand distinct identities across all of its commits. The pool hands out one shared string per distinct value,
+    and numbers each distinct (name, email) pair so commits can be compared and filtered by identity ID.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty pool.
+
+        Identity IDs are assigned in order of first appearance, starting at 0.
+        """
+        self._strings: dict[str, str] = {}
+        self._identity_ids: dict[tuple[str, str], int] = {}
+        self._identities: list[tuple[str, str]] = []
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """
+        Number of distinct identities.
+
+        Returns how many (name, email) pairs have been assigned an ID.
+        """
+        return len(self._identities)
+
+    def intern(self, value: str) -> str:
+        """
+        Get the pooled instance of a string.
+
+        Returns a previously pooled equal string, or pools and returns the given one.
+        """
+        return self._strings.setdefault(value, value)
+
+    def get_identity_id(self, name: str, email: str) -> int:
+        """
+        Get the ID of an identity.
+
+        Assigns a new ID if the (name, email) pair has not been seen before.
+        """
+        key: tuple[str, str] = (name, email)
+        identity_id: int | None = self._identity_ids.get(key)
+        if identity_id is not None:
+            return identity_id
+
+        with self._lock:
+            # Another thread may have assigned the ID in the meantime
+            identity_id = self._identity_ids.get(key)
+            if identity_id is None:
+                identity_id = len(self._identities)
+                self._identities.append((self.intern(name), self.intern(email)))
+                self._identity_ids[key] = identity_id
+        return identity_id
+
+    def find_identity_id(self, name: str, email: str) -> int | None:
+        """
+        Look up the ID of an identity without assigning one.
+
+        Returns None if the identity has not been seen.
+        """
+        return self._identity_ids.get((name, email))
+
+    def adopt(self, other: "IdentityPool", identity_id: int) -> int:
+        """
+        Get the ID in this pool of an identity from another pool.
+
+        Assigns a new ID if the identity has not been seen by this pool.
+        """
+        return self.get_identity_id(*other.get_identity(identity_id))
+
+    def get_identity(self, identity_id: int) -> tuple[str, str]:
+        """
+        Get the name and email of an identity.
+
+        Raises IndexError if the ID was not assigned by this pool.
+        """
+        return self._identities[identity_id]
+
+    def make_signature(self, signature: pygit2.Signature) -> tuple[Signature, int]:
+        """
+        Convert a pygit2.Signature to a Signature model with pooled strings.
+
+        Returns the signature and its identity ID.
+        """
+        return self.get_signature(
+            signature.name, signature.email, signature.time, signature.offset
+        )
+
+    def get_signature(
+        self, name: str, email: str, time: int, time_offset: int
+    ) -> tuple[Signature, int]:
+        """
+        Build a Signature model with pooled strings.
+
+        Returns the signature and its identity ID.
+        """
+        identity_id: int = self.get_identity_id(name, email)
+        pooled_name, pooled_email = self._identities[identity_id]
+        return (
+            Signature(
+                name=pooled_name,
+                email=pooled_email,
+                time=time,
+                time_offset=time_offset,
+            ),
+            identity_id,
+        )
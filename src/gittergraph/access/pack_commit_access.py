@@ -0,0 +1,384 @@
+"""
+Commit access through packfiles.
+
+Provides a commit access layer that reads commit objects directly from memory-mapped packfiles and parses them in Python, instead of going through libgit2 objects.
+"""
+
+import heapq
+import sys
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from gittergraph.access.commit_access import CommitAccess
+from gittergraph.access.identity_pool import IdentityPool
+from gittergraph.access.pack_reader import (
+    OBJ_COMMIT,
+    OBJ_TAG,
+    ObjectReader,
+    RawObject,
+)
+from gittergraph.models import Commit, Signature
+
+# Enough to hold the tree, parent, author and committer lines of most commits
+_HEADER_LIMIT: int = 512
+
+# Number of hidden commits walked past the point where only hidden commits are queued
+_SLOP: int = 5
+
+
+class PackCommitAccess(CommitAccess):
+    """
+    Access layer for commit operations through packfiles.
+
+    Walks history by reading raw commit objects with an ObjectReader and parsing their headers, so no libgit2 object is wrapped per commit.
+    Commits only needed for their parents are inflated just far enough to read the parent and committer lines. Objects the reader cannot find are read through pygit2.
+    Only SHA-1 repositories are read from packfiles; in SHA-256 repositories every object is read through pygit2, so the backend is no faster than pygit2.
+    """
+
+    def __init__(
+        self, path: Path | str, identities: IdentityPool | None = None, jobs: int = 1
+    ) -> None:
+        """
+        Initialize packfile commit access.
+
+        Maps the packs of the repository's object directory and its alternates. Commits are always decoded on the calling thread.
+        """
+        super().__init__(path, identities, jobs)
+        self.objects: ObjectReader = ObjectReader(self._get_common_dir() / "objects")
+
+    def close(self) -> None:
+        """
+        Unmap the packs of the repository.
+
+        Later reads go through pygit2, so snapshots still holding this access layer keep working.
+        """
+        self.objects.close()
+
+    def get(self, commit_id: str) -> Commit:
+        """
+        Get a commit by its ID.
+
+        Raises KeyError if not found, ValueError if not a commit.
+        """
+        obj_type, data = self._read(commit_id)
+        if obj_type != OBJ_COMMIT:
+            raise ValueError(f"Object '{commit_id}' is not a commit")
+        return self._to_model(commit_id, data)
+
+    def iter_all(
+        self,
+        start_ids: Iterable[str] | None = None,
+        exclude_ids: Iterable[str] = (),
+        max_count: int | None = None,
+        since: int | None = None,
+    ) -> Iterator[Commit]:
+        """
+        Iterate over all commits reachable from the given starting points.
+
+        Same walk as CommitAccess.iter_all, always in commit date order.
+        """
+        if start_ids is None:
+            start_ids = [str(ref.target) for ref in self._repo.references.objects]
+
+        count: int = 0
+        for commit_id, commit_time, data in self._walk_commits(
+            start_ids, exclude_ids, True
+        ):
+            if max_count is not None and count >= max_count:
+                break
+            if since is not None and commit_time < since:
+                break
+            count += 1
+            yield self._to_model(commit_id, data)
+
+    def iter_ids(
+        self, start_ids: Iterable[str], exclude_ids: Iterable[str] = ()
+    ) -> Iterator[str]:
+        """
+        Iterate over the IDs of commits reachable from the given starting points.
+
+        Only commit headers are inflated.
+        """
+        for commit_id, _, _ in self._walk_commits(start_ids, exclude_ids, False):
+            yield commit_id
+
+    def _walk_commits(  # pylint: disable=too-many-locals
+        self, start_ids: Iterable[str], exclude_ids: Iterable[str], full: bool
+    ) -> Iterator[tuple[str, int, bytes]]:
+        """
+        Walk commits newest first.
+
+        Yields the ID, committer time and raw data of each commit reachable from start_ids but not from exclude_ids, in committer time order.
+        The data is complete only if full is set. Walks without exclusions stream commits as they are read.
+        """
+        starts: list[str] = [
+            commit_id for commit_id in map(self._resolve, start_ids) if commit_id
+        ]
+        excluded: list[str] = [
+            commit_id for commit_id in map(self._resolve, exclude_ids) if commit_id
+        ]
+        if excluded:
+            for commit_id in self._limit(starts, excluded):
+                link: tuple[int, list[str], bytes] | None = self._read_links(
+                    commit_id, full
+                )
+                if link is not None:
+                    yield commit_id, link[0], link[2]
+            return
+
+        queue: list[tuple[int, str]] = []
+        links: dict[str, tuple[int, list[str], bytes]] = {}
+        seen: set[str] = set()
+
+        def push(commit_id: str) -> None:
+            if commit_id not in seen:
+                seen.add(commit_id)
+                link: tuple[int, list[str], bytes] | None = self._read_links(
+                    commit_id, full
+                )
+                if link is not None:
+                    links[commit_id] = link
+                    heapq.heappush(queue, (-link[0], commit_id))
+
+        for commit_id in starts:
+            push(commit_id)
+        while queue:
+            commit_id = heapq.heappop(queue)[1]
+            commit_time, parent_ids, data = links.pop(commit_id)
+            yield commit_id, commit_time, data
+            for parent_id in parent_ids:
+                push(parent_id)
+
+    def _limit(  # pylint: disable=too-many-locals
+        self, start_ids: list[str], exclude_ids: list[str]
+    ) -> list[str]:
+        """
+        Find the commits reachable from start_ids but not from exclude_ids.
+
+        Works like limit_list of git: commits are visited in committer time order and hidden marks are propagated to parents already read. To correct for clock skew,
+        the walk goes on while queued commits are not older than the oldest visited one, and then for a few more hidden commits. Returns the commit IDs in visiting order.
+        """
+        queue: list[tuple[int, bool, str]] = []
+        parents: dict[str, list[str]] = {}
+        hidden: set[str] = set()
+        visited: list[str] = []
+        oldest: int = sys.maxsize
+        interesting: int = 0
+
+        def push(commit_id: str) -> None:
+            nonlocal interesting
+            if commit_id not in parents:
+                link: tuple[int, list[str], bytes] | None = self._read_links(
+                    commit_id, False
+                )
+                parents[commit_id] = link[1] if link is not None else []
+                if link is not None:
+                    is_hidden: bool = commit_id in hidden
+                    heapq.heappush(queue, (-link[0], not is_hidden, commit_id))
+                    interesting += not is_hidden
+
+        def hide(commit_id: str) -> None:
+            pending: list[str] = [commit_id]
+            while pending:
+                current: str = pending.pop()
+                if current not in hidden:
+                    hidden.add(current)
+                    pending.extend(parents.get(current, ()))
+
+        for commit_id in exclude_ids:
+            hide(commit_id)
+            push(commit_id)
+        for commit_id in start_ids:
+            push(commit_id)
+
+        slop: int = _SLOP
+        while queue:
+            negative_time, counted, commit_id = heapq.heappop(queue)
+            interesting -= counted
+            if commit_id not in hidden:
+                oldest = min(oldest, -negative_time)
+                visited.append(commit_id)
+                for parent_id in parents[commit_id]:
+                    push(parent_id)
+                continue
+
+            for parent_id in parents[commit_id]:
+                hide(parent_id)
+                push(parent_id)
+            if not queue:
+                break
+            if interesting > 0 or -queue[0][0] >= min(oldest, -negative_time):
+                slop = _SLOP
+            else:
+                slop -= 1
+                if not slop:
+                    break
+
+        return [commit_id for commit_id in visited if commit_id not in hidden]
+
+    def _read_links(
+        self, commit_id: str, full: bool
+    ) -> tuple[int, list[str], bytes] | None:
+        """
+        Read the committer time and parents of a commit.
+
+        Returns them with the commit data, which is complete if full is set, or None if the object is missing or not a commit.
+        """
+        try:
+            obj_type, data = self._read(commit_id, None if full else _HEADER_LIMIT)
+        except KeyError:
+            return None
+        if obj_type != OBJ_COMMIT:
+            return None
+
+        links: tuple[int, list[str]] | None = _parse_links(data)
+        if links is None and not full:
+            data = self._read(commit_id)[1]
+            links = _parse_links(data)
+        commit_time, parent_ids = links or (0, [])
+        return commit_time, parent_ids, data
+
+    def _resolve(self, commit_ish: str) -> str | None:
+        """
+        Resolve an object ID to the ID of the commit it points to.
+
+        Annotated tags are peeled. Returns None if the ID does not resolve to a commit.
+        """
+        object_id: str = commit_ish
+        while True:
+            try:
+                obj_type, data = self._read(object_id)
+            except (KeyError, ValueError):
+                return None
+            if obj_type == OBJ_COMMIT:
+                return object_id
+            if obj_type != OBJ_TAG or not data.startswith(b"object "):
+                return None
+            object_id = data[7 : data.index(b"\n")].decode("ascii")
+
+    def _read(self, object_id: str, limit: int | None = None) -> RawObject:
+        """
+        Read a raw object.
+
+        Falls back to pygit2 for objects the packfile reader cannot find. Raises KeyError if not found.
+        """
+        obj: RawObject | None = self.objects.read(object_id, limit)
+        if obj is not None:
+            return obj
+
+        try:
+            obj_type, data = self._repo.read(object_id)
+        except (KeyError, ValueError) as error:
+            raise KeyError(f"Object '{object_id}' not found") from error
+        return int(obj_type), data
+
+    def _to_model(  # pylint: disable=too-many-locals
+        self, commit_id: str, data: bytes
+    ) -> Commit:
+        """
+        Convert raw commit data to a Commit model.
+
+        Names and emails come from the identity pool, and a single Signature instance is shared when author and committer are identical.
+        """
+        header, _, raw_message = data.partition(b"\n\n")
+        parent_ids: list[str] = []
+        raw_author: bytes = b""
+        raw_committer: bytes = b""
+        encoding: str = "utf-8"
+        for line in header.split(b"\n"):
+            key, _, value = line.partition(b" ")
+            if key == b"parent":
+                parent_ids.append(value.decode("ascii"))
+            elif key == b"author":
+                raw_author = value
+            elif key == b"committer":
+                raw_committer = value
+            elif key == b"encoding":
+                encoding = value.decode("ascii", "replace")
+
+        author, author_identity = self._make_signature(raw_author, encoding)
+        committer: Signature = author
+        committer_identity: int = author_identity
+        if raw_committer != raw_author:
+            committer, committer_identity = self._make_signature(
+                raw_committer, encoding
+            )
+
+        return Commit(
+            id=commit_id,
+            message=_decode(raw_message, encoding).strip(),
+            author=author,
+            committer=committer,
+            parent_ids=parent_ids,
+            author_identity=author_identity,
+            committer_identity=committer_identity,
+        )
+
+    def _make_signature(self, value: bytes, encoding: str) -> tuple[Signature, int]:
+        """
+        Parse a raw author or committer line.
+
+        Returns the signature with pooled strings and its identity ID.
+        """
+        email_start: int = value.find(b"<")
+        email_end: int = value.find(b">", email_start)
+        name: bytes = value[:email_start].strip()
+        email: bytes = value[email_start + 1 : email_end]
+        time, offset = _parse_date(value[email_end + 1 :])
+        return self.identities.get_signature(
+            _decode(name, encoding), _decode(email, encoding), time, offset
+        )
+
+
+def _parse_links(data: bytes) -> tuple[int, list[str]] | None:
+    """
+    Parse the committer time and parents from the start of raw commit data.
+
+    Returns None if the data ends before the committer line is complete.
+    """
+    parent_ids: list[str] = []
+    position: int = 0
+    while True:
+        end: int = data.find(b"\n", position)
+        if end < 0:
+            return None
+        if data.startswith(b"parent ", position):
+            parent_ids.append(data[position + 7 : end].decode("ascii"))
+        elif data.startswith(b"committer ", position):
+            line: bytes = data[position:end]
+            return _parse_date(line[line.rfind(b">") + 1 :])[0], parent_ids
+        elif end == position:
+            return 0, parent_ids
+        position = end + 1
+
+
+def _parse_date(value: bytes) -> tuple[int, int]:
+    """
+    Parse the timestamp and timezone following an email in a signature.
+
+    Returns the Unix timestamp and the timezone offset in minutes, or zeros if the value is malformed.
+    """
+    parts: list[bytes] = value.split()
+    try:
+        timestamp: int = int(parts[0])
+    except (IndexError, ValueError):
+        return 0, 0
+
+    zone: bytes = parts[1] if len(parts) > 1 else b"+0000"
+    try:
+        offset: int = int(zone[1:3]) * 60 + int(zone[3:5])
+    except ValueError:
+        return timestamp, 0
+    return timestamp, -offset if zone.startswith(b"-") else offset
+
+
+def _decode(value: bytes, encoding: str) -> str:
+    """
+    Decode commit text in the commit's encoding.
+
+    Falls back to UTF-8 for unknown encodings and replaces undecodable bytes.
+    """
+    try:
+        return value.decode(encoding, "replace")
+    except LookupError:
+        return value.decode("utf-8", "replace")
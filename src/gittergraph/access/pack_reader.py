@@ -0,0 +1,483 @@
+"""
+Packfile object reader.
+
+Provides a pure-Python reader for objects in a git object directory. Pack indexes and packfiles are memory-mapped, objects are located through the
+version 2 pack index and inflated on demand, and delta chains are resolved with a small cache of base objects. Loose objects and alternates are supported.
+"""
+
+import mmap
+import os
+import struct
+import threading
+import zlib
+from collections.abc import Callable
+from pathlib import Path
+
+# Object types as stored in packfiles
+OBJ_COMMIT: int = 1
+OBJ_TREE: int = 2
+OBJ_BLOB: int = 3
+OBJ_TAG: int = 4
+OBJ_OFS_DELTA: int = 6
+OBJ_REF_DELTA: int = 7
+
+_LOOSE_TYPES: dict[bytes, int] = {
+    b"commit": OBJ_COMMIT,
+    b"tree": OBJ_TREE,
+    b"blob": OBJ_BLOB,
+    b"tag": OBJ_TAG,
+}
+_IDX_HEADER: bytes = b"\xfftOc\x00\x00\x00\x02"
+_FANOUT: struct.Struct = struct.Struct(">256I")
+_OFFSET: struct.Struct = struct.Struct(">I")
+_LARGE_OFFSET: struct.Struct = struct.Struct(">Q")
+_OID_SIZE: int = 20
+
+# Slack added to the expected size when feeding compressed data to zlib
+_INFLATE_SLACK: int = 64
+
+RawObject = tuple[int, bytes]
+
+
+class PackIndex:
+    """
+    Memory-mapped version 2 pack index.
+
+    Maps object IDs to offsets in the corresponding packfile using the fanout table and a binary search over the sorted object IDs.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Map a pack index file.
+
+        Raises ValueError if the file is not a version 2 pack index.
+        """
+        with open(path, "rb") as file:
+            self._map: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[: len(_IDX_HEADER)] != _IDX_HEADER:
+            self._map.close()
+            raise ValueError(f"Unsupported pack index '{path}'")
+
+        self._fanout: tuple[int, ...] = _FANOUT.unpack_from(self._map, len(_IDX_HEADER))
+        self.count: int = self._fanout[255]
+        self._names_start: int = len(_IDX_HEADER) + _FANOUT.size
+        self._offsets_start: int = self._names_start + self.count * (_OID_SIZE + 4)
+        self._large_offsets_start: int = self._offsets_start + self.count * 4
+
+    def find(self, oid: bytes) -> int | None:
+        """
+        Find the pack offset of an object.
+
+        Returns None if the object is not in this pack.
+        """
+        low: int = self._fanout[oid[0] - 1] if oid[0] else 0
+        high: int = self._fanout[oid[0]]
+        while low < high:
+            middle: int = (low + high) // 2
+            start: int = self._names_start + middle * _OID_SIZE
+            name: bytes = self._map[start : start + _OID_SIZE]
+            if name < oid:
+                low = middle + 1
+            elif name > oid:
+                high = middle
+            else:
+                return self._get_offset(middle)
+        return None
+
+    def _get_offset(self, position: int) -> int:
+        """
+        Get the pack offset of the object at a position in the index.
+
+        Offsets with the most significant bit set refer to the table of 64-bit offsets.
+        """
+        offset: int = _OFFSET.unpack_from(
+            self._map, self._offsets_start + position * 4
+        )[0]
+        if offset & 0x80000000:
+            offset = _LARGE_OFFSET.unpack_from(
+                self._map, self._large_offsets_start + (offset & 0x7FFFFFFF) * 8
+            )[0]
+        return offset
+
+    def close(self) -> None:
+        """
+        Unmap the index file.
+
+        The index cannot be used afterwards.
+        """
+        self._map.close()
+
+
+class PackFile:
+    """
+    Memory-mapped packfile.
+
+    Reads and inflates objects at given offsets, resolving offset and reference deltas. Base objects of delta chains are kept in a small cache,
+    which is guarded by a lock since one pack is read from the interface, background loading and daemon threads.
+    """
+
+    def __init__(
+        self,
+        pack_path: Path,
+        index: PackIndex,
+        find_base: Callable[[bytes], RawObject | None],
+        cache_size: int = 256,
+    ) -> None:
+        """
+        Map a packfile.
+
+        Bases of reference deltas outside this pack are looked up through find_base. Raises ValueError if the file is not a packfile.
+        """
+        with open(pack_path, "rb") as file:
+            self._map: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:4] != b"PACK":
+            self._map.close()
+            raise ValueError(f"Unsupported packfile '{pack_path}'")
+
+        self.index: PackIndex = index
+        self._view: memoryview = memoryview(self._map)
+        self._find_base: Callable[[bytes], RawObject | None] = find_base
+        self._cache: dict[int, RawObject] = {}
+        self._cache_size: int = cache_size
+        self._cache_lock: threading.Lock = threading.Lock()
+
+    def read(  # pylint: disable=too-many-locals
+        self, offset: int, limit: int | None = None
+    ) -> RawObject:
+        """
+        Read the object at an offset.
+
+        With a limit, objects stored whole are only inflated up to at least limit bytes. Deltified objects are always read in full.
+        """
+        kind, size, position = self._read_header(offset)
+        if kind not in (OBJ_OFS_DELTA, OBJ_REF_DELTA):
+            return kind, self._inflate(position, size, limit)
+
+        # Follow the chain down to a cached or whole base object
+        chain: list[tuple[int, bytes]] = []
+        base: RawObject | None = None
+        while base is None:
+            if chain:
+                with self._cache_lock:
+                    base = self._cache.get(offset)
+                if base is not None:
+                    break
+                kind, size, position = self._read_header(offset)
+
+            if kind == OBJ_OFS_DELTA:
+                distance, position = self._read_base_distance(position)
+                chain.append((offset, self._inflate(position, size)))
+                offset -= distance
+            elif kind == OBJ_REF_DELTA:
+                base_oid: bytes = bytes(self._view[position : position + _OID_SIZE])
+                chain.append((offset, self._inflate(position + _OID_SIZE, size)))
+                base_offset: int | None = self.index.find(base_oid)
+                if base_offset is None:
+                    base = self._find_base(base_oid)
+                    if base is None:
+                        raise KeyError(f"Delta base '{base_oid.hex()}' not found")
+                else:
+                    offset = base_offset
+            else:
+                base = (kind, self._inflate(position, size))
+                self._remember(offset, base)
+
+        # Intermediate results are bases of other objects in the chain
+        base_type, data = base
+        for depth in range(len(chain) - 1, -1, -1):
+            delta_offset, delta = chain[depth]
+            data = apply_delta(data, delta)
+            if depth:
+                self._remember(delta_offset, (base_type, data))
+        return base_type, data
+
+    def _read_header(self, offset: int) -> tuple[int, int, int]:
+        """
+        Parse the header of the object at an offset.
+
+        Returns the object type, the inflated size and the offset of the data following the header.
+        """
+        byte: int = self._map[offset]
+        kind: int = (byte >> 4) & 0x07
+        size: int = byte & 0x0F
+        shift: int = 4
+        offset += 1
+        while byte & 0x80:
+            byte = self._map[offset]
+            size |= (byte & 0x7F) << shift
+            shift += 7
+            offset += 1
+        return kind, size, offset
+
+    def _read_base_distance(self, offset: int) -> tuple[int, int]:
+        """
+        Parse the base distance of an offset delta.
+
+        Returns the distance back to the base object and the offset of the delta data.
+        """
+        byte: int = self._map[offset]
+        distance: int = byte & 0x7F
+        offset += 1
+        while byte & 0x80:
+            byte = self._map[offset]
+            distance = ((distance + 1) << 7) | (byte & 0x7F)
+            offset += 1
+        return distance, offset
+
+    def _inflate(self, offset: int, size: int, limit: int | None = None) -> bytes:
+        """
+        Inflate object data starting at an offset.
+
+        Feeds compressed data to zlib in windows, so the rest of the pack is never copied. Stops after limit bytes if given.
+        """
+        decompressor = zlib.decompressobj()
+        wanted: int = size if limit is None else min(size, limit)
+        window: int = wanted + _INFLATE_SLACK
+        data: bytes = b""
+        while len(data) < wanted and not decompressor.eof and offset < len(self._map):
+            data += decompressor.decompress(
+                self._view[offset : offset + window], wanted - len(data)
+            )
+            offset += window - len(decompressor.unconsumed_tail)
+            window *= 2
+        return data
+
+    def _remember(self, offset: int, obj: RawObject) -> None:
+        """
+        Cache a delta base object.
+
+        Evicts the oldest entry once the cache is full.
+        """
+        with self._cache_lock:
+            if len(self._cache) >= self._cache_size:
+                self._cache.pop(next(iter(self._cache)), None)
+            self._cache[offset] = obj
+
+    def close(self) -> None:
+        """
+        Unmap the packfile and its index.
+
+        The pack cannot be used afterwards.
+        """
+        self._view.release()
+        self._map.close()
+        self.index.close()
+
+
+class ObjectReader:
+    """
+    Reader for objects of a git object directory.
+
+    Looks objects up in all packfiles of the directory and its alternates, newest pack first, and then among loose objects.
+    Returns raw object types and contents without creating libgit2 objects. Only 20-byte SHA-1 IDs are supported, so nothing is found for SHA-256 IDs.
+    """
+
+    def __init__(self, objects_dir: Path | str, cache_size: int = 256) -> None:
+        """
+        Open the packs of an object directory and its alternates.
+
+        Packs with unsupported index or pack versions are skipped, so their objects are not found.
+        """
+        self.directories: list[Path] = [Path(objects_dir)]
+        self.directories.extend(self._read_alternates(self.directories[0]))
+        self.packs: list[PackFile] = []
+        for directory in self.directories:
+            self.packs.extend(self._open_packs(directory / "pack", cache_size))
+
+        # Closed packs are unmapped once no read is using them
+        self._lock: threading.Lock = threading.Lock()
+        self._active_reads: int = 0
+        self._closed_packs: list[PackFile] = []
+
+    def read(self, oid_hex: str, limit: int | None = None) -> RawObject | None:
+        """
+        Read an object by its hex ID.
+
+        Returns the object type and contents, or None if the object is not found. With a limit, only at least the first limit bytes may be returned.
+        """
+        try:
+            oid: bytes = bytes.fromhex(oid_hex)
+        except ValueError:
+            return None
+        if len(oid) != _OID_SIZE:
+            return None
+        return self._read(oid, limit)
+
+    def _read(self, oid: bytes, limit: int | None = None) -> RawObject | None:
+        """
+        Read an object by its binary ID.
+
+        Returns None if the object is not found.
+        """
+        with self._lock:
+            packs: list[PackFile] = self.packs
+            self._active_reads += 1
+        try:
+            for pack in packs:
+                offset: int | None = pack.index.find(oid)
+                if offset is not None:
+                    return pack.read(offset, limit)
+        finally:
+            self._end_read()
+
+        oid_hex: str = oid.hex()
+        for directory in self.directories:
+            try:
+                with open(directory / oid_hex[:2] / oid_hex[2:], "rb") as file:
+                    content: bytes = zlib.decompress(file.read())
+            except OSError:
+                continue
+            header, _, data = content.partition(b"\0")
+            kind: int | None = _LOOSE_TYPES.get(header.partition(b" ")[0])
+            if kind is None:
+                raise ValueError(f"Unsupported loose object '{oid_hex}'")
+            return kind, data
+        return None
+
+    def _open_packs(self, pack_dir: Path, cache_size: int) -> list[PackFile]:
+        """
+        Open the packfiles of a pack directory.
+
+        Returns the packs ordered by modification time, newest first, as new objects are most likely in recent packs.
+        """
+        try:
+            entries: list[os.DirEntry[str]] = [
+                entry for entry in os.scandir(pack_dir) if entry.name.endswith(".idx")
+            ]
+        except OSError:
+            return []
+
+        packs: list[tuple[float, PackFile]] = []
+        for entry in entries:
+            index_path: Path = Path(entry.path)
+            try:
+                index: PackIndex = PackIndex(index_path)
+            except (OSError, ValueError):
+                continue
+            try:
+                pack: PackFile = PackFile(
+                    index_path.with_suffix(".pack"), index, self._read, cache_size
+                )
+            except (OSError, ValueError):
+                index.close()
+                continue
+            packs.append((entry.stat().st_mtime, pack))
+
+        packs.sort(key=lambda item: item[0], reverse=True)
+        return [pack for _, pack in packs]
+
+    @staticmethod
+    def _read_alternates(objects_dir: Path) -> list[Path]:
+        """
+        Read the alternate object directories of an object directory.
+
+        Relative paths are resolved against the object directory. Returns an empty list if there are no alternates.
+        """
+        try:
+            lines: list[str] = (
+                (objects_dir / "info" / "alternates")
+                .read_text(encoding="utf-8")
+                .splitlines()
+            )
+        except OSError:
+            return []
+        return [
+            (objects_dir / line.strip()).resolve()
+            for line in lines
+            if line.strip() and not line.startswith("#")
+        ]
+
+    def close(self) -> None:
+        """
+        Unmap all packfiles.
+
+        Packs still in use by reads on other threads are unmapped when those reads finish. Later reads only find loose objects.
+        """
+        with self._lock:
+            self._closed_packs.extend(self.packs)
+            self.packs = []
+        self._end_read(0)
+
+    def _end_read(self, count: int = 1) -> None:
+        """
+        Finish a read of a pack.
+
+        Unmaps closed packs once the last read in progress has finished.
+        """
+        with self._lock:
+            self._active_reads -= count
+            if self._active_reads:
+                return
+            packs: list[PackFile] = self._closed_packs
+            self._closed_packs = []
+        for pack in packs:
+            pack.close()
+
+
+def apply_delta(base: bytes, delta: bytes) -> bytes:
+    """
+    Apply a git delta to a base object.
+
+    Copies ranges of the base and inserts literal data as instructed by the delta. Raises ValueError if the delta is malformed.
+    """
+    source: memoryview = memoryview(base)
+    _, position = _read_delta_size(delta, 0)
+    size, position = _read_delta_size(delta, position)
+
+    result: bytearray = bytearray()
+    end: int = len(delta)
+    while position < end:
+        command: int = delta[position]
+        position += 1
+        if command & 0x80:
+            # Copy instruction, with offset and length bytes present as flagged
+            offset: int = 0
+            length: int = 0
+            if command & 0x01:
+                offset = delta[position]
+                position += 1
+            if command & 0x02:
+                offset |= delta[position] << 8
+                position += 1
+            if command & 0x04:
+                offset |= delta[position] << 16
+                position += 1
+            if command & 0x08:
+                offset |= delta[position] << 24
+                position += 1
+            if command & 0x10:
+                length = delta[position]
+                position += 1
+            if command & 0x20:
+                length |= delta[position] << 8
+                position += 1
+            if command & 0x40:
+                length |= delta[position] << 16
+                position += 1
+            result += source[offset : offset + (length or 0x10000)]
+        elif command:
+            result += delta[position : position + command]
+            position += command
+        else:
+            raise ValueError("Invalid delta instruction")
+
+    if len(result) != size:
+        raise ValueError("Delta result has unexpected size")
+    return bytes(result)
+
+
+def _read_delta_size(delta: bytes, position: int) -> tuple[int, int]:
+    """
+    Parse a size in a delta header.
+
+    Returns the size and the position after it.
+    """
+    size: int = 0
+    shift: int = 0
+    while True:
+        byte: int = delta[position]
+        position += 1
+        size |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return size, position
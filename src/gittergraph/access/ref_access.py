@@ -0,0 +1,184 @@
+"""
+Reference access operations.
+
+Provides a bulk reference loader that reads packed-refs and loose refs directly from the git directory in a single pass, without per-reference object lookups.
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import pygit2
+
+from gittergraph.access.base_access import BaseAccess
+from gittergraph.access.identity_pool import IdentityPool
+from gittergraph.access.ref_filter import RefFilter
+
+
+@dataclass(slots=True, frozen=True)
+class RefRecord:
+    """
+    Raw reference data.
+
+    Stores a reference name and target ID. When is_peeled is set, peeled_id holds the commit an annotated tag points to, or None if the target is not an annotated tag.
+    """
+
+    name: str
+    target_id: str
+    peeled_id: str | None = None
+    is_peeled: bool = False
+
+
+class RefAccess(BaseAccess):  # pylint: disable=too-few-public-methods
+    """
+    Access layer for bulk reference loading.
+
+    Reads packed-refs (including peeled lines of annotated tags) and loose refs once, producing raw reference records for branch and tag models.
+    References rejected by the filter are skipped before they are read. Reference names are pooled, so repeated loads share name strings.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        ref_filter: RefFilter | None = None,
+        pool: IdentityPool | None = None,
+    ) -> None:
+        """
+        Initialize reference access.
+
+        Stores the reference filter and string pool, and resets the hidden reference counter.
+        """
+        super().__init__(path)
+        self.ref_filter: RefFilter = ref_filter or RefFilter()
+        self.pool: IdentityPool = pool if pool is not None else IdentityPool()
+        self.hidden_count: int = 0
+
+    def get_all(self) -> dict[str, RefRecord]:
+        """
+        Get all direct references.
+
+        Returns a dictionary of reference records sorted by name. Loose refs take precedence over packed ones and symbolic refs are skipped.
+        The number of references rejected by the filter is stored in hidden_count.
+        """
+        hidden: set[str] = set()
+        records: dict[str, RefRecord] = self._load(hidden)
+        self.hidden_count = len(hidden)
+        return records
+
+    def _load(self, hidden: set[str]) -> dict[str, RefRecord]:
+        """
+        Load references from the most suitable source.
+
+        Collects names of filtered out references into hidden.
+        """
+        common_dir: Path = self._get_common_dir()
+
+        # Repositories using the reftable backend have no files to parse
+        if (common_dir / "reftable").is_dir():
+            return self._get_all_from_repository(hidden)
+
+        records: dict[str, RefRecord] = self._read_packed_refs(
+            common_dir / "packed-refs", hidden
+        )
+        records.update(self._read_loose_refs(common_dir, hidden))
+        return dict(sorted(records.items()))
+
+    def _read_packed_refs(self, path: Path, hidden: set[str]) -> dict[str, RefRecord]:
+        """
+        Parse a packed-refs file.
+
+        Uses the header traits to decide whether missing peeled lines mean a reference is not an annotated tag.
+        """
+        records: dict[str, RefRecord] = {}
+        try:
+            with open(path, encoding="utf-8", errors="surrogateescape") as file:
+                lines: list[str] = file.read().splitlines()
+        except OSError:
+            return records
+
+        traits: list[str] = []
+        last: RefRecord | None = None
+        for line in lines:
+            if line.startswith("#"):
+                if line.startswith("# pack-refs with:"):
+                    traits = line.removeprefix("# pack-refs with:").split()
+                continue
+
+            if line.startswith("^"):
+                # Peeled line applies to the preceding reference
+                if last is not None:
+                    last = RefRecord(last.name, last.target_id, line[1:], True)
+                    records[last.name] = last
+                continue
+
+            target_id, _, name = line.partition(" ")
+            if not name:
+                continue
+
+            if not self.ref_filter.matches(name):
+                hidden.add(name)
+                last = None
+                continue
+
+            is_peeled: bool = "fully-peeled" in traits or (
+                "peeled" in traits and name.startswith("refs/tags/")
+            )
+            last = RefRecord(self.pool.intern(name), target_id, None, is_peeled)
+            records[last.name] = last
+
+        return records
+
+    def _read_loose_refs(
+        self, common_dir: Path, hidden: set[str]
+    ) -> dict[str, RefRecord]:
+        """
+        Read loose reference files.
+
+        Walks the refs directory and returns records for all direct references. Loose refs carry no peeled information.
+        """
+        records: dict[str, RefRecord] = {}
+        refs_dir: Path = common_dir / "refs"
+
+        for dir_path, _, file_names in os.walk(refs_dir):
+            for file_name in file_names:
+                if file_name.endswith(".lock"):
+                    continue
+
+                file_path: str = os.path.join(dir_path, file_name)
+                name: str = os.path.relpath(file_path, common_dir).replace(os.sep, "/")
+                if not self.ref_filter.matches(name):
+                    hidden.add(name)
+                    continue
+
+                try:
+                    with open(file_path, encoding="utf-8") as file:
+                        content: str = file.read().strip()
+                except (OSError, UnicodeDecodeError):
+                    continue
+
+                # Symbolic refs are not branches or tags in their own right
+                if not content or content.startswith("ref:"):
+                    continue
+
+                name = self.pool.intern(name)
+                records[name] = RefRecord(name, content)
+
+        return records
+
+    def _get_all_from_repository(self, hidden: set[str]) -> dict[str, RefRecord]:
+        """
+        Get all direct references through libgit2.
+
+        Fallback for reference storage formats that cannot be parsed directly.
+        """
+        records: dict[str, RefRecord] = {}
+        for name in self._repo.references:
+            if not self.ref_filter.matches(name):
+                hidden.add(name)
+                continue
+
+            ref: pygit2.Reference = self._repo.references[name]
+            if ref.type == pygit2.enums.ReferenceType.DIRECT:
+                name = self.pool.intern(ref.name)
+                records[name] = RefRecord(name, str(ref.target))
+        return dict(sorted(records.items()))
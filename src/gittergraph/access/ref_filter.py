@@ -0,0 +1,67 @@
+"""
+Reference namespace filtering.
+
+Provides the RefFilter class for including or excluding references by glob pattern before they are resolved or walked.
+"""
+
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+
+import pygit2
+
+
+@dataclass(slots=True, frozen=True)
+class RefFilter:
+    """
+    Include/exclude filter for reference names.
+
+    Patterns are shell-style globs matched against full reference names, where '*' also matches '/'. A reference is kept if it matches any include pattern (or no include patterns are set) and matches no exclude pattern.
+    """
+
+    include: tuple[str, ...] = ()
+    exclude: tuple[str, ...] = ()
+
+    INCLUDE_CONFIG_KEY = "gittergraph.includeRefs"
+    EXCLUDE_CONFIG_KEY = "gittergraph.excludeRefs"
+
+    @classmethod
+    def from_config(cls, config: pygit2.Config) -> "RefFilter":
+        """
+        Create a filter from git configuration.
+
+        Reads the multi-valued gittergraph.includeRefs and gittergraph.excludeRefs keys.
+        """
+        return cls(
+            include=tuple(str(v) for v in config.get_multivar(cls.INCLUDE_CONFIG_KEY)),
+            exclude=tuple(str(v) for v in config.get_multivar(cls.EXCLUDE_CONFIG_KEY)),
+        )
+
+    def merged(self, other: "RefFilter") -> "RefFilter":
+        """
+        Combine two filters.
+
+        Returns a filter with the patterns of both filters.
+        """
+        return RefFilter(
+            include=self.include + other.include,
+            exclude=self.exclude + other.exclude,
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        Check if the filter has no patterns.
+
+        Returns True if every reference is kept.
+        """
+        return not self.include and not self.exclude
+
+    def matches(self, name: str) -> bool:
+        """
+        Check if a reference is kept by the filter.
+
+        Returns True if the reference name passes the include and exclude patterns.
+        """
+        if self.include and not any(fnmatchcase(name, p) for p in self.include):
+            return False
+        return not any(fnmatchcase(name, p) for p in self.exclude)
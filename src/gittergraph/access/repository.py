@@ -6,61 +6,175 @@ Repository access operations.
 Provides unified access to all git repository data through specialized access layers.
 """
 
+import os
+from collections.abc import Callable
 from pathlib import Path
 
 import pygit2
 
+from gittergraph.access.backend import Backend, get_backend, get_configured_backend
 from gittergraph.access.branch_access import BranchAccess
 from gittergraph.access.commit_access import CommitAccess
+from gittergraph.access.diff_access import DiffAccess
+from gittergraph.access.fingerprint_access import (
+    FingerprintAccess,
+    RepositoryFingerprint,
+)
 from gittergraph.access.head_access import HeadAccess
+from gittergraph.access.identity_pool import IdentityPool
+from gittergraph.access.ref_access import RefAccess
+from gittergraph.access.ref_filter import RefFilter
+from gittergraph.access.repository_watcher import RepositoryWatcher
 from gittergraph.access.tag_access import TagAccess
 
 
-class GitRepository:
+class GitRepository:  # pylint: disable=too-many-instance-attributes
     """
     Git repository access operations.
 
     Provides a unified interface to all repository data access operations
-    through specialized access layers for commits, branches, tags, and HEAD.
+    through specialized access layers for references, commits, branches, tags, HEAD, and diffs.
     """
 
-    def __init__(self, path: str | Path) -> None:
+    def __init__(
+        self,
+        path: str | Path,
+        ref_filter: RefFilter | None = None,
+        backend: str | None = None,
+        jobs: int = 1,
+    ) -> None:
         """
         Initialize repository access.
 
-        Sets up repository and access layers for commits, branches, tags, and HEAD.
+        Sets up repository and access layers for commits, branches, tags, and HEAD. The given reference filter is combined with the gittergraph.includeRefs and gittergraph.excludeRefs settings from git configuration.
+        Commits and references are loaded through the named backend, or the one set by gittergraph.backend if none is given. Raises ValueError for an unknown backend.
+        With more than one job, the pygit2 backend decodes commits in that many processes.
         """
         self.path: Path = Path(path)
         self._repo: pygit2.Repository = pygit2.Repository(str(self.path))
+        self.backend: Backend = (
+            get_backend(backend)
+            if backend is not None
+            else get_configured_backend(self._repo.config)
+        )
+        self.ref_filter: RefFilter = RefFilter.from_config(self._repo.config).merged(
+            ref_filter or RefFilter()
+        )
+
+        # Names, emails and reference names are shared across all loads
+        self.identities: IdentityPool = IdentityPool()
 
         # Initialize access components
-        self.commits: CommitAccess = CommitAccess(self.path)
+        self.refs: RefAccess = self.backend.ref_access(
+            self.path, self.ref_filter, self.identities
+        )
+        self.jobs: int = jobs
+        self.commits: CommitAccess = self.backend.commit_access(
+            self.path, self.identities, jobs
+        )
         self.branches: BranchAccess = BranchAccess(self.path)
         self.tags: TagAccess = TagAccess(self.path)
         self.head: HeadAccess = HeadAccess(self.path)
+        self.diffs: DiffAccess = DiffAccess(self.path)
+        self.fingerprints: FingerprintAccess = FingerprintAccess(self.path)
 
     @classmethod
-    def discover(cls, start_path: str | Path = ".") -> "GitRepository | None":
+    def discover(
+        cls,
+        start_path: str | Path = ".",
+        ref_filter: RefFilter | None = None,
+        backend: str | None = None,
+        jobs: int = 1,
+    ) -> "GitRepository | None":
         """
         Discover a git repository starting from a directory.
 
         Searches upward from start_path for a .git directory and returns a GitRepository instance if found.
         """
         repo_path: str | None = pygit2.discover_repository(str(start_path))
-        return cls(repo_path) if repo_path is not None else None
+        return (
+            cls(repo_path, ref_filter, backend, jobs) if repo_path is not None else None
+        )
+
+    @staticmethod
+    def find_all(root: str | Path, max_depth: int = 3) -> list[Path]:
+        """
+        Find the repositories under a directory.
+
+        Looks for working trees with a .git entry and bare repositories up to max_depth levels below root, without descending into repositories
+        or hidden directories. Returns the repository paths sorted by path.
+        """
+        found: list[Path] = []
+        pending: list[tuple[Path, int]] = [(Path(root), 0)]
+        while pending:
+            directory, depth = pending.pop()
+            if (directory / ".git").exists() or _is_bare_repository(directory):
+                found.append(directory)
+                continue
+            if depth >= max_depth:
+                continue
+            try:
+                entries: list[os.DirEntry[str]] = list(os.scandir(directory))
+            except OSError:
+                continue
+            pending.extend(
+                (Path(entry.path), depth + 1)
+                for entry in entries
+                if not entry.name.startswith(".")
+                and entry.is_dir(follow_symlinks=False)
+            )
+        return sorted(found)
 
     def reload(self):
         """
         Reload repository to detect external changes.
 
-        Reinitializes all access layers with a fresh repository object.
+        Reinitializes all access layers with a fresh repository object. The identity pool is kept, so identity IDs stay stable.
+        The previous commit access layer is closed, so packfiles mapped for it are released.
         """
         self._repo = pygit2.Repository(str(self.path))
-        self.commits = CommitAccess(self.path)
+        self.refs = self.backend.ref_access(self.path, self.ref_filter, self.identities)
+        previous_commits: CommitAccess = self.commits
+        self.commits = self.backend.commit_access(self.path, self.identities, self.jobs)
+        previous_commits.close()
         self.branches = BranchAccess(self.path)
         self.tags = TagAccess(self.path)
         self.head = HeadAccess(self.path)
 
+        # Keep the diff cache so its counters survive reloads
+        self.diffs = DiffAccess(self.path, self.diffs.cache)
+        self.fingerprints = FingerprintAccess(self.path)
+
+    def resolve(self, revision: str) -> str | None:
+        """
+        Resolve a revision to a commit ID without loading any history.
+
+        Accepts anything git rev-parse does, such as HEAD, branch and tag names, and abbreviated IDs. Tags are peeled.
+        Returns None if the revision does not resolve to a commit.
+        """
+        try:
+            return str(self._repo.revparse_single(revision).peel(pygit2.Commit).id)
+        except (pygit2.InvalidSpecError, KeyError, ValueError):
+            return None
+
+    def get_fingerprint(self) -> RepositoryFingerprint:
+        """
+        Get the current fingerprint of the repository's references.
+
+        Cheap enough to call on every reload request, as it only reads file metadata and ref tips.
+        """
+        return self.fingerprints.get()
+
+    def watch(
+        self, on_change: Callable[[], None], use_inotify: bool = True
+    ) -> RepositoryWatcher:
+        """
+        Create a watcher for changes to the repository's references.
+
+        The returned watcher calls on_change from a background thread once started. Uses polling if use_inotify is False or inotify is unavailable.
+        """
+        return RepositoryWatcher(self.path, on_change, use_inotify=use_inotify)
+
     def is_empty(self) -> bool:
         """
         Check if repository has no commits.
@@ -68,3 +182,16 @@ class GitRepository:
         Returns True if the repository is empty, otherwise False.
         """
         return self._repo.is_empty
+
+
+def _is_bare_repository(path: Path) -> bool:
+    """
+    Check if a directory looks like a bare repository.
+
+    Only checks for the HEAD file and the objects and refs directories, without opening the repository.
+    """
+    return (
+        (path / "HEAD").is_file()
+        and (path / "objects").is_dir()
+        and (path / "refs").is_dir()
+    )
@@ -0,0 +1,341 @@
+"""
+Repository change watching.
+
+Provides the RepositoryWatcher class, which monitors HEAD, packed-refs, refs/ and logs/ for changes using inotify where available and polling the repository fingerprint otherwise.
+Bursts of events are coalesced so that a single callback is made per burst.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from gittergraph.access.base_access import BaseAccess
+from gittergraph.access.fingerprint_access import (
+    FingerprintAccess,
+    RepositoryFingerprint,
+)
+
+# inotify constants from <sys/inotify.h>
+_IN_MODIFY: int = 0x00000002
+_IN_ATTRIB: int = 0x00000004
+_IN_CLOSE_WRITE: int = 0x00000008
+_IN_MOVED_FROM: int = 0x00000040
+_IN_MOVED_TO: int = 0x00000080
+_IN_CREATE: int = 0x00000100
+_IN_DELETE: int = 0x00000200
+_IN_Q_OVERFLOW: int = 0x00004000
+_IN_ISDIR: int = 0x40000000
+_IN_NONBLOCK: int = 0o4000
+_IN_CLOEXEC: int = 0o2000000
+_WATCH_MASK: int = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+)
+_EVENT_HEADER: struct.Struct = struct.Struct("iIII")
+
+# Files in the git directory itself whose changes move references
+_ROOT_FILES: frozenset[str] = frozenset({"HEAD", "packed-refs"})
+_TREE_DIRS: tuple[str, ...] = ("refs", "logs", "reftable")
+
+
+class RepositoryWatcher(BaseAccess):  # pylint: disable=too-many-instance-attributes
+    """
+    Background watcher for reference changes.
+
+    Calls on_change from a background thread once a burst of changes has settled for debounce seconds, or after max_delay seconds of continuous changes.
+    Uses inotify on Linux and falls back to polling the repository fingerprint every poll_interval seconds.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        path: Path | str,
+        on_change: Callable[[], None],
+        debounce: float = 0.25,
+        max_delay: float = 2.0,
+        poll_interval: float = 1.0,
+        use_inotify: bool = True,
+    ) -> None:
+        """
+        Initialize repository watcher.
+
+        The watcher does not run until started.
+        """
+        super().__init__(path)
+        self.on_change: Callable[[], None] = on_change
+        self.debounce: float = debounce
+        self.max_delay: float = max_delay
+        self.poll_interval: float = poll_interval
+
+        self._git_dir: Path = Path(self._repo.path)
+        self._common_dir: Path = self._get_common_dir()
+        self._fingerprints: FingerprintAccess = FingerprintAccess(path)
+        self._fingerprint: RepositoryFingerprint | None = None
+        self._stop_event: threading.Event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._inotify: _Inotify | None = None
+        if use_inotify:
+            self._inotify = _Inotify.create()
+
+    @property
+    def backend(self) -> str:
+        """
+        Name of the change detection backend.
+
+        Returns 'inotify' or 'polling'.
+        """
+        return "inotify" if self._inotify is not None else "polling"
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Check if the watcher thread is running.
+
+        Returns True between start and stop.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """
+        Start watching in a background thread.
+
+        Does nothing if the watcher is already running.
+        """
+        if self.is_running:
+            return
+
+        self._stop_event.clear()
+        if self._inotify is not None:
+            for directory in dict.fromkeys((self._git_dir, self._common_dir)):
+                self._inotify.add_watch(directory, is_root=True)
+                for name in _TREE_DIRS:
+                    self._inotify.add_tree(directory / name)
+        else:
+            self._fingerprint = self._fingerprints.get()
+
+        self._thread = threading.Thread(
+            target=self._run, name="gittergraph-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop watching and wait for the background thread to finish.
+
+        Releases the inotify instance. A stopped watcher cannot be restarted.
+        """
+        self._stop_event.set()
+        if self._inotify is not None:
+            self._inotify.wake()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def _run(self) -> None:
+        """
+        Watch loop of the background thread.
+
+        Collects changes and calls on_change once per settled burst.
+        """
+        first_change: float | None = None
+        last_change: float = 0.0
+
+        while not self._stop_event.is_set():
+            timeout: float = self.poll_interval
+            if first_change is not None:
+                timeout = max(
+                    0.0,
+                    min(last_change + self.debounce, first_change + self.max_delay)
+                    - time.monotonic(),
+                )
+
+            changed: bool = self._wait_for_change(timeout)
+            now: float = time.monotonic()
+            if changed:
+                last_change = now
+                if first_change is None:
+                    first_change = now
+
+            if first_change is not None and (
+                now - last_change >= self.debounce
+                or now - first_change >= self.max_delay
+            ):
+                first_change = None
+                if not self._stop_event.is_set():
+                    self.on_change()
+
+    def _wait_for_change(self, timeout: float) -> bool:
+        """
+        Wait up to timeout seconds for a change.
+
+        Returns True if a relevant change was detected.
+        """
+        if self._inotify is not None:
+            return self._inotify.wait(timeout)
+
+        if self._stop_event.wait(min(timeout, self.poll_interval)):
+            return False
+
+        fingerprint: RepositoryFingerprint = self._fingerprints.get()
+        if fingerprint == self._fingerprint:
+            return False
+        self._fingerprint = fingerprint
+        return True
+
+
+class _Inotify:
+    """
+    Minimal inotify binding.
+
+    Watches root git directories for HEAD and packed-refs, and directory trees such as refs/ recursively, adding watches for new subdirectories.
+    """
+
+    def __init__(self, libc: ctypes.CDLL, fd: int) -> None:
+        """
+        Wrap an inotify file descriptor.
+
+        Creates a pipe used to wake up a blocked wait.
+        """
+        self._libc: ctypes.CDLL = libc
+        self._fd: int = fd
+        self._wake_read, self._wake_write = os.pipe()
+        self._watches: dict[int, tuple[Path, bool]] = {}
+
+    @classmethod
+    def create(cls) -> "_Inotify | None":
+        """
+        Create an inotify instance.
+
+        Returns None if inotify is not available on this platform.
+        """
+        if not sys.platform.startswith("linux"):
+            return None
+
+        try:
+            libc: ctypes.CDLL = ctypes.CDLL(
+                ctypes.util.find_library("c") or "libc.so.6", use_errno=True
+            )
+            fd: int = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        return cls(libc, fd) if fd >= 0 else None
+
+    def add_watch(self, directory: Path, is_root: bool = False) -> bool:
+        """
+        Watch a single directory.
+
+        Root directories only report changes to HEAD and packed-refs, other directories report all changes. Returns False if the directory cannot be watched.
+        """
+        wd: int = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(directory), _WATCH_MASK
+        )
+        if wd < 0:
+            return False
+        self._watches[wd] = (directory, is_root)
+        return True
+
+    def add_tree(self, directory: Path) -> None:
+        """
+        Watch a directory and all of its subdirectories.
+
+        Missing directories are skipped.
+        """
+        for dir_path, _, _ in os.walk(directory):
+            self.add_watch(Path(dir_path))
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Wait up to timeout seconds for events.
+
+        Returns True if a relevant event was read.
+        """
+        try:
+            readable, _, _ = select.select([self._fd, self._wake_read], [], [], timeout)
+        except (OSError, ValueError):
+            return False
+
+        if self._wake_read in readable:
+            os.read(self._wake_read, 64)
+        if self._fd not in readable:
+            return False
+
+        try:
+            data: bytes = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return False
+        return self._parse(data)
+
+    def _parse(self, data: bytes) -> bool:
+        """
+        Parse a buffer of inotify events.
+
+        Adds watches for new directories in watched trees and returns True if any event is relevant.
+        """
+        relevant: bool = False
+        offset: int = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name: str = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                relevant = True
+                continue
+
+            watch: tuple[Path, bool] | None = self._watches.get(wd)
+            if watch is None or name.endswith(".lock"):
+                continue
+
+            directory, is_root = watch
+            if is_root:
+                if mask & _IN_ISDIR and name in _TREE_DIRS:
+                    self.add_tree(directory / name)
+                    relevant = True
+                elif name in _ROOT_FILES:
+                    relevant = True
+                continue
+
+            if mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO):
+                self.add_tree(directory / name)
+            relevant = True
+
+        return relevant
+
+    def wake(self) -> None:
+        """
+        Wake up a blocked wait.
+
+        Used when stopping the watcher.
+        """
+        try:
+            os.write(self._wake_write, b"\0")
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        """
+        Release the inotify instance and wake-up pipe.
+
+        The instance cannot be used afterwards.
+        """
+        for fd in (self._fd, self._wake_read, self._wake_write):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
@@ -8,7 +8,8 @@ Provides access layer for retrieving and converting git tag objects.
 import pygit2
 
 from gittergraph.access.base_access import BaseAccess
-from gittergraph.models import Tag
+from gittergraph.access.ref_access import RefAccess, RefRecord
+from gittergraph.models import Signature, Tag, TagAnnotation
 
 
 class TagAccess(BaseAccess):
@@ -25,35 +26,95 @@ class TagAccess(BaseAccess):
         Transforms a pygit2.Reference object into a Tag dataclass instance.
         Raises KeyError if the reference target is not found, ValueError if not a tag.
         """
-        obj: pygit2.Object | None = self._repo.get(ref.target)
+        return self._peel(ref.name, str(ref.target))
+
+    def from_record(self, record: RefRecord) -> Tag:
+        """
+        Convert a reference record to a Tag model.
+
+        Uses the peeled ID from packed-refs when available and only looks up the target object otherwise.
+        Raises KeyError if the reference target is not found, ValueError if not a tag.
+        """
+        if record.is_peeled:
+            if record.peeled_id is None:
+                return Tag(target_id=record.target_id, name=record.name)
+
+            return Tag(
+                target_id=record.peeled_id,
+                name=record.name,
+                object_id=record.target_id,
+            )
+
+        return self._peel(record.name, record.target_id)
+
+    def _peel(self, name: str, target_id: str) -> Tag:
+        """
+        Build a Tag model by looking up the reference target.
+
+        Annotated tags are peeled to the object they point to.
+        Raises KeyError if the target is not found, ValueError if not a tag.
+        """
+        obj: pygit2.Object | None = self._repo.get(target_id)
 
         if obj is None:
-            raise KeyError(f"Reference '{ref.name}' not found")
+            raise KeyError(f"Reference '{name}' not found")
 
         if not isinstance(obj, pygit2.Commit) and not isinstance(obj, pygit2.Tag):
-            raise ValueError(f"Reference '{ref.name}' is not a tag")
+            raise ValueError(f"Reference '{name}' is not a tag")
 
-        target_id: str = str(obj.target) if isinstance(obj, pygit2.Tag) else str(obj.id)
-        return Tag(
-            target_id=target_id,
-            name=ref.name,
-        )
+        if isinstance(obj, pygit2.Tag):
+            return Tag(target_id=str(obj.target), name=name, object_id=target_id)
+
+        return Tag(target_id=target_id, name=name)
 
-    def get_all(self) -> dict[str, Tag]:
+    def get_all(self, refs: dict[str, RefRecord] | None = None) -> dict[str, Tag]:
         """
         Get all tags that point directly to commits.
 
-        Walks all references and collects all tags into a dictionary mapping full tag names to Tag objects.
+        Returns a dictionary mapping full tag names to Tag objects. Uses the given reference records, or loads them in bulk if not provided.
         """
-        tags: dict[str, Tag] = {}
+        if refs is None:
+            refs = RefAccess(self.path).get_all()
 
-        for ref in self._repo.references.objects:
-            ref_name: str = ref.name
-            if ref_name.startswith("refs/tags/"):
-                tags[ref_name] = self.to_model(ref)
+        tags: dict[str, Tag] = {}
+        for name, record in refs.items():
+            if name.startswith("refs/tags/"):
+                tags[name] = self.from_record(record)
 
         return tags
 
+    def get_annotation(self, tag: Tag) -> TagAnnotation | None:
+        """
+        Load the metadata of an annotated tag.
+
+        Inflates the tag object on demand. Returns None for lightweight tags.
+        Raises KeyError if the tag object is not found.
+        """
+        if tag.object_id is None:
+            return None
+
+        obj: pygit2.Object | None = self._repo.get(tag.object_id)
+        if obj is None:
+            raise KeyError(f"Tag object '{tag.object_id}' not found")
+
+        if not isinstance(obj, pygit2.Tag):
+            return None
+
+        tagger: Signature | None = None
+        if obj.tagger is not None:
+            tagger = Signature(
+                name=obj.tagger.name,
+                email=obj.tagger.email,
+                time=obj.tagger.time,
+                time_offset=obj.tagger.offset,
+            )
+
+        return TagAnnotation(
+            name=tag.name,
+            tagger=tagger,
+            message=(obj.message or "").strip(),
+        )
+
     def get(self, name: str) -> Tag:
         """
         Get a tag by its full reference name.
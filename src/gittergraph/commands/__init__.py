@@ -0,0 +1,9 @@
+"""
+Headless commands for gittergraph.
+
+Provides commands that write repository data to streams and files instead of starting the interface.
+"""
+
+from .export import FORMATS, get_format, write_columns
+from .graph_lanes import GraphLanes
+from .log import write_log
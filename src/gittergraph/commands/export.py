@@ -0,0 +1,138 @@
+"""
+Columnar graph export.
+
+Provides the write_columns function, which writes the columns of a commit graph to a NumPy .npz archive or an Arrow IPC file.
+"""
+
+import importlib
+import json
+from array import array
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from gittergraph.core import GraphColumns
+
+# Export formats, by name
+FORMATS: tuple[str, ...] = ("npz", "arrow")
+
+# File suffixes that select the Arrow IPC format
+_ARROW_SUFFIXES: tuple[str, ...] = (".arrow", ".arrows", ".feather", ".ipc")
+
+
+def get_format(path: Path | str) -> str:
+    """
+    Choose the export format for an output file.
+
+    Returns arrow for Arrow IPC suffixes, and npz otherwise.
+    """
+    return "arrow" if Path(path).suffix.lower() in _ARROW_SUFFIXES else "npz"
+
+
+def write_columns(
+    columns: GraphColumns,
+    path: Path | str,
+    file_format: str = "npz",
+    compress: bool = False,
+) -> None:
+    """
+    Write graph columns to a file.
+
+    The .npz format needs numpy and is compressed with deflate, and the Arrow IPC format needs pyarrow and is compressed with zstd.
+    Raises ImportError if the library for the format is not installed, and ValueError for an unknown format.
+    """
+    match file_format:
+        case "npz":
+            _write_npz(columns, path, compress)
+        case "arrow":
+            _write_arrow(columns, path, compress)
+        case _:
+            raise ValueError(f"Unknown export format '{file_format}'")
+
+
+def _write_npz(columns: GraphColumns, path: Path | str, compress: bool) -> None:
+    """
+    Write graph columns to a NumPy .npz archive.
+
+    Stores one array per column. Integer columns are wrapped without copying, and strings are stored as fixed-width unicode arrays, so the archive loads without pickle.
+    """
+    numpy: ModuleType = _import("numpy", "npz")
+    arrays: dict[str, Any] = {
+        "oids": numpy.frombuffer(columns.oids, dtype=numpy.uint8).reshape(
+            -1, columns.oid_size
+        ),
+        "parent_offsets": numpy.frombuffer(columns.parent_offsets, dtype=numpy.int64),
+        "parent_rows": numpy.frombuffer(columns.parent_rows, dtype=numpy.int64),
+        "commit_times": numpy.frombuffer(columns.commit_times, dtype=numpy.int64),
+        "author_ids": numpy.frombuffer(columns.author_ids, dtype=numpy.int64),
+        "author_names": numpy.array([name for name, _ in columns.authors], dtype=str),
+        "author_emails": numpy.array(
+            [email for _, email in columns.authors], dtype=str
+        ),
+        "ref_names": numpy.array(columns.ref_names, dtype=str),
+        "ref_rows": numpy.frombuffer(columns.ref_rows, dtype=numpy.int64),
+    }
+
+    # Writing to an open file keeps numpy from appending a suffix to the path
+    with open(path, "wb") as file:
+        (numpy.savez_compressed if compress else numpy.savez)(file, **arrays)
+
+
+def _write_arrow(columns: GraphColumns, path: Path | str, compress: bool) -> None:
+    """
+    Write graph columns to an Arrow IPC file.
+
+    Writes one table with a row per commit, with the parent rows as a list column over the flat arrays. Authors and reference tips
+    are stored as JSON in the schema metadata, since they do not have a row per commit.
+    """
+    pyarrow: ModuleType = _import("pyarrow", "Arrow IPC")
+    ipc: ModuleType = _import("pyarrow.ipc", "Arrow IPC")
+    count: int = len(columns)
+
+    def int64_column(values: array) -> Any:
+        return pyarrow.Array.from_buffers(
+            pyarrow.int64(), len(values), [None, pyarrow.py_buffer(values)]
+        )
+
+    table = pyarrow.table(
+        {
+            "oid": pyarrow.Array.from_buffers(
+                pyarrow.binary(columns.oid_size),
+                count,
+                [None, pyarrow.py_buffer(columns.oids)],
+            ),
+            "parents": pyarrow.LargeListArray.from_arrays(
+                int64_column(columns.parent_offsets),
+                int64_column(columns.parent_rows),
+            ),
+            "commit_time": int64_column(columns.commit_times),
+            "author_id": int64_column(columns.author_ids),
+        }
+    ).replace_schema_metadata(
+        {
+            "gittergraph.authors": json.dumps(columns.authors),
+            "gittergraph.refs": json.dumps(
+                dict(zip(columns.ref_names, columns.ref_rows))
+            ),
+        }
+    )
+
+    options = ipc.IpcWriteOptions(compression="zstd" if compress else None)
+    with pyarrow.OSFile(str(path), "wb") as sink:
+        with ipc.new_file(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+
+
+def _import(module: str, file_format: str) -> ModuleType:
+    """
+    Import the library needed for an export format.
+
+    Raises ImportError with installation instructions if it is missing.
+    """
+    try:
+        return importlib.import_module(module)
+    except ImportError as error:
+        package: str = module.partition(".")[0]
+        raise ImportError(
+            f"Exporting to {file_format} requires {package} (pip install {package})"
+        ) from error
@@ -0,0 +1,89 @@
+"""
+Graph lane layout for text output.
+
+Provides the GraphLanes class, which draws the branch and merge lines to the left of each commit as commits are printed one at a time.
+"""
+
+
+class GraphLanes:  # pylint: disable=too-few-public-methods
+    """
+    Incremental lane layout for a stream of commits.
+
+    Each lane holds the ID of the commit it leads to, or None if it is free. Lanes keep their column until they end, so
+    only the lines around the current commit are redrawn. Lanes that end in the same commit converge into its column.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize lane layout.
+
+        Starts with no lanes.
+        """
+        self._lanes: list[str | None] = []
+
+    def layout(
+        self, commit_id: str, parent_ids: list[str]
+    ) -> tuple[list[str], str, list[str]]:
+        """
+        Lay out the next commit.
+
+        Returns the rows to print before the commit, the prefix of the commit's own row, and the rows to print after it.
+        Commits should be laid out children first.
+        """
+        matching: list[int] = [
+            index for index, lane in enumerate(self._lanes) if lane == commit_id
+        ]
+        column: int = matching[0] if matching else self._free_lane(0)
+
+        # Other lanes leading to this commit merge into its column
+        before_rows: list[str] = []
+        if len(matching) > 1:
+            before_rows.append(self._draw({index: "/" for index in matching[1:]}))
+            for index in matching[1:]:
+                self._lanes[index] = None
+
+        prefix: str = " ".join(
+            "*" if index == column else "|" if lane is not None else " "
+            for index, lane in enumerate(self._lanes)
+        )
+
+        self._lanes[column] = parent_ids[0] if parent_ids else None
+
+        # Merged parents that no lane leads to yet branch off to the right
+        opened: dict[int, str] = {}
+        for parent_id in parent_ids[1:]:
+            if parent_id not in self._lanes:
+                lane: int = self._free_lane(column + 1)
+                self._lanes[lane] = parent_id
+                opened[lane] = "\\"
+        after_rows: list[str] = [self._draw(opened)] if opened else []
+
+        while self._lanes and self._lanes[-1] is None:
+            self._lanes.pop()
+        return before_rows, prefix.rstrip(), after_rows
+
+    def _free_lane(self, start: int) -> int:
+        """
+        Find a free lane at or right of a column.
+
+        Appends a new lane if all of them are taken.
+        """
+        for index in range(start, len(self._lanes)):
+            if self._lanes[index] is None:
+                return index
+        self._lanes.append(None)
+        return len(self._lanes) - 1
+
+    def _draw(self, diagonals: dict[int, str]) -> str:
+        """
+        Draw a row between commits.
+
+        Draws the given diagonal just left of its lane, and a vertical line for every other lane in use.
+        """
+        row: list[str] = [" "] * (2 * len(self._lanes))
+        for index, lane in enumerate(self._lanes):
+            if index in diagonals:
+                row[2 * index - 1] = diagonals[index]
+            elif lane is not None:
+                row[2 * index] = "|"
+        return "".join(row).rstrip()
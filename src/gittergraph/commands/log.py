@@ -0,0 +1,173 @@
+"""
+Headless history output.
+
+Provides the write_log function, which streams the history of a revision as text or JSON Lines without loading a graph.
+"""
+
+import json
+from collections.abc import Callable, Iterator, Mapping
+from typing import TextIO
+
+from gittergraph.access import GitRepository
+from gittergraph.commands.graph_lanes import GraphLanes
+from gittergraph.models import Commit, Signature
+
+
+def write_log(  # pylint: disable=too-many-arguments
+    repo: GitRepository,
+    revision: str,
+    output: TextIO,
+    *,
+    first_parent: bool = True,
+    graph: bool = False,
+    json_lines: bool = False,
+    max_count: int | None = None,
+    since: int | None = None,
+    commits: Mapping[str, Commit] | None = None,
+) -> int:
+    """
+    Write the history of a revision to a stream.
+
+    Follows the first-parent chain, or walks the full history newest first, with children always before their parents, if first_parent is False.
+    Commits are read and written one at a time, so memory does not grow with the output. The full history is first sorted in a walk that reads only commit headers,
+    which delays the first line by the time it takes to read every reachable commit once.
+    Commits found in commits, such as those taken over from a daemon, are read from it instead of the repository. Returns the number of commits written.
+    Raises ValueError if the revision does not resolve to a commit.
+    """
+    start_id: str | None = repo.resolve(revision)
+    if start_id is None:
+        raise ValueError(f"Unknown revision '{revision}'")
+
+    get_commit: Callable[[str], Commit] = _get_reader(repo, commits)
+    history: Iterator[Commit] = (
+        _iter_first_parent(get_commit, start_id, since)
+        if first_parent
+        else _iter_by_date(repo, get_commit, start_id, since)
+    )
+    lanes: GraphLanes | None = GraphLanes() if graph else None
+    count: int = 0
+    for commit in history:
+        if max_count is not None and count >= max_count:
+            break
+        if json_lines:
+            output.write(json.dumps(_to_json(commit)) + "\n")
+        elif lanes is not None:
+            _write_graph_rows(output, commit, lanes)
+        else:
+            output.write(_format(commit) + "\n")
+        count += 1
+    return count
+
+
+def _get_reader(
+    repo: GitRepository, commits: Mapping[str, Commit] | None
+) -> Callable[[str], Commit]:
+    """
+    Get a function reading commits by ID.
+
+    Reads from commits where found, and from the repository otherwise.
+    """
+    if commits is None:
+        return repo.commits.get
+
+    def get_commit(commit_id: str) -> Commit:
+        commit: Commit | None = commits.get(commit_id)
+        return commit if commit is not None else repo.commits.get(commit_id)
+
+    return get_commit
+
+
+def _iter_first_parent(
+    get_commit: Callable[[str], Commit], start_id: str, since: int | None
+) -> Iterator[Commit]:
+    """
+    Iterate over the first-parent chain of a commit.
+
+    Stops at the root commit, or at the first commit older than since (Unix timestamp).
+    """
+    commit_id: str | None = start_id
+    while commit_id is not None:
+        commit: Commit = get_commit(commit_id)
+        if since is not None and commit.committer.time < since:
+            return
+        yield commit
+        commit_id = commit.parent_ids[0] if commit.parent_ids else None
+
+
+def _iter_by_date(
+    repo: GitRepository,
+    get_commit: Callable[[str], Commit],
+    start_id: str,
+    since: int | None,
+) -> Iterator[Commit]:
+    """
+    Iterate over all commits reachable from a commit, newest first but never ahead of their children.
+
+    The order comes from a date-order walk over IDs and parents only, so commits are only decoded as they are yielded and graph lines stay intact
+    when committer clocks were wrong. Commits older than since (Unix timestamp) are left out, with the history only reachable through them.
+    """
+    # Commits reachable through commits not older than since, not walked yet
+    wanted: set[str] = {start_id}
+    for commit_id, commit_time, parent_ids in repo.commits.iter_date_order(start_id):
+        if since is not None:
+            if commit_id not in wanted:
+                continue
+            wanted.discard(commit_id)
+            if commit_time < since:
+                continue
+            wanted.update(parent_ids)
+        yield get_commit(commit_id)
+
+
+def _write_graph_rows(output: TextIO, commit: Commit, lanes: GraphLanes) -> None:
+    """
+    Write a commit with its graph lines.
+
+    Writes the rows joining lanes before the commit, the commit itself, and the rows opening lanes after it.
+    """
+    before_rows, prefix, after_rows = lanes.layout(commit.id, commit.parent_ids)
+    output.writelines(row + "\n" for row in before_rows)
+    output.write(f"{prefix} {_format(commit)}\n")
+    output.writelines(row + "\n" for row in after_rows)
+
+
+def _format(commit: Commit) -> str:
+    """
+    Format a commit as one line of text.
+
+    Shows the short ID, author date, author name, and first line of the message.
+    """
+    summary: str = commit.message.partition("\n")[0]
+    return (
+        f"{commit.short_id} {commit.author.datetime.date().isoformat()} "
+        f"{commit.author.name} {summary}"
+    )
+
+
+def _to_json(commit: Commit) -> dict:
+    """
+    Convert a commit to a JSON object.
+
+    Includes the full message and both signatures, with times as Unix timestamps and offsets in minutes.
+    """
+    return {
+        "id": commit.id,
+        "parents": commit.parent_ids,
+        "author": _signature_to_json(commit.author),
+        "committer": _signature_to_json(commit.committer),
+        "message": commit.message,
+    }
+
+
+def _signature_to_json(signature: Signature) -> dict:
+    """
+    Convert a signature to a JSON object.
+
+    Keeps the raw timestamp and offset so consumers can format dates themselves.
+    """
+    return {
+        "name": signature.name,
+        "email": signature.email,
+        "time": signature.time,
+        "offset": signature.time_offset,
+    }
@@ -5,4 +5,10 @@ Core graph structures and algorithms.
 Provides the main GitGraph class for loading and querying git repository data, along with helper classes for reference resolution, indexing, and history traversal.
 """
 
+from .async_graph import AsyncGitGraph
 from .graph import GitGraph
+from .graph_change_set import GraphChangeSet, RefChanges
+from .graph_columns import GraphColumns
+from .graph_options import GraphOptions
+from .graph_snapshot import GraphSnapshot
+from .workspace import LoadState, RepositorySummary, Workspace
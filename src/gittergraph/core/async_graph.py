@@ -0,0 +1,243 @@
+"""
+Asyncio facade for git graphs.
+
+Provides the AsyncGitGraph class, which runs the blocking queries of a GitGraph on a bounded thread pool and coalesces identical concurrent requests.
+"""
+
+import asyncio
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+
+from gittergraph.core.graph import GitGraph
+from gittergraph.core.graph_change_set import GraphChangeSet
+from gittergraph.core.graph_options import GraphOptions
+from gittergraph.core.graph_snapshot import GraphSnapshot
+from gittergraph.models import Commit
+
+T = TypeVar("T")
+
+
+class AsyncGitGraph:
+    """
+    Awaitable queries against a git graph.
+
+    Blocking work runs on a pool of max_workers threads, and at most that many jobs are submitted at once, so further requests wait in the event loop
+    instead of piling up in the pool. Identical concurrent requests against the same graph version share one computation, which is cancelled when
+    all of its callers are. Work already running on a thread cannot be interrupted, but keeps its thread slot until it finishes.
+    Use as an async context manager to shut the pool down.
+    """
+
+    DEFAULT_MAX_WORKERS: int = 4
+
+    def __init__(self, graph: GitGraph, max_workers: int | None = None) -> None:
+        """
+        Initialize facade for a loaded graph.
+
+        Runs blocking work on up to max_workers threads (DEFAULT_MAX_WORKERS by default).
+        """
+        self.graph: GitGraph = graph
+        self.max_workers: int = max_workers or self.DEFAULT_MAX_WORKERS
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            self.max_workers, thread_name_prefix="gittergraph-async"
+        )
+        self._slots: asyncio.Semaphore = asyncio.Semaphore(self.max_workers)
+
+        # Computations in progress, keyed by operation, graph version, and arguments
+        self._requests: dict[Hashable, _SharedRequest] = {}
+
+    @classmethod
+    async def from_path(
+        cls,
+        path: str | Path,
+        options: GraphOptions | None = None,
+        max_workers: int | None = None,
+    ) -> "AsyncGitGraph":
+        """
+        Load the graph of a repository path.
+
+        Loading runs in a thread, so the event loop keeps running meanwhile.
+        """
+        graph: GitGraph = await asyncio.to_thread(GitGraph.from_path, path, options)
+        return cls(graph, max_workers)
+
+    @classmethod
+    async def discover(
+        cls,
+        start_path: str | Path = ".",
+        options: GraphOptions | None = None,
+        max_workers: int | None = None,
+    ) -> "AsyncGitGraph | None":
+        """
+        Discover and load a git repository from a directory.
+
+        Loading runs in a thread, so the event loop keeps running meanwhile. Returns None if no repository is found.
+        """
+        graph: GitGraph | None = await asyncio.to_thread(
+            GitGraph.discover, start_path, options
+        )
+        return cls(graph, max_workers) if graph is not None else None
+
+    @property
+    def snapshot(self) -> GraphSnapshot:
+        """
+        Get the current snapshot of the graph.
+
+        Queries on the snapshot itself do not block on loading, but may take time proportional to the loaded history.
+        """
+        return self.graph.snapshot
+
+    async def reload(self) -> GraphChangeSet:
+        """
+        Reload graph data from repository.
+
+        Concurrent reloads share one. Returns the changes, which are empty (and falsy) if nothing visible changed.
+        """
+        return await self._run(("reload",), self.graph.reload)
+
+    async def load_more(self, commit_ids: list[str] | None = None) -> int:
+        """
+        Load the next chunk of history past boundary commits.
+
+        Returns the number of newly loaded commits.
+        """
+        key: tuple[Hashable, ...] = (
+            "load_more",
+            self.graph.snapshot.version,
+            tuple(commit_ids) if commit_ids is not None else None,
+        )
+        return await self._run(key, self.graph.load_more, commit_ids)
+
+    async def get_linear_history(
+        self, start_ref: str = "HEAD", offset: int = 0, limit: int | None = None
+    ) -> list[Commit]:
+        """
+        Get a window of the linear first-parent history of a reference.
+
+        Returns up to limit commits, newest first, skipping the first offset ones. Windows of the same history requested concurrently share one walk.
+        In lazy mode, the history of the reference is loaded first if needed.
+        """
+        history: list[Commit] = await self._run(
+            ("history", self.graph.snapshot.version, start_ref),
+            self.graph.get_linear_history,
+            start_ref,
+        )
+        end: int | None = offset + limit if limit is not None else None
+        return history[offset:end]
+
+    async def search(self, text: str, limit: int | None = None) -> list[Commit]:
+        """
+        Search loaded commits.
+
+        Matches the text case-insensitively against messages, author names and emails, and commit ID prefixes. Returns up to limit matches in load order.
+        """
+        snapshot: GraphSnapshot = self.graph.snapshot
+        return await self._run(
+            ("search", snapshot.version, text, limit), snapshot.search, text, limit
+        )
+
+    async def is_ancestor(self, ancestor_ref: str, ref: str) -> bool:
+        """
+        Check if one reference is an ancestor of another.
+
+        Walks the loaded history of ref, which counts as its own ancestor. Returns False if either reference cannot be resolved.
+        """
+        snapshot: GraphSnapshot = self.graph.snapshot
+        return await self._run(
+            ("ancestry", snapshot.version, ancestor_ref, ref),
+            snapshot.is_ancestor,
+            ancestor_ref,
+            ref,
+        )
+
+    def close(self) -> None:
+        """
+        Shut the thread pool down.
+
+        Cancels requests in progress and jobs not started yet, without waiting for running jobs.
+        """
+        for request in list(self._requests.values()):
+            request.task.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self) -> "AsyncGitGraph":
+        """
+        Enter the facade context.
+
+        Returns the facade itself.
+        """
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        """
+        Leave the facade context.
+
+        Shuts the thread pool down.
+        """
+        self.close()
+
+    async def _run(self, key: Hashable, function: Callable[..., T], *args: Any) -> T:
+        """
+        Run blocking work, sharing it with identical concurrent requests.
+
+        The work is cancelled if all callers waiting for it are cancelled before it starts.
+        """
+        request: _SharedRequest | None = self._requests.get(key)
+        if request is None:
+            request = _SharedRequest(
+                asyncio.ensure_future(self._submit(function, *args))
+            )
+            self._requests[key] = request
+            request.task.add_done_callback(lambda _: self._forget(key, request))
+
+        request.waiters += 1
+        try:
+            return await asyncio.shield(request.task)
+        finally:
+            request.waiters -= 1
+            if not request.waiters and not request.task.done():
+                request.task.cancel()
+
+    async def _submit(self, function: Callable[..., T], *args: Any) -> T:
+        """
+        Run blocking work on the thread pool once a slot is free.
+
+        The slot is released when the thread finishes the work, even if the caller stopped waiting for it.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        await self._slots.acquire()
+        try:
+            future: Future[T] = self._executor.submit(function, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        def release(_: Future[T]) -> None:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self._slots.release)
+
+        future.add_done_callback(release)
+        return await asyncio.wrap_future(future)
+
+    def _forget(self, key: Hashable, request: "_SharedRequest") -> None:
+        """
+        Remove a finished request.
+
+        Later identical requests start a new computation.
+        """
+        if self._requests.get(key) is request:
+            del self._requests[key]
+
+
+@dataclass(slots=True)
+class _SharedRequest:
+    """
+    Computation shared by identical concurrent requests.
+
+    Counts the callers waiting for it.
+    """
+
+    task: "asyncio.Future[Any]"
+    waiters: int = 0
@@ -0,0 +1,712 @@
+"""
+Memory-bounded commit storage.
+
+Provides the CommitStore mapping, which keeps compact binary commit topology resident while decoded commit payloads live in a size-bounded cache and are re-fetched from the object database after eviction.
+"""
+
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+
+from gittergraph.access.commit_access import CommitAccess
+from gittergraph.access.identity_pool import IdentityPool
+from gittergraph.core.commit_table import CommitTable
+from gittergraph.core.graph_columns import GraphColumns
+from gittergraph.models import Commit, Signature
+from gittergraph.utils.oid import hex_to_oid
+
+
+@dataclass(slots=True)
+class CommitStoreStats:
+    """
+    Commit payload cache counters.
+
+    Tracks payload lookups, re-fetches from the object database, and evictions.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class _PayloadCache:
+    """
+    Least recently used cache of decoded commits.
+
+    Shared between a store and its copies, since a commit payload never changes for a given ID. So is the commit table the payloads were loaded from, if any.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int | None,
+        table: CommitTable | None = None,
+        identities: IdentityPool | None = None,
+    ) -> None:
+        """
+        Initialize payload cache.
+
+        A max_bytes of None means payloads are never evicted. Payloads missing from the cache are decoded from the table, if given, with the given identity pool.
+        """
+        self.max_bytes: int | None = max_bytes
+        self.table: CommitTable | None = table
+        self.identities: IdentityPool = identities or IdentityPool()
+        self.current_bytes: int = 0
+        self.stats: CommitStoreStats = CommitStoreStats()
+        self.entries: OrderedDict[bytes, tuple[Commit, int]] = OrderedDict()
+        self.lock: threading.Lock = threading.Lock()
+
+    def get(self, oid: bytes) -> Commit | None:
+        """
+        Look up a cached commit by binary ID.
+
+        Marks the commit as recently used. Returns None if it is not cached.
+        """
+        with self.lock:
+            entry: tuple[Commit, int] | None = self.entries.get(oid)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+
+            self.entries.move_to_end(oid)
+            self.stats.hits += 1
+            return entry[0]
+
+    def read_table(self, oid: bytes) -> Commit | None:
+        """
+        Decode a commit from the commit table.
+
+        Returns None if there is no table or the commit is not in it.
+        """
+        if self.table is None:
+            return None
+        index: int | None = self.table.find_oid(oid)
+        if index is None:
+            return None
+        return self.table.get_commit(index, self.identities)
+
+    def put(self, oid: bytes, commit: Commit) -> None:
+        """
+        Store a commit under its binary ID.
+
+        Evicts least recently used commits while the cache is over its size limit.
+        """
+        size: int = _estimate_size(commit)
+        with self.lock:
+            if oid in self.entries:
+                return
+
+            self.entries[oid] = (commit, size)
+            self.current_bytes += size
+
+            if self.max_bytes is None:
+                return
+
+            # The newest commit is always kept, even if it alone exceeds the budget
+            while self.current_bytes > self.max_bytes and len(self.entries) > 1:
+                _, (_, evicted_size) = self.entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.stats.evictions += 1
+
+
+class _CommitGraph:  # pylint: disable=too-many-instance-attributes
+    """
+    Append-only commit topology.
+
+    Every known commit is a dense integer index keyed by its binary object ID, and parent links are stored as flat index arrays.
+    Commit times and author identity IDs are kept next to the topology, so the graph can be exported without decoding payloads.
+    Parents that are not loaded yet are kept as placeholder nodes. Loaded commits are numbered in load order, and nothing is ever removed,
+    so a prefix of the load order is a consistent snapshot that stays valid while further commits are appended.
+    A graph attached to a commit table uses the table rows as its first nodes, whose IDs and parents are looked up in the mapped table.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty graph.
+
+        Nodes are added by add_node and loaded by load, or taken from a commit table by attach.
+        """
+        self.table: CommitTable | None = None
+        self.base: int = 0
+        self.indices: dict[bytes, int] = {}
+        self.oids: list[bytes] = []
+        self.positions: array = array("q")
+        self.parent_starts: array = array("q")
+        self.parent_counts: array = array("I")
+        self.parent_indices: array = array("q")
+        self.order: array = array("q")
+        self.times: array = array("q")
+        self.authors: array = array("q")
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """
+        Number of nodes.
+
+        Includes placeholder parents.
+        """
+        return len(self.positions)
+
+    def find(self, oid: bytes) -> int | None:
+        """
+        Look up the node index of a binary ID.
+
+        Returns None if the ID has no node.
+        """
+        index: int | None = self.indices.get(oid)
+        if index is None and self.table is not None:
+            index = self.table.find_oid(oid)
+        return index
+
+    def get_oid(self, index: int) -> bytes:
+        """
+        Get the binary ID of a node.
+
+        Reads table rows from the table.
+        """
+        if self.table is not None and index < self.base:
+            return self.table.get_oid(index)
+        return self.oids[index - self.base]
+
+    def add_node(self, oid: bytes) -> int:
+        """
+        Get the node index of a binary ID.
+
+        Adds a placeholder node for IDs seen for the first time. Readers add placeholders for the parents of table rows, so adding is locked.
+        """
+        index: int | None = self.find(oid)
+        if index is not None:
+            return index
+
+        with self._lock:
+            index = self.find(oid)
+            if index is None:
+                index = len(self.positions)
+                self.oids.append(oid)
+                self.parent_starts.append(0)
+                self.parent_counts.append(0)
+                self.times.append(0)
+                self.authors.append(-1)
+                self.positions.append(-1)
+                # Readers of earlier snapshots may look the ID up concurrently, so it is only published once its node is complete
+                self.indices[oid] = index
+        return index
+
+    def load(
+        self,
+        oid: bytes,
+        parent_oids: Iterable[bytes],
+        time: int = 0,
+        author: int = -1,
+    ) -> bool:
+        """
+        Load a commit into the graph.
+
+        Stores the commit time and the author identity ID alongside the parent links. Returns False if the commit was already loaded.
+        """
+        index: int = self.add_node(oid)
+        if self.positions[index] >= 0:
+            return False
+
+        parents: list[int] = [self.add_node(parent) for parent in parent_oids]
+        self.parent_starts[index] = len(self.parent_indices)
+        self.parent_counts[index] = len(parents)
+        self.parent_indices.extend(parents)
+        self.times[index] = time
+        self.authors[index] = author
+        self.positions[index] = len(self.order)
+        self.order.append(index)
+        return True
+
+    def attach(self, table: CommitTable, identities: IdentityPool) -> int:
+        """
+        Take the commits of a commit table as the first nodes of an empty graph.
+
+        No ID is copied and no index is built: IDs are binary searched in the table, and parents are resolved when first asked for.
+        Only flat integer arrays are filled, in bulk. Author identity IDs are taken from the given pool. Returns the number of commits.
+        """
+        count: int = len(table)
+        self.table = table
+        self.base = count
+        self.positions = array("q", range(count))
+        self.order = array("q", range(count))
+        self.parent_starts = array("q", bytes(8 * count))
+        self.parent_counts = array("I", bytes(4 * count))
+        self.times = table.get_committer_times()
+        self.authors = table.get_author_identities(identities)
+        return count
+
+    def get_parents(self, index: int) -> array:
+        """
+        Get the parent node indices of a loaded commit.
+
+        Returns a slice of the flat parent index array, or for table rows the parents looked up in the table, with placeholders for the others.
+        """
+        if self.table is not None and index < self.base:
+            return array("q", map(self.add_node, self.table.get_parent_oids(index)))
+        start: int = self.parent_starts[index]
+        return self.parent_indices[start : start + self.parent_counts[index]]
+
+
+class CommitStore(Mapping[str, Commit]):
+    """
+    Mapping of commit IDs to commits with bounded payload memory.
+
+    Topology is kept resident in compact form in an append-only graph, so membership tests and history traversal never touch the object database or allocate hex strings.
+    Copies are snapshots that share the graph and only remember how many commits they contain and which of them were removed,
+    so a snapshot costs memory proportional to its differences from the others. Hex IDs are produced only at the Mapping interface.
+    Decoded commits are kept in a least recently used cache limited to max_bytes (unbounded if None) and transparently re-fetched when evicted.
+    """
+
+    def __init__(
+        self, access: CommitAccess | None = None, max_bytes: int | None = None
+    ) -> None:
+        """
+        Initialize commit store.
+
+        Evicted commits are re-fetched through the given commit access. Without access, payloads are never evicted.
+        """
+        self.access: CommitAccess | None = access
+        self._graph: _CommitGraph = _CommitGraph()
+        self._count: int = 0
+        self._removed: frozenset[int] = frozenset()
+        self._cache: _PayloadCache = _PayloadCache(
+            max_bytes if access is not None else None
+        )
+
+    @classmethod
+    def from_commits(
+        cls,
+        commits: Iterable[Commit],
+        access: CommitAccess | None = None,
+        max_bytes: int | None = None,
+    ) -> "CommitStore":
+        """
+        Create a store from commits.
+
+        Adds the commits one at a time, so a bounded store never holds more payloads than its budget allows.
+        """
+        store: CommitStore = cls(access, max_bytes)
+        store.update(commits)
+        return store
+
+    @classmethod
+    def from_table(
+        cls,
+        table: CommitTable,
+        access: CommitAccess | None = None,
+        max_bytes: int | None = None,
+    ) -> "CommitStore":
+        """
+        Create a store over a commit table.
+
+        Attaching copies no IDs and builds no index, so it takes time independent of the number of commits beyond filling a few integer arrays.
+        Payloads are decoded from the table when first requested and again after eviction, so they can be evicted even without access.
+        Commits added later are re-fetched through the given commit access, whose identity pool is used for decoding.
+        """
+        store: CommitStore = cls(access)
+        # pylint: disable=protected-access
+        store._cache = _PayloadCache(
+            max_bytes, table, access.identities if access is not None else None
+        )
+        store._count = store._graph.attach(table, store._cache.identities)
+        return store
+
+    @property
+    def max_bytes(self) -> int | None:
+        """
+        Payload memory budget in bytes.
+
+        Returns None if payloads are never evicted.
+        """
+        return self._cache.max_bytes
+
+    @property
+    def cached_bytes(self) -> int:
+        """
+        Estimated memory used by cached payloads.
+
+        Returns the sum of the estimated sizes of all cached commits.
+        """
+        return self._cache.current_bytes
+
+    @property
+    def cached_count(self) -> int:
+        """
+        Number of cached payloads.
+
+        Returns how many decoded commits are currently held in memory.
+        """
+        return len(self._cache.entries)
+
+    @property
+    def stats(self) -> CommitStoreStats:
+        """
+        Payload cache counters.
+
+        Returns the counters shared by this store and its copies.
+        """
+        return self._cache.stats
+
+    def get_parent_ids(self, commit_id: str) -> tuple[str, ...]:
+        """
+        Get the parent IDs of a commit without loading its payload.
+
+        Raises KeyError if the commit is not in the store.
+        """
+        index: int = self._get_loaded_index(commit_id)
+        return tuple(
+            self._graph.get_oid(parent).hex()
+            for parent in self._graph.get_parents(index)
+        )
+
+    def get_boundary_ids(
+        self, commit_ids: Iterable[str] | None = None
+    ) -> frozenset[str]:
+        """
+        Find commits whose parents were not loaded.
+
+        Checks only the given commits if any, or all commits otherwise. Returns the IDs of commits at the edge of a truncated history.
+        """
+        indices: Iterable[int] = (
+            self._iter_indices()
+            if commit_ids is None
+            else (
+                index
+                for index in map(self._find_index, commit_ids)
+                if index is not None and self._is_loaded(index)
+            )
+        )
+        return frozenset(
+            self._graph.get_oid(index).hex()
+            for index in indices
+            if any(
+                not self._is_loaded(parent) for parent in self._graph.get_parents(index)
+            )
+        )
+
+    def get_changes_since(
+        self, previous: "CommitStore"
+    ) -> tuple[list[str], list[str]] | None:
+        """
+        Get the commits added and removed since an earlier snapshot of this store.
+
+        Takes time proportional to the number of changes. Returns None if the store does not share its graph with the given snapshot.
+        """
+        # pylint: disable=protected-access
+        if previous._graph is not self._graph or previous._count > self._count:
+            return None
+
+        added: list[int] = list(self._iter_indices(previous._count))
+        added.extend(previous._removed - self._removed)
+        removed: list[int] = [
+            index
+            for index in self._removed - previous._removed
+            if self._graph.positions[index] < previous._count
+        ]
+        return (
+            [self._graph.get_oid(index).hex() for index in added],
+            [self._graph.get_oid(index).hex() for index in removed],
+        )
+
+    def is_truncated(self, commit_id: str) -> bool:
+        """
+        Check if the first-parent history of a commit ends at a load boundary.
+
+        Returns True if the chain reaches a commit whose first parent was not loaded, as opposed to a true root commit.
+        """
+        start: int | None = self._find_index(commit_id)
+        index: int | None = start
+        while index is not None and self._is_loaded(index):
+            parents: array = self._graph.get_parents(index)
+            if not parents:
+                return False
+            index = parents[0]
+
+        return index != start
+
+    def to_columns(
+        self,
+        ref_targets: Mapping[str, str] | None = None,
+        identities: IdentityPool | None = None,
+    ) -> GraphColumns:
+        """
+        Export the commits of the store as flat columns.
+
+        Reads the resident topology only, so no payloads are decoded or re-fetched. References are given as names mapped to commit IDs,
+        and those whose commits are not in the store are left out. Authors are listed from the given pool, which should be the one the commits were loaded with.
+        """
+        rows: array = array("q", self._iter_indices())
+        row_of: array = array("q", [-1]) * len(self._graph)
+        for row, index in enumerate(rows):
+            row_of[index] = row
+
+        parent_offsets: array = array("q", [0])
+        parent_rows: array = array("q")
+        for index in rows:
+            # Placeholders added while exporting are never loaded
+            parent_rows.extend(
+                row_of[parent] if parent < len(row_of) else -1
+                for parent in self._graph.get_parents(index)
+            )
+            parent_offsets.append(len(parent_rows))
+
+        ref_names: list[str] = []
+        ref_rows: array = array("q")
+        for name, target_id in (ref_targets or {}).items():
+            target: int | None = self._find_index(target_id)
+            if target is not None and self._is_loaded(target):
+                ref_names.append(name)
+                ref_rows.append(row_of[target])
+
+        pool: IdentityPool = identities or self._cache.identities
+        return GraphColumns(
+            # Empty stores are exported with the size of SHA-1 IDs
+            oid_size=len(self._graph.get_oid(rows[0])) if rows else 20,
+            oids=b"".join(map(self._graph.get_oid, rows)),
+            parent_offsets=parent_offsets,
+            parent_rows=parent_rows,
+            commit_times=array("q", map(self._graph.times.__getitem__, rows)),
+            author_ids=array("q", map(self._graph.authors.__getitem__, rows)),
+            authors=tuple(pool.get_identity(author) for author in range(len(pool))),
+            ref_names=tuple(ref_names),
+            ref_rows=ref_rows,
+        )
+
+    def add(self, commit: Commit) -> None:
+        """
+        Add a commit to the store.
+
+        Commits already in the store are kept as they are. Adding to an older snapshot first gives it a graph of its own.
+        """
+        if self._count != len(self._graph.order):
+            self._graph = self._rebuild_graph(self._iter_indices())
+            self._count = len(self._graph.order)
+            self._removed = frozenset()
+
+        oid: bytes = hex_to_oid(commit.id)
+        index: int | None = self._graph.find(oid)
+        if index is not None and index in self._removed:
+            # A removed commit became reachable again
+            self._removed = self._removed - {index}
+        elif self._graph.load(
+            oid,
+            map(hex_to_oid, commit.parent_ids),
+            commit.committer.time,
+            commit.author_identity,
+        ):
+            self._count += 1
+        else:
+            return
+        self._cache.put(oid, commit)
+
+    def update(self, commits: Iterable[Commit]) -> None:
+        """
+        Add several commits to the store.
+
+        Commits already in the store are kept as they are.
+        """
+        for commit in commits:
+            self.add(commit)
+
+    def copy(self) -> "CommitStore":
+        """
+        Create a snapshot of the store.
+
+        Takes constant time: the snapshot shares the graph and payload cache, and either store can be extended without affecting the other.
+        """
+        store: CommitStore = CommitStore(self.access)
+        # pylint: disable=protected-access
+        store._graph = self._graph
+        store._count = self._count
+        store._removed = self._removed
+        store._cache = self._cache
+        return store
+
+    def without(self, commit_ids: Iterable[str]) -> "CommitStore":
+        """
+        Create a snapshot of the store without some commits.
+
+        The snapshot shares the graph and payload cache and records the removed commits, so it costs memory proportional to the number of removed commits.
+        Once removed commits make up half of the graph, the snapshot gets a compacted graph of its own.
+        """
+        store: CommitStore = self.copy()
+        # pylint: disable=protected-access
+        store._removed = self._removed.union(
+            index
+            for index in map(self._find_index, commit_ids)
+            if index is not None and self._is_loaded(index)
+        )
+        if len(store._removed) * 2 > store._count:
+            store._graph = store._rebuild_graph(store._iter_indices())
+            store._count = len(store._graph.order)
+            store._removed = frozenset()
+        return store
+
+    def __getitem__(self, commit_id: str) -> Commit:
+        """
+        Get a commit by ID.
+
+        Serves cached payloads and decodes or re-fetches the others. Raises KeyError if the commit is not in the store.
+        """
+        oid: bytes = self._graph.get_oid(self._get_loaded_index(commit_id))
+        commit: Commit | None = self._cache.get(oid)
+        if commit is None:
+            commit = self._cache.read_table(oid)
+            if commit is None:
+                if self.access is None:
+                    raise KeyError(commit_id)
+                commit = self.access.get(commit_id)
+            self._cache.put(oid, commit)
+        return commit
+
+    def __contains__(self, commit_id: object) -> bool:
+        """
+        Check if a commit is in the store.
+
+        Answered from the resident topology without loading payloads. Strings that are not full object IDs are never contained.
+        """
+        if not isinstance(commit_id, str):
+            return False
+        index: int | None = self._find_index(commit_id)
+        return index is not None and self._is_loaded(index)
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over commit IDs.
+
+        Yields hex IDs in insertion order.
+        """
+        return (self._graph.get_oid(index).hex() for index in self._iter_indices())
+
+    def __len__(self) -> int:
+        """
+        Number of commits in the store.
+
+        Includes commits whose payloads are evicted, but not placeholder parents.
+        """
+        return self._count - len(self._removed)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare stores by commit IDs.
+
+        Commit IDs identify commit content, so payloads are never loaded for comparison.
+        """
+        if isinstance(other, CommitStore):
+            # pylint: disable=protected-access
+            if other._graph is self._graph:
+                return other._count == self._count and other._removed == self._removed
+            return len(self) == len(other) and all(
+                other._is_loaded_oid(self._graph.get_oid(index))
+                for index in self._iter_indices()
+            )
+        if isinstance(other, Mapping):
+            return len(self) == len(other) and all(
+                commit_id in other for commit_id in self
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def _iter_indices(self, start: int = 0) -> Iterator[int]:
+        """
+        Iterate over the node indices of the commits in this store.
+
+        Follows the load order from the given position up to this store's commit count, skipping removed commits.
+        """
+        if not self._removed:
+            return iter(self._graph.order[start : self._count])
+        return (
+            index
+            for index in self._graph.order[start : self._count]
+            if index not in self._removed
+        )
+
+    def _rebuild_graph(self, indices: Iterable[int]) -> _CommitGraph:
+        """
+        Build a new graph from some loaded commits of the current graph.
+
+        Used when a store diverges from the graph it shares.
+        """
+        graph: _CommitGraph = _CommitGraph()
+        for index in indices:
+            graph.load(
+                self._graph.get_oid(index),
+                map(self._graph.get_oid, self._graph.get_parents(index)),
+                self._graph.times[index],
+                self._graph.authors[index],
+            )
+        return graph
+
+    def _find_index(self, commit_id: str) -> int | None:
+        """
+        Look up the node index of a hex ID.
+
+        Returns None if the string is not a full object ID or the commit is unknown.
+        """
+        try:
+            return self._graph.find(hex_to_oid(commit_id))
+        except ValueError:
+            return None
+
+    def _get_loaded_index(self, commit_id: str) -> int:
+        """
+        Get the node index of a commit in this store.
+
+        Raises KeyError if the commit is not in the store.
+        """
+        index: int | None = self._find_index(commit_id)
+        if index is None or not self._is_loaded(index):
+            raise KeyError(commit_id)
+        return index
+
+    def _is_loaded(self, index: int) -> bool:
+        """
+        Check if a node belongs to a commit in this store.
+
+        Returns False for placeholder parents, removed commits, and commits loaded after this snapshot was taken.
+        """
+        return (
+            0 <= self._graph.positions[index] < self._count
+            and index not in self._removed
+        )
+
+    def _is_loaded_oid(self, oid: bytes) -> bool:
+        """
+        Check if a binary ID belongs to a commit in this store.
+
+        Returns False for unknown IDs and placeholder parents.
+        """
+        index: int | None = self._graph.find(oid)
+        return index is not None and self._is_loaded(index)
+
+
+def _estimate_size(commit: Commit) -> int:
+    """
+    Estimate the memory used by a decoded commit.
+
+    Sums the sizes of the commit object, its message, and its signatures.
+    """
+    return (
+        sys.getsizeof(commit)
+        + sys.getsizeof(commit.id)
+        + sys.getsizeof(commit.message)
+        + _estimate_signature_size(commit.author)
+        + _estimate_signature_size(commit.committer)
+    )
+
+
+def _estimate_signature_size(signature: Signature) -> int:
+    """
+    Estimate the memory used by a signature.
+
+    Sums the sizes of the signature object and its name and email strings.
+    """
+    return (
+        sys.getsizeof(signature)
+        + sys.getsizeof(signature.name)
+        + sys.getsizeof(signature.email)
+    )
@@ -0,0 +1,386 @@
+"""
+Compact commit tables.
+
+Provides the CommitTable class, which stores commits as flat arrays in a file that other processes memory-map and read in place.
+"""
+
+import mmap
+import struct
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+from pathlib import Path
+
+from gittergraph.access.identity_pool import IdentityPool
+from gittergraph.models import Commit, Signature
+from gittergraph.utils.oid import hex_to_oid
+
+_MAGIC: bytes = b"GGCT"
+_VERSION: int = 1
+
+# Magic, version, object ID size, then the number of commits, parent links, identities, message bytes and string bytes
+_HEADER: struct.Struct = struct.Struct("=4sIIqqqqq")
+
+# Size of SHA-1 object IDs, used for tables without commits
+_DEFAULT_OID_SIZE: int = 20
+
+# Every section starts at a multiple of this, so integer arrays can be cast in place
+_ALIGNMENT: int = 8
+
+# Integer arrays holding one value per commit, in file order
+_COMMIT_ARRAYS: tuple[str, ...] = (
+    "order",
+    "author_identities",
+    "author_times",
+    "author_offsets",
+    "committer_identities",
+    "committer_times",
+    "committer_offsets",
+)
+
+
+class CommitTable:  # pylint: disable=too-many-instance-attributes
+    """
+    Commits stored as flat arrays in a memory-mapped file.
+
+    Holds binary SHA-1 or SHA-256 IDs, parent links, signature identities and times, and UTF-8 messages in a few contiguous arrays, with names and emails stored once per identity.
+    A table is written once by write and then opened read-only; the arrays are memoryviews over the mapping, so opening a table copies and decodes nothing.
+    The mapping stays valid until the table and every view of it are released, even if the file is deleted right after opening.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """
+        Open a commit table.
+
+        Maps the file read-only. Raises ValueError if the file is not a commit table.
+        """
+        with open(path, "rb") as file:
+            self._map: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._map) < _HEADER.size:
+            raise ValueError(f"'{path}' is not a commit table")
+        (
+            magic,
+            version,
+            oid_size,
+            count,
+            parent_count,
+            identity_count,
+            message_size,
+            _,
+        ) = _HEADER.unpack_from(self._map)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"'{path}' is not a commit table")
+
+        view: memoryview = memoryview(self._map)
+        position: int = _HEADER.size
+
+        def take(size: int) -> memoryview:
+            nonlocal position
+            position = _align(position)
+            section: memoryview = view[position : position + size]
+            position += size
+            return section
+
+        self._oid_size: int = oid_size
+        self._count: int = count
+        self._oids: memoryview = take(count * oid_size)
+        self._parent_oids: memoryview = take(parent_count * oid_size)
+        self._parent_starts: memoryview = take((count + 1) * 8).cast("q")
+        self._message_starts: memoryview = take((count + 1) * 8).cast("q")
+        self._string_starts: memoryview = take((identity_count * 2 + 1) * 8).cast("q")
+        arrays: dict[str, memoryview] = {
+            name: take(count * 8).cast("q") for name in _COMMIT_ARRAYS
+        }
+        self._order: memoryview = arrays["order"]
+        self._author_identities: memoryview = arrays["author_identities"]
+        self._author_times: memoryview = arrays["author_times"]
+        self._author_offsets: memoryview = arrays["author_offsets"]
+        self._committer_identities: memoryview = arrays["committer_identities"]
+        self._committer_times: memoryview = arrays["committer_times"]
+        self._committer_offsets: memoryview = arrays["committer_offsets"]
+        self._messages: memoryview = take(message_size)
+        self._strings: memoryview = view[_align(position) :]
+
+    @classmethod
+    def write(  # pylint: disable=too-many-locals
+        cls, path: Path | str, commits: Iterable[Commit]
+    ) -> int:
+        """
+        Write commits to a commit table file.
+
+        Commits keep their order, so a table written from a commit store loads back in the same order. A commit listed again is skipped,
+        so every ID has one row. Returns the number of commits written. Raises ValueError if SHA-1 and SHA-256 IDs are mixed.
+        """
+        oid_size: int | None = None
+        oids: bytearray = bytearray()
+        parent_oids: bytearray = bytearray()
+        parent_starts: array = array("q", [0])
+        message_starts: array = array("q", [0])
+        messages: bytearray = bytearray()
+        identities: dict[tuple[str, str], int] = {}
+        arrays: dict[str, array] = {name: array("q") for name in _COMMIT_ARRAYS}
+        written_ids: set[str] = set()
+
+        def add_signature(role: str, signature: Signature) -> None:
+            identity: int = identities.setdefault(
+                (signature.name, signature.email), len(identities)
+            )
+            arrays[f"{role}_identities"].append(identity)
+            arrays[f"{role}_times"].append(signature.time)
+            arrays[f"{role}_offsets"].append(signature.time_offset)
+
+        def add_oid(target: bytearray, commit_id: str) -> None:
+            nonlocal oid_size
+            oid: bytes = hex_to_oid(commit_id)
+            if oid_size is None:
+                oid_size = len(oid)
+            elif len(oid) != oid_size:
+                raise ValueError(f"Object ID '{commit_id}' has a different length")
+            target += oid
+
+        for commit in commits:
+            if commit.id in written_ids:
+                continue
+            written_ids.add(commit.id)
+            add_oid(oids, commit.id)
+            for parent_id in commit.parent_ids:
+                add_oid(parent_oids, parent_id)
+            parent_starts.append(len(parent_oids) // (oid_size or _DEFAULT_OID_SIZE))
+            messages += commit.message.encode("utf-8", "surrogatepass")
+            message_starts.append(len(messages))
+            add_signature("author", commit.author)
+            add_signature("committer", commit.committer)
+
+        size: int = oid_size or _DEFAULT_OID_SIZE
+        count: int = len(oids) // size
+        arrays["order"].extend(
+            sorted(
+                range(count), key=lambda index: oids[index * size : (index + 1) * size]
+            )
+        )
+
+        strings: bytearray = bytearray()
+        string_starts: array = array("q", [0])
+        for identity in identities:
+            for value in identity:
+                strings += value.encode("utf-8", "surrogatepass")
+                string_starts.append(len(strings))
+
+        sections: list[bytes | bytearray | array] = [
+            oids,
+            parent_oids,
+            parent_starts,
+            message_starts,
+            string_starts,
+            *(arrays[name] for name in _COMMIT_ARRAYS),
+            messages,
+            strings,
+        ]
+        with open(path, "wb") as file:
+            file.write(
+                _HEADER.pack(
+                    _MAGIC,
+                    _VERSION,
+                    size,
+                    count,
+                    len(parent_oids) // size,
+                    len(identities),
+                    len(messages),
+                    len(strings),
+                )
+            )
+            position: int = _HEADER.size
+            for section in sections:
+                padding: int = _align(position) - position
+                file.write(bytes(padding))
+                file.write(section)
+                position += padding + len(section) * (
+                    section.itemsize if isinstance(section, array) else 1
+                )
+        return count
+
+    def find(self, commit_id: str) -> int | None:
+        """
+        Look up the row of a commit.
+
+        Binary searches the IDs in sorted order. Returns None if the commit is not in the table or the string is not a full object ID.
+        """
+        try:
+            return self.find_oid(hex_to_oid(commit_id))
+        except ValueError:
+            return None
+
+    def find_oid(self, oid: bytes) -> int | None:
+        """
+        Look up the row of a commit by binary ID.
+
+        Returns None if the commit is not in the table.
+        """
+        position: int = bisect_left(self._order, oid, key=self.get_oid)
+        if position < self._count and self.get_oid(self._order[position]) == oid:
+            return self._order[position]
+        return None
+
+    def get_oid(self, index: int) -> bytes:
+        """
+        Get the binary ID of the commit in a row.
+
+        Raises IndexError if the row does not exist.
+        """
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return self._oids[
+            index * self._oid_size : (index + 1) * self._oid_size
+        ].tobytes()
+
+    def get_parent_oids(self, index: int) -> list[bytes]:
+        """
+        Get the binary parent IDs of the commit in a row.
+
+        Parents do not need to be in the table. Raises IndexError if the row does not exist.
+        """
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        size: int = self._oid_size
+        return [
+            self._parent_oids[position : position + size].tobytes()
+            for position in range(
+                self._parent_starts[index] * size,
+                self._parent_starts[index + 1] * size,
+                size,
+            )
+        ]
+
+    def get_oids(self) -> list[bytes]:
+        """
+        Get the binary IDs of all commits.
+
+        Returns them in table order.
+        """
+        size: int = self._oid_size
+        oids: bytes = self._oids.tobytes()
+        return [oids[start : start + size] for start in range(0, len(oids), size)]
+
+    def get_parent_links(self) -> tuple[list[bytes], list[int]]:
+        """
+        Get the binary parent IDs of all commits.
+
+        Returns the parent IDs of all commits in table order, and where the parents of each commit start in that list, followed by the total number of parents.
+        """
+        size: int = self._oid_size
+        parent_oids: bytes = self._parent_oids.tobytes()
+        return [
+            parent_oids[start : start + size]
+            for start in range(0, len(parent_oids), size)
+        ], self._parent_starts.tolist()
+
+    def get_committer_times(self) -> array:
+        """
+        Get the committer times of all commits.
+
+        Returns Unix timestamps in table order.
+        """
+        return array("q", self._committer_times)
+
+    def get_author_identities(self, identities: IdentityPool) -> array:
+        """
+        Get the author identity IDs of all commits.
+
+        Each identity stored in the table is looked up once in the given pool, so no signatures are built. Returns the IDs in table order.
+        """
+        starts: memoryview = self._string_starts
+        pool_ids: list[int] = [
+            identities.get_identity_id(
+                _decode(self._strings, starts[identity * 2], starts[identity * 2 + 1]),
+                _decode(
+                    self._strings, starts[identity * 2 + 1], starts[identity * 2 + 2]
+                ),
+            )
+            for identity in range((len(starts) - 1) // 2)
+        ]
+        return array("q", map(pool_ids.__getitem__, self._author_identities))
+
+    def get_commit(self, index: int, identities: IdentityPool) -> Commit:
+        """
+        Decode the commit in a row.
+
+        Names and emails come from the given identity pool, and a single Signature instance is shared when author and committer are identical.
+        Raises IndexError if the row does not exist.
+        """
+        oid: bytes = self.get_oid(index)
+        author, author_identity = self._get_signature(
+            identities,
+            self._author_identities[index],
+            self._author_times[index],
+            self._author_offsets[index],
+        )
+        committer: Signature = author
+        committer_identity: int = author_identity
+        if (
+            self._committer_identities[index] != self._author_identities[index]
+            or self._committer_times[index] != author.time
+            or self._committer_offsets[index] != author.time_offset
+        ):
+            committer, committer_identity = self._get_signature(
+                identities,
+                self._committer_identities[index],
+                self._committer_times[index],
+                self._committer_offsets[index],
+            )
+
+        return Commit(
+            id=oid.hex(),
+            message=_decode(
+                self._messages,
+                self._message_starts[index],
+                self._message_starts[index + 1],
+            ),
+            author=author,
+            committer=committer,
+            parent_ids=[parent.hex() for parent in self.get_parent_oids(index)],
+            author_identity=author_identity,
+            committer_identity=committer_identity,
+        )
+
+    def __len__(self) -> int:
+        """
+        Number of commits in the table.
+
+        Counts only commits with a row, not parents outside the table.
+        """
+        return self._count
+
+    def _get_signature(
+        self, identities: IdentityPool, identity: int, time: int, time_offset: int
+    ) -> tuple[Signature, int]:
+        """
+        Build a signature from a stored identity.
+
+        Returns the signature with strings pooled in the given identity pool and its identity ID there.
+        """
+        starts: memoryview = self._string_starts
+        return identities.get_signature(
+            _decode(self._strings, starts[identity * 2], starts[identity * 2 + 1]),
+            _decode(self._strings, starts[identity * 2 + 1], starts[identity * 2 + 2]),
+            time,
+            time_offset,
+        )
+
+
+def _align(position: int) -> int:
+    """
+    Round a file position up to the section alignment.
+
+    Returns the position itself if it is already aligned.
+    """
+    return -(-position // _ALIGNMENT) * _ALIGNMENT
+
+
+def _decode(data: memoryview, start: int, end: int) -> str:
+    """
+    Decode a stored string.
+
+    Reads the UTF-8 bytes between the given offsets.
+    """
+    return str(data[start:end], "utf-8", "surrogatepass")
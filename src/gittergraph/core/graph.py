@@ -6,57 +6,107 @@ Git graph representation.
 Provides the GitGraph class for loading, organizing, and querying git repository data. Includes helper classes for reference resolution, indexing, and history traversal to support efficient lookups and visualization.
 """
 
+import threading
+from collections.abc import Callable
+from dataclasses import replace
+from functools import partial
 from pathlib import Path
 
 from gittergraph.access import GitRepository
+from gittergraph.access.fingerprint_access import RepositoryFingerprint
+from gittergraph.access.repository_watcher import RepositoryWatcher
+from gittergraph.core.commit_store import CommitStore
+from gittergraph.core.graph_change_set import GraphChangeSet
+from gittergraph.core.graph_columns import GraphColumns
 from gittergraph.core.graph_data import GitGraphData
-from gittergraph.core.history_walker import HistoryWalker
-from gittergraph.core.ref_index import RefIndex
-from gittergraph.core.ref_resolver import RefResolver
-from gittergraph.models import Branch, Commit, Tag
+from gittergraph.core.graph_loader import (
+    load_from_daemon,
+    load_in_process,
+    walk_in_process,
+)
+from gittergraph.core.graph_options import GraphOptions
+from gittergraph.core.graph_snapshot import GraphSnapshot
+from gittergraph.core.memory_usage import MemoryUsage
+from gittergraph.models import Branch, Commit, DiffStat, Tag, TagAnnotation
+from gittergraph.utils.memory import get_resident_memory
 
 
-class GitGraph:
+class GitGraph:  # pylint: disable=too-many-public-methods
     """
     Git graph structure.
 
-    Loads and organizes repository data for efficient access and rendering. Uses helper classes for reference resolution, indexing, and history traversal.
+    Loads and organizes repository data for efficient access and rendering. Publishes the data as immutable, versioned snapshots with their own helpers,
+    which readers can pin without locks while loading and reloading build the next version.
     """
 
-    def __init__(self, repo: GitRepository) -> None:
+    DEFAULT_CHUNK_SIZE: int = 1000
+
+    def __init__(
+        self, repo: GitRepository, options: GraphOptions | None = None
+    ) -> None:
         """
         Initialize graph from repository.
 
         Loads all commits, branches, tags, and HEAD info, then builds helper indexes for efficient access and visualization.
+        In lazy mode, only the history of HEAD is loaded up front. Loaded history may be bounded by the commit count and date options.
         """
         self.repo: GitRepository = repo
-        self.data: GitGraphData = GitGraphData.load_from(repo)
+        self.options: GraphOptions = options or GraphOptions()
+        self._snapshot: GraphSnapshot = GraphSnapshot(self._load_data())
+
+        # Serializes writers, which publish each new snapshot with a single assignment
+        self._load_lock: threading.Lock = threading.Lock()
 
-        # Initialize helpers
-        self._ref_index: RefIndex
-        self._history_walker: HistoryWalker
-        self._ref_resolver: RefResolver
-        self._build_helpers()
+        # Set while the repository is watched for changes
+        self._watcher: RepositoryWatcher | None = None
 
     @classmethod
-    def from_path(cls, path: str | Path) -> "GitGraph":
+    def from_path(
+        cls, path: str | Path, options: GraphOptions | None = None
+    ) -> "GitGraph":
         """
         Create graph from repository path.
 
         Opens the repository at the specified path and initializes the graph with its data.
         """
-        repo: GitRepository = GitRepository(path)
-        return cls(repo)
+        options = options or GraphOptions()
+        repo: GitRepository = GitRepository(
+            path, options.ref_filter, options.backend, options.jobs
+        )
+        return cls(repo, options)
 
     @classmethod
-    def discover(cls, start_path: str | Path = ".") -> "GitGraph | None":
+    def discover(
+        cls, start_path: str | Path = ".", options: GraphOptions | None = None
+    ) -> "GitGraph | None":
         """
         Discover and load a git repository from a directory.
 
         Searches for a repository starting from the given path and moving up the directory tree. Returns None if no repository is found.
         """
-        repo: GitRepository | None = GitRepository.discover(start_path)
-        return cls(repo) if repo is not None else None
+        options = options or GraphOptions()
+        repo: GitRepository | None = GitRepository.discover(
+            start_path, options.ref_filter, options.backend, options.jobs
+        )
+        return cls(repo, options) if repo is not None else None
+
+    @property
+    def snapshot(self) -> GraphSnapshot:
+        """
+        Get the current snapshot of the graph.
+
+        Queries against the returned snapshot keep seeing the same data when the graph is reloaded or loads more history.
+        """
+        return self._snapshot
+
+    @property
+    def data(self) -> GitGraphData:
+        """
+        Get the graph data of the current snapshot.
+
+        Take the snapshot first to combine several reads of data consistent with each other.
+        """
+        return self._snapshot.data
 
     def get_branches_at_commit(self, commit_id: str) -> list[Branch]:
         """
@@ -64,7 +114,7 @@ class GitGraph:
 
         Returns an empty list if no branches point to the commit.
         """
-        return self._ref_index.get_branches_at_commit(commit_id)
+        return self._snapshot.get_branches_at_commit(commit_id)
 
     def get_tags_at_commit(self, commit_id: str) -> list[Tag]:
         """
@@ -72,50 +122,254 @@ class GitGraph:
 
         Returns an empty list if no tags point to the commit.
         """
-        return self._ref_index.get_tags_at_commit(commit_id)
+        return self._snapshot.get_tags_at_commit(commit_id)
+
+    def get_tag_annotation(self, name: str) -> TagAnnotation | None:
+        """
+        Get the metadata of an annotated tag.
+
+        Loads the tag object on first request and caches the result. Returns None for lightweight or unknown tags.
+        """
+        snapshot: GraphSnapshot = self._snapshot
+        tag: Tag | None = snapshot.data.tags.get(name)
+        if tag is None:
+            return None
+
+        if name not in snapshot.tag_annotations:
+            snapshot.tag_annotations[name] = self.repo.tags.get_annotation(tag)
+        return snapshot.tag_annotations[name]
+
+    def resolve(self, ref: str) -> str | None:
+        """
+        Resolve a reference name to a commit ID.
+
+        Handles HEAD, commit IDs, branch names, and tag names. Returns None if the reference cannot be resolved.
+        """
+        return self._snapshot.resolve(ref)
 
     def get_linear_history(self, start_ref: str = "HEAD") -> list[Commit]:
         """
         Get linear first-parent history from a reference.
 
         Follows the first parent chain to build linear history for visualization. Returns commits in newest-first order.
+        In lazy mode, the history of the reference is loaded first if needed.
+        """
+        self.load_ref(start_ref)
+        return self._snapshot.get_linear_history(start_ref)
+
+    def is_truncated(self, start_ref: str = "HEAD") -> bool:
+        """
+        Check if the linear history of a reference ends at a load boundary.
+
+        Returns True if more history can be loaded with load_more.
+        """
+        return self._snapshot.is_truncated(start_ref)
+
+    def is_ancestor(self, ancestor_ref: str, ref: str) -> bool:
+        """
+        Check if one reference is an ancestor of another.
+
+        Walks the loaded history of ref, which counts as its own ancestor. Returns False if either reference cannot be resolved.
+        """
+        return self._snapshot.is_ancestor(ancestor_ref, ref)
+
+    def search(self, text: str, limit: int | None = None) -> list[Commit]:
+        """
+        Search loaded commits.
+
+        Matches the text case-insensitively against messages, author names and emails, and commit ID prefixes. Returns up to limit matches in load order.
+        """
+        return self._snapshot.search(text, limit)
+
+    def get_diff_stat(self, commit_id: str) -> DiffStat:
+        """
+        Get diff statistics of a commit against its first parent.
+
+        Results are served from the persistent diff cache when available.
+        """
+        return self.repo.diffs.get_commit_stat(commit_id)
+
+    def get_memory_usage(self) -> MemoryUsage:
+        """
+        Get the memory usage of the graph.
+
+        Reports resident process memory and how much of the commit payload budget is in use.
         """
-        start_id: str | None = self._ref_resolver.resolve(start_ref)
-        if start_id is None:
-            return []
+        commits: CommitStore = self._snapshot.data.commits
+        return MemoryUsage(
+            resident_bytes=get_resident_memory(),
+            cached_bytes=commits.cached_bytes,
+            budget_bytes=commits.max_bytes,
+            cached_commits=commits.cached_count,
+            total_commits=len(commits),
+        )
+
+    def to_columns(self) -> GraphColumns:
+        """
+        Export the loaded commit graph as flat columns.
 
-        return self._history_walker.get_linear_history_from_commit(start_id)
+        Built from the resident topology of one snapshot, without decoding commits. Reference tips include all loaded branches and tags, and HEAD.
+        """
+        return self._snapshot.data.to_columns(self.repo.identities)
+
+    def load_ref(self, ref: str) -> bool:
+        """
+        Load the history of a reference on demand.
+
+        Walks from the reference, stopping at already loaded commits. Returns True if new commits were loaded.
+        """
+        snapshot: GraphSnapshot = self._snapshot
+        start_id: str | None = snapshot.resolve(ref)
+        if start_id is None or start_id in snapshot.data.commits:
+            return False
+
+        return self._extend([start_id]) > 0
+
+    def load_pending(self) -> int:
+        """
+        Load the history of all references not loaded yet.
+
+        Intended for a background pass after a lazy startup. Returns the number of newly loaded commits.
+        """
+        return self._extend(self.data.pending_ids)
+
+    def load_more(self, commit_ids: list[str] | None = None) -> int:
+        """
+        Load the next chunk of history past boundary commits.
+
+        Expands the given boundary commits, or all of them, by up to max_commits commits (1000 if unbounded).
+        Returns the number of newly loaded commits.
+        """
+        chunk: int = self.options.max_commits or self.DEFAULT_CHUNK_SIZE
+
+        with self._load_lock:
+            old_data: GitGraphData = self._snapshot.data
+            new_data: GitGraphData = old_data.expand(self.repo, chunk, commit_ids)
+            added: int = len(new_data.commits) - len(old_data.commits)
+            if added:
+                self._publish(new_data)
+
+        return added
+
+    def _extend(self, start_ids: list[str]) -> int:
+        """
+        Extend the graph data with the history of further commits.
 
-    def reload(self) -> None:
+        Publishes a new snapshot if commits were loaded, and returns the number of newly loaded commits.
+        """
+        if not start_ids:
+            return 0
+
+        with self._load_lock:
+            old_data: GitGraphData = self._snapshot.data
+            new_data: GitGraphData = old_data.extend(
+                self.repo, start_ids, self.options.max_commits, self.options.since
+            )
+            added: int = len(new_data.commits) - len(old_data.commits)
+            if added:
+                self._publish(new_data)
+
+        return added
+
+    def reload(self) -> GraphChangeSet:
         """
         Reload graph data from repository.
 
-        Refreshes all data and rebuilds indexes to reflect external changes in the repository.
+        Compares a cheap fingerprint of the repository's references first and returns early if nothing changed.
+        Otherwise refreshes all data and publishes a new snapshot, whose indexes are updated with the changes. With the loader process option,
+        new history is decoded in a loader process. Returns the changes, which are empty (and falsy) if nothing visible changed.
+        """
+        fingerprint: RepositoryFingerprint = self.repo.get_fingerprint()
+        if fingerprint == self._snapshot.data.fingerprint:
+            return GraphChangeSet()
+
+        # Reloads may be triggered by a watcher while history loads in the background
+        with self._load_lock:
+            self.repo.reload()
+
+            old_data: GitGraphData = self._snapshot.data
+            new_data: GitGraphData = old_data.refresh(
+                self.repo,
+                self.options.lazy,
+                self.options.max_commits,
+                self.options.since,
+                (
+                    partial(walk_in_process, self.repo)
+                    if self.options.loader_process
+                    else None
+                ),
+            )
+            changes: GraphChangeSet = GraphChangeSet.between(old_data, new_data)
+
+            if not changes:
+                # Keep the old data and its helpers, but remember the new fingerprint
+                self._publish(replace(old_data, fingerprint=new_data.fingerprint))
+                return changes
+
+            self._publish(new_data, changes)
+        return changes
+
+    def start_watching(
+        self, on_reload: Callable[[GraphChangeSet], None], use_inotify: bool = True
+    ) -> None:
         """
-        self.repo.reload()
+        Watch the repository and reload the graph when its references change.
 
-        old_data: GitGraphData = self.data
-        self.data = GitGraphData.load_from(self.repo)
+        Reloads run in the watcher's background thread, and on_reload is called from that thread with the changes of each reload that changed the data.
+        """
+        if self._watcher is not None:
+            return
+
+        def on_change() -> None:
+            changes: GraphChangeSet = self.reload()
+            if changes:
+                on_reload(changes)
+
+        self._watcher = self.repo.watch(on_change, use_inotify)
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        """
+        Stop watching the repository.
 
-        if self.data != old_data:
-            # Rebuild helpers with fresh data
-            self._build_helpers()
+        Waits for a reload in progress to finish. Does nothing if the repository is not watched.
+        """
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
 
-    def _build_helpers(self) -> None:
+    def _load_data(self) -> GitGraphData:
         """
-        Build helper indexes with current data.
+        Load graph data with the current options.
 
-        Initializes reference index, history walker, and reference resolver using the current graph data.
+        Applies the lazy mode, history bounds, and memory budget of the graph options. Takes over the data of a running daemon,
+        or loads in a loader process, if requested.
         """
-        self._ref_index = RefIndex(self.data.branches, self.data.tags)
-        self._history_walker = HistoryWalker(self.data.commits)
-        self._ref_resolver = RefResolver(
-            self.data.commits,
-            self.data.branches,
-            self.data.tags,
-            self.data.head_info,
+        if self.options.use_daemon:
+            data: GitGraphData | None = load_from_daemon(self.repo, self.options)
+            if data is not None:
+                return data
+        if self.options.loader_process:
+            return load_in_process(self.repo, self.options)
+        return GitGraphData.load_from(
+            self.repo,
+            self.options.lazy,
+            self.options.max_commits,
+            self.options.since,
+            self.options.memory_budget,
         )
 
+    def _publish(
+        self, data: GitGraphData, changes: GraphChangeSet | None = None
+    ) -> None:
+        """
+        Publish the next snapshot of the graph.
+
+        The references of the data are those of the current snapshot updated by changes (unchanged if None). Must be called with the load lock held.
+        """
+        previous: GraphSnapshot = self._snapshot
+        self._snapshot = GraphSnapshot(data, previous.version + 1, previous, changes)
+
     def is_empty(self) -> bool:
         """
         Check if repository is empty.
@@ -0,0 +1,108 @@
+"""
+Graph change sets.
+
+Provides the RefChanges and GraphChangeSet dataclasses, which describe the differences between two graph data snapshots so views can update only what changed.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+from gittergraph.core.graph_data import GitGraphData
+from gittergraph.models import Branch, Tag
+
+
+@dataclass(slots=True, frozen=True)
+class RefChanges:
+    """
+    Changes to one kind of reference.
+
+    Holds the full names of references that were added, removed, or moved to another target, each in the order of the newer snapshot (removed ones in the order of the older one).
+    """
+
+    added: tuple[str, ...] = ()
+    removed: tuple[str, ...] = ()
+    moved: tuple[str, ...] = ()
+
+    @classmethod
+    def between(
+        cls, old: Mapping[str, Branch | Tag], new: Mapping[str, Branch | Tag]
+    ) -> "RefChanges":
+        """
+        Compare two reference maps.
+
+        References whose target or tag object differs are reported as moved.
+        """
+        return cls(
+            added=tuple(name for name in new if name not in old),
+            removed=tuple(name for name in old if name not in new),
+            moved=tuple(
+                name for name, ref in new.items() if name in old and old[name] != ref
+            ),
+        )
+
+    def __bool__(self) -> bool:
+        """
+        Check if any reference changed.
+
+        Returns False if nothing was added, removed, or moved.
+        """
+        return bool(self.added or self.removed or self.moved)
+
+
+@dataclass(slots=True, frozen=True)
+class GraphChangeSet:
+    """
+    Changes between two graph data snapshots.
+
+    Describes added, removed, and moved branches and tags, whether HEAD changed, and which commits were added or removed.
+    An empty change set is falsy.
+    """
+
+    branches: RefChanges = field(default_factory=RefChanges)
+    tags: RefChanges = field(default_factory=RefChanges)
+    head_changed: bool = False
+    added_commits: frozenset[str] = frozenset()
+    removed_commits: frozenset[str] = frozenset()
+
+    @classmethod
+    def between(cls, old: GitGraphData, new: GitGraphData) -> "GraphChangeSet":
+        """
+        Compare two snapshots.
+
+        Commits are compared by ID only, so no commit payloads are loaded. Snapshots sharing a commit store are compared in time proportional to the changed commits.
+        """
+        commit_changes: tuple[list[str], list[str]] | None = (
+            new.commits.get_changes_since(old.commits)
+        )
+        added_commits, removed_commits = (
+            commit_changes
+            if commit_changes is not None
+            else (
+                new.commits.keys() - old.commits.keys(),
+                old.commits.keys() - new.commits.keys(),
+            )
+        )
+        return cls(
+            branches=RefChanges.between(old.branches, new.branches),
+            tags=RefChanges.between(old.tags, new.tags),
+            head_changed=old.head_info != new.head_info,
+            added_commits=frozenset(added_commits),
+            removed_commits=frozenset(removed_commits),
+        )
+
+    @property
+    def refs_changed(self) -> bool:
+        """
+        Check if any branch, tag, or HEAD changed.
+
+        Returns False if only commits were added or removed.
+        """
+        return bool(self.branches or self.tags or self.head_changed)
+
+    def __bool__(self) -> bool:
+        """
+        Check if anything changed.
+
+        Returns False for an empty change set.
+        """
+        return bool(self.refs_changed or self.added_commits or self.removed_commits)
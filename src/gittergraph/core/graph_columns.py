@@ -0,0 +1,46 @@
+"""
+Columnar commit graph export.
+
+Defines the GraphColumns dataclass, which holds the commits of a graph as flat arrays for analysis outside gittergraph.
+"""
+
+from array import array
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class GraphColumns:  # pylint: disable=too-many-instance-attributes
+    """
+    Commit graph as flat columns.
+
+    Row i of every per-commit column describes the same commit, and commits are in load order. The parents of row i are the rows
+    parent_rows[parent_offsets[i]:parent_offsets[i + 1]], with -1 for parents that are not loaded. Author IDs index authors, and are -1 if unknown.
+    """
+
+    oid_size: int
+    oids: bytes
+    parent_offsets: array
+    parent_rows: array
+    commit_times: array
+    author_ids: array
+    authors: tuple[tuple[str, str], ...]
+    ref_names: tuple[str, ...]
+    ref_rows: array
+
+    def __len__(self) -> int:
+        """
+        Number of commits.
+
+        Counts rows, not parents that are not loaded.
+        """
+        return len(self.commit_times)
+
+    def get_oid(self, row: int) -> bytes:
+        """
+        Get the binary ID of the commit in a row.
+
+        Raises IndexError if the row does not exist.
+        """
+        if not 0 <= row < len(self):
+            raise IndexError(row)
+        return self.oids[row * self.oid_size : (row + 1) * self.oid_size]
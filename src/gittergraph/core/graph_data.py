@@ -5,35 +5,376 @@ Repository data snapshot.
 Provides the GitGraphData dataclass for representing an immutable snapshot of repository data loaded from a Git repository.
 """
 
-from dataclasses import dataclass
+from array import array
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, fields, replace
+from itertools import chain
+from typing import TypeVar
 
 from gittergraph.access import GitRepository
+from gittergraph.access.fingerprint_access import RepositoryFingerprint
+from gittergraph.access.identity_pool import IdentityPool
+from gittergraph.access.ref_access import RefRecord
+from gittergraph.core.commit_store import CommitStore
+from gittergraph.core.graph_columns import GraphColumns
 from gittergraph.models import Branch, Commit, HeadInfo, Tag
 
+RefT = TypeVar("RefT", Branch, Tag)
 
-@dataclass(slots=True, frozen=True)
-class GitGraphData:
+
+@dataclass(slots=True, frozen=True, eq=False)
+class GitGraphData:  # pylint: disable=too-many-instance-attributes
     """
     Repository data snapshot.
 
     Immutable snapshot of commits, branches, tags, and HEAD info loaded from a repository.
+    Commits always include the full history of every walked starting point, so a lazily loaded snapshot can be extended by walking further references.
+    Commit payloads may be evicted and re-fetched by the commit store when a memory budget is set.
+    Snapshots compare equal by the repository fingerprint taken before loading, so comparison never touches commits.
     """
 
-    commits: dict[str, Commit]
+    commits: CommitStore
     branches: dict[str, Branch]
     tags: dict[str, Tag]
     head_info: HeadInfo
+    hidden_ref_count: int = 0
+    walked_ids: tuple[str, ...] = ()
+    boundary_ids: frozenset[str] = frozenset()
+    fingerprint: RepositoryFingerprint | None = None
 
     @classmethod
-    def load_from(cls, repo: GitRepository) -> "GitGraphData":
+    def load_from(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        cls,
+        repo: GitRepository,
+        lazy: bool = False,
+        max_commits: int | None = None,
+        since: int | None = None,
+        memory_budget: int | None = None,
+    ) -> "GitGraphData":
         """
         Load repository data.
 
-        Retrieves all commits, branches, tags, and HEAD info from the repository.
+        Retrieves all commits, branches, tags, and HEAD info from the repository. References are read once and shared between branches and tags,
+        and commits are walked only from references kept by the repository's reference filter (plus HEAD).
+        In lazy mode, only the history of HEAD is walked. History can be bounded by commit count and by commit date (Unix timestamp);
+        commits whose parents were not loaded are marked as boundary commits. A memory budget (in bytes) bounds the memory held by decoded commits.
         """
+        # Taken first, so changes made while loading are picked up by the next reload
+        fingerprint: RepositoryFingerprint = repo.get_fingerprint()
+        refs: dict[str, RefRecord] = repo.refs.get_all()
+        head_info: HeadInfo = repo.head.get_info()
+
+        start_ids: list[str] = _get_start_ids(refs, head_info, lazy)
+
+        commits: CommitStore = CommitStore.from_commits(
+            repo.commits.iter_all(start_ids, max_count=max_commits, since=since),
+            repo.commits,
+            memory_budget,
+        )
         return cls(
-            commits=repo.commits.get_all(),
-            branches=repo.branches.get_all(),
-            tags=repo.tags.get_all(),
-            head_info=repo.head.get_info(),
+            commits=commits,
+            branches=repo.branches.get_all(refs),
+            tags=repo.tags.get_all(refs),
+            head_info=head_info,
+            hidden_ref_count=repo.refs.hidden_count,
+            walked_ids=tuple(start_ids),
+            boundary_ids=commits.get_boundary_ids(),
+            fingerprint=fingerprint,
+        )
+
+    @staticmethod
+    def load_columns(  # pylint: disable=too-many-locals
+        repo: GitRepository,
+        max_commits: int | None = None,
+        since: int | None = None,
+    ) -> GraphColumns:
+        """
+        Load the commit graph of a repository as flat columns, without building graph data.
+
+        Walks the same history as load_from in full mode, but fills the columns straight from commit headers, so no commit model, message or commit store is created.
+        Rows are in walk order, and reference tips include all branches and tags kept by the reference filter, and HEAD.
+        """
+        refs: dict[str, RefRecord] = repo.refs.get_all()
+        head_info: HeadInfo = repo.head.get_info()
+
+        oid_size: int = 20
+        oids: bytearray = bytearray()
+        rows: dict[bytes, int] = {}
+        parent_oids: list[bytes] = []
+        parent_offsets: array = array("q", [0])
+        commit_times: array = array("q")
+        author_ids: array = array("q")
+        authors: dict[tuple[str, str], int] = {}
+        for oid, parents, commit_time, name, email in repo.commits.iter_headers(
+            _get_start_ids(refs, head_info, False), max_commits, since
+        ):
+            oid_size = len(oid)
+            rows[oid] = len(rows)
+            oids += oid
+            parent_oids.extend(parents)
+            parent_offsets.append(len(parent_oids))
+            commit_times.append(commit_time)
+            author_ids.append(authors.setdefault((name, email), len(authors)))
+
+        ref_names: list[str] = []
+        ref_rows: array = array("q")
+        for name, target_id in _get_ref_targets(
+            repo.branches.get_all(refs), repo.tags.get_all(refs), head_info
+        ).items():
+            row: int | None = rows.get(bytes.fromhex(target_id))
+            if row is not None:
+                ref_names.append(name)
+                ref_rows.append(row)
+
+        return GraphColumns(
+            oid_size=oid_size,
+            oids=bytes(oids),
+            parent_offsets=parent_offsets,
+            parent_rows=array("q", (rows.get(oid, -1) for oid in parent_oids)),
+            commit_times=commit_times,
+            author_ids=author_ids,
+            authors=tuple(authors),
+            ref_names=tuple(ref_names),
+            ref_rows=ref_rows,
+        )
+
+    def refresh(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        repo: GitRepository,
+        lazy: bool = False,
+        max_commits: int | None = None,
+        since: int | None = None,
+        walk: (
+            Callable[
+                [list[str], Iterable[str], int | None, int | None], Iterable[Commit]
+            ]
+            | None
+        ) = None,
+    ) -> "GitGraphData":
+        """
+        Load a new snapshot of the repository that shares unchanged data with this one.
+
+        Only history not reachable from the previously walked starting points is walked, and commits that became unreachable are found by walking
+        from the dropped starting points only. The commit store is shared with this snapshot, and unchanged branches and tags keep their identity,
+        so the memory needed for the new snapshot scales with the changes rather than with the size of the repository.
+        In lazy mode, references whose history was loaded before stay loaded. New history is walked by walk, called like CommitAccess.iter_all, if given.
+        """
+        fingerprint: RepositoryFingerprint = repo.get_fingerprint()
+        refs: dict[str, RefRecord] = repo.refs.get_all()
+        head_info: HeadInfo = repo.head.get_info()
+        start_ids: list[str] = _get_start_ids(
+            refs, head_info, lazy, frozenset(self.walked_ids)
         )
+
+        kept_ids: set[str] = set(start_ids)
+        dropped_ids: list[str] = [
+            commit_id for commit_id in self.walked_ids if commit_id not in kept_ids
+        ]
+        commits: CommitStore = (
+            self.commits.without(repo.commits.iter_ids(dropped_ids, start_ids))
+            if dropped_ids
+            else self.commits.copy()
+        )
+        commits.access = repo.commits
+
+        base: CommitStore = commits.copy()
+        commits.update(
+            (walk or repo.commits.iter_all)(
+                start_ids, self.walked_ids, max_commits, since
+            )
+        )
+
+        boundary_ids: frozenset[str] = _update_boundary_ids(
+            self.boundary_ids, base, commits
+        )
+
+        return GitGraphData(
+            commits=commits,
+            branches=_share_unchanged(self.branches, repo.branches.get_all(refs)),
+            tags=_share_unchanged(self.tags, repo.tags.get_all(refs)),
+            head_info=head_info,
+            hidden_ref_count=repo.refs.hidden_count,
+            walked_ids=tuple(start_ids),
+            boundary_ids=boundary_ids,
+            fingerprint=fingerprint,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare snapshots.
+
+        Snapshots of the same repository state with the same number of loaded commits are equal. Without fingerprints, all fields are compared.
+        """
+        if not isinstance(other, GitGraphData):
+            return NotImplemented
+        if self.fingerprint is not None and other.fingerprint is not None:
+            return self.fingerprint == other.fingerprint and len(self.commits) == len(
+                other.commits
+            )
+        return all(
+            getattr(self, field.name) == getattr(other, field.name)
+            for field in fields(self)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def pending_ids(self) -> list[str]:
+        """
+        Get branch and tag targets whose history is not loaded yet.
+
+        Returns an empty list if the snapshot contains the history of every reference.
+        """
+        target_ids: list[str] = [branch.target_id for branch in self.branches.values()]
+        target_ids.extend(tag.target_id for tag in self.tags.values())
+
+        # Deduplicate while keeping reference order
+        return list(
+            dict.fromkeys(
+                target_id for target_id in target_ids if target_id not in self.commits
+            )
+        )
+
+    def extend(
+        self,
+        repo: GitRepository,
+        start_ids: list[str],
+        max_commits: int | None = None,
+        since: int | None = None,
+    ) -> "GitGraphData":
+        """
+        Load the history of further starting points.
+
+        Walks from the given commit IDs, stopping at commits already in the snapshot, and returns a new snapshot containing both old and new commits.
+        """
+        merged: CommitStore = self.commits.copy()
+        merged.update(
+            repo.commits.iter_all(
+                start_ids,
+                exclude_ids=self.walked_ids,
+                max_count=max_commits,
+                since=since,
+            )
+        )
+        if len(merged) == len(self.commits):
+            return self
+
+        return replace(
+            self,
+            commits=merged,
+            walked_ids=self.walked_ids + tuple(start_ids),
+            boundary_ids=_update_boundary_ids(self.boundary_ids, self.commits, merged),
+        )
+
+    def expand(
+        self,
+        repo: GitRepository,
+        max_commits: int,
+        commit_ids: list[str] | None = None,
+    ) -> "GitGraphData":
+        """
+        Load the next chunk of history past boundary commits.
+
+        Walks from the missing parents of the given boundary commits (or all boundary commits), loading up to max_commits commits.
+        Returns a new snapshot in which already loaded commits keep their identity.
+        """
+        boundary: list[str] = sorted(
+            self.boundary_ids
+            if commit_ids is None
+            else self.boundary_ids & set(commit_ids)
+        )
+        start_ids: list[str] = [
+            parent_id
+            for commit_id in boundary
+            for parent_id in self.commits.get_parent_ids(commit_id)
+            if parent_id not in self.commits
+        ]
+        if not start_ids:
+            return self
+
+        merged: CommitStore = self.commits.copy()
+        merged.update(repo.commits.iter_all(start_ids, max_count=max_commits))
+        return replace(
+            self,
+            commits=merged,
+            boundary_ids=_update_boundary_ids(self.boundary_ids, self.commits, merged),
+        )
+
+    def to_columns(self, identities: IdentityPool | None = None) -> GraphColumns:
+        """
+        Export the loaded commit graph as flat columns.
+
+        Built from the resident topology, without decoding commits. Reference tips include all loaded branches and tags, and HEAD.
+        Authors are listed from the given pool, which should be the one the commits were loaded with.
+        """
+        return self.commits.to_columns(
+            _get_ref_targets(self.branches, self.tags, self.head_info), identities
+        )
+
+
+def _update_boundary_ids(
+    boundary_ids: frozenset[str], base: CommitStore, commits: CommitStore
+) -> frozenset[str]:
+    """
+    Find the boundary commits of a store after commits were added to it.
+
+    Only the boundary commits of base and commits added since can be at the boundary, so paging through history costs time proportional to each page.
+    Checks all commits if the store no longer shares its graph with base.
+    """
+    changes: tuple[list[str], list[str]] | None = commits.get_changes_since(base)
+    if changes is None:
+        return commits.get_boundary_ids()
+    return commits.get_boundary_ids(chain(boundary_ids, changes[0]))
+
+
+def _get_start_ids(
+    refs: dict[str, RefRecord],
+    head_info: HeadInfo,
+    lazy: bool,
+    walked_ids: frozenset[str] = frozenset(),
+) -> list[str]:
+    """
+    Get the commit IDs to walk history from.
+
+    Returns the peeled targets of all references and HEAD. In lazy mode, only HEAD and references whose targets are in walked_ids are included.
+    """
+    start_ids: list[str] = [
+        target_id
+        for target_id in (
+            record.peeled_id or record.target_id for record in refs.values()
+        )
+        if not lazy or target_id in walked_ids
+    ]
+    if head_info.target_id is not None:
+        start_ids.append(head_info.target_id)
+    return start_ids
+
+
+def _get_ref_targets(
+    branches: dict[str, Branch], tags: dict[str, Tag], head_info: HeadInfo
+) -> dict[str, str]:
+    """
+    Map reference names to the commits they point to.
+
+    Includes all branches and tags, and HEAD unless it is unborn.
+    """
+    ref_targets: dict[str, str] = {
+        name: branch.target_id for name, branch in branches.items()
+    }
+    ref_targets.update((name, tag.target_id) for name, tag in tags.items())
+    if head_info.target_id is not None:
+        ref_targets["HEAD"] = head_info.target_id
+    return ref_targets
+
+
+def _share_unchanged(old: dict[str, RefT], new: dict[str, RefT]) -> dict[str, RefT]:
+    """
+    Reuse unchanged references of an older snapshot.
+
+    Returns the new references, with those equal to an old one replaced by the old instance.
+    """
+    shared: dict[str, RefT] = {}
+    for name, ref in new.items():
+        old_ref: RefT | None = old.get(name)
+        shared[name] = old_ref if old_ref == ref else ref
+    return shared
@@ -0,0 +1,376 @@
+"""
+Graph loading in a separate process.
+
+Provides load_in_process, which loads graph data in a child process and hands the commits over through a memory-mapped commit table,
+walk_in_process, which walks further history the same way, and load_from_daemon and load_commits_from_daemon, which take over the graph data or commits of a running daemon.
+"""
+
+import multiprocessing
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from pathlib import Path
+from typing import Any
+
+from gittergraph.access import GitRepository, RefFilter
+from gittergraph.access.daemon_client import (
+    PROTOCOL_VERSION,
+    DaemonClient,
+    get_socket_path,
+)
+from gittergraph.access.fingerprint_access import RepositoryFingerprint
+from gittergraph.access.identity_pool import IdentityPool
+from gittergraph.core.commit_store import CommitStore
+from gittergraph.core.commit_table import CommitTable
+from gittergraph.core.graph_data import GitGraphData
+from gittergraph.core.graph_options import GraphOptions
+from gittergraph.models import Branch, Commit, HeadInfo, HeadState, Tag
+
+# Memory-backed on Linux, so a table never touches the disk
+_SHARED_MEMORY_DIR: str = "/dev/shm"
+
+
+def load_in_process(repo: GitRepository, options: GraphOptions) -> GitGraphData:
+    """
+    Load graph data in a loader process.
+
+    The child walks and decodes the history and writes it to a commit table, while the calling process only waits and then maps the table,
+    so decoding never competes with the caller for the GIL. The returned commit store decodes payloads from the mapping on demand and re-fetches commits added later through the repository.
+    """
+    table_path: str = _create_table_file()
+    try:
+        # Forking a process that runs threads is unsafe, so the loader always starts fresh
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            snapshot: dict[str, Any] = executor.submit(
+                _load_table,
+                str(repo.path),
+                repo.ref_filter,
+                repo.backend.name,
+                repo.jobs,
+                options,
+                table_path,
+            ).result()
+        table: CommitTable = CommitTable(table_path)
+    finally:
+        # The mapping outlives the file
+        os.unlink(table_path)
+
+    return GitGraphData(
+        commits=CommitStore.from_table(table, repo.commits, options.memory_budget),
+        **snapshot,
+    )
+
+
+def walk_in_process(
+    repo: GitRepository,
+    start_ids: list[str],
+    exclude_ids: Iterable[str] = (),
+    max_count: int | None = None,
+    since: int | None = None,
+) -> Iterator[Commit]:
+    """
+    Walk commits in a loader process.
+
+    Same walk as CommitAccess.iter_all, for refreshing graph data. The child reads and decodes the commits and writes them to a commit table,
+    and the returned iterator builds models from the mapped table with the repository's identity pool, which is cheap compared to reading objects.
+    """
+    table_path: str = _create_table_file()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            executor.submit(
+                _walk_table,
+                str(repo.path),
+                repo.backend.name,
+                repo.jobs,
+                list(start_ids),
+                list(exclude_ids),
+                max_count,
+                since,
+                table_path,
+            ).result()
+        table: CommitTable = CommitTable(table_path)
+    finally:
+        os.unlink(table_path)
+
+    return (table.get_commit(index, repo.identities) for index in range(len(table)))
+
+
+def load_from_daemon(repo: GitRepository, options: GraphOptions) -> GitGraphData | None:
+    """
+    Take over the graph data of a daemon serving the repository.
+
+    Maps the commit table published by the daemon, so no history is walked or decoded. Returns None if no daemon is running,
+    if it loaded the repository with options that give different data, or if it serves another repository or offers a table outside the table directory.
+    """
+    published: tuple[CommitTable, dict[str, Any]] | None = _map_published_table(
+        repo, options
+    )
+    if published is None:
+        return None
+    try:
+        return _build_data(repo, options, *published)
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+
+def load_commits_from_daemon(repo: GitRepository) -> CommitStore | None:
+    """
+    Take over the commits of a daemon serving the repository.
+
+    Maps the commit table published by the daemon whatever options it loaded the repository with, for reading commits by ID without walking history.
+    Payloads are decoded from the mapping and not kept. Returns None if no daemon is running, if it serves another repository, or if it offers a table outside the table directory.
+    """
+    published: tuple[CommitTable, dict[str, Any]] | None = _map_published_table(
+        repo, None
+    )
+    if published is None:
+        return None
+    return CommitStore.from_table(published[0], repo.commits, 0)
+
+
+def _map_published_table(
+    repo: GitRepository, options: GraphOptions | None
+) -> tuple[CommitTable, dict[str, Any]] | None:
+    """
+    Map the commit table published by a daemon serving the repository.
+
+    The daemon must have loaded the repository with the given options, unless None. Returns the table and the rest of the snapshot, or None.
+    """
+    client: DaemonClient | None = DaemonClient.connect(get_socket_path(repo.path))
+    if client is None:
+        return None
+
+    try:
+        with client:
+            info: dict[str, Any] = client.ping()
+            if (
+                info.get("version") != PROTOCOL_VERSION
+                or (
+                    options is not None
+                    and info.get("options") != describe_options(repo, options)
+                )
+                or Path(info["path"]).resolve() != repo.path.resolve()
+            ):
+                return None
+            snapshot: dict[str, Any] = client.get_snapshot()
+        if not _is_table_path(snapshot["table"]):
+            return None
+        # The daemon deletes the file once its data changes, but the mapping stays valid
+        return CommitTable(snapshot["table"]), snapshot
+    except (AttributeError, KeyError, OSError, TypeError, ValueError):
+        return None
+
+
+def _build_data(
+    repo: GitRepository,
+    options: GraphOptions,
+    table: CommitTable,
+    snapshot: dict[str, Any],
+) -> GitGraphData:
+    """
+    Build graph data from a commit table and a daemon snapshot.
+
+    Raises KeyError, TypeError, or ValueError if the snapshot is malformed.
+    """
+    return GitGraphData(
+        commits=CommitStore.from_table(table, repo.commits, options.memory_budget),
+        branches={
+            name: Branch(target_id=target_id, name=name)
+            for name, target_id in snapshot["branches"]
+        },
+        tags={
+            name: Tag(target_id=target_id, name=name, object_id=object_id)
+            for name, target_id, object_id in snapshot["tags"]
+        },
+        head_info=HeadInfo(
+            state=HeadState(snapshot["head"][0]),
+            target_id=snapshot["head"][1],
+            branch_name=snapshot["head"][2],
+        ),
+        hidden_ref_count=snapshot["hidden_ref_count"],
+        walked_ids=tuple(snapshot["walked_ids"]),
+        boundary_ids=frozenset(snapshot["boundary_ids"]),
+        fingerprint=(
+            RepositoryFingerprint(*snapshot["fingerprint"])
+            if snapshot["fingerprint"] is not None
+            else None
+        ),
+    )
+
+
+def publish_snapshot(
+    data: GitGraphData, previous: CommitTable | None = None
+) -> dict[str, Any]:
+    """
+    Publish graph data for load_from_daemon.
+
+    Writes the commits to a new commit table file, which the caller deletes once it is no longer offered. Commits found in a previously published table
+    are copied from it, so only new commits are read from the commit store. Returns the file path, references, HEAD, and loading state.
+    """
+    return {
+        "table": write_table(_iter_published(data.commits, previous)),
+        "branches": [
+            [name, branch.target_id] for name, branch in data.branches.items()
+        ],
+        "tags": [
+            [name, tag.target_id, tag.object_id] for name, tag in data.tags.items()
+        ],
+        "head": [
+            data.head_info.state.value,
+            data.head_info.target_id,
+            data.head_info.branch_name,
+        ],
+        "hidden_ref_count": data.hidden_ref_count,
+        "walked_ids": list(data.walked_ids),
+        "boundary_ids": sorted(data.boundary_ids),
+        "fingerprint": (
+            [data.fingerprint.digest, data.fingerprint.ref_file_count]
+            if data.fingerprint is not None
+            else None
+        ),
+    }
+
+
+def describe_options(repo: GitRepository, options: GraphOptions) -> dict[str, Any]:
+    """
+    Describe the options that loaded graph data depends on.
+
+    Graph data can be taken over from a daemon only if both describe their options the same way.
+    """
+    return {
+        "include": list(repo.ref_filter.include),
+        "exclude": list(repo.ref_filter.exclude),
+        "lazy": options.lazy,
+        "max_commits": options.max_commits,
+        "since": options.since,
+    }
+
+
+def write_table(commits: Iterable[Commit]) -> str:
+    """
+    Write commits to a new commit table file.
+
+    The file is created in shared memory if available. Returns its path; the caller deletes the file.
+    """
+    table_path: str = _create_table_file()
+    try:
+        CommitTable.write(table_path, commits)
+    except BaseException:
+        os.unlink(table_path)
+        raise
+    return table_path
+
+
+def _iter_published(
+    commits: CommitStore, previous: CommitTable | None
+) -> Iterator[Commit]:
+    """
+    Iterate over the commits of a store for publishing.
+
+    Decodes commits found in the previous table from it, which never evicts payloads from the store or reads them from the repository again.
+    """
+    if previous is None:
+        yield from commits.values()
+        return
+
+    identities: IdentityPool = IdentityPool()
+    for commit_id in commits:
+        row: int | None = previous.find(commit_id)
+        yield (
+            previous.get_commit(row, identities)
+            if row is not None
+            else commits[commit_id]
+        )
+
+
+def _load_table(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    path: str,
+    ref_filter: RefFilter,
+    backend: str,
+    jobs: int,
+    options: GraphOptions,
+    table_path: str,
+) -> dict[str, Any]:
+    """
+    Load graph data and write its commits to a commit table.
+
+    Runs in the loader process. Returns the other fields of the snapshot, which are small enough to be pickled.
+    """
+    repo: GitRepository = GitRepository(path, ref_filter, backend, jobs)
+    data: GitGraphData = GitGraphData.load_from(
+        repo,
+        options.lazy,
+        options.max_commits,
+        options.since,
+        options.memory_budget,
+    )
+    CommitTable.write(table_path, data.commits.values())
+    return {
+        field.name: getattr(data, field.name)
+        for field in fields(data)
+        if field.name != "commits"
+    }
+
+
+def _walk_table(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    path: str,
+    backend: str,
+    jobs: int,
+    start_ids: list[str],
+    exclude_ids: list[str],
+    max_count: int | None,
+    since: int | None,
+    table_path: str,
+) -> int:
+    """
+    Walk commits and write them to a commit table.
+
+    Runs in the loader process. Returns the number of commits written.
+    """
+    repo: GitRepository = GitRepository(path, backend=backend, jobs=jobs)
+    return CommitTable.write(
+        table_path, repo.commits.iter_all(start_ids, exclude_ids, max_count, since)
+    )
+
+
+def _create_table_file() -> str:
+    """
+    Create an empty commit table file.
+
+    Returns the path of a new file in the table directory.
+    """
+    descriptor, table_path = tempfile.mkstemp(
+        prefix="gittergraph-", suffix=".table", dir=_get_table_dir()
+    )
+    os.close(descriptor)
+    return table_path
+
+
+def _is_table_path(path: str) -> bool:
+    """
+    Check that a path names a commit table in the table directory.
+
+    Resolves symbolic links first, so a table offered by a daemon cannot point at any other file.
+    """
+    table_path: Path = Path(path).resolve()
+    table_dir: Path = Path(_get_table_dir() or tempfile.gettempdir()).resolve()
+    return (
+        table_path.parent == table_dir
+        and table_path.name.startswith("gittergraph-")
+        and table_path.suffix == ".table"
+    )
+
+
+def _get_table_dir() -> str | None:
+    """
+    Get the directory commit tables are written to.
+
+    Returns None for the default temporary directory if shared memory is not available as a directory.
+    """
+    return _SHARED_MEMORY_DIR if os.access(_SHARED_MEMORY_DIR, os.W_OK) else None
@@ -0,0 +1,50 @@
+"""
+Graph loading options.
+
+Provides the GraphOptions dataclass for configuring how a GitGraph loads repository data.
+"""
+
+from dataclasses import dataclass
+
+from gittergraph.access import RefFilter
+
+
+@dataclass(slots=True, frozen=True)
+class GraphOptions:  # pylint: disable=too-many-instance-attributes
+    """
+    Options for loading a git graph.
+
+    Holds the reference filter applied before any reference is resolved or walked, whether history beyond HEAD is loaded lazily,
+    the commit count and date (Unix timestamp) bounds of loaded history, the memory budget (in bytes) for decoded commits,
+    whether the repository is watched for changes and reloaded automatically, the name of the backend commits and references are loaded through (None for the configured one), the number of processes decoding commits,
+    whether commits are loaded in a separate process and shared through a memory-mapped commit table, and whether the data of a running daemon is taken over instead of loading.
+    """
+
+    ref_filter: RefFilter = RefFilter()
+    lazy: bool = False
+    max_commits: int | None = None
+    since: int | None = None
+    memory_budget: int | None = None
+    watch: bool = False
+    backend: str | None = None
+    jobs: int = 1
+    loader_process: bool = False
+    use_daemon: bool = True
+
+    def __post_init__(self) -> None:
+        """
+        Validate the options.
+
+        Raises ValueError if a commit count bound is given but not positive, since no page of history could ever be loaded.
+        """
+        if self.max_commits is not None and self.max_commits < 1:
+            raise ValueError(f"max_commits must be positive, got {self.max_commits}")
+
+    @property
+    def is_bounded(self) -> bool:
+        """
+        Check if loaded history is bounded.
+
+        Returns True if a commit count or date limit is set.
+        """
+        return self.max_commits is not None or self.since is not None
@@ -0,0 +1,143 @@
+"""
+Versioned graph snapshots.
+
+Provides the GraphSnapshot class, which binds one version of graph data to the helper indexes built from it.
+"""
+
+from gittergraph.core.graph_change_set import GraphChangeSet
+from gittergraph.core.graph_data import GitGraphData
+from gittergraph.core.history_walker import HistoryWalker
+from gittergraph.core.ref_index import RefIndex
+from gittergraph.core.ref_resolver import RefResolver
+from gittergraph.models import Branch, Commit, Tag, TagAnnotation
+
+
+class GraphSnapshot:
+    """
+    Immutable graph data at one version, with its helpers.
+
+    Every query against a snapshot sees the same data, however the graph changes afterwards, so readers can pin a snapshot and query it without locks.
+    Snapshots are never modified once created; a new version shares unchanged data and helpers with the previous one.
+    """
+
+    def __init__(
+        self,
+        data: GitGraphData,
+        version: int = 0,
+        previous: "GraphSnapshot | None" = None,
+        changes: GraphChangeSet | None = None,
+    ) -> None:
+        """
+        Initialize snapshot of graph data.
+
+        Without a previous snapshot, the reference index is built from scratch. Otherwise, the references are those of the previous snapshot updated by changes
+        (unchanged if None), and the reference index is updated in time proportional to the changed references.
+        """
+        self.version: int = version
+        self.data: GitGraphData = data
+
+        # Annotations are inflated on first request, and only dropped for tags that changed
+        self.tag_annotations: dict[str, TagAnnotation | None]
+        self._ref_index: RefIndex
+        if previous is None:
+            self._ref_index = RefIndex(data.branches, data.tags)
+            self.tag_annotations = {}
+        elif changes is None:
+            self._ref_index = previous._ref_index
+            self.tag_annotations = previous.tag_annotations
+        else:
+            self._ref_index = previous._ref_index.updated(
+                data.branches, data.tags, changes
+            )
+            stale: set[str] = {*changes.tags.removed, *changes.tags.moved}
+            self.tag_annotations = {
+                name: annotation
+                for name, annotation in previous.tag_annotations.items()
+                if name not in stale
+            }
+
+        self._history_walker: HistoryWalker = HistoryWalker(data.commits)
+        self._ref_resolver: RefResolver = RefResolver(
+            data.commits, data.branches, data.tags, data.head_info
+        )
+
+    def get_branches_at_commit(self, commit_id: str) -> list[Branch]:
+        """
+        Get all branches pointing to a commit.
+
+        Returns an empty list if no branches point to the commit.
+        """
+        return self._ref_index.get_branches_at_commit(commit_id)
+
+    def get_tags_at_commit(self, commit_id: str) -> list[Tag]:
+        """
+        Get all tags pointing to a commit.
+
+        Returns an empty list if no tags point to the commit.
+        """
+        return self._ref_index.get_tags_at_commit(commit_id)
+
+    def resolve(self, ref: str) -> str | None:
+        """
+        Resolve a reference name to a commit ID.
+
+        Handles HEAD, commit IDs, branch names, and tag names. Returns None if the reference cannot be resolved.
+        """
+        return self._ref_resolver.resolve(ref)
+
+    def get_linear_history(self, start_ref: str = "HEAD") -> list[Commit]:
+        """
+        Get linear first-parent history from a reference.
+
+        Only loaded commits are included. Returns commits in newest-first order, or an empty list if the reference cannot be resolved.
+        """
+        start_id: str | None = self._ref_resolver.resolve(start_ref)
+        if start_id is None:
+            return []
+
+        return self._history_walker.get_linear_history_from_commit(start_id)
+
+    def is_truncated(self, start_ref: str = "HEAD") -> bool:
+        """
+        Check if the linear history of a reference ends at a load boundary.
+
+        Returns False if the reference cannot be resolved.
+        """
+        start_id: str | None = self._ref_resolver.resolve(start_ref)
+        if start_id is None:
+            return False
+
+        return self._history_walker.is_truncated(start_id)
+
+    def is_ancestor(self, ancestor_ref: str, ref: str) -> bool:
+        """
+        Check if one reference is an ancestor of another.
+
+        Walks the loaded history of ref, which counts as its own ancestor. Returns False if either reference cannot be resolved.
+        """
+        ancestor_id: str | None = self._ref_resolver.resolve(ancestor_ref)
+        commit_id: str | None = self._ref_resolver.resolve(ref)
+        if ancestor_id is None or commit_id is None:
+            return False
+
+        return self._history_walker.is_ancestor(ancestor_id, commit_id)
+
+    def search(self, text: str, limit: int | None = None) -> list[Commit]:
+        """
+        Search loaded commits.
+
+        Matches the text case-insensitively against messages, author names and emails, and commit ID prefixes. Returns up to limit matches in load order.
+        """
+        needle: str = text.casefold()
+        matches: list[Commit] = []
+        for commit in self.data.commits.values():
+            if limit is not None and len(matches) >= limit:
+                break
+            if (
+                commit.id.startswith(needle)
+                or needle in commit.message.casefold()
+                or needle in commit.author.name.casefold()
+                or needle in commit.author.email.casefold()
+            ):
+                matches.append(commit)
+        return matches
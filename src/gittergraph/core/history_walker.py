@@ -6,23 +6,26 @@ Commit history traversal.
 Provides the HistoryWalker class for traversing commit graphs and building history sequences for visualization.
 """
 
+from collections.abc import Mapping
+
+from gittergraph.core.commit_store import CommitStore
 from gittergraph.models import Commit
 
 
-class HistoryWalker:  # pylint: disable=too-few-public-methods
+class HistoryWalker:
     """
     Helper for traversing commit history.
 
     Provides methods for walking first-parent chains and other traversals.
     """
 
-    def __init__(self, commits: dict[str, Commit]) -> None:
+    def __init__(self, commits: Mapping[str, Commit]) -> None:
         """
         Initialize history walker.
 
-        Stores the commit dictionary for traversal operations.
+        Stores the commit mapping for traversal operations.
         """
-        self.commits: dict[str, Commit] = commits
+        self.commits: Mapping[str, Commit] = commits
 
     def get_linear_history_from_commit(self, commit_id: str) -> list[Commit]:
         """
@@ -43,3 +46,52 @@ class HistoryWalker:  # pylint: disable=too-few-public-methods
                 break
 
         return history
+
+    def is_truncated(self, commit_id: str) -> bool:
+        """
+        Check if the first-parent history of a commit ends at a load boundary.
+
+        Returns True if the chain reaches a commit whose first parent was not loaded, as opposed to a true root commit.
+        Commit stores answer this from their resident topology without loading commit payloads.
+        """
+        if isinstance(self.commits, CommitStore):
+            return self.commits.is_truncated(commit_id)
+
+        current_id: str = commit_id
+
+        while current_id in self.commits:
+            commit: Commit = self.commits[current_id]
+            if not commit.parent_ids:
+                return False
+            current_id = commit.parent_ids[0]
+
+        return current_id != commit_id
+
+    def is_ancestor(self, ancestor_id: str, commit_id: str) -> bool:
+        """
+        Check if a commit is reachable from another through parent links.
+
+        Only loaded commits are walked, and a commit counts as its own ancestor. Commit stores answer this from their resident topology.
+        """
+        pending: list[str] = [commit_id]
+        seen: set[str] = set()
+        while pending:
+            current_id: str = pending.pop()
+            if current_id == ancestor_id:
+                return True
+            if current_id in seen or current_id not in self.commits:
+                continue
+            seen.add(current_id)
+            pending.extend(self._get_parent_ids(current_id))
+
+        return False
+
+    def _get_parent_ids(self, commit_id: str) -> tuple[str, ...] | list[str]:
+        """
+        Get the parent IDs of a loaded commit.
+
+        Avoids loading the commit payload if the commits are in a commit store.
+        """
+        if isinstance(self.commits, CommitStore):
+            return self.commits.get_parent_ids(commit_id)
+        return self.commits[commit_id].parent_ids
@@ -0,0 +1,41 @@
+"""
+Memory usage report.
+
+Provides the MemoryUsage dataclass summarizing process memory and commit payload cache usage of a graph.
+"""
+
+from dataclasses import dataclass
+
+from gittergraph.utils.memory import format_size
+
+
+@dataclass(slots=True, frozen=True)
+class MemoryUsage:
+    """
+    Memory usage of a loaded graph.
+
+    Holds the resident memory of the process and the size, budget, and fill level of the commit payload cache.
+    """
+
+    resident_bytes: int
+    cached_bytes: int
+    budget_bytes: int | None
+    cached_commits: int
+    total_commits: int
+
+    def __str__(self) -> str:
+        """
+        Format as a one-line summary.
+
+        Returns resident memory followed by commit cache usage.
+        """
+        budget: str = (
+            f" / {format_size(self.budget_bytes)}"
+            if self.budget_bytes is not None
+            else ""
+        )
+        return (
+            f"Resident {format_size(self.resident_bytes)}, "
+            f"commit cache {format_size(self.cached_bytes)}{budget} "
+            f"({self.cached_commits:,} of {self.total_commits:,} commits)"
+        )
@@ -6,14 +6,23 @@ Reference indexing for fast lookups.
 Provides the RefIndex class for building and maintaining indexes that map commit IDs to their associated branches and tags.
 """
 
+import copy
+from bisect import insort
+from collections.abc import Mapping
+from typing import TypeVar
+
+from gittergraph.core.graph_change_set import GraphChangeSet, RefChanges
 from gittergraph.models import Branch, Tag
 
+RefT = TypeVar("RefT", Branch, Tag)
+
 
 class RefIndex:
     """
     Index for fast lookups of references by commit ID.
 
-    Builds and maintains dictionaries mapping commits to their branches and tags.
+    Builds and maintains dictionaries mapping commits to their branches and tags. References at a commit are ordered by name.
+    The index can be updated from reference changes in time proportional to the number of changed references.
     """
 
     def __init__(self, branches: dict[str, Branch], tags: dict[str, Tag]) -> None:
@@ -24,6 +33,8 @@ class RefIndex:
         """
         self._branches_by_commit: dict[str, list[Branch]] = {}
         self._tags_by_commit: dict[str, list[Tag]] = {}
+        self._branch_targets: dict[str, str] = {}
+        self._tag_targets: dict[str, str] = {}
         self._build_index_branches(branches)
         self._build_index_tags(tags)
 
@@ -33,11 +44,7 @@ class RefIndex:
 
         Creates a reverse index from commit IDs to lists of branches pointing to them.
         """
-        for branch in branches.values():
-            target: str = branch.target_id
-            if target not in self._branches_by_commit:
-                self._branches_by_commit[target] = []
-            self._branches_by_commit[target].append(branch)
+        _build_index(self._branches_by_commit, self._branch_targets, branches)
 
     def _build_index_tags(self, tags: dict[str, Tag]) -> None:
         """
@@ -45,11 +52,33 @@ class RefIndex:
 
         Creates a reverse index from commit IDs to lists of tags pointing to them.
         """
-        for tag in tags.values():
-            target: str = tag.target_id
-            if target not in self._tags_by_commit:
-                self._tags_by_commit[target] = []
-            self._tags_by_commit[target].append(tag)
+        _build_index(self._tags_by_commit, self._tag_targets, tags)
+
+    def updated(
+        self,
+        branches: Mapping[str, Branch],
+        tags: Mapping[str, Tag],
+        changes: GraphChangeSet,
+    ) -> "RefIndex":
+        """
+        Get a copy of the index updated from reference changes.
+
+        Only the changed references are looked up in the given maps of all current branches and tags. The index itself is left unchanged,
+        and lists previously returned by the getters are never modified, so callers can compare old and new results.
+        """
+        index: RefIndex = copy.copy(self)
+        # pylint: disable=protected-access
+        index._branches_by_commit = dict(self._branches_by_commit)
+        index._branch_targets = dict(self._branch_targets)
+        index._tags_by_commit = dict(self._tags_by_commit)
+        index._tag_targets = dict(self._tag_targets)
+        _apply_ref_changes(
+            index._branches_by_commit, index._branch_targets, branches, changes.branches
+        )
+        _apply_ref_changes(
+            index._tags_by_commit, index._tag_targets, tags, changes.tags
+        )
+        return index
 
     def get_branches_at_commit(self, commit_id: str) -> list[Branch]:
         """
@@ -66,3 +95,82 @@ class RefIndex:
         Returns an empty list if no tags point to the commit.
         """
         return self._tags_by_commit.get(commit_id, [])
+
+
+def _build_index(
+    refs_by_commit: dict[str, list[RefT]],
+    targets: dict[str, str],
+    refs: Mapping[str, RefT],
+) -> None:
+    """
+    Build an index of one kind of reference from scratch.
+
+    Each list is sorted once after all references are added.
+    """
+    for ref in refs.values():
+        refs_by_commit.setdefault(ref.target_id, []).append(ref)
+        targets[ref.name] = ref.target_id
+
+    for at_commit in refs_by_commit.values():
+        at_commit.sort(key=_get_name)
+
+
+def _apply_ref_changes(
+    refs_by_commit: dict[str, list[RefT]],
+    targets: dict[str, str],
+    refs: Mapping[str, RefT],
+    changes: RefChanges,
+) -> None:
+    """
+    Apply changes of one kind of reference to an index.
+
+    Moved references are removed from their old commit and added at their new one.
+    """
+    for name in (*changes.removed, *changes.moved):
+        _remove_ref(refs_by_commit, targets, name)
+    for name in (*changes.added, *changes.moved):
+        _add_ref(refs_by_commit, targets, refs[name])
+
+
+def _add_ref(
+    refs_by_commit: dict[str, list[RefT]], targets: dict[str, str], ref: RefT
+) -> None:
+    """
+    Add a reference to an index.
+
+    Replaces the list at the target commit with a copy that includes the reference, keeping references ordered by name.
+    """
+    at_commit: list[RefT] = list(refs_by_commit.get(ref.target_id, ()))
+    insort(at_commit, ref, key=_get_name)
+    refs_by_commit[ref.target_id] = at_commit
+    targets[ref.name] = ref.target_id
+
+
+def _remove_ref(
+    refs_by_commit: dict[str, list[RefT]], targets: dict[str, str], name: str
+) -> None:
+    """
+    Remove a reference from an index.
+
+    Replaces the list at the old target commit with a copy without the reference. Unknown names are ignored.
+    """
+    target: str | None = targets.pop(name, None)
+    if target is None:
+        return
+
+    at_commit: list[RefT] = [
+        ref for ref in refs_by_commit.get(target, ()) if ref.name != name
+    ]
+    if at_commit:
+        refs_by_commit[target] = at_commit
+    else:
+        refs_by_commit.pop(target, None)
+
+
+def _get_name(ref: Branch | Tag) -> str:
+    """
+    Get the name of a reference.
+
+    Used as the sort key of references at a commit.
+    """
+    return ref.name
@@ -6,6 +6,8 @@ Reference name resolution.
 Provides the RefResolver class for resolving reference names (branches, tags, HEAD, commit IDs) to commit IDs for graph operations.
 """
 
+from collections.abc import Mapping
+
 from gittergraph.models import Branch, Commit, HeadInfo, Tag
 
 
@@ -18,7 +20,7 @@ class RefResolver:  # pylint: disable=too-few-public-methods
 
     def __init__(
         self,
-        commits: dict[str, Commit],
+        commits: Mapping[str, Commit],
         branches: dict[str, Branch],
         tags: dict[str, Tag],
         head_info: HeadInfo,
@@ -28,7 +30,7 @@ class RefResolver:  # pylint: disable=too-few-public-methods
 
         Stores dictionaries of commits, branches, tags, and HEAD info for resolution.
         """
-        self.commits: dict[str, Commit] = commits
+        self.commits: Mapping[str, Commit] = commits
         self.branches: dict[str, Branch] = branches
         self.tags: dict[str, Tag] = tags
         self.head_info: HeadInfo = head_info
@@ -0,0 +1,252 @@
+"""
+Workspaces of many repositories.
+
+Provides the Workspace class for loading all repositories under a directory concurrently, and the RepositorySummary of a workspace repository.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+
+from gittergraph.access import GitRepository
+from gittergraph.core.graph import GitGraph
+from gittergraph.core.graph_data import GitGraphData
+from gittergraph.core.graph_options import GraphOptions
+
+
+class LoadState(Enum):
+    """
+    Loading state of a workspace repository.
+
+    Repositories start pending, and end up loaded or failed.
+    """
+
+    PENDING = "pending"
+    LOADING = "loading"
+    LOADED = "loaded"
+    FAILED = "failed"
+
+
+@dataclass(slots=True, frozen=True)
+class RepositorySummary:
+    """
+    Compact summary of a workspace repository.
+
+    Kept for every repository, including those whose graph was dropped to bound memory.
+    """
+
+    path: Path
+    state: LoadState = LoadState.PENDING
+    head: str | None = None
+    commit_count: int = 0
+    branch_count: int = 0
+    tag_count: int = 0
+    error: str | None = None
+
+    @property
+    def name(self) -> str:
+        """
+        Get the display name of the repository.
+
+        Returns the name of the repository directory.
+        """
+        return self.path.name
+
+    @classmethod
+    def from_graph(cls, path: Path, graph: GitGraph) -> "RepositorySummary":
+        """
+        Summarize a loaded graph.
+
+        HEAD is described by its branch name, or its abbreviated commit ID if detached.
+        """
+        data: GitGraphData = graph.data
+        head: str | None = data.head_info.branch_name or (
+            data.head_info.target_id[:7] if data.head_info.target_id else None
+        )
+        return cls(
+            path=path,
+            state=LoadState.LOADED,
+            head=head.removeprefix("refs/heads/") if head else None,
+            commit_count=len(data.commits),
+            branch_count=len(data.branches),
+            tag_count=len(data.tags),
+        )
+
+
+class Workspace:  # pylint: disable=too-many-instance-attributes
+    """
+    Repositories found under a directory.
+
+    Loads the graphs of all repositories concurrently on a bounded pool of threads. Only the graphs of the max_open most recently opened repositories are kept,
+    the others are dropped to their summary and loaded again when opened.
+    """
+
+    DEFAULT_MAX_WORKERS: int = 4
+
+    def __init__(
+        self,
+        root: str | Path,
+        options: GraphOptions | None = None,
+        max_workers: int | None = None,
+        max_open: int = 1,
+    ) -> None:
+        """
+        Initialize workspace of the repositories under a directory.
+
+        Finds the repositories, but does not load them yet. Loads run on up to max_workers threads (DEFAULT_MAX_WORKERS by default).
+        """
+        self.root: Path = Path(root)
+        self.options: GraphOptions = options or GraphOptions()
+        self.max_workers: int = max_workers or self.DEFAULT_MAX_WORKERS
+        self.max_open: int = max_open
+        self.paths: list[Path] = GitRepository.find_all(self.root)
+        self.summaries: dict[Path, RepositorySummary] = {
+            path: RepositorySummary(path) for path in self.paths
+        }
+
+        # Open graphs, least recently opened first, and the loads in progress
+        self._lock: threading.Lock = threading.Lock()
+        self._graphs: OrderedDict[Path, GitGraph] = OrderedDict()
+        self._loads: dict[Path, Future[GitGraph | None]] = {}
+
+    def load_all(
+        self, on_progress: Callable[[RepositorySummary], None] | None = None
+    ) -> None:
+        """
+        Load all repositories concurrently to summarize them.
+
+        Calls on_progress from the loading threads with the new summary whenever a repository starts or finishes loading.
+        The graphs are dropped once summarized, unless opened meanwhile. Open repositories are skipped, as their summaries are current.
+        """
+        with ThreadPoolExecutor(
+            self.max_workers, thread_name_prefix="gittergraph-workspace"
+        ) as executor:
+            for path in self.paths:
+                if not self.is_open(path):
+                    executor.submit(self._load, path, on_progress)
+
+    def open(
+        self,
+        path: Path,
+        on_progress: Callable[[RepositorySummary], None] | None = None,
+    ) -> GitGraph | None:
+        """
+        Get the graph of a repository, loading it if it was dropped.
+
+        Drops the graphs of the least recently opened repositories beyond max_open. Calls on_progress like load_all if the graph is loaded,
+        or waits for and keeps the graph of a load already in progress, such as one started by load_all. Returns None if the repository fails to load.
+        """
+        with self._lock:
+            graph: GitGraph | None = self._graphs.get(path)
+            if graph is not None:
+                self._graphs.move_to_end(path)
+                return graph
+
+        graph = self._load(path, on_progress)
+        if graph is None:
+            return None
+
+        dropped: list[GitGraph] = []
+        with self._lock:
+            self._graphs[path] = graph
+            self._graphs.move_to_end(path)
+            while len(self._graphs) > self.max_open:
+                dropped.append(self._graphs.popitem(last=False)[1])
+        for old_graph in dropped:
+            old_graph.stop_watching()
+        return graph
+
+    def is_open(self, path: Path) -> bool:
+        """
+        Check if the graph of a repository is kept.
+
+        Returns False for repositories dropped to their summary.
+        """
+        with self._lock:
+            return path in self._graphs
+
+    def close(self) -> None:
+        """
+        Drop all graphs.
+
+        Stops watching the repositories of open graphs.
+        """
+        with self._lock:
+            graphs: list[GitGraph] = list(self._graphs.values())
+            self._graphs.clear()
+        for graph in graphs:
+            graph.stop_watching()
+
+    def _load(
+        self,
+        path: Path,
+        on_progress: Callable[[RepositorySummary], None] | None = None,
+    ) -> GitGraph | None:
+        """
+        Load the graph of a repository unless it is open or already loading.
+
+        Returns the open graph, or waits for the load in progress and returns its result, so a repository is never loaded twice at once.
+        """
+        with self._lock:
+            graph: GitGraph | None = self._graphs.get(path)
+            if graph is not None:
+                return graph
+            pending: Future[GitGraph | None] | None = self._loads.get(path)
+            if pending is None:
+                future: Future[GitGraph | None] = Future()
+                self._loads[path] = future
+        if pending is not None:
+            return pending.result()
+
+        try:
+            graph = self._read(path, on_progress)
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        finally:
+            with self._lock:
+                del self._loads[path]
+        future.set_result(graph)
+        return graph
+
+    def _read(
+        self,
+        path: Path,
+        on_progress: Callable[[RepositorySummary], None] | None,
+    ) -> GitGraph | None:
+        """
+        Load the graph of a repository and update its summary.
+
+        Returns None if loading fails, and records the error in the summary.
+        """
+        self._set_summary(RepositorySummary(path, LoadState.LOADING), on_progress)
+        try:
+            graph: GitGraph = GitGraph.from_path(path, self.options)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            # A broken repository must not keep the others from loading
+            self._set_summary(
+                RepositorySummary(path, LoadState.FAILED, error=str(error)),
+                on_progress,
+            )
+            return None
+
+        self._set_summary(RepositorySummary.from_graph(path, graph), on_progress)
+        return graph
+
+    def _set_summary(
+        self,
+        summary: RepositorySummary,
+        on_progress: Callable[[RepositorySummary], None] | None,
+    ) -> None:
+        """
+        Record the summary of a repository.
+
+        Reports it to on_progress if given.
+        """
+        self.summaries[summary.path] = summary
+        if on_progress is not None:
+            on_progress(summary)
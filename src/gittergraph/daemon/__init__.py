@@ -0,0 +1,7 @@
+"""
+Graph daemon for gittergraph.
+
+Provides a daemon that keeps a graph loaded and answers queries over a Unix socket, so later launches on the same repository start without loading.
+"""
+
+from .server import GraphDaemon, serve
@@ -0,0 +1,375 @@
+"""
+Graph daemon server.
+
+Provides the GraphDaemon class, which keeps a GitGraph loaded, reloads it when the repository changes, and answers DaemonClient queries over a Unix socket.
+"""
+
+import json
+import os
+import socketserver
+import threading
+from collections.abc import Callable
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+from gittergraph.access.daemon_client import (
+    PROTOCOL_VERSION,
+    DaemonClient,
+    encode_commit,
+    get_peer_uid,
+    get_socket_path,
+    is_private_dir,
+)
+from gittergraph.core import GitGraph, GraphChangeSet, GraphOptions, GraphSnapshot
+from gittergraph.core.commit_table import CommitTable
+from gittergraph.core.graph_data import GitGraphData
+from gittergraph.core.graph_loader import describe_options, publish_snapshot
+from gittergraph.models import Commit
+
+
+class GraphDaemon:  # pylint: disable=too-many-instance-attributes
+    """
+    Daemon serving queries about a loaded graph.
+
+    Listens on a Unix socket only accessible to the current user, and answers each connection on its own thread.
+    The graph is watched for repository changes while the daemon runs, and the commit table offered for taking over its data is rewritten on the watcher thread
+    after each reload that changed it, never while answering a request.
+    """
+
+    def __init__(self, graph: GitGraph, socket_path: Path | str | None = None) -> None:
+        """
+        Initialize daemon for a graph.
+
+        Listens on the given socket path, or the one clients look up for the graph's repository.
+        """
+        self.graph: GitGraph = graph
+        self.socket_path: Path = (
+            Path(socket_path)
+            if socket_path is not None
+            else get_socket_path(graph.repo.path)
+        )
+        self._server: _Server | None = None
+        self._thread: threading.Thread | None = None
+
+        # Commit table offered to clients, the data it was written from, and its mapping for copying commits into the next table
+        self._snapshot_lock: threading.Lock = threading.Lock()
+        self._snapshot: dict[str, Any] | None = None
+        self._snapshot_data: GitGraphData | None = None
+        self._snapshot_table: CommitTable | None = None
+
+        # Held while writing a table, so tables are written one at a time
+        self._publish_lock: threading.Lock = threading.Lock()
+        self._publisher: threading.Thread | None = None
+
+        self._operations: dict[str, Callable[[dict[str, Any]], Any]] = {
+            "ping": self._ping,
+            "resolve": self._resolve,
+            "history": self._get_history,
+            "ancestry": self._is_ancestor,
+            "search": self._search,
+            "decorations": self._get_decorations,
+            "snapshot": self._get_snapshot,
+        }
+
+    def start(self) -> None:
+        """
+        Start serving on a background thread.
+
+        Writes the offered commit table before returning. Raises FileExistsError if another daemon is already listening on the socket,
+        and PermissionError if the socket directory is not private to the current user.
+        """
+        server: _Server = self._listen()
+        self._thread = threading.Thread(
+            target=server.serve_forever, name="gittergraph-daemon", daemon=True
+        )
+        self._thread.start()
+
+    def serve_forever(self) -> None:
+        """
+        Serve on the calling thread until stopped.
+
+        Raises FileExistsError if another daemon is already listening on the socket, and PermissionError if the socket directory is not private
+        to the current user. The socket is removed when serving ends.
+        """
+        server: _Server = self._listen()
+        try:
+            server.serve_forever()
+        finally:
+            self._close()
+
+    def stop(self) -> None:
+        """
+        Stop serving.
+
+        Waits for the serving loop to end, then removes the socket and the offered commit table. Does nothing if the daemon is not serving.
+        """
+        if self._server is None:
+            return
+
+        self._server.shutdown()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._close()
+
+    def publish(self) -> None:
+        """
+        Offer the current graph data for taking over.
+
+        Writes a commit table unless one was written for the current data already. Commits of the previously offered table are copied from it,
+        so payloads evicted from the commit store are not decoded again. Does nothing if the daemon is not serving.
+        """
+        with self._publish_lock:
+            data: GitGraphData = self.graph.data
+            with self._snapshot_lock:
+                if self._server is None or self._snapshot_data is data:
+                    return
+                previous: CommitTable | None = self._snapshot_table
+
+            snapshot: dict[str, Any] = publish_snapshot(data, previous)
+            table: CommitTable = CommitTable(snapshot["table"])
+            with self._snapshot_lock:
+                self._discard_snapshot()
+                self._snapshot = snapshot
+                self._snapshot_data = data
+                self._snapshot_table = table
+
+    def handle(self, request: dict[str, Any]) -> Any:
+        """
+        Answer a request.
+
+        Returns the result of the requested operation. Raises ValueError for unknown operations and KeyError for missing parameters.
+        """
+        operation: Callable[[dict[str, Any]], Any] | None = self._operations.get(
+            request.get("op", "")
+        )
+        if operation is None:
+            raise ValueError(f"Unknown operation '{request.get('op')}'")
+        return operation(request)
+
+    def _listen(self) -> "_Server":
+        """
+        Bind the socket and start watching the repository.
+
+        Removes a stale socket left by a daemon that did not shut down cleanly, and writes the offered commit table. Returns the bound server.
+        """
+        socket_dir: Path = self.socket_path.parent
+        socket_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if not is_private_dir(socket_dir):
+            raise PermissionError(
+                f"Socket directory '{socket_dir}' must be owned by the current user with mode 0700"
+            )
+        if self.socket_path.exists():
+            client: DaemonClient | None = DaemonClient.connect(self.socket_path)
+            if client is not None:
+                client.close()
+                raise FileExistsError(
+                    f"A daemon is already listening on '{self.socket_path}'"
+                )
+            self.socket_path.unlink()
+
+        # Created without group and other access, so the socket is never reachable by others
+        previous_umask: int = os.umask(0o077)
+        try:
+            self._server = _Server(str(self.socket_path), self)
+        finally:
+            os.umask(previous_umask)
+        self.graph.start_watching(self._on_reload)
+        self.publish()
+        return self._server
+
+    def _close(self) -> None:
+        """
+        Release the socket and the offered commit table.
+
+        Also stops watching the repository, and waits for a commit table being written.
+        """
+        self.graph.stop_watching()
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+        self.socket_path.unlink(missing_ok=True)
+        with self._publish_lock, self._snapshot_lock:
+            self._discard_snapshot()
+
+    def _on_reload(self, _: GraphChangeSet) -> None:
+        """
+        Offer the graph data after a reload that changed it.
+
+        Runs on the watcher thread, so requests keep being answered while the table is written.
+        """
+        self.publish()
+
+    def _discard_snapshot(self) -> None:
+        """
+        Delete the offered commit table.
+
+        Clients that already mapped it keep their mapping. Must be called with the snapshot lock held.
+        """
+        if self._snapshot is not None:
+            Path(self._snapshot["table"]).unlink(missing_ok=True)
+        self._snapshot = None
+        self._snapshot_data = None
+        self._snapshot_table = None
+
+    def _ping(self, _: dict[str, Any]) -> dict[str, Any]:
+        """
+        Describe the daemon.
+
+        Returns the protocol version, repository path, and the options the graph data depends on.
+        """
+        return {
+            "version": PROTOCOL_VERSION,
+            "path": str(self.graph.repo.path),
+            "options": describe_options(self.graph.repo, self.graph.options),
+        }
+
+    def _resolve(self, request: dict[str, Any]) -> str | None:
+        """
+        Resolve a reference.
+
+        Takes the reference name as "ref".
+        """
+        return self.graph.resolve(request["ref"])
+
+    def _get_history(self, request: dict[str, Any]) -> list[list[Any]]:
+        """
+        Get a window of the linear history of a reference.
+
+        Takes the reference as "ref" (HEAD by default), and the window as "offset" and "limit" (all commits by default).
+        """
+        offset: int = request.get("offset") or 0
+        limit: int | None = request.get("limit")
+        history: list[Commit] = self.graph.get_linear_history(
+            request.get("ref") or "HEAD"
+        )
+        end: int | None = offset + limit if limit is not None else None
+        return [encode_commit(commit) for commit in history[offset:end]]
+
+    def _is_ancestor(self, request: dict[str, Any]) -> bool:
+        """
+        Check ancestry of two references.
+
+        Takes the possible ancestor as "ancestor" and the descendant as "ref".
+        """
+        return self.graph.is_ancestor(request["ancestor"], request["ref"])
+
+    def _search(self, request: dict[str, Any]) -> list[list[Any]]:
+        """
+        Search loaded commits.
+
+        Takes the search text as "text" and the maximum number of matches as "limit".
+        """
+        return [
+            encode_commit(commit)
+            for commit in self.graph.search(request["text"], request.get("limit"))
+        ]
+
+    def _get_decorations(self, request: dict[str, Any]) -> dict[str, list[str]]:
+        """
+        Get the references pointing to a commit.
+
+        Takes the commit ID as "commit_id".
+        """
+        commit_id: str = request["commit_id"]
+        snapshot: GraphSnapshot = self.graph.snapshot
+        return {
+            "branches": [
+                branch.name for branch in snapshot.get_branches_at_commit(commit_id)
+            ],
+            "tags": [tag.name for tag in snapshot.get_tags_at_commit(commit_id)],
+        }
+
+    def _get_snapshot(self, _: dict[str, Any]) -> dict[str, Any]:
+        """
+        Get the offered commit table.
+
+        Never writes a table itself. If the graph data changed without a reload, such as by loading more history, a new table is written in the background
+        and the previous one is offered meanwhile; it holds consistent older data, which clients bring up to date by reloading.
+        """
+        with self._snapshot_lock:
+            if self._snapshot is None:
+                raise ValueError("No commit table is offered")
+            if self._snapshot_data is not self.graph.data and (
+                self._publisher is None or not self._publisher.is_alive()
+            ):
+                self._publisher = threading.Thread(
+                    target=self.publish, name="gittergraph-publisher", daemon=True
+                )
+                self._publisher.start()
+            return self._snapshot
+
+
+class _Server(socketserver.ThreadingUnixStreamServer):
+    """
+    Unix socket server of a graph daemon.
+
+    Handles each connection on a daemon thread, so open connections never keep the process alive.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, graph_daemon: GraphDaemon) -> None:
+        """
+        Initialize server bound to a socket path.
+
+        Requests are answered by the given daemon.
+        """
+        super().__init__(socket_path, _RequestHandler)
+        self.graph_daemon: GraphDaemon = graph_daemon
+
+    def verify_request(self, request: Any, client_address: Any) -> bool:
+        """
+        Check that a connection comes from the current user.
+
+        Accepts all connections if the platform does not report peer credentials.
+        """
+        return get_peer_uid(request) in (None, os.getuid())
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handler of one daemon connection.
+
+    Answers JSON requests line by line until the client disconnects.
+    """
+
+    server: _Server
+
+    def handle(self) -> None:
+        """
+        Answer the requests of a connection.
+
+        Errors are sent back to the client and leave the connection open.
+        """
+        for line in self.rfile:
+            answer: dict[str, Any]
+            try:
+                answer = {"result": self.server.graph_daemon.handle(json.loads(line))}
+            except (KeyError, TypeError, ValueError) as error:
+                answer = {"error": f"{type(error).__name__}: {error}"}
+            try:
+                self.wfile.write(json.dumps(answer).encode("utf-8") + b"\n")
+            except (BrokenPipeError, ConnectionResetError):
+                return
+
+
+def serve(start_path: str | Path, options: GraphOptions) -> None:
+    """
+    Run a daemon for the repository containing a path.
+
+    Loads the graph and serves until interrupted. Raises FileNotFoundError if no repository is found.
+    """
+    graph: GitGraph | None = GitGraph.discover(
+        start_path, replace(options, use_daemon=False)
+    )
+    if graph is None:
+        raise FileNotFoundError(f"No git repository found at '{start_path}'")
+
+    daemon: GraphDaemon = GraphDaemon(graph)
+    print(f"Serving {graph.repo.path} on {daemon.socket_path}", flush=True)
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
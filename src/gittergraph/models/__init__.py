@@ -7,6 +7,7 @@ Provides dataclasses for representing core Git objects and metadata, including b
 
 from .branch import Branch
 from .commit import Commit
+from .diff_stat import DiffStat
 from .head import HeadInfo, HeadState
 from .signature import Signature
-from .tag import Tag
+from .tag import Tag, TagAnnotation
@@ -6,17 +6,19 @@ Commit model definition.
 Defines the Commit dataclass, which represents a Git commit's metadata, author/committer information, and parent relationships. Provides properties for short hash, truncated message, and commit type checks.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from gittergraph.models.signature import Signature
 
 
 @dataclass(slots=True)
-class Commit:
+class Commit:  # pylint: disable=too-many-instance-attributes
     """
     Git commit data.
 
     Represents commit metadata, author/committer info, and parent relationships.
+    Identity IDs number distinct (name, email) pairs within an identity pool and are -1 if unknown.
+    Derived display values are computed on first use and cached.
     """
 
     id: str
@@ -24,29 +26,38 @@ class Commit:
     author: Signature
     committer: Signature
     parent_ids: list[str]
+    author_identity: int = field(default=-1, compare=False, repr=False)
+    committer_identity: int = field(default=-1, compare=False, repr=False)
+    _short_id: str | None = field(default=None, init=False, compare=False, repr=False)
+    _short_message: str | None = field(
+        default=None, init=False, compare=False, repr=False
+    )
 
     @property
     def short_id(self) -> str:
         """
         Short commit hash.
 
-        Returns the first 7 characters of the commit id.
+        Returns the first 7 characters of the commit id, computed once.
         """
-        return self.id[:7]
+        if self._short_id is None:
+            self._short_id = self.id[:7]
+        return self._short_id
 
     @property
     def short_message(self) -> str:
         """
         Truncated commit message.
 
-        Returns the first line of the commit message, up to 50 characters.
+        Returns the first line of the commit message, up to 50 characters, computed once.
         """
-        max_length: int = 50
-        first_line: str = self.message.splitlines()[0]
-        if len(first_line) <= max_length:
-            return first_line
-
-        return first_line[: max_length - 3] + "..."
+        if self._short_message is None:
+            max_length: int = 50
+            first_line: str = self.message.splitlines()[0]
+            if len(first_line) > max_length:
+                first_line = first_line[: max_length - 3] + "..."
+            self._short_message = first_line
+        return self._short_message
 
     @property
     def is_merge(self) -> bool:
@@ -0,0 +1,29 @@
+"""
+Diff statistics model definition.
+
+Defines the DiffStat dataclass, representing the summary of a tree-to-tree diff: line insertion and deletion counts together with the list of changed paths.
+"""
+
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class DiffStat:
+    """
+    Git diff statistics.
+
+    Represents insertions, deletions, and changed paths between two trees.
+    """
+
+    insertions: int
+    deletions: int
+    paths: list[str] = field(default_factory=list)
+
+    @property
+    def files_changed(self) -> int:
+        """
+        Number of changed files.
+
+        Returns the number of paths touched by the diff.
+        """
+        return len(self.paths)
@@ -3,10 +3,10 @@
 """
 Signature model definition.
 
-Defines the Signature dataclass, representing a Git author, committer, or tagger with name, email, timestamp, and timezone offset. Provides conversion to timezone-aware datetime and string formatting.
+Defines the Signature dataclass, representing a Git author, committer, or tagger with name, email, timestamp, and timezone offset. Provides cached conversion to timezone-aware datetime and string formatting.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from gittergraph.utils.time import unix_timestamp_to_datetime
@@ -18,21 +18,39 @@ class Signature:
     Git signature data.
 
     Represents an author, committer, or tagger with name, email, timestamp, and timezone offset.
+    Derived display values are computed on first use and cached.
     """
 
     name: str
     email: str
     time: int
     time_offset: int
+    _datetime: "datetime | None" = field(
+        default=None, init=False, compare=False, repr=False
+    )
+    _date_text: str | None = field(default=None, init=False, compare=False, repr=False)
 
     @property
     def datetime(self) -> datetime:
         """
         Convert to timezone-aware datetime.
 
-        Returns a datetime object using the stored timestamp and offset.
+        Returns a datetime object using the stored timestamp and offset, computed once.
         """
-        return unix_timestamp_to_datetime(self.time, self.time_offset)
+        if self._datetime is None:
+            self._datetime = unix_timestamp_to_datetime(self.time, self.time_offset)
+        return self._datetime
+
+    @property
+    def date_text(self) -> str:
+        """
+        Formatted date for display.
+
+        Returns the datetime in ISO-like format with its UTC offset, computed once.
+        """
+        if self._date_text is None:
+            self._date_text = str(self.datetime)
+        return self._date_text
 
     def __str__(self) -> str:
         """
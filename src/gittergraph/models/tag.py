@@ -2,22 +2,34 @@
 """
 Tag model definition.
 
-Defines the Tag, LightweightTag, and AnnotatedTag dataclasses, representing Git tags and their metadata. Provides properties for tag name normalization and storage of tagger information for annotated tags.
+Defines the Tag and TagAnnotation dataclasses, representing Git tags and their metadata. Provides properties for tag name normalization and storage of tagger information for annotated tags.
 """
 
 from dataclasses import dataclass
 
+from gittergraph.models.signature import Signature
+
 
 @dataclass(slots=True)
 class Tag:
     """
     Git tag data.
 
-    Represents a tag name and the object it points to.
+    Represents a tag name and the object it points to. Annotated tags also store the ID of their tag object, whose metadata is loaded on demand.
     """
 
     target_id: str
     name: str
+    object_id: str | None = None
+
+    @property
+    def is_annotated(self) -> bool:
+        """
+        Check if tag is an annotated tag.
+
+        Returns True if the tag points to a tag object.
+        """
+        return self.object_id is not None
 
     @property
     def shorthand(self) -> str:
@@ -27,3 +39,16 @@ class Tag:
         Returns the tag name without the refs prefix.
         """
         return self.name.removeprefix("refs/tags/")
+
+
+@dataclass(slots=True)
+class TagAnnotation:
+    """
+    Annotated tag metadata.
+
+    Represents the tag name, tagger, and message stored in an annotated tag object.
+    """
+
+    name: str
+    tagger: Signature | None
+    message: str
@@ -5,13 +5,23 @@ TUI application entry point for gittergraph.
 Defines the main application class and run function for launching the Textual UI.
 """
 
+import asyncio
+from functools import partial
 from pathlib import Path
 from typing import cast
 
 from textual.app import App
+from textual.message import Message
 
-from gittergraph.core import GitGraph
-from gittergraph.tui.screens import RepositoryScreen
+from gittergraph.core import (
+    GitGraph,
+    GraphChangeSet,
+    GraphOptions,
+    RepositorySummary,
+    Workspace,
+)
+from gittergraph.tui.screens import RepositoryScreen, WorkspaceScreen
+from gittergraph.tui.widgets import RepositoryList
 
 
 class GitterGraphApp(App):
@@ -27,18 +37,47 @@ class GitterGraphApp(App):
     BINDINGS = [
         ("q", "quit", "Quit"),
         ("r", "reload", "Reload"),
+        ("m", "memory", "Memory"),
+        ("w", "workspace", "Repositories"),
     ]
 
-    SCREENS = {"repository-screen": RepositoryScreen}
+    SCREENS = {
+        "repository-screen": RepositoryScreen,
+        "workspace-screen": WorkspaceScreen,
+    }
 
-    def __init__(self, repo_path: str | Path | None = None, **kwargs) -> None:
+    class RepositoryChanged(Message):
+        """
+        Message sent when the watched repository was reloaded.
+
+        Posted from the watcher thread after a reload that changed the graph data. Contains the reloaded graph and the changes.
+        """
+
+        def __init__(self, graph: GitGraph, changes: GraphChangeSet) -> None:
+            super().__init__()
+            self.graph: GitGraph = graph
+            self.changes: GraphChangeSet = changes
+
+    def __init__(
+        self,
+        repo_path: str | Path | None = None,
+        options: GraphOptions | None = None,
+        workspace_path: str | Path | None = None,
+        **kwargs,
+    ) -> None:
         """
         Initialize the TUI application.
 
-        Accepts path to the git repository, or None to auto-discover.
+        Accepts path to the git repository, or None to auto-discover, and options for loading the graph.
+        With a workspace path, all repositories under it are loaded instead and shown in a repository switcher.
         """
         super().__init__(**kwargs)
         self.repo_path: Path = Path(repo_path or ".")
+        self.options: GraphOptions = options or GraphOptions()
+        self.workspace_path: Path | None = (
+            Path(workspace_path) if workspace_path is not None else None
+        )
+        self.workspace: Workspace | None = None
         self.graph: GitGraph | None = None
 
     async def on_mount(self) -> None:
@@ -46,8 +85,15 @@ class GitterGraphApp(App):
         Load the git repository and show the main screen.
 
         Discovers the repository starting from the provided path or current directory. Exits if no repository is found.
+        Loading runs in a thread, so the event loop keeps running while a loader process does the work.
         """
-        self.graph = GitGraph.discover(self.repo_path)
+        if self.workspace_path is not None:
+            await self._mount_workspace(self.workspace_path)
+            return
+
+        self.graph = await asyncio.to_thread(
+            GitGraph.discover, self.repo_path, self.options
+        )
 
         if not self.graph:
             self.exit(message="No git repository found!")
@@ -60,30 +106,248 @@ class GitterGraphApp(App):
             RepositoryScreen, self.get_screen("repository-screen")
         )
         repository_screen.show(self.graph)
+        self._start_background_load()
+
+        if self.options.watch:
+            self.graph.start_watching(
+                partial(self._post_repository_changed, self.graph)
+            )
+
+    async def _mount_workspace(self, workspace_path: Path) -> None:
+        """
+        Find the repositories of a workspace and show the repository switcher.
+
+        The repositories are then loaded in the background, and their progress is shown as it happens. Exits if no repository is found.
+        """
+        self.workspace = await asyncio.to_thread(
+            Workspace, workspace_path, self.options
+        )
+        if not self.workspace.paths:
+            self.exit(message="No git repositories found!")
+            return
+
+        await self.push_screen("workspace-screen")
+        self._get_workspace_screen().show(self.workspace)
+        self.run_worker(self._load_workspace, thread=True, group="workspace")
+
+    def on_unmount(self) -> None:
+        """
+        Stop watching the repository.
+
+        Called by Textual when the application shuts down.
+        """
+        if self.graph:
+            self.graph.stop_watching()
+        if self.workspace:
+            self.workspace.close()
+
+    def _load_workspace(self) -> None:
+        """
+        Load all workspace repositories.
+
+        Runs in a worker thread, while the workspace loads the repositories on its own pool of threads.
+        """
+        if not self.workspace:
+            return
+
+        self.workspace.load_all(self._post_workspace_progress)
+        self.call_from_thread(self.notify, "All repositories loaded", timeout=2)
+
+    def _post_workspace_progress(self, summary: RepositorySummary) -> None:
+        """
+        Show the new summary of a workspace repository.
+
+        Called from the workspace loading threads.
+        """
+        self.call_from_thread(self._get_workspace_screen().update_summary, summary)
+
+    async def on_repository_list_repository_selected(
+        self, message: RepositoryList.RepositorySelected
+    ) -> None:
+        """
+        Open a workspace repository selected in the repository switcher.
+
+        Loads the repository again if its graph was dropped, and shows it on the repository screen. The previously shown repository stops being watched.
+        """
+        if not self.workspace:
+            return
+
+        if self.graph:
+            self.graph.stop_watching()
+        self.graph = None
+        graph: GitGraph | None = await asyncio.to_thread(
+            self.workspace.open, message.path, self._post_workspace_progress
+        )
+        if graph is None:
+            self.notify(
+                f"Could not load {message.path.name}", severity="error", timeout=5
+            )
+            return
+
+        self.graph = graph
+        await self.push_screen("repository-screen")
+        repository_screen: RepositoryScreen = cast(
+            RepositoryScreen, self.get_screen("repository-screen")
+        )
+        repository_screen.show(graph)
+        self._start_background_load()
+
+        if self.options.watch:
+            graph.start_watching(partial(self._post_repository_changed, graph))
+
+    def action_workspace(self) -> None:
+        """
+        Go back to the repository switcher.
+
+        Only available in workspace mode, while a repository is shown.
+        """
+        if not self.workspace or not isinstance(self.screen, RepositoryScreen):
+            return
+
+        if self.graph:
+            self.graph.stop_watching()
+            self.graph = None
+        self.pop_screen()
+
+    def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:
+        """
+        Check whether an action may run.
+
+        Hides the repository switcher binding outside workspace mode.
+        """
+        if action == "workspace":
+            return self.workspace is not None
+        return True
+
+    def _get_workspace_screen(self) -> WorkspaceScreen:
+        """
+        Get the repository switcher screen.
+
+        Returns the installed workspace screen.
+        """
+        return cast(WorkspaceScreen, self.get_screen("workspace-screen"))
+
+    def _post_repository_changed(
+        self, graph: GitGraph, changes: GraphChangeSet
+    ) -> None:
+        """
+        Notify the application that a watched repository was reloaded.
+
+        Called from the watcher thread; posting a message is thread-safe.
+        """
+        self.post_message(self.RepositoryChanged(graph, changes))
+
+    def on_gitter_graph_app_repository_changed(
+        self, message: RepositoryChanged
+    ) -> None:
+        """
+        Handle a reload triggered by the repository watcher.
+
+        Updates the screen with the changes while keeping the current reference and selected commit.
+        Changes of a graph that is no longer shown, e.g. posted just before switching repositories, are dropped.
+        """
+        self._apply_changes(
+            message.graph, message.changes, "Repository changed, graph reloaded"
+        )
 
     def action_reload(self) -> None:
         """
         Reload the git repository and refresh the screen.
 
-        Reloads the graph data and updates the current screen with fresh data.
+        Reloads the graph data in a worker thread, so the interface keeps running, and updates only what changed on the current screen.
+        Nothing is redrawn if the repository did not change.
         """
         if not self.graph:
             return
 
-        self.graph.reload()
+        self.run_worker(
+            partial(self._reload, self.graph),
+            thread=True,
+            exclusive=True,
+            group="reload",
+        )
+
+    def _reload(self, graph: GitGraph) -> None:
+        """
+        Reload a graph and apply its changes.
+
+        Runs in a worker thread; with the loader process option, new history is decoded in a loader process.
+        """
+        changes: GraphChangeSet = graph.reload()
+        if not changes:
+            self.call_from_thread(self.notify, "Already up to date", timeout=2)
+            return
+        self.call_from_thread(self._apply_changes, graph, changes, "Graph reloaded")
+
+    def _apply_changes(
+        self, graph: GitGraph, changes: GraphChangeSet, notice: str
+    ) -> None:
+        """
+        Show the changes of a reloaded graph and notify the user.
+
+        Does nothing if the graph is no longer shown.
+        """
+        if not self.graph or graph is not self.graph:
+            return
+
         repository_screen: RepositoryScreen = cast(
             RepositoryScreen, self.get_screen("repository-screen")
         )
-        repository_screen.show(self.graph)
+        repository_screen.apply_changes(changes)
+        self._start_background_load()
+
+        self.notify(notice, timeout=2)
+
+    def action_memory(self) -> None:
+        """
+        Show the memory usage of the graph.
+
+        Notifies the user of resident memory and commit cache usage.
+        """
+        if not self.graph:
+            return
+
+        self.notify(str(self.graph.get_memory_usage()), title="Memory", timeout=5)
+
+    def _start_background_load(self) -> None:
+        """
+        Start loading the remaining history in the background.
+
+        Only used in lazy mode, where startup loads just the history of HEAD.
+        """
+        if self.graph and self.graph.options.lazy:
+            self.run_worker(
+                self._load_pending_history, thread=True, exclusive=True, group="load"
+            )
+
+    def _load_pending_history(self) -> None:
+        """
+        Load history of all references not loaded yet.
+
+        Runs in a worker thread and notifies the user once done.
+        """
+        if not self.graph:
+            return
 
-        self.notify("Graph reloaded", timeout=2)
+        count: int = self.graph.load_pending()
+        if count:
+            self.call_from_thread(
+                self.notify, f"Loaded {count} more commits", timeout=2
+            )
 
 
-def run(repo_path: str | Path | None = None) -> None:
+def run(
+    repo_path: str | Path | None = None,
+    options: GraphOptions | None = None,
+    workspace_path: str | Path | None = None,
+) -> None:
     """
     Launch the gittergraph TUI application.
 
-    Accepts path to the git repository, or None to auto-discover.
+    Accepts path to the git repository, or None to auto-discover, and options for loading the graph.
+    With a workspace path, all repositories under it are shown in a repository switcher instead.
     """
-    app: GitterGraphApp = GitterGraphApp(repo_path=repo_path)
+    app: GitterGraphApp = GitterGraphApp(
+        repo_path=repo_path, options=options, workspace_path=workspace_path
+    )
     app.run()
@@ -38,17 +38,49 @@ class HistoryPanel(Vertical):
         commits: list[Commit],
         branches_by_commit: dict[str, list[Branch]],
         tags_by_commit: dict[str, list[Tag]],
+        truncated: bool = False,
+        selected_id: str | None = None,
     ) -> None:
         """
         Display commit history with decorations.
 
-        Updates the history list and shows details for the first commit if available.
+        Updates the history list and shows details for the selected commit if it is in the history, or for the first commit otherwise. Truncated histories are marked as such.
         """
         commit_history = self.query_one("#commit-history", CommitHistory)
-        commit_history.show(commits, branches_by_commit, tags_by_commit)
+        commit_history.show(commits, branches_by_commit, tags_by_commit, truncated)
+        self._show_detail(commits, selected_id)
 
+    def apply(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        commits: list[Commit],
+        branches_by_commit: dict[str, list[Branch]],
+        tags_by_commit: dict[str, list[Tag]],
+        truncated: bool = False,
+        selected_id: str | None = None,
+    ) -> None:
+        """
+        Update displayed commit history in place.
+
+        Only the commits that differ from the displayed history are replaced. Details are shown as in show.
+        """
+        commit_history = self.query_one("#commit-history", CommitHistory)
+        commit_history.apply(commits, branches_by_commit, tags_by_commit, truncated)
+        self._show_detail(commits, selected_id)
+
+    def _show_detail(self, commits: list[Commit], selected_id: str | None) -> None:
+        """
+        Show details for the selected or first commit.
+
+        Highlights the selected commit if it is in the history, and clears the details if the history is empty.
+        """
+        commit_history = self.query_one("#commit-history", CommitHistory)
         detail = self.query_one("#commit-detail", CommitDetail)
-        if commits:
+        selected: Commit | None = next(
+            (commit for commit in commits if commit.id == selected_id), None
+        )
+        if selected is not None and commit_history.select_commit(selected.id):
+            detail.show(selected)
+        elif commits:
             detail.show(commits[0])
         else:
             detail.clear()
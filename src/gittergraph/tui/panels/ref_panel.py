@@ -6,7 +6,9 @@ Displays repository references (HEAD, branches, and tags) in a vertical layout f
 """
 
 from textual.containers import Vertical
+from textual.widgets import Static
 
+from gittergraph.core import GraphChangeSet
 from gittergraph.models import Branch, HeadInfo, Tag
 from gittergraph.tui.widgets import BranchList, HeadDetail, TagList
 
@@ -22,6 +24,12 @@ class RefPanel(Vertical):
     RefPanel {
         width: 30;
     }
+
+    RefPanel > #hidden-refs {
+        height: auto;
+        padding: 0 1;
+        color: $text-muted;
+    }
     """
 
     def compose(self):
@@ -33,13 +41,52 @@ class RefPanel(Vertical):
         yield HeadDetail(id="head-detail")
         yield BranchList(id="branch-list")
         yield TagList(id="tag-list")
+        yield Static(id="hidden-refs")
 
-    def show(self, head: HeadInfo, branches: list[Branch], tags: list[Tag]) -> None:
+    def show(
+        self,
+        head: HeadInfo,
+        branches: list[Branch],
+        tags: list[Tag],
+        hidden_count: int = 0,
+    ) -> None:
         """
         Display repository references.
 
-        Updates all child widgets with the provided HEAD, branches, and tags.
+        Updates all child widgets with the provided HEAD, branches, and tags, and reports how many references were hidden by the reference filter.
         """
         self.query_one("#head-detail", HeadDetail).show(head)
         self.query_one("#branch-list", BranchList).show(branches)
         self.query_one("#tag-list", TagList).show(tags)
+        self._show_hidden_count(hidden_count)
+
+    def apply(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        head: HeadInfo,
+        branches: list[Branch],
+        tags: list[Tag],
+        hidden_count: int,
+        changes: GraphChangeSet,
+    ) -> None:
+        """
+        Update displayed references in place.
+
+        Only the widgets affected by the changes are updated, and the branch and tag lists only add and remove the items of changed references.
+        """
+        if changes.head_changed:
+            self.query_one("#head-detail", HeadDetail).show(head)
+        if changes.branches:
+            self.query_one("#branch-list", BranchList).apply(branches, changes.branches)
+        if changes.tags:
+            self.query_one("#tag-list", TagList).apply(tags, changes.tags)
+        self._show_hidden_count(hidden_count)
+
+    def _show_hidden_count(self, hidden_count: int) -> None:
+        """
+        Display the number of hidden references.
+
+        The note is only shown if the reference filter hid any references.
+        """
+        hidden_refs: Static = self.query_one("#hidden-refs", Static)
+        hidden_refs.update(f"{hidden_count} refs hidden by filter")
+        hidden_refs.display = hidden_count > 0
@@ -6,3 +6,4 @@ Top-level screen components that define complete UI views.
 """
 
 from .repository_screen import RepositoryScreen
+from .workspace_screen import WorkspaceScreen
@@ -9,8 +9,9 @@ from textual.containers import Horizontal
 from textual.screen import Screen
 from textual.widgets import Footer, ListView
 
-from gittergraph.core import GitGraph
-from gittergraph.models import Branch, Commit, HeadInfo, Tag
+from gittergraph.core import GitGraph, GraphChangeSet, GraphSnapshot
+from gittergraph.core.graph_data import GitGraphData
+from gittergraph.models import Branch, Commit, HeadInfo, Tag, TagAnnotation
 from gittergraph.tui.panels import HistoryPanel, RefPanel
 from gittergraph.tui.widgets import (
     BranchList,
@@ -95,6 +96,7 @@ class RepositoryScreen(Screen):
         """
         super().__init__(**kwargs)
         self.graph: GitGraph | None = None
+        self.current_ref: str = "HEAD"
 
     def compose(self):
         """
@@ -114,43 +116,87 @@ class RepositoryScreen(Screen):
         Updates both panels with repository data from the graph.
         """
         self.graph = graph
-        head: HeadInfo = graph.data.head_info
-        branches: list[Branch] = list(graph.data.branches.values())
-        tags: list[Tag] = list(graph.data.tags.values())
+        data: GitGraphData = graph.data
+        head: HeadInfo = data.head_info
+        branches: list[Branch] = list(data.branches.values())
+        tags: list[Tag] = list(data.tags.values())
 
-        self._update_ref_panel(head, branches, tags)
+        self._update_ref_panel(head, branches, tags, data.hidden_ref_count)
         self._update_history_panel("HEAD")
 
+    def apply_changes(self, changes: GraphChangeSet) -> None:
+        """
+        Update displayed git graph data after a reload.
+
+        Applies minimal updates for the given changes. Keeps showing the current reference and selected commit if they still exist, and falls back to HEAD otherwise.
+        """
+        if not self.graph or not changes:
+            return
+
+        selected: Commit | None = self.query_one("#commit-detail", CommitDetail).commit
+        snapshot: GraphSnapshot = self.graph.snapshot
+        self.query_one("#ref-panel", RefPanel).apply(
+            snapshot.data.head_info,
+            list(snapshot.data.branches.values()),
+            list(snapshot.data.tags.values()),
+            snapshot.data.hidden_ref_count,
+            changes,
+        )
+
+        start_ref: str = self.current_ref
+        if snapshot.resolve(start_ref) is None:
+            start_ref = "HEAD"
+        self._update_history_panel(
+            start_ref, selected.id if selected else None, incremental=True
+        )
+
     def _update_ref_panel(
-        self, head: HeadInfo, branches: list[Branch], tags: list[Tag]
+        self,
+        head: HeadInfo,
+        branches: list[Branch],
+        tags: list[Tag],
+        hidden_count: int = 0,
     ) -> None:
         """
         Update the reference panel with HEAD, branches, and tags.
 
-        Updates the RefPanel with the provided repository references.
+        Updates the RefPanel with the provided repository references and hidden reference count.
         """
-        self.query_one("#ref-panel", RefPanel).show(head, branches, tags)
+        self.query_one("#ref-panel", RefPanel).show(head, branches, tags, hidden_count)
 
-    def _update_history_panel(self, start_ref: str) -> None:
+    def _update_history_panel(
+        self, start_ref: str, selected_id: str | None = None, incremental: bool = False
+    ) -> None:
         """
         Update the history panel with commits from a starting reference.
 
-        Retrieves linear history and decorates commits with branches and tags.
+        Retrieves linear history and decorates commits with branches and tags. Histories ending at a load boundary are marked as truncated.
+        The given commit is kept selected if it is part of the history. Incremental updates only replace the commits that differ from the displayed history.
         """
         if not self.graph:
             return
 
-        commits: list[Commit] = self.graph.get_linear_history(start_ref)
+        self.current_ref = start_ref
+
+        # Pin one snapshot, so a reload in the background cannot mix versions
+        self.graph.load_ref(start_ref)
+        snapshot: GraphSnapshot = self.graph.snapshot
+        commits: list[Commit] = snapshot.get_linear_history(start_ref)
         branches_by_commit: dict[str, list[Branch]] = {
-            commit.id: self.graph.get_branches_at_commit(commit.id)
-            for commit in commits
+            commit.id: snapshot.get_branches_at_commit(commit.id) for commit in commits
         }
         tags_by_commit: dict[str, list[Tag]] = {
-            commit.id: self.graph.get_tags_at_commit(commit.id) for commit in commits
+            commit.id: snapshot.get_tags_at_commit(commit.id) for commit in commits
         }
 
-        self.query_one("#history-panel", HistoryPanel).show(
-            commits, branches_by_commit, tags_by_commit
+        history_panel: HistoryPanel = self.query_one("#history-panel", HistoryPanel)
+        update = history_panel.apply if incremental else history_panel.show
+        update(
+            commits,
+            branches_by_commit,
+            tags_by_commit,
+            snapshot.is_truncated(start_ref),
+            selected_id,
         )
 
     def on_commit_history_commit_selected(
@@ -167,6 +213,20 @@ class RepositoryScreen(Screen):
         commit: Commit = self.graph.data.commits[message.id]
         self.query_one("#commit-detail", CommitDetail).show(commit)
 
+    def on_commit_history_load_more_requested(
+        self, message: CommitHistory.LoadMoreRequested
+    ) -> None:
+        """
+        Handle load more request from CommitHistory widget.
+
+        Loads the next chunk of history past the boundary commit and refreshes the current history.
+        """
+        if not self.graph:
+            return
+
+        self.graph.load_more([message.id])
+        self._update_history_panel(self.current_ref)
+
     def on_branch_list_branch_selected(
         self, message: BranchList.BranchSelected
     ) -> None:
@@ -181,9 +241,16 @@ class RepositoryScreen(Screen):
         """
         Handle tag selection event from TagList widget.
 
-        Updates the history panel to show commits for the selected tag.
+        Updates the history panel to show commits for the selected tag. For annotated tags, the tag metadata is loaded on demand and shown with the tagged commit.
         """
         self._update_history_panel(message.name)
+        if not self.graph:
+            return
+
+        annotation: TagAnnotation | None = self.graph.get_tag_annotation(message.name)
+        commit_detail: CommitDetail = self.query_one("#commit-detail", CommitDetail)
+        if annotation and commit_detail.commit:
+            commit_detail.show(commit_detail.commit, annotation)
 
     def on_head_detail_head_selected(self, _: HeadDetail.HeadSelected) -> None:
         """
@@ -0,0 +1,67 @@
+"""
+Workspace screen for the TUI.
+
+Defines the repository switcher screen, which lists all repositories of a workspace while they load.
+"""
+
+from textual.screen import Screen
+from textual.widgets import Footer, ListView
+
+from gittergraph.core import RepositorySummary, Workspace
+from gittergraph.tui.widgets import RepositoryList
+
+
+class WorkspaceScreen(Screen):
+    """
+    Screen for switching between workspace repositories.
+
+    Lists the repositories with per-repository loading progress. Selecting a repository opens it on the repository screen.
+    """
+
+    DEFAULT_CSS = """
+    #repository-list {
+        height: 1fr;
+    }
+
+    #repository-list:focus-within {
+        border: double $accent;
+    }
+    """
+
+    def __init__(self, **kwargs) -> None:
+        """
+        Initialize the WorkspaceScreen.
+
+        Sets up the screen for displaying workspace repositories.
+        """
+        super().__init__(**kwargs)
+        self.workspace: Workspace | None = None
+
+    def compose(self):
+        """
+        Yield the repository list.
+
+        Called by Textual to build the widget tree.
+        """
+        yield RepositoryList(id="repository-list")
+        yield Footer()
+
+    def show(self, workspace: Workspace) -> None:
+        """
+        Display the repositories of a workspace.
+
+        Shows the current summary of each repository and focuses the list.
+        """
+        self.workspace = workspace
+        self.query_one("#repository-list", RepositoryList).show(
+            [workspace.summaries[path] for path in workspace.paths]
+        )
+        self.query_one("#repository-list", RepositoryList).query_one(ListView).focus()
+
+    def update_summary(self, summary: RepositorySummary) -> None:
+        """
+        Display the new summary of a repository.
+
+        Called as repositories start and finish loading.
+        """
+        self.query_one("#repository-list", RepositoryList).update_summary(summary)
@@ -9,4 +9,5 @@ from .branch_list import BranchList
 from .commit_detail import CommitDetail
 from .commit_history import CommitHistory
 from .head_detail import HeadDetail
+from .repository_list import RepositoryList
 from .tag_list import TagList
@@ -10,7 +10,9 @@ from textual.containers import Vertical
 from textual.message import Message
 from textual.widgets import Label, ListItem, ListView
 
+from gittergraph.core import RefChanges
 from gittergraph.models import Branch
+from gittergraph.tui.widgets.ref_list_updates import apply_ref_changes
 
 
 class BranchList(Vertical):
@@ -59,6 +61,7 @@ class BranchList(Vertical):
         """
         super().__init__(**kwargs)
         self.branches: list[Branch] = []
+        self._items: dict[str, ListItem] = {}
         self.border_title = "Branches"
 
     def compose(self):
@@ -76,12 +79,31 @@ class BranchList(Vertical):
         Updates the ListView with the provided branches.
         """
         self.branches = branches
+        self._items = {}
         list_view: ListView = self.query_one(ListView)
         list_view.clear()
 
         for branch in self.branches:
             label: Label = BranchList._get_label(branch)
-            list_view.append(ListItem(label))
+            item: ListItem = ListItem(label)
+            self._items[branch.name] = item
+            list_view.append(item)
+
+    def apply(self, branches: list[Branch], changes: RefChanges) -> None:
+        """
+        Update the displayed branches in place.
+
+        Removes items of removed branches and inserts items for added ones, keeping all other items.
+        """
+        by_name: dict[str, Branch] = {branch.name: branch for branch in branches}
+        self.branches = branches
+        apply_ref_changes(
+            self.query_one(ListView),
+            self._items,
+            list(by_name),
+            changes,
+            lambda name: ListItem(BranchList._get_label(by_name[name])),
+        )
 
     @staticmethod
     def _get_label(branch: Branch) -> Label:
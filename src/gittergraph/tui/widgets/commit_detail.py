@@ -9,14 +9,14 @@ from rich.text import Text
 from textual.containers import VerticalScroll
 from textual.widgets import Static
 
-from gittergraph.models import Commit
+from gittergraph.models import Commit, TagAnnotation
 
 
 class CommitDetail(VerticalScroll):
     """
     Scrollable widget for commit details in the TUI.
 
-    Shows commit metadata, author/committer info, dates, message, and parents.
+    Shows commit metadata, author/committer info, dates, message, and parents, optionally preceded by annotated tag metadata.
     """
 
     # Widgets should use inline TCSS for styling.
@@ -42,6 +42,7 @@ class CommitDetail(VerticalScroll):
         """
         super().__init__(**kwargs)
         self.commit: Commit | None = None
+        self.annotation: TagAnnotation | None = None
         self.border_title: str = "Commit Details"
 
     def compose(self):
@@ -52,13 +53,14 @@ class CommitDetail(VerticalScroll):
         """
         yield Static(CommitDetail.DEFAULT_TEXT)
 
-    def show(self, commit: Commit) -> None:
+    def show(self, commit: Commit, annotation: TagAnnotation | None = None) -> None:
         """
         Display details for a commit.
 
-        Updates the internal commit reference and updates the Static child with commit details.
+        Updates the internal commit reference and updates the Static child with commit details. If an annotated tag is given, its metadata is shown above the commit.
         """
         self.commit = commit
+        self.annotation = annotation
         text: Text = self._get_text()
         self.query_one(Static).update(text)
 
@@ -71,7 +73,7 @@ class CommitDetail(VerticalScroll):
         if not self.commit:
             return Text(CommitDetail.DEFAULT_TEXT)
 
-        content: Text = Text()
+        content: Text = self._get_annotation_text()
         content.append(f"Commit: {self.commit.id}\n", style="bold cyan")
 
         style: str = "yellow"
@@ -79,13 +81,15 @@ class CommitDetail(VerticalScroll):
             content.append(
                 f"Author/Committer: {str(self.commit.author)}\n", style=style
             )
-            content.append(f"Date: {self.commit.author.datetime}\n", style=style)
+            content.append(f"Date: {self.commit.author.date_text}\n", style=style)
         else:
             content.append(f"Author: {str(self.commit.author)}\n", style=style)
-            content.append(f"Author Date: {self.commit.author.datetime}\n", style=style)
+            content.append(
+                f"Author Date: {self.commit.author.date_text}\n", style=style
+            )
             content.append(f"Committer: {str(self.commit.committer)}\n", style=style)
             content.append(
-                f"Committer Date: {self.commit.committer.datetime}\n", style=style
+                f"Committer Date: {self.commit.committer.date_text}\n", style=style
             )
 
         content.append("\n")
@@ -99,6 +103,29 @@ class CommitDetail(VerticalScroll):
 
         return content
 
+    def _get_annotation_text(self) -> Text:
+        """
+        Build the rich Text object with annotated tag metadata.
+
+        Returns an empty Text object if no annotated tag is set.
+        """
+        content: Text = Text()
+        if not self.annotation:
+            return content
+
+        shorthand: str = self.annotation.name.removeprefix("refs/tags/")
+        content.append(f"Tag: {shorthand}\n", style="bold magenta")
+
+        if self.annotation.tagger:
+            style: str = "yellow"
+            content.append(f"Tagger: {str(self.annotation.tagger)}\n", style=style)
+            content.append(f"Date: {self.annotation.tagger.date_text}\n", style=style)
+
+        content.append("\n")
+        content.append(self.annotation.message)
+        content.append("\n\n")
+        return content
+
     def clear(self) -> None:
         """
         Clear the detail view.
@@ -106,4 +133,5 @@ class CommitDetail(VerticalScroll):
         Resets the internal commit reference and updates the Static child to show the default text.
         """
         self.commit = None
+        self.annotation = None
         self.query_one(Static).update(CommitDetail.DEFAULT_TEXT)
@@ -18,7 +18,7 @@ class CommitHistory(Vertical):
     Widget for displaying commit history in the TUI.
 
     Shows commit short IDs, messages, and decorations for branches and tags in a selectable list.
-    Posts a message when a commit is selected.
+    Posts a message when a commit is selected. Truncated histories end with a sentinel item that requests more history.
     """
 
     DEFAULT_CSS = """
@@ -39,6 +39,12 @@ class CommitHistory(Vertical):
         padding: 0 1;
     }
 
+    .truncated-item {
+        height: auto;
+        padding: 0 1;
+        color: $text-muted;
+    }
+
     .selected-commit {
         background: $boost;
     }
@@ -55,6 +61,19 @@ class CommitHistory(Vertical):
             super().__init__()
             self.id: str = commit_id
 
+    class LoadMoreRequested(Message):
+        """
+        Message sent when the truncated history sentinel is selected.
+
+        Contains the ID of the boundary commit whose history should be expanded.
+        """
+
+        def __init__(self, commit_id: str) -> None:
+            super().__init__()
+            self.id: str = commit_id
+
+    TRUNCATED_TEXT: str = "history truncated, load more"
+
     def __init__(self, **kwargs) -> None:
         """
         Initialize the CommitHistory widget.
@@ -65,7 +84,10 @@ class CommitHistory(Vertical):
         self.commits: list[Commit] = []
         self.branches_by_commit: dict[str, list[Branch]] = {}
         self.tags_by_commit: dict[str, list[Tag]] = {}
+        self.truncated: bool = False
         self.border_title: str = "Linear History"
+        self._items: list[ListItem] = []
+        self._sentinel: ListItem | None = None
 
     def compose(self):
         """
@@ -80,22 +102,103 @@ class CommitHistory(Vertical):
         commits: list[Commit],
         branches_by_commit: dict[str, list[Branch]],
         tags_by_commit: dict[str, list[Tag]],
+        truncated: bool = False,
     ) -> None:
         """
         Display a history of commits with branch and tag decorations.
 
-        Updates the ListView with the provided commits and their associated branches and tags.
+        Updates the ListView with the provided commits and their associated branches and tags. If truncated, a sentinel item is shown after the last commit instead of a root marker.
         """
         self.commits = commits
         self.branches_by_commit = branches_by_commit
         self.tags_by_commit = tags_by_commit
+        self.truncated = truncated and bool(commits)
 
         list_view: ListView = self.query_one(ListView)
         list_view.clear()
 
-        for commit in self.commits:
-            label: Label = self._get_label(commit)
-            list_view.append(ListItem(label))
+        self._items = [ListItem(self._get_label(commit)) for commit in self.commits]
+        list_view.extend(self._items)
+
+        self._sentinel = None
+        if self.truncated:
+            self._append_sentinel()
+
+    def apply(
+        self,
+        commits: list[Commit],
+        branches_by_commit: dict[str, list[Branch]],
+        tags_by_commit: dict[str, list[Tag]],
+        truncated: bool = False,
+    ) -> None:
+        """
+        Update the displayed history in place.
+
+        Keeps the items of the older commits shared with the displayed history and only replaces the newer ones that differ,
+        e.g. after a branch advanced or was reset. Labels of kept commits are refreshed only if their decorations changed.
+        Falls back to a full redisplay if the histories share no commits.
+        """
+        shared: int = _count_common_suffix(self.commits, commits)
+        if not shared:
+            self.show(commits, branches_by_commit, tags_by_commit, truncated)
+            return
+
+        old_branches: dict[str, list[Branch]] = self.branches_by_commit
+        old_tags: dict[str, list[Tag]] = self.tags_by_commit
+        self.branches_by_commit = branches_by_commit
+        self.tags_by_commit = tags_by_commit
+
+        list_view: ListView = self.query_one(ListView)
+        removed_count: int = len(self.commits) - shared
+        kept: list[ListItem] = self._items[removed_count:]
+        if removed_count:
+            list_view.remove_children(self._items[:removed_count])
+
+        added_count: int = len(commits) - shared
+        added: list[ListItem] = [
+            ListItem(self._get_label(commit)) for commit in commits[:added_count]
+        ]
+        if added:
+            list_view.mount(*added, before=kept[0])
+
+        for commit, item in zip(commits[added_count:], kept):
+            if old_branches.get(commit.id) != branches_by_commit.get(
+                commit.id
+            ) or old_tags.get(commit.id) != tags_by_commit.get(commit.id):
+                item.query_one(Label).update(self._get_text(commit))
+
+        self.commits = commits
+        self._items = added + kept
+
+        self.truncated = truncated
+        if truncated and self._sentinel is None:
+            self._append_sentinel()
+        elif not truncated and self._sentinel is not None:
+            self._sentinel.remove()
+            self._sentinel = None
+
+    def select_commit(self, commit_id: str) -> bool:
+        """
+        Highlight a commit in the list.
+
+        Returns False if the commit is not in the displayed history.
+        """
+        for index, commit in enumerate(self.commits):
+            if commit.id == commit_id:
+                self.query_one(ListView).index = index
+                return True
+        return False
+
+    def _append_sentinel(self) -> None:
+        """
+        Append the truncated history sentinel item.
+
+        Selecting it requests more history.
+        """
+        sentinel: Label = Label(Text(f"┆ {self.TRUNCATED_TEXT}", style="italic"))
+        sentinel.add_class("truncated-item")
+        self._sentinel = ListItem(sentinel)
+        self.query_one(ListView).append(self._sentinel)
 
     def _get_label(self, commit: Commit) -> Label:
         """
@@ -103,13 +206,18 @@ class CommitHistory(Vertical):
 
         Returns a styled Label widget for the given commit.
         """
-        header: Text = self._get_header_text(commit)
-        body: Text = CommitHistory._get_body_text(commit)
-
-        label = Label(header + body)
+        label = Label(self._get_text(commit))
         label.add_class("commit-item")
         return label
 
+    def _get_text(self, commit: Commit) -> Text:
+        """
+        Build the full text for a commit label.
+
+        Returns the header with decorations followed by the body.
+        """
+        return self._get_header_text(commit) + CommitHistory._get_body_text(commit)
+
     @staticmethod
     def _get_body_text(commit: Commit) -> Text:
         """
@@ -150,7 +258,26 @@ class CommitHistory(Vertical):
         """
         Handle selection of a commit in the list.
 
-        Posts a CommitSelected message with the selected commit ID.
+        Posts a CommitSelected message with the selected commit ID, or a LoadMoreRequested message if the truncation sentinel is selected.
         """
+        if event.index >= len(self.commits):
+            if self.truncated:
+                self.post_message(self.LoadMoreRequested(self.commits[-1].id))
+            return
+
         commit_id: str = self.commits[event.index].id
         self.post_message(self.CommitSelected(commit_id))
+
+
+def _count_common_suffix(old: list[Commit], new: list[Commit]) -> int:
+    """
+    Count the commits at the end of two histories that are the same.
+
+    Histories are newest-first, so the common suffix is the shared older history.
+    """
+    count: int = 0
+    for old_commit, new_commit in zip(reversed(old), reversed(new)):
+        if old_commit.id != new_commit.id:
+            break
+        count += 1
+    return count
@@ -0,0 +1,45 @@
+"""
+Incremental reference list updates.
+
+Provides a helper shared by the branch and tag lists for applying reference changes to a ListView without rebuilding it.
+"""
+
+from collections.abc import Callable
+
+from textual.widgets import ListItem, ListView
+
+from gittergraph.core import RefChanges
+
+
+def apply_ref_changes(
+    list_view: ListView,
+    items: dict[str, ListItem],
+    names: list[str],
+    changes: RefChanges,
+    make_item: Callable[[str], ListItem],
+) -> None:
+    """
+    Apply reference changes to a list view.
+
+    Removes the items of removed references and inserts items for added ones at their position in names, the new order of all references.
+    Moved references keep their items. The items mapping of reference names to list items is updated in place.
+    """
+    removed: list[ListItem] = [
+        items.pop(name) for name in changes.removed if name in items
+    ]
+    if removed:
+        list_view.remove_children(removed)
+
+    added: set[str] = set(changes.added)
+    pending: list[ListItem] = []
+    for name in names:
+        if name in added:
+            item: ListItem = make_item(name)
+            items[name] = item
+            pending.append(item)
+        elif pending and name in items:
+            list_view.mount(*pending, before=items[name])
+            pending = []
+
+    if pending:
+        list_view.mount(*pending)
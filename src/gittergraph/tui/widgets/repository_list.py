@@ -0,0 +1,133 @@
+"""
+Repository list widget for the TUI.
+
+Displays a selectable list of workspace repositories with their loading progress and summaries.
+"""
+
+from pathlib import Path
+
+from rich.text import Text
+from textual.containers import Vertical
+from textual.message import Message
+from textual.widgets import Label, ListItem, ListView
+
+from gittergraph.core import LoadState, RepositorySummary
+
+_STATE_STYLES: dict[LoadState, str] = {
+    LoadState.PENDING: "dim",
+    LoadState.LOADING: "yellow",
+    LoadState.LOADED: "green",
+    LoadState.FAILED: "red",
+}
+
+
+class RepositoryList(Vertical):
+    """
+    Widget for displaying a list of repositories in the TUI.
+
+    Shows one line per repository that is updated in place as loading progresses, and posts a message when a repository is selected.
+    """
+
+    # Widgets should use inline TCSS for styling.
+    DEFAULT_CSS = """
+    RepositoryList {
+        border: solid $primary;
+        overflow-y: auto;
+        scrollbar-size: 0 0;
+    }
+
+    RepositoryList > ListView {
+        height: 100%;
+        scrollbar-size: 0 0;
+    }
+
+    .repository-item {
+        height: auto;
+        padding: 0 1;
+    }
+    """
+
+    class RepositorySelected(Message):
+        """
+        Message sent when a repository is selected.
+
+        Contains the path of the selected repository.
+        """
+
+        def __init__(self, path: Path) -> None:
+            super().__init__()
+            self.path: Path = path
+
+    def __init__(self, **kwargs) -> None:
+        """
+        Initialize the RepositoryList widget.
+
+        Sets up the widget for displaying a list of repositories.
+        """
+        super().__init__(**kwargs)
+        self.paths: list[Path] = []
+        self._labels: dict[Path, Label] = {}
+        self.border_title = "Repositories"
+
+    def compose(self):
+        """
+        Yield the ListView widget for displaying repositories.
+
+        Called by Textual to build the widget tree.
+        """
+        yield ListView()
+
+    def show(self, summaries: list[RepositorySummary]) -> None:
+        """
+        Display a list of repositories.
+
+        Updates the ListView with the provided repository summaries.
+        """
+        self.paths = [summary.path for summary in summaries]
+        self._labels = {}
+        list_view: ListView = self.query_one(ListView)
+        list_view.clear()
+
+        for summary in summaries:
+            label: Label = Label(RepositoryList._get_text(summary))
+            label.add_class("repository-item")
+            self._labels[summary.path] = label
+            list_view.append(ListItem(label))
+
+    def update_summary(self, summary: RepositorySummary) -> None:
+        """
+        Update the displayed summary of a repository in place.
+
+        Ignores repositories that are not displayed.
+        """
+        label: Label | None = self._labels.get(summary.path)
+        if label is not None:
+            label.update(RepositoryList._get_text(summary))
+
+    @staticmethod
+    def _get_text(summary: RepositorySummary) -> Text:
+        """
+        Create the text of a repository line.
+
+        Shows the name and loading state, then HEAD and reference counts once loaded, or the error if loading failed.
+        """
+        text: Text = Text()
+        text.append(f"{summary.name:<24} ", style="bold")
+        text.append(f"{summary.state.value:<8} ", style=_STATE_STYLES[summary.state])
+        if summary.state == LoadState.LOADED:
+            text.append(summary.head or "(no HEAD)", style="cyan")
+            text.append(
+                f"  {summary.commit_count} commits, {summary.branch_count} branches, {summary.tag_count} tags",
+                style="dim",
+            )
+        elif summary.error:
+            text.append(summary.error, style="red")
+        return text
+
+    def on_list_view_selected(self, event: ListView.Selected) -> None:
+        """
+        Handle selection of a repository in the list.
+
+        Posts a RepositorySelected message with the selected repository path.
+        """
+        self.post_message(self.RepositorySelected(self.paths[event.index]))
@@ -10,7 +10,9 @@ from textual.containers import Vertical
 from textual.message import Message
 from textual.widgets import Label, ListItem, ListView
 
+from gittergraph.core import RefChanges
 from gittergraph.models import Tag
+from gittergraph.tui.widgets.ref_list_updates import apply_ref_changes
 
 
 class TagList(Vertical):
@@ -59,6 +61,7 @@ class TagList(Vertical):
         """
         super().__init__(**kwargs)
         self.tags: list[Tag] = []
+        self._items: dict[str, ListItem] = {}
         self.border_title: str = "Tags"
 
     def compose(self):
@@ -76,12 +79,31 @@ class TagList(Vertical):
         Updates the ListView with the provided tags.
         """
         self.tags = tags
+        self._items = {}
         list_view: ListView = self.query_one(ListView)
         list_view.clear()
 
         for tag in self.tags:
             label: Label = TagList._get_label(tag)
-            list_view.append(ListItem(label))
+            item: ListItem = ListItem(label)
+            self._items[tag.name] = item
+            list_view.append(item)
+
+    def apply(self, tags: list[Tag], changes: RefChanges) -> None:
+        """
+        Update the displayed tags in place.
+
+        Removes items of removed tags and inserts items for added ones, keeping all other items.
+        """
+        by_name: dict[str, Tag] = {tag.name: tag for tag in tags}
+        self.tags = tags
+        apply_ref_changes(
+            self.query_one(ListView),
+            self._items,
+            list(by_name),
+            changes,
+            lambda name: ListItem(TagList._get_label(by_name[name])),
+        )
 
     @staticmethod
     def _get_label(tag: Tag) -> Label:
@@ -0,0 +1,65 @@
+"""
+Memory utility functions.
+
+Provides helpers for measuring process memory and for parsing and formatting byte sizes.
+"""
+
+import os
+import re
+import resource
+import sys
+
+_SIZE_PATTERN: re.Pattern[str] = re.compile(r"(\d+(?:\.\d+)?)\s*([kmgt]?)i?b?", re.I)
+_SIZE_UNITS: dict[str, int] = {
+    "": 1,
+    "k": 1 << 10,
+    "m": 1 << 20,
+    "g": 1 << 30,
+    "t": 1 << 40,
+}
+
+
+def get_resident_memory() -> int:
+    """
+    Get the resident memory of the current process in bytes.
+
+    Reads the current resident set size from /proc where available, and falls back to the peak resident set size otherwise.
+    """
+    try:
+        with open("/proc/self/statm", encoding="ascii") as file:
+            resident_pages: int = int(file.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    max_rss: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def parse_size(value: str) -> int:
+    """
+    Parse a byte size string.
+
+    Accepts plain byte counts and binary unit suffixes (e.g. '512M', '2GiB', '64k'). Raises ValueError if the string is not a valid size.
+    """
+    match: re.Match[str] | None = _SIZE_PATTERN.fullmatch(value.strip())
+    if match is None:
+        raise ValueError(f"Invalid size '{value}'")
+
+    number, unit = match.groups()
+    return int(float(number) * _SIZE_UNITS[unit.lower()])
+
+
+def format_size(size: int) -> str:
+    """
+    Format a byte size for display.
+
+    Returns the size with a binary unit suffix, e.g. '12.5 MiB'.
+    """
+    value: float = float(size)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} TiB"
@@ -0,0 +1,46 @@
+"""
+Object ID utility functions.
+
+Provides helpers for converting git object IDs between hex strings and compact binary form, for both SHA-1 and SHA-256 repositories.
+"""
+
+SHA1_HEX_LENGTH: int = 40
+SHA256_HEX_LENGTH: int = 64
+
+
+def is_full_hex(value: str) -> bool:
+    """
+    Check if a string is a full hex object ID.
+
+    Returns True for 40 (SHA-1) or 64 (SHA-256) hex digits.
+    """
+    try:
+        hex_to_oid(value)
+    except ValueError:
+        return False
+    return True
+
+
+def hex_to_oid(value: str) -> bytes:
+    """
+    Convert a hex object ID to binary form.
+
+    Returns 20 bytes for SHA-1 and 32 bytes for SHA-256 IDs. Raises ValueError if the string is not a full hex object ID.
+    """
+    if len(value) not in (SHA1_HEX_LENGTH, SHA256_HEX_LENGTH):
+        raise ValueError(f"Invalid object ID '{value}'")
+
+    # fromhex skips whitespace, so the decoded length must be checked too
+    oid: bytes = bytes.fromhex(value)
+    if len(oid) * 2 != len(value):
+        raise ValueError(f"Invalid object ID '{value}'")
+    return oid
+
+
+def oid_to_hex(oid: bytes) -> str:
+    """
+    Convert a binary object ID to hex form.
+
+    Returns the lowercase hex digits of the ID.
+    """
+    return oid.hex()
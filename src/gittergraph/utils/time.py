@@ -6,6 +6,17 @@ Provides helpers for working with time.
 """
 
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def get_timezone(offset: int) -> timezone:
+    """
+    Get the timezone for an offset in minutes.
+
+    Returns a shared timezone object per offset. Repositories use only a handful of distinct offsets, so the cache stays small.
+    """
+    return timezone(timedelta(minutes=offset))
 
 
 def unix_timestamp_to_datetime(timestamp: int, offset: int = 0) -> datetime:
@@ -14,5 +25,17 @@ def unix_timestamp_to_datetime(timestamp: int, offset: int = 0) -> datetime:
 
     Takes a Unix timestamp and an optional timezone offset in minutes, returning a datetime object with the correct timezone applied.
     """
-    tz = timezone(timedelta(minutes=offset))
-    return datetime.fromtimestamp(timestamp, tz)
+    return datetime.fromtimestamp(timestamp, get_timezone(offset))
+
+
+def parse_date(value: str) -> int:
+    """
+    Parse a date string into a Unix timestamp.
+
+    Accepts ISO 8601 dates and datetimes (e.g. '2024-01-31' or '2024-01-31T12:00:00+02:00'); values without a timezone are taken as UTC.
+    Raises ValueError if the string is not a valid date.
+    """
+    parsed: datetime = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
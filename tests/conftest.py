@@ -10,6 +10,18 @@ import pygit2
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def runtime_dir(tmp_path_factory, monkeypatch):
+    """
+    Isolate daemon sockets.
+
+    Points XDG_RUNTIME_DIR to a fresh short temporary directory, so tests never attach to a daemon the user is running and socket paths stay short.
+    """
+    path = tmp_path_factory.mktemp("run")
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(path))
+    return path
+
+
 @pytest.fixture
 def empty_repo(tmp_path):
     """
@@ -273,3 +285,30 @@ def repo_with_merge(empty_repo):
         "feature1": str(feature1),
         "merge": str(merge),
     }
+
+
+@pytest.fixture
+def repo_with_files(empty_repo):
+    """
+    Create a repository with commits that change files.
+
+    Creates a root commit adding two files and a second commit modifying one and adding another. Returns the path and commit ids.
+    """
+    repo_path, repo = empty_repo
+    author = pygit2.Signature("Test", "test@example.com")
+
+    builder = repo.TreeBuilder()
+    builder.insert("a.txt", repo.create_blob(b"one\ntwo\n"), pygit2.GIT_FILEMODE_BLOB)
+    builder.insert("b.txt", repo.create_blob(b"bee\n"), pygit2.GIT_FILEMODE_BLOB)
+    tree1 = builder.write()
+    c1 = repo.create_commit("refs/heads/main", author, author, "Add files", tree1, [])
+
+    builder = repo.TreeBuilder(repo[tree1])
+    builder.insert("a.txt", repo.create_blob(b"one\n2\n"), pygit2.GIT_FILEMODE_BLOB)
+    builder.insert("c.txt", repo.create_blob(b"sea\n"), pygit2.GIT_FILEMODE_BLOB)
+    tree2 = builder.write()
+    c2 = repo.create_commit(
+        "refs/heads/main", author, author, "Change files", tree2, [c1]
+    )
+
+    return repo_path, [str(c1), str(c2)]
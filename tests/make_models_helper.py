@@ -71,4 +71,5 @@ def make_tag(**kwargs):
     return Tag(
         target_id=kwargs.get("target_id", "abc1234567890"),
         name=kwargs.get("name", "refs/tags/v1.0.0"),
+        object_id=kwargs.get("object_id", None),
     )
@@ -0,0 +1,46 @@
+"""
+Test helpers for access tests.
+
+Provides utility functions for preparing repository state, such as packing references, in the access test suite.
+"""
+
+import subprocess
+
+
+def pack_refs(repo_path) -> None:
+    """
+    Pack all references of a repository.
+
+    Runs git pack-refs so references are stored in packed-refs with peeled lines.
+    """
+    subprocess.run(
+        ["git", "-C", str(repo_path), "pack-refs", "--all"],
+        check=True,
+        capture_output=True,
+    )
+
+
+def pack_objects(repo_path, offset_deltas: bool = True) -> None:
+    """
+    Pack all objects of a repository.
+
+    Runs git repack with a large delta window, so similar objects are stored as deltas. Uses reference deltas instead of offset deltas if offset_deltas is False.
+    """
+    subprocess.run(
+        [
+            "git",
+            "-C",
+            str(repo_path),
+            "-c",
+            f"repack.useDeltaBaseOffset={str(offset_deltas).lower()}",
+            "repack",
+            "-a",
+            "-d",
+            "-f",
+            "-q",
+            "--window=250",
+            "--depth=50",
+        ],
+        check=True,
+        capture_output=True,
+    )
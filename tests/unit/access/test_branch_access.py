@@ -10,7 +10,9 @@ import pygit2
 import pytest
 
 from gittergraph.access.branch_access import BranchAccess
+from gittergraph.access.ref_access import RefRecord
 from gittergraph.models import Branch
+from tests.unit.access.access_helper import pack_refs
 
 
 class TestToModel:
@@ -254,6 +256,52 @@ class TestGetAll:
         assert len(branches) == branch_count
 
 
+class TestGetAllFromRecords:
+    """
+    Tests for get_all with bulk-loaded references.
+
+    Covers packed references and provided reference records.
+    """
+
+    def test_get_all_with_packed_refs(self, repo_with_remote_branches):
+        """
+        Get all branches from packed references.
+
+        Returns local and remote branches with their targets.
+        """
+        repo_path, commit_ids = repo_with_remote_branches
+        pack_refs(repo_path)
+        access = BranchAccess(repo_path)
+
+        branches = access.get_all()
+
+        assert branches["refs/heads/develop"].target_id == commit_ids[1]
+        assert branches["refs/remotes/upstream/main"].target_id == commit_ids[0]
+        assert len(branches) == 5
+
+    def test_get_all_with_given_records(self, simple_repo):
+        """
+        Get all branches from provided reference records.
+
+        Returns only branch references, skipping tags and remote HEADs.
+        """
+        repo_path, _ = simple_repo
+        access = BranchAccess(repo_path)
+        refs = {
+            name: RefRecord(name, "1" * 40)
+            for name in [
+                "refs/heads/main",
+                "refs/remotes/origin/HEAD",
+                "refs/remotes/origin/main",
+                "refs/tags/v1",
+            ]
+        }
+
+        branches = access.get_all(refs)
+
+        assert list(branches) == ["refs/heads/main", "refs/remotes/origin/main"]
+
+
 class TestBranchProperties:
     """
     Tests for Branch model properties via BranchAccess.
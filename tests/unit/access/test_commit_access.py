@@ -10,6 +10,7 @@ import pygit2
 import pytest
 
 from gittergraph.access.commit_access import CommitAccess
+from gittergraph.access.identity_pool import IdentityPool
 from gittergraph.models import Commit
 
 
@@ -111,6 +112,39 @@ class TestToModel:
         assert len(commit.parent_ids) == 1
         assert commit.parent_ids[0] == commit_ids[-2]
 
+    def test_shares_identical_signatures(self, simple_repo):
+        """
+        Test that identical author and committer share one signature.
+
+        Ensures a single Signature instance and identity ID are used.
+        """
+        repo_path, commit_ids = simple_repo
+        repo = pygit2.Repository(str(repo_path))
+
+        commit = CommitAccess.to_model(repo.get(commit_ids[0]))
+
+        assert commit.committer is commit.author
+        assert commit.author_identity == commit.committer_identity == 0
+
+    def test_identities_from_pool(self, repo_different_author_and_commiter):
+        """
+        Test that identity IDs and strings come from the given pool.
+
+        Ensures distinct identities get distinct IDs and pooled strings are reused.
+        """
+        repo_path, commit_ids = repo_different_author_and_commiter
+        repo = pygit2.Repository(str(repo_path))
+        pool = IdentityPool()
+
+        first = CommitAccess.to_model(repo.get(commit_ids[0]), pool)
+        second = CommitAccess.to_model(repo.get(commit_ids[0]), pool)
+
+        assert first.author_identity == 0
+        assert first.committer_identity == 1
+        assert second.committer_identity == 1
+        assert second.author.name is first.author.name
+        assert pool.get_identity(1) == ("Bob", "bob@example.com")
+
 
 class TestGet:
     """
@@ -300,3 +334,210 @@ class TestGetAll:
         # Should only have one commit, not duplicated
         assert len(commits) == 1
         assert str(id_) in commits
+
+
+class TestGetAllFromStartIds:
+    """
+    Tests for get_all with explicit starting points.
+
+    Covers walking only from the given commit-ish IDs.
+    """
+
+    def test_walks_only_from_given_ids(self, repo_with_branches):
+        """
+        Get commits reachable from a single starting point.
+
+        Excludes commits reachable only from other references.
+        """
+        repo_path, commit_ids = repo_with_branches
+        access = CommitAccess(repo_path)
+
+        commits = access.get_all([commit_ids[1]])
+
+        assert set(commits) == {commit_ids[0], commit_ids[1]}
+
+    def test_empty_start_ids(self, simple_repo):
+        """
+        Get commits with no starting points.
+
+        Returns an empty dictionary.
+        """
+        repo_path, _ = simple_repo
+        assert not CommitAccess(repo_path).get_all([])
+
+    def test_skips_non_commit_start_ids(self, repo_with_annotated_tag):
+        """
+        Get commits from a tree, an annotated tag, and a missing object.
+
+        Peels the tag and skips starting points that are not commits.
+        """
+        repo_path, commit_ids = repo_with_annotated_tag
+        repo = pygit2.Repository(str(repo_path))
+        tree_id = str(repo[commit_ids[0]].tree_id)
+        tag_id = str(repo.references["refs/tags/v2.0.0"].target)
+
+        commits = CommitAccess(repo_path).get_all([tree_id, "0" * 40, tag_id])
+
+        assert list(commits) == [commit_ids[0]]
+
+    def test_exclude_ids_stop_the_walk(self, repo_with_branches):
+        """
+        Get commits while excluding the history of another commit.
+
+        Returns only commits not reachable from the excluded commit.
+        """
+        repo_path, commit_ids = repo_with_branches
+        access = CommitAccess(repo_path)
+
+        commits = access.get_all([commit_ids[2]], exclude_ids=[commit_ids[1]])
+
+        assert list(commits) == [commit_ids[2]]
+
+    def test_max_count_bounds_walk(self, repo_with_history):
+        """
+        Get commits with a commit count bound.
+
+        Returns only the newest commits.
+        """
+        repo_path, commit_ids = repo_with_history
+
+        commits = CommitAccess(repo_path).get_all([commit_ids[4]], max_count=2)
+
+        assert list(commits) == [commit_ids[4], commit_ids[3]]
+
+    def test_since_bounds_walk(self, repo_with_history):
+        """
+        Get commits with a date bound.
+
+        Returns only commits not older than the given timestamp.
+        """
+        repo_path, commit_ids = repo_with_history
+
+        commits = CommitAccess(repo_path).get_all([commit_ids[4]], since=1234567892)
+
+        assert list(commits) == commit_ids[:1:-1]
+
+    def test_iter_all_matches_get_all(self, repo_with_history):
+        """
+        Iterate over all commits.
+
+        Yields the same commits in the same order as get_all.
+        """
+        repo_path, commit_ids = repo_with_history
+        access = CommitAccess(repo_path)
+
+        commits = list(access.iter_all([commit_ids[4]], max_count=3))
+
+        assert [c.id for c in commits] == list(
+            access.get_all([commit_ids[4]], max_count=3)
+        )
+        assert len(commits) == 3
+
+    def test_iter_date_order(self, repo_with_merge):
+        """
+        Iterate over the history of a merge in date order.
+
+        Yields every commit after its children, with its committer time and parent IDs.
+        """
+        repo_path, commits = repo_with_merge
+
+        walked = list(CommitAccess(repo_path).iter_date_order(commits["merge"]))
+
+        order = [commit_id for commit_id, _, _ in walked]
+        assert sorted(order) == sorted(commits.values())
+        assert order[0] == commits["merge"]
+        assert order[-1] == commits["base"]
+        assert order.index(commits["feature1"]) > order.index(commits["merge"])
+        assert walked[0][2] == [commits["main2"], commits["feature1"]]
+        assert (
+            walked[0][1]
+            == pygit2.Repository(str(repo_path))[commits["merge"]].commit_time
+        )
+
+
+class TestParallelLoading:
+    """
+    Tests for decoding commits in worker processes.
+
+    Covers agreement with the serial walk, deterministic identity IDs, pooled strings, bounds, and stopping early.
+    """
+
+    @pytest.fixture(autouse=True)
+    def small_chunks(self, monkeypatch):
+        """Use tiny chunks so small repositories are split across workers."""
+        monkeypatch.setattr("gittergraph.access.commit_access._CHUNK_SIZE", 2)
+
+    def test_matches_serial_walk(self, repo_with_merge):
+        """
+        Load a repository with a merge commit on four processes.
+
+        Returns the same commits in the same order, with the same identity IDs, as the serial walk.
+        """
+        repo_path, _ = repo_with_merge
+
+        serial = list(CommitAccess(repo_path).iter_all(max_count=100))
+        parallel = list(CommitAccess(repo_path, jobs=4).iter_all(max_count=100))
+
+        assert parallel == serial
+        assert [c.id for c in parallel] == [c.id for c in serial]
+        assert [(c.author_identity, c.committer_identity) for c in parallel] == [
+            (c.author_identity, c.committer_identity) for c in serial
+        ]
+
+    def test_identities_are_shared(self, repo_different_author_and_commiter):
+        """
+        Load commits with different author and committer in parallel.
+
+        Identity IDs refer to the shared identity pool.
+        """
+        repo_path, commit_ids = repo_different_author_and_commiter
+        pool = IdentityPool()
+
+        commit = CommitAccess(repo_path, pool, jobs=2).get_all()[commit_ids[0]]
+
+        assert pool.get_identity(commit.author_identity) == (
+            commit.author.name,
+            commit.author.email,
+        )
+        assert pool.get_identity(commit.committer_identity) == (
+            commit.committer.name,
+            commit.committer.email,
+        )
+
+    def test_strings_are_pooled(self, repo_with_merge):
+        """
+        Load commits of the same author in parallel.
+
+        All commits share one name and one email string from the shared identity pool, across chunks.
+        """
+        repo_path, _ = repo_with_merge
+
+        commits = list(CommitAccess(repo_path, jobs=4).iter_all(max_count=100))
+
+        assert len(commits) == 5
+        assert len({id(commit.author.name) for commit in commits}) == 1
+        assert len({id(commit.committer.email) for commit in commits}) == 1
+
+    def test_bounds(self, repo_with_history):
+        """
+        Load with a commit count bound in parallel.
+
+        Returns the newest commits only.
+        """
+        repo_path, commit_ids = repo_with_history
+
+        commits = list(CommitAccess(repo_path, jobs=3).iter_all(max_count=3))
+
+        assert [commit.id for commit in commits] == commit_ids[:-4:-1]
+
+    def test_stopping_early(self, repo_with_history):
+        """
+        Stop iterating after the first commit.
+
+        Closing the iterator shuts the worker processes down without errors.
+        """
+        repo_path, commit_ids = repo_with_history
+        commits = CommitAccess(repo_path, jobs=2).iter_all(max_count=5)
+
+        assert next(commits).id == commit_ids[-1]
+        commits.close()
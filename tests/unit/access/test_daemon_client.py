@@ -0,0 +1,120 @@
+"""
+Tests for the daemon client.
+
+Covers socket path lookup, connecting without a daemon or to an untrusted socket, and the commit encoding of the daemon protocol.
+"""
+
+import os
+import socket
+
+from gittergraph.access.daemon_client import (
+    DaemonClient,
+    decode_commit,
+    encode_commit,
+    get_peer_uid,
+    get_socket_path,
+    is_private_dir,
+)
+from tests.make_models_helper import make_commit
+
+
+def test_socket_path_in_runtime_dir(runtime_dir, tmp_path):
+    """
+    Get the socket path of a repository.
+
+    Is stable for the same repository, differs between repositories, and lives in the runtime directory.
+    """
+    path = get_socket_path(tmp_path / "repo")
+
+    assert path == get_socket_path(tmp_path / "other" / ".." / "repo")
+    assert path != get_socket_path(tmp_path / "other")
+    assert path.parent == runtime_dir / "gittergraph"
+
+
+def test_socket_path_without_runtime_dir(monkeypatch, tmp_path):
+    """
+    Get the socket path of a repository without XDG_RUNTIME_DIR.
+
+    Falls back to a per-user temporary directory.
+    """
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+
+    assert get_socket_path(tmp_path).parent.name.startswith("gittergraph-")
+
+
+def test_connect_without_daemon(tmp_path):
+    """
+    Connect to a socket nobody listens on.
+
+    Returns None both for a missing socket and for a stale socket file.
+    """
+    stale = tmp_path / "stale.sock"
+    stale.touch()
+
+    assert DaemonClient.connect(tmp_path / "missing.sock") is None
+    assert DaemonClient.connect(stale) is None
+
+
+def test_is_private_dir(tmp_path):
+    """
+    Check directories with different modes and a symbolic link.
+
+    Only accepts a directory with mode 0700.
+    """
+    private = tmp_path / "private"
+    private.mkdir(mode=0o700)
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o755)
+    link = tmp_path / "link"
+    link.symlink_to(private)
+
+    assert is_private_dir(private)
+    assert not is_private_dir(shared)
+    assert not is_private_dir(link)
+    assert not is_private_dir(tmp_path / "missing")
+
+
+def test_connect_refuses_shared_dir(tmp_path):
+    """
+    Connect to a listening socket in a directory others can write to.
+
+    Returns None, while the same socket is connected to once the directory is private.
+    """
+    socket_dir = tmp_path / "sockets"
+    socket_dir.mkdir()
+    socket_dir.chmod(0o777)
+    socket_path = socket_dir / "daemon.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(str(socket_path))
+        listener.listen()
+
+        assert DaemonClient.connect(socket_path) is None
+
+        socket_dir.chmod(0o700)
+        client = DaemonClient.connect(socket_path)
+
+        assert client is not None
+        client.close()
+
+
+def test_peer_uid():
+    """
+    Get the peer user ID of a connected socket pair.
+
+    Returns the current user, or None where peer credentials are not reported.
+    """
+    left, right = socket.socketpair()
+    with left, right:
+        assert get_peer_uid(left) in (None, os.getuid())
+
+
+def test_commit_round_trip():
+    """
+    Encode and decode a commit.
+
+    Returns an equal commit.
+    """
+    commit = make_commit(id="a" * 40, parent_ids=["b" * 40], message="Message")
+
+    assert decode_commit(encode_commit(commit)) == commit
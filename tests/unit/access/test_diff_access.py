@@ -0,0 +1,129 @@
+"""
+DiffAccess tests.
+
+Unit tests for the DiffAccess class, covering diff statistics for commits and trees and reuse of the persistent cache.
+"""
+
+import pygit2
+import pytest
+
+from gittergraph.access.diff_access import DiffAccess
+from gittergraph.access.diff_cache import DiffCache
+from gittergraph.models import DiffStat
+
+
+class TestGetCommitStat:
+    """
+    Tests for get_commit_stat method.
+
+    Covers root and non-root commits and error handling.
+    """
+
+    def test_root_commit_compared_to_empty_tree(self, repo_with_files):
+        """
+        Get statistics of a root commit.
+
+        Returns all files as added.
+        """
+        repo_path, commit_ids = repo_with_files
+        access = DiffAccess(repo_path)
+
+        stat = access.get_commit_stat(commit_ids[0])
+
+        assert isinstance(stat, DiffStat)
+        assert sorted(stat.paths) == ["a.txt", "b.txt"]
+        assert stat.insertions == 3
+        assert stat.deletions == 0
+
+    def test_commit_compared_to_first_parent(self, repo_with_files):
+        """
+        Get statistics of a commit with a parent.
+
+        Returns only the files changed by the commit.
+        """
+        repo_path, commit_ids = repo_with_files
+        access = DiffAccess(repo_path)
+
+        stat = access.get_commit_stat(commit_ids[1])
+
+        assert sorted(stat.paths) == ["a.txt", "c.txt"]
+        assert stat.files_changed == 2
+        assert stat.insertions == 2
+        assert stat.deletions == 1
+
+    def test_nonexistent_commit_raises_keyerror(self, simple_repo):
+        """
+        Get statistics of a missing commit.
+
+        Ensures KeyError is raised.
+        """
+        repo_path, _ = simple_repo
+        access = DiffAccess(repo_path)
+
+        with pytest.raises(KeyError):
+            access.get_commit_stat("0" * 40)
+
+    def test_non_commit_raises_valueerror(self, repo_with_files):
+        """
+        Get statistics of a non-commit object.
+
+        Ensures ValueError is raised for a tree ID.
+        """
+        repo_path, commit_ids = repo_with_files
+        tree_id = str(pygit2.Repository(str(repo_path))[commit_ids[0]].tree_id)
+        access = DiffAccess(repo_path)
+
+        with pytest.raises(ValueError, match="is not a commit"):
+            access.get_commit_stat(tree_id)
+
+
+class TestCache:
+    """
+    Tests for cache usage.
+
+    Covers cache location and warm starts across instances.
+    """
+
+    def test_default_cache_lives_in_git_dir(self, simple_repo):
+        """
+        Create access with the default cache.
+
+        Places the cache below the repository's git directory.
+        """
+        repo_path, _ = simple_repo
+        access = DiffAccess(repo_path)
+
+        assert (
+            access.cache.directory == repo_path / ".git" / "gittergraph" / "diff-cache"
+        )
+
+    def test_second_session_hits_cache(self, repo_with_files):
+        """
+        Compute the same diff from two access instances.
+
+        Serves the second lookup from the disk cache.
+        """
+        repo_path, commit_ids = repo_with_files
+        first = DiffAccess(repo_path).get_commit_stat(commit_ids[1])
+
+        access = DiffAccess(repo_path)
+        second = access.get_commit_stat(commit_ids[1])
+
+        assert second == first
+        assert access.cache.stats.hits == 1
+        assert access.cache.stats.misses == 0
+
+    def test_uses_given_cache(self, repo_with_files, tmp_path):
+        """
+        Create access with an explicit cache.
+
+        Stores entries in the given cache.
+        """
+        repo_path, commit_ids = repo_with_files
+        cache = DiffCache(tmp_path / "cache")
+        access = DiffAccess(repo_path, cache)
+
+        access.get_commit_stat(commit_ids[0])
+
+        assert access.cache is cache
+        assert cache.stats.writes == 1
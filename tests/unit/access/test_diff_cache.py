@@ -0,0 +1,187 @@
+"""
+DiffCache tests.
+
+Unit tests for the DiffCache class, covering round trips, persistence across instances, hit-rate counters, and size-bounded eviction.
+"""
+
+from gittergraph.access.diff_cache import DiffCache, DiffCacheStats
+from gittergraph.models import DiffStat
+
+
+class TestMakeKey:
+    """
+    Tests for make_key method.
+
+    Covers key stability and sensitivity to tree IDs and options.
+    """
+
+    def test_key_is_stable(self):
+        """
+        Build the same key twice.
+
+        Returns identical keys for identical inputs.
+        """
+        assert DiffCache.make_key("a", "b") == DiffCache.make_key("a", "b")
+
+    def test_key_depends_on_trees_and_options(self):
+        """
+        Build keys with different inputs.
+
+        Returns distinct keys for different trees, flags, and rename detection.
+        """
+        keys = {
+            DiffCache.make_key("a", "b"),
+            DiffCache.make_key("b", "a"),
+            DiffCache.make_key(None, "b"),
+            DiffCache.make_key("a", "b", flags=1),
+            DiffCache.make_key("a", "b", find_renames=True),
+        }
+        assert len(keys) == 5
+
+
+class TestGetPut:
+    """
+    Tests for get and put methods.
+
+    Covers storing, reading back, and persistence of entries.
+    """
+
+    def test_round_trip(self, tmp_path):
+        """
+        Store and read back an entry.
+
+        Returns an equal DiffStat and counts one miss and one hit.
+        """
+        cache = DiffCache(tmp_path / "cache")
+        stat = DiffStat(insertions=3, deletions=1, paths=["a.txt", "dir/b.txt"])
+
+        assert cache.get("abcdef") is None
+        cache.put("abcdef", stat)
+
+        assert cache.get("abcdef") == stat
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.writes == 1
+
+    def test_round_trip_without_paths(self, tmp_path):
+        """
+        Store an entry with no changed paths.
+
+        Returns a DiffStat with an empty path list.
+        """
+        cache = DiffCache(tmp_path / "cache")
+        cache.put("abcdef", DiffStat(insertions=0, deletions=0))
+
+        assert cache.get("abcdef") == DiffStat(insertions=0, deletions=0, paths=[])
+
+    def test_entries_shared_across_instances(self, tmp_path):
+        """
+        Read an entry written by another cache instance.
+
+        Returns the stored entry from a fresh cache on the same directory.
+        """
+        stat = DiffStat(insertions=1, deletions=2, paths=["x"])
+        DiffCache(tmp_path / "cache").put("abcdef", stat)
+
+        assert DiffCache(tmp_path / "cache").get("abcdef") == stat
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        """
+        Read a corrupted entry.
+
+        Returns None and counts a miss.
+        """
+        cache = DiffCache(tmp_path / "cache")
+        cache.put("abcdef", DiffStat(insertions=1, deletions=0, paths=["x"]))
+        (tmp_path / "cache" / "ab" / "cdef").write_bytes(b"garbage")
+
+        assert cache.get("abcdef") is None
+        assert cache.stats.misses == 1
+
+    def test_clear_removes_entries(self, tmp_path):
+        """
+        Clear the cache.
+
+        Removes all stored entries.
+        """
+        cache = DiffCache(tmp_path / "cache")
+        cache.put("abcdef", DiffStat(insertions=1, deletions=0, paths=["x"]))
+        cache.clear()
+
+        assert cache.get("abcdef") is None
+
+
+class TestEviction:
+    """
+    Tests for size-bounded eviction.
+
+    Covers eviction order and counters.
+    """
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """
+        Exceed the size limit.
+
+        Evicts the oldest entries while keeping the newest one.
+        """
+        paths = [f"file_{i:04d}.txt" for i in range(200)]
+        cache = DiffCache(tmp_path / "cache", max_bytes=1)
+
+        for i in range(5):
+            cache.put(f"{i:02d}key", DiffStat(insertions=i, deletions=0, paths=paths))
+
+        assert cache.stats.evictions > 0
+        assert cache.get("00key") is None
+
+    def test_no_eviction_under_limit(self, tmp_path):
+        """
+        Stay below the size limit.
+
+        Keeps all entries.
+        """
+        cache = DiffCache(tmp_path / "cache")
+        for i in range(5):
+            cache.put(f"{i:02d}key", DiffStat(insertions=i, deletions=0))
+
+        assert cache.stats.evictions == 0
+        for i in range(5):
+            assert cache.get(f"{i:02d}key") is not None
+
+    def test_size_counts_entries_once(self, tmp_path):
+        """
+        Put one entry into a fresh cache, then overwrite it.
+
+        The tracked size is the size of the entry on disk, and overwriting replaces its size instead of adding to it.
+        """
+        cache = DiffCache(tmp_path / "cache")
+        entry = tmp_path / "cache" / "ab" / "cdef"
+
+        cache.put("abcdef", DiffStat(insertions=1, deletions=0, paths=["x"]))
+        assert cache._current_size() == entry.stat().st_size
+
+        cache.put("abcdef", DiffStat(insertions=2, deletions=0, paths=["x", "y"]))
+        assert cache._current_size() == entry.stat().st_size
+
+
+class TestDiffCacheStats:
+    """
+    Tests for DiffCacheStats.
+
+    Covers the hit rate computation.
+    """
+
+    def test_hit_rate_without_lookups(self):
+        """
+        Compute hit rate with no lookups.
+
+        Returns 0.0.
+        """
+        assert DiffCacheStats().hit_rate == 0.0
+
+    def test_hit_rate(self):
+        """
+        Compute hit rate with hits and misses.
+
+        Returns the ratio of hits to lookups.
+        """
+        assert DiffCacheStats(hits=3, misses=1).hit_rate == 0.75
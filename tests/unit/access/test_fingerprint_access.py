@@ -0,0 +1,76 @@
+"""
+FingerprintAccess tests.
+
+Unit tests for repository fingerprints, covering unchanged repositories and changes to HEAD, loose refs, and packed refs.
+"""
+
+import pygit2
+
+from gittergraph.access.fingerprint_access import FingerprintAccess
+from tests.unit.access.access_helper import pack_refs
+
+
+class TestFingerprintAccess:
+    """
+    Tests for computing repository fingerprints.
+
+    Covers stability and sensitivity to reference changes.
+    """
+
+    def test_unchanged_repository(self, repo_with_branches):
+        """
+        Compute the fingerprint twice without changes.
+
+        Returns equal fingerprints.
+        """
+        repo_path, _ = repo_with_branches
+        access = FingerprintAccess(repo_path)
+
+        assert access.get() == access.get()
+        assert access.get().ref_file_count == 2
+
+    def test_moved_branch(self, repo_with_branches):
+        """
+        Move a loose branch.
+
+        Returns a different fingerprint.
+        """
+        repo_path, commit_ids = repo_with_branches
+        access = FingerprintAccess(repo_path)
+        before = access.get()
+
+        repo = pygit2.Repository(str(repo_path))
+        repo.references["refs/heads/main"].set_target(commit_ids[2])
+
+        assert access.get() != before
+
+    def test_changed_head(self, repo_with_branches):
+        """
+        Point HEAD to another branch.
+
+        Returns a different fingerprint.
+        """
+        repo_path, _ = repo_with_branches
+        access = FingerprintAccess(repo_path)
+        before = access.get()
+
+        pygit2.Repository(str(repo_path)).set_head("refs/heads/feature")
+
+        assert access.get() != before
+
+    def test_packed_refs(self, repo_with_branches):
+        """
+        Pack all references.
+
+        Returns a different fingerprint that is stable afterwards.
+        """
+        repo_path, _ = repo_with_branches
+        access = FingerprintAccess(repo_path)
+        before = access.get()
+
+        pack_refs(repo_path)
+        after = access.get()
+
+        assert after != before
+        assert after == access.get()
+        assert after.ref_file_count == 0
@@ -0,0 +1,166 @@
+"""
+GitCliCommitAccess tests.
+
+Unit tests for walking history through git log, checked against the pygit2 based CommitAccess.
+"""
+
+import pygit2
+import pytest
+
+from gittergraph.access.commit_access import CommitAccess
+from gittergraph.access.git_cli_commit_access import GitCliCommitAccess
+from gittergraph.access.git_process import is_git_available
+
+pytestmark = pytest.mark.skipif(not is_git_available(), reason="git not installed")
+
+
+class TestIterAll:
+    """
+    Tests for walking all commits.
+
+    Covers agreement with the pygit2 walk, bounds, exclusions, and invalid starting points.
+    """
+
+    def test_matches_pygit2_walk(self, repo_with_merge):
+        """
+        Walk a repository with a merge commit.
+
+        Returns the same commits, field by field, as the pygit2 walk.
+        """
+        repo_path, _ = repo_with_merge
+
+        expected = CommitAccess(repo_path).get_all()
+        commits = GitCliCommitAccess(repo_path).get_all()
+
+        assert commits == expected
+
+    def test_converts_signatures(self, repo_different_author_and_commiter):
+        """
+        Walk a commit with different author and committer.
+
+        Keeps names, emails, times and timezone offsets of both, and assigns separate identities.
+        """
+        repo_path, commit_ids = repo_different_author_and_commiter
+        expected = CommitAccess(repo_path).get(commit_ids[0])
+
+        commit = GitCliCommitAccess(repo_path).get_all()[commit_ids[0]]
+
+        assert commit.author == expected.author
+        assert commit.committer == expected.committer
+        assert commit.author_identity != commit.committer_identity
+
+    def test_shares_identical_signatures(self, simple_repo):
+        """
+        Walk a commit whose author and committer are identical.
+
+        Uses a single Signature instance for both.
+        """
+        repo_path, commit_ids = simple_repo
+
+        commit = GitCliCommitAccess(repo_path).get_all()[commit_ids[0]]
+
+        assert commit.committer is commit.author
+        assert commit.author.time_offset == 60
+
+    def test_max_count(self, repo_with_history):
+        """
+        Walk with a commit count bound.
+
+        Returns the newest commits only.
+        """
+        repo_path, commit_ids = repo_with_history
+
+        commits = list(GitCliCommitAccess(repo_path).iter_all(max_count=2))
+
+        assert [commit.id for commit in commits] == commit_ids[:-3:-1]
+
+    def test_since(self, repo_with_history):
+        """
+        Walk with a date bound.
+
+        Stops at the first commit older than the bound.
+        """
+        repo_path, commit_ids = repo_with_history
+        access = GitCliCommitAccess(repo_path)
+        since = access.get(commit_ids[3]).committer.time
+
+        commits = list(access.iter_all(since=since))
+
+        assert {commit.id for commit in commits} == set(commit_ids[3:])
+
+    def test_excludes_commits(self, repo_with_branches):
+        """
+        Walk from a branch while excluding another.
+
+        Returns only the commits not reachable from the excluded branch.
+        """
+        repo_path, commit_ids = repo_with_branches
+
+        commits = GitCliCommitAccess(repo_path).get_all(
+            [commit_ids[2]], exclude_ids=[commit_ids[1]]
+        )
+
+        assert list(commits) == [commit_ids[2]]
+
+    def test_skips_invalid_starting_points(self, repo_with_history):
+        """
+        Walk from a mix of valid and invalid starting points.
+
+        Skips the invalid ones, and returns nothing if none is valid.
+        """
+        repo_path, commit_ids = repo_with_history
+        access = GitCliCommitAccess(repo_path)
+
+        commits = access.get_all(["0" * 40, "not-a-ref", commit_ids[0]])
+
+        assert list(commits) == [commit_ids[0]]
+        assert not access.get_all(["0" * 40])
+
+    def test_peels_annotated_tags(self, repo_with_annotated_tag):
+        """
+        Walk from an annotated tag object.
+
+        Starts from the commit the tag points to.
+        """
+        repo_path, commit_ids = repo_with_annotated_tag
+        tag_id = str(
+            pygit2.Repository(str(repo_path)).references["refs/tags/v2.0.0"].target
+        )
+
+        commits = GitCliCommitAccess(repo_path).get_all([tag_id])
+
+        assert list(commits) == commit_ids
+
+    def test_stopping_early_ends_walk(self, repo_with_history):
+        """
+        Stop iterating after the first commit.
+
+        Closing the iterator stops the git process without errors.
+        """
+        repo_path, commit_ids = repo_with_history
+        commits = GitCliCommitAccess(repo_path).iter_all()
+
+        assert next(commits).id == commit_ids[-1]
+        commits.close()
+
+
+class TestIterIds:
+    """
+    Tests for listing commit IDs.
+
+    Covers agreement with the pygit2 walk.
+    """
+
+    def test_matches_pygit2_walk(self, repo_with_merge):
+        """
+        List commits of main excluding the feature branch.
+
+        Returns the same IDs as the pygit2 walk.
+        """
+        repo_path, ids = repo_with_merge
+        args = ([ids["merge"]], [ids["feature1"]])
+
+        expected = set(CommitAccess(repo_path).iter_ids(*args))
+        commit_ids = set(GitCliCommitAccess(repo_path).iter_ids(*args))
+
+        assert commit_ids == expected == {ids["merge"], ids["main2"], ids["main1"]}
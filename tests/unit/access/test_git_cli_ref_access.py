@@ -0,0 +1,82 @@
+"""
+GitCliRefAccess tests.
+
+Unit tests for loading references through git for-each-ref, checked against the file based RefAccess.
+"""
+
+import pygit2
+import pytest
+
+from gittergraph.access.git_cli_ref_access import GitCliRefAccess
+from gittergraph.access.git_process import is_git_available
+from gittergraph.access.ref_access import RefAccess, RefRecord
+from gittergraph.access.ref_filter import RefFilter
+from gittergraph.access.tag_access import TagAccess
+
+pytestmark = pytest.mark.skipif(not is_git_available(), reason="git not installed")
+
+
+def test_matches_file_based_loader(repo_with_multiple_tags):
+    """
+    Load branches and tags.
+
+    Returns the same references in the same order as the file based loader, and tags resolve to the same models.
+    """
+    repo_path, _ = repo_with_multiple_tags
+
+    expected = RefAccess(repo_path).get_all()
+    refs = GitCliRefAccess(repo_path).get_all()
+
+    assert list(refs) == list(expected)
+    assert TagAccess(repo_path).get_all(refs) == TagAccess(repo_path).get_all(expected)
+
+
+def test_peels_annotated_tags(repo_with_annotated_tag):
+    """
+    Load an annotated tag.
+
+    Returns a peeled record holding the tagged commit.
+    """
+    repo_path, commit_ids = repo_with_annotated_tag
+
+    record = GitCliRefAccess(repo_path).get_all()["refs/tags/v2.0.0"]
+
+    assert record.peeled_id == commit_ids[0]
+    assert record.target_id != commit_ids[0]
+    assert record.is_peeled is True
+
+
+def test_lightweight_tag_is_peeled(repo_with_lightweight_tag):
+    """
+    Load a lightweight tag.
+
+    Returns a peeled record without peeled ID, so no object lookup is needed.
+    """
+    repo_path, commit_ids = repo_with_lightweight_tag
+
+    refs = GitCliRefAccess(repo_path).get_all()
+
+    assert refs["refs/tags/v1.0.0"] == RefRecord(
+        "refs/tags/v1.0.0", commit_ids[0], None, True
+    )
+
+
+def test_skips_symbolic_refs_and_counts_hidden(repo_with_remote_tracking):
+    """
+    Load references with a filter and a symbolic remote HEAD.
+
+    Skips symbolic refs and counts references rejected by the filter.
+    """
+    repo_path = repo_with_remote_tracking[0]
+    pygit2.Repository(str(repo_path)).references.create(
+        "refs/remotes/origin/HEAD", "refs/remotes/origin/main"
+    )
+    ref_filter = RefFilter(exclude=("refs/heads/*",))
+
+    expected = RefAccess(repo_path, ref_filter)
+    access = GitCliRefAccess(repo_path, ref_filter)
+
+    refs = access.get_all()
+
+    assert list(refs) == list(expected.get_all()) == ["refs/remotes/origin/main"]
+    assert access.hidden_count == expected.hidden_count > 0
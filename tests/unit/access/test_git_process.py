@@ -0,0 +1,62 @@
+"""
+Tests for git process helpers.
+
+Covers streaming output split into fields, and git processes that write a lot to stderr.
+"""
+
+import os
+import stat
+import subprocess
+
+import pytest
+
+from gittergraph.access.git_process import iter_git_output
+
+
+@pytest.fixture
+def fake_git(tmp_path, monkeypatch):
+    """
+    Put a fake git executable first on the PATH.
+
+    Returns a function that sets the shell script the fake git runs.
+    """
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    def set_script(script):
+        path = bin_dir / "git"
+        path.write_text(f"#!/bin/sh\n{script}\n")
+        path.chmod(path.stat().st_mode | stat.S_IEXEC)
+
+    return set_script
+
+
+def test_splits_output_into_fields(fake_git, tmp_path):
+    """
+    Run git writing NUL-separated fields.
+
+    Yields each complete field.
+    """
+    fake_git("printf 'a\\0b\\0'")
+
+    assert list(iter_git_output(tmp_path, ["log"])) == [b"a", b"b"]
+
+
+def test_large_stderr_does_not_block(fake_git, tmp_path):
+    """
+    Run git writing more than a pipe buffer to stderr before its output.
+
+    Reads the output without deadlocking, and reports stderr when git fails.
+    """
+    fake_git(
+        "head -c 1000000 /dev/zero | tr '\\0' 'w' >&2\n" "printf 'a\\0'\n" "exit 1"
+    )
+
+    fields = []
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        for field in iter_git_output(tmp_path, ["log"]):
+            fields.append(field)
+
+    assert fields == [b"a"]
+    assert len(exc_info.value.stderr) == 1000000
@@ -0,0 +1,87 @@
+"""
+Tests for the IdentityPool class.
+
+Covers string interning, identity ID assignment, and signature conversion.
+"""
+
+import pygit2
+import pytest
+
+from gittergraph.access.identity_pool import IdentityPool
+
+
+class TestIdentityPool:
+    """
+    IdentityPool test cases.
+
+    Covers pooled strings, identity IDs, and pooled signatures.
+    """
+
+    def test_intern_returns_pooled_string(self):
+        """
+        Intern equal strings built separately.
+
+        Returns the first pooled instance.
+        """
+        pool = IdentityPool()
+        first = "".join(["refs/heads/", "main"])
+        second = "".join(["refs/heads/", "main"])
+
+        assert pool.intern(first) is first
+        assert pool.intern(second) is first
+
+    def test_identity_ids_in_order_of_appearance(self):
+        """
+        Get identity IDs for several identities.
+
+        Assigns consecutive IDs and returns the same ID for a known identity.
+        """
+        pool = IdentityPool()
+
+        assert pool.get_identity_id("Alice", "alice@example.com") == 0
+        assert pool.get_identity_id("Bob", "bob@example.com") == 1
+        assert pool.get_identity_id("Alice", "alice@example.com") == 0
+        assert pool.get_identity_id("Alice", "alice@work.example.com") == 2
+        assert len(pool) == 3
+
+    def test_find_identity_id(self):
+        """
+        Look up identities without assigning IDs.
+
+        Returns None for unknown identities and leaves the pool unchanged.
+        """
+        pool = IdentityPool()
+        pool.get_identity_id("Alice", "alice@example.com")
+
+        assert pool.find_identity_id("Alice", "alice@example.com") == 0
+        assert pool.find_identity_id("Bob", "bob@example.com") is None
+        assert len(pool) == 1
+
+    def test_get_identity_unknown(self):
+        """
+        Get an identity by an unassigned ID.
+
+        Raises IndexError.
+        """
+        with pytest.raises(IndexError):
+            IdentityPool().get_identity(0)
+
+    def test_make_signature(self):
+        """
+        Convert pygit2 signatures of the same identity.
+
+        Returns separate signatures sharing pooled name and email strings.
+        """
+        pool = IdentityPool()
+
+        first, first_id = pool.make_signature(
+            pygit2.Signature("Alice", "alice@example.com", 1234567890, 60)
+        )
+        second, second_id = pool.make_signature(
+            pygit2.Signature("Alice", "alice@example.com", 1234567900, -60)
+        )
+
+        assert first_id == second_id == 0
+        assert first.name is second.name
+        assert first.email is second.email
+        assert (second.time, second.time_offset) == (1234567900, -60)
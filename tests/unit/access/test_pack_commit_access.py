@@ -0,0 +1,198 @@
+"""
+PackCommitAccess tests.
+
+Unit tests for reading commits directly from packfiles, checked against the pygit2 based CommitAccess on packed and unpacked repositories.
+"""
+
+import pygit2
+import pytest
+
+from gittergraph.access.commit_access import CommitAccess
+from gittergraph.access.git_process import is_git_available
+from gittergraph.access.pack_commit_access import PackCommitAccess
+from tests.unit.access.access_helper import pack_objects
+
+
+@pytest.fixture(params=["loose", "packed"])
+def merge_repo(request, repo_with_merge):
+    """Repository with a merge commit, with loose or packed objects."""
+    repo_path, ids = repo_with_merge
+    if request.param == "packed":
+        if not is_git_available():
+            pytest.skip("git not installed")
+        pack_objects(repo_path)
+    return repo_path, ids
+
+
+@pytest.fixture
+def repo_with_skewed_branch(empty_repo):
+    """
+    Create a repository where a side branch has an older committer date than its parent.
+
+    Main is merged with the side branch, whose tip is dated long before the commits it builds on.
+    """
+    repo_path, repo = empty_repo
+    tree = repo.TreeBuilder().write()
+
+    def commit(message, parents, time, ref="refs/heads/main"):
+        author = pygit2.Signature("Test", "test@example.com", time, 0)
+        return str(repo.create_commit(ref, author, author, message, tree, parents))
+
+    base = commit("Base", [], 2_000_000_000)
+    middle = commit("Middle", [base], 2_000_000_100)
+    side = commit("Side", [middle], 1_000_000_000, "refs/heads/side")
+    top = commit("Top", [middle], 2_000_000_200)
+    merge = commit("Merge", [top, side], 2_000_000_300)
+    return repo_path, {
+        "base": base,
+        "middle": middle,
+        "side": side,
+        "top": top,
+        "merge": merge,
+    }
+
+
+class TestIterAll:
+    """
+    Tests for walking all commits.
+
+    Covers agreement with the pygit2 walk, bounds, exclusions, and starting points.
+    """
+
+    def test_matches_pygit2_walk(self, merge_repo):
+        """
+        Walk a repository with a merge commit.
+
+        Returns the same commits, field by field, as the pygit2 walk.
+        """
+        repo_path, _ = merge_repo
+
+        assert (
+            PackCommitAccess(repo_path).get_all() == CommitAccess(repo_path).get_all()
+        )
+
+    def test_converts_signatures(self, repo_different_author_and_commiter):
+        """
+        Walk a commit with different author and committer.
+
+        Keeps names, emails, times and timezone offsets of both.
+        """
+        repo_path, commit_ids = repo_different_author_and_commiter
+        expected = CommitAccess(repo_path).get(commit_ids[0])
+
+        commit = PackCommitAccess(repo_path).get(commit_ids[0])
+
+        assert commit == expected
+        assert commit.author_identity != commit.committer_identity
+
+    def test_shares_identical_signatures(self, simple_repo):
+        """
+        Read a commit whose author and committer are identical.
+
+        Uses a single Signature instance for both.
+        """
+        repo_path, commit_ids = simple_repo
+
+        commit = PackCommitAccess(repo_path).get(commit_ids[0])
+
+        assert commit.committer is commit.author
+        assert commit.author.time_offset == 60
+
+    def test_bounds(self, repo_with_skewed_branch):
+        """
+        Walk with count and date bounds.
+
+        Returns commits newest first and stops at the first bound reached.
+        """
+        repo_path, ids = repo_with_skewed_branch
+        access = PackCommitAccess(repo_path)
+
+        newest = [commit.id for commit in access.iter_all([ids["merge"]], max_count=3)]
+        recent = [
+            commit.id for commit in access.iter_all([ids["merge"]], since=1_500_000_000)
+        ]
+
+        assert newest == [ids["merge"], ids["top"], ids["middle"]]
+        assert recent == [ids["merge"], ids["top"], ids["middle"], ids["base"]]
+
+    def test_excludes_despite_clock_skew(self, repo_with_skewed_branch):
+        """
+        Walk main while excluding a side branch dated before its parents.
+
+        Excludes the commits reachable from the side branch, like the pygit2 walk.
+        """
+        repo_path, ids = repo_with_skewed_branch
+        args = ([ids["merge"]], [ids["side"]])
+
+        commits = PackCommitAccess(repo_path).get_all(*args)
+
+        assert set(commits) == {ids["merge"], ids["top"]}
+        assert commits == CommitAccess(repo_path).get_all(*args)
+
+    def test_peels_annotated_tags(self, repo_with_annotated_tag):
+        """
+        Walk from an annotated tag object.
+
+        Starts from the commit the tag points to and skips invalid starting points.
+        """
+        repo_path, commit_ids = repo_with_annotated_tag
+        tag_id = str(
+            pygit2.Repository(str(repo_path)).references["refs/tags/v2.0.0"].target
+        )
+
+        commits = PackCommitAccess(repo_path).get_all([tag_id, "0" * 40, "main"])
+
+        assert list(commits) == commit_ids
+
+
+class TestIterIds:
+    """
+    Tests for listing commit IDs.
+
+    Covers agreement with the pygit2 walk.
+    """
+
+    def test_matches_pygit2_walk(self, merge_repo):
+        """
+        List commits of main excluding the feature branch.
+
+        Returns the same IDs as the pygit2 walk.
+        """
+        repo_path, ids = merge_repo
+        args = ([ids["merge"]], [ids["feature1"]])
+
+        expected = set(CommitAccess(repo_path).iter_ids(*args))
+        commit_ids = set(PackCommitAccess(repo_path).iter_ids(*args))
+
+        assert commit_ids == expected == {ids["merge"], ids["main2"], ids["main1"]}
+
+
+class TestGet:
+    """
+    Tests for reading single commits.
+
+    Covers errors for missing objects and objects that are not commits.
+    """
+
+    def test_missing_commit(self, simple_repo):
+        """
+        Read a commit that does not exist.
+
+        Raises KeyError.
+        """
+        repo_path, _ = simple_repo
+
+        with pytest.raises(KeyError):
+            PackCommitAccess(repo_path).get("0" * 40)
+
+    def test_not_a_commit(self, simple_repo):
+        """
+        Read an object that is not a commit.
+
+        Raises ValueError.
+        """
+        repo_path, commit_ids = simple_repo
+        tree_id = str(pygit2.Repository(str(repo_path)).get(commit_ids[0]).tree_id)
+
+        with pytest.raises(ValueError):
+            PackCommitAccess(repo_path).get(tree_id)
@@ -0,0 +1,205 @@
+"""
+Packfile reader tests.
+
+Unit tests for reading objects from memory-mapped packfiles and loose objects, checked against libgit2.
+"""
+
+import sys
+import threading
+
+import pygit2
+import pytest
+
+from gittergraph.access.git_process import is_git_available
+from gittergraph.access.pack_reader import (
+    OBJ_COMMIT,
+    ObjectReader,
+    apply_delta,
+)
+from tests.unit.access.access_helper import pack_objects
+
+BODY: str = "".join(
+    f"Line {i} of a long and repetitive commit message\n" for i in range(60)
+)
+
+
+@pytest.fixture
+def repo_with_similar_commits(empty_repo):
+    """Create a repository with commits and blobs that compress well as deltas."""
+    repo_path, repo = empty_repo
+    author = pygit2.Signature("Test", "test@example.com", 1_700_000_000, 60)
+    parents = []
+    for i in range(20):
+        builder = repo.TreeBuilder()
+        builder.insert(
+            "file.txt",
+            repo.create_blob(BODY + f"Version {i}\n"),
+            pygit2.GIT_FILEMODE_BLOB,
+        )
+        commit_id = repo.create_commit(
+            "refs/heads/main",
+            author,
+            author,
+            f"Commit {i}\n\n{BODY}",
+            builder.write(),
+            parents,
+        )
+        parents = [commit_id]
+    return repo_path, repo
+
+
+def _read_all(repo_path, repo):
+    """Read every object of a repository through the reader and libgit2."""
+    reader = ObjectReader(repo_path / ".git" / "objects")
+    results = []
+    for oid in repo.odb:
+        expected_type, expected_data = repo.read(oid)
+        results.append((reader.read(str(oid)), (int(expected_type), expected_data)))
+    reader.close()
+    return results
+
+
+def test_reads_loose_objects(repo_with_similar_commits):
+    """
+    Read objects of an unpacked repository.
+
+    Returns the same types and contents as libgit2.
+    """
+    for obj, expected in _read_all(*repo_with_similar_commits):
+        assert obj == expected
+
+
+@pytest.mark.skipif(not is_git_available(), reason="git not installed")
+@pytest.mark.parametrize("offset_deltas", [True, False])
+def test_reads_packed_objects(repo_with_similar_commits, offset_deltas):
+    """
+    Read objects of a packed repository with offset or reference deltas.
+
+    Resolves delta chains to the same contents as libgit2.
+    """
+    repo_path, _ = repo_with_similar_commits
+    pack_objects(repo_path, offset_deltas)
+    repo = pygit2.Repository(str(repo_path))
+
+    reader = ObjectReader(repo_path / ".git" / "objects")
+    assert len(reader.packs) == 1
+    reader.close()
+
+    results = _read_all(repo_path, repo)
+    assert results
+    for obj, expected in results:
+        assert obj == expected
+
+
+@pytest.mark.skipif(not is_git_available(), reason="git not installed")
+def test_reads_prefix_with_limit(repo_with_similar_commits):
+    """
+    Read a commit with a limit.
+
+    Returns at least the requested prefix of the contents.
+    """
+    repo_path, repo = repo_with_similar_commits
+    pack_objects(repo_path)
+    commit_id = str(repo.references["refs/heads/main"].target)
+    reader = ObjectReader(repo_path / ".git" / "objects")
+
+    obj_type, data = reader.read(commit_id, limit=64)
+    full = reader.read(commit_id)
+
+    assert obj_type == OBJ_COMMIT
+    assert full is not None
+    assert 64 <= len(data) <= len(full[1])
+    assert full[1].startswith(data)
+
+
+@pytest.mark.skipif(not is_git_available(), reason="git not installed")
+def test_concurrent_reads(repo_with_similar_commits):
+    """
+    Read all objects of a packed repository from several threads with a tiny delta base cache.
+
+    Every thread gets the same contents as libgit2 while the threads evict each other's cached bases.
+    """
+    repo_path, _ = repo_with_similar_commits
+    pack_objects(repo_path)
+    repo = pygit2.Repository(str(repo_path))
+    expected = {str(oid): repo.read(oid)[1] for oid in repo.odb}
+    reader = ObjectReader(repo_path / ".git" / "objects", cache_size=2)
+    errors = []
+
+    def read_all():
+        try:
+            for _ in range(20):
+                for oid, data in expected.items():
+                    assert reader.read(oid)[1] == data
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            errors.append(error)
+
+    # Switching threads often makes interleaved cache updates likely
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=read_all) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    reader.close()
+
+    assert not errors
+
+
+@pytest.mark.skipif(not is_git_available(), reason="git not installed")
+def test_close_during_read(repo_with_similar_commits):
+    """
+    Close a reader while one of its packs is being read.
+
+    The read in progress completes, the pack is unmapped when it ends, and later reads no longer find packed objects.
+    """
+    repo_path, repo = repo_with_similar_commits
+    pack_objects(repo_path)
+    commit_id = str(repo.references["refs/heads/main"].target)
+    reader = ObjectReader(repo_path / ".git" / "objects")
+    pack = reader.packs[0]
+    read = pack.read
+
+    def read_while_closing(offset, limit=None):
+        reader.close()
+        assert not pack._map.closed
+        return read(offset, limit)
+
+    pack.read = read_while_closing
+
+    assert reader.read(commit_id) == (OBJ_COMMIT, repo.read(commit_id)[1])
+    assert pack._map.closed
+    assert reader.read(commit_id) is None
+
+
+def test_missing_objects(repo_with_similar_commits):
+    """
+    Read objects that do not exist.
+
+    Returns None for unknown and malformed IDs.
+    """
+    repo_path, _ = repo_with_similar_commits
+    reader = ObjectReader(repo_path / ".git" / "objects")
+
+    assert reader.read("0" * 40) is None
+    assert reader.read("not-an-id") is None
+    assert reader.read("abcd") is None
+
+
+def test_apply_delta():
+    """
+    Apply a delta with copy and insert instructions.
+
+    Builds the target from base ranges and literal data, and rejects deltas of the wrong size.
+    """
+    base = b"hello world"
+    # Sizes 11 and 12, copy 6 bytes at offset 0, insert "there!"
+    delta = bytes([11, 12, 0x91, 0, 6, 6]) + b"there!"
+
+    assert apply_delta(base, delta) == b"hello there!"
+    with pytest.raises(ValueError):
+        apply_delta(base, bytes([11, 13, 0x91, 0, 6, 6]) + b"there!")
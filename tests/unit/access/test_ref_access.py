@@ -0,0 +1,227 @@
+"""
+RefAccess tests.
+
+Unit tests for the RefAccess bulk loader, covering loose refs, packed refs with peeled lines, precedence rules, and symbolic refs.
+"""
+
+import pygit2
+
+from gittergraph.access.identity_pool import IdentityPool
+from gittergraph.access.ref_access import RefAccess, RefRecord
+from gittergraph.access.ref_filter import RefFilter
+from tests.unit.access.access_helper import pack_refs
+
+
+class TestLooseRefs:
+    """
+    Tests for loading loose references.
+
+    Covers branches, tags, and symbolic refs stored as files.
+    """
+
+    def test_loads_loose_branches(self, repo_with_branches):
+        """
+        Load loose branch references.
+
+        Returns records for all branches without peeled information.
+        """
+        repo_path, commit_ids = repo_with_branches
+        refs = RefAccess(repo_path).get_all()
+
+        assert refs["refs/heads/main"] == RefRecord("refs/heads/main", commit_ids[1])
+        assert refs["refs/heads/feature"].target_id == commit_ids[2]
+        assert refs["refs/heads/feature"].is_peeled is False
+
+    def test_loose_annotated_tag_is_not_peeled(self, repo_with_annotated_tag):
+        """
+        Load a loose annotated tag.
+
+        Returns the tag object ID as target without peeled information.
+        """
+        repo_path, commit_ids = repo_with_annotated_tag
+        refs = RefAccess(repo_path).get_all()
+
+        record = refs["refs/tags/v2.0.0"]
+        assert record.target_id != commit_ids[0]
+        assert record.is_peeled is False
+
+    def test_skips_symbolic_refs(self, repo_with_remote_tracking):
+        """
+        Load references including a symbolic ref.
+
+        Skips symbolic refs such as refs/remotes/origin/HEAD.
+        """
+        repo_path, _ = repo_with_remote_tracking
+        repo = pygit2.Repository(str(repo_path))
+        repo.references.create("refs/remotes/origin/HEAD", "refs/remotes/origin/main")
+
+        refs = RefAccess(repo_path).get_all()
+
+        assert "refs/remotes/origin/HEAD" not in refs
+        assert "refs/remotes/origin/main" in refs
+
+    def test_empty_repo(self, empty_repo):
+        """
+        Load references of an empty repository.
+
+        Returns an empty dictionary.
+        """
+        repo_path, _ = empty_repo
+        assert not RefAccess(repo_path).get_all()
+
+    def test_records_sorted_by_name(self, repo_with_remote_branches):
+        """
+        Load references from several namespaces.
+
+        Returns records sorted by full reference name.
+        """
+        repo_path, _ = repo_with_remote_branches
+        names = list(RefAccess(repo_path).get_all())
+
+        assert names == sorted(names)
+
+
+class TestNamePooling:
+    """
+    Tests for pooling reference names.
+
+    Covers sharing name strings across repeated loads.
+    """
+
+    def test_names_shared_across_loads(self, repo_with_branches):
+        """
+        Load references twice with the same pool.
+
+        Returns records sharing the same name strings.
+        """
+        repo_path, _ = repo_with_branches
+        pool = IdentityPool()
+
+        first = RefAccess(repo_path, pool=pool).get_all()
+        pack_refs(repo_path)
+        second = RefAccess(repo_path, pool=pool).get_all()
+
+        assert second["refs/heads/main"].name is first["refs/heads/main"].name
+
+
+class TestPackedRefs:
+    """
+    Tests for loading packed references.
+
+    Covers peeled lines and precedence of loose refs over packed ones.
+    """
+
+    def test_loads_packed_branches(self, repo_with_branches):
+        """
+        Load packed branch references.
+
+        Returns records marked as peeled with no peeled ID.
+        """
+        repo_path, commit_ids = repo_with_branches
+        pack_refs(repo_path)
+
+        refs = RefAccess(repo_path).get_all()
+
+        assert refs["refs/heads/main"].target_id == commit_ids[1]
+        assert refs["refs/heads/main"].is_peeled is True
+        assert refs["refs/heads/main"].peeled_id is None
+
+    def test_packed_annotated_tag_is_peeled(self, repo_with_multiple_tags):
+        """
+        Load a packed annotated tag.
+
+        Returns the peeled commit ID from the packed-refs peeled line.
+        """
+        repo_path, commit_ids = repo_with_multiple_tags
+        pack_refs(repo_path)
+
+        refs = RefAccess(repo_path).get_all()
+
+        assert refs["refs/tags/v2.0.0"].peeled_id == commit_ids[1]
+        assert refs["refs/tags/v1.0.0"].peeled_id is None
+        assert refs["refs/tags/v1.0.0"].target_id == commit_ids[0]
+
+    def test_loose_ref_overrides_packed(self, repo_with_history):
+        """
+        Update a packed branch with a loose ref.
+
+        Returns the loose ref's target.
+        """
+        repo_path, commit_ids = repo_with_history
+        pack_refs(repo_path)
+        repo = pygit2.Repository(str(repo_path))
+        repo.references.create("refs/heads/main", commit_ids[0], force=True)
+
+        refs = RefAccess(repo_path).get_all()
+
+        assert refs["refs/heads/main"].target_id == commit_ids[0]
+        assert refs["refs/heads/main"].is_peeled is False
+
+    def test_without_peeled_trait(self, simple_repo):
+        """
+        Load a packed-refs file without header traits.
+
+        Returns records without peeled information.
+        """
+        repo_path, commit_ids = simple_repo
+        (repo_path / ".git" / "packed-refs").write_text(
+            f"{commit_ids[0]} refs/tags/old\n", encoding="utf-8"
+        )
+
+        record = RefAccess(repo_path).get_all()["refs/tags/old"]
+
+        assert record.target_id == commit_ids[0]
+        assert record.is_peeled is False
+
+
+class TestRefFilter:
+    """
+    Tests for reference filtering.
+
+    Covers skipping and counting references rejected by the filter.
+    """
+
+    def test_excluded_loose_refs_are_hidden(self, repo_with_history):
+        """
+        Load references with an exclude filter.
+
+        Skips excluded references and counts them as hidden.
+        """
+        repo_path, commit_ids = repo_with_history
+        repo = pygit2.Repository(str(repo_path))
+        repo.create_reference("refs/pull/1/head", commit_ids[2])
+        repo.create_reference("refs/pull/2/head", commit_ids[3])
+
+        access = RefAccess(repo_path, RefFilter(exclude=("refs/pull/*",)))
+        refs = access.get_all()
+
+        assert list(refs) == ["refs/heads/main"]
+        assert access.hidden_count == 2
+
+    def test_excluded_packed_refs_are_hidden(self, repo_with_multiple_tags):
+        """
+        Load packed references with an exclude filter.
+
+        Skips excluded references together with their peeled lines.
+        """
+        repo_path, _ = repo_with_multiple_tags
+        pack_refs(repo_path)
+
+        access = RefAccess(repo_path, RefFilter(exclude=("refs/tags/v*",)))
+        refs = access.get_all()
+
+        assert set(refs) == {"refs/heads/main", "refs/tags/latest"}
+        assert refs["refs/tags/latest"].peeled_id is None
+        assert access.hidden_count == 2
+
+    def test_no_filter_hides_nothing(self, repo_with_branches):
+        """
+        Load references without a filter.
+
+        Reports no hidden references.
+        """
+        repo_path, _ = repo_with_branches
+        access = RefAccess(repo_path)
+        access.get_all()
+
+        assert access.hidden_count == 0
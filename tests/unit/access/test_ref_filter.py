@@ -0,0 +1,109 @@
+"""
+RefFilter tests.
+
+Unit tests for the RefFilter class, covering glob matching, merging, and loading patterns from git configuration.
+"""
+
+import pygit2
+import pytest
+
+from gittergraph.access.ref_filter import RefFilter
+
+
+class TestMatches:
+    """
+    Tests for matches method.
+
+    Covers include and exclude patterns and their interaction.
+    """
+
+    def test_empty_filter_keeps_everything(self):
+        """
+        Match with an empty filter.
+
+        Keeps every reference.
+        """
+        ref_filter = RefFilter()
+        assert ref_filter.is_empty
+        assert ref_filter.matches("refs/pull/1/head")
+
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("refs/heads/main", True),
+            ("refs/pull/1/head", False),
+            ("refs/changes/01/1/1", False),
+            ("refs/tags/v1", True),
+        ],
+    )
+    def test_exclude_patterns(self, name, expected):
+        """
+        Match with exclude patterns.
+
+        Rejects references in excluded namespaces, including nested ones.
+        """
+        ref_filter = RefFilter(exclude=("refs/pull/*", "refs/changes/*"))
+        assert ref_filter.matches(name) is expected
+
+    def test_include_patterns(self):
+        """
+        Match with include patterns.
+
+        Keeps only references matching an include pattern.
+        """
+        ref_filter = RefFilter(include=("refs/heads/*",))
+        assert ref_filter.matches("refs/heads/feature/x")
+        assert not ref_filter.matches("refs/remotes/origin/main")
+
+    def test_exclude_wins_over_include(self):
+        """
+        Match a reference matching both include and exclude patterns.
+
+        Rejects the reference.
+        """
+        ref_filter = RefFilter(include=("refs/heads/*",), exclude=("*/wip-*",))
+        assert not ref_filter.matches("refs/heads/wip-stuff")
+
+
+class TestConstruction:
+    """
+    Tests for building filters.
+
+    Covers merging and reading from git configuration.
+    """
+
+    def test_merged_combines_patterns(self):
+        """
+        Merge two filters.
+
+        Returns a filter with patterns of both.
+        """
+        merged = RefFilter(include=("a",), exclude=("b",)).merged(
+            RefFilter(exclude=("c",))
+        )
+        assert merged == RefFilter(include=("a",), exclude=("b", "c"))
+
+    def test_from_config(self, empty_repo):
+        """
+        Read patterns from git configuration.
+
+        Returns a filter with all configured values.
+        """
+        _, repo = empty_repo
+        repo.config.set_multivar(RefFilter.EXCLUDE_CONFIG_KEY, "^$", "refs/pull/*")
+        repo.config.set_multivar(RefFilter.EXCLUDE_CONFIG_KEY, "^$", "refs/keep/*")
+        repo.config[RefFilter.INCLUDE_CONFIG_KEY] = "refs/heads/*"
+
+        ref_filter = RefFilter.from_config(pygit2.Repository(repo.path).config)
+
+        assert ref_filter.include == ("refs/heads/*",)
+        assert set(ref_filter.exclude) == {"refs/pull/*", "refs/keep/*"}
+
+    def test_from_config_without_settings(self, empty_repo):
+        """
+        Read patterns from configuration without gittergraph settings.
+
+        Returns an empty filter.
+        """
+        _, repo = empty_repo
+        assert RefFilter.from_config(repo.config).is_empty
@@ -6,8 +6,14 @@ Tests initialization, discovery, reload, and is_empty functionality using pytest
 """
 
 import pygit2
+import pytest
 
+from gittergraph.access.git_cli_commit_access import GitCliCommitAccess
+from gittergraph.access.git_cli_ref_access import GitCliRefAccess
+from gittergraph.access.git_process import is_git_available
+from gittergraph.access.ref_filter import RefFilter
 from gittergraph.access.repository import GitRepository
+from tests.unit.access.access_helper import pack_objects
 
 
 def test_init_and_access_layers(simple_repo):
@@ -40,6 +46,31 @@ def test_discover(simple_repo):
     assert discovered.path == repo_path / ".git"
 
 
+def test_find_all(tmp_path):
+    """
+    Test finding the repositories under a directory.
+
+    Ensures working trees and bare repositories are found, sorted by path, without descending into repositories, hidden directories, or past the depth limit.
+    """
+    pygit2.init_repository(str(tmp_path / "b"))
+    pygit2.init_repository(str(tmp_path / "a"))
+    pygit2.init_repository(str(tmp_path / "a" / "nested"))
+    pygit2.init_repository(str(tmp_path / "group" / "c.git"), bare=True)
+    pygit2.init_repository(str(tmp_path / ".hidden" / "d"))
+    pygit2.init_repository(str(tmp_path / "x" / "y" / "z" / "deep"))
+    (tmp_path / "plain").mkdir()
+
+    assert GitRepository.find_all(tmp_path) == [
+        tmp_path / "a",
+        tmp_path / "b",
+        tmp_path / "group" / "c.git",
+    ]
+    assert GitRepository.find_all(tmp_path, max_depth=4)[-1] == (
+        tmp_path / "x" / "y" / "z" / "deep"
+    )
+    assert GitRepository.find_all(tmp_path / "a") == [tmp_path / "a"]
+
+
 def test_is_empty_on_empty_repo(empty_repo):
     """
     Test is_empty method for an empty repository.
@@ -78,3 +109,101 @@ def test_reload(simple_repo):
     assert isinstance(repo.branches, type(repo.branches))
     assert isinstance(repo.tags, type(repo.tags))
     assert isinstance(repo.head, type(repo.head))
+
+
+@pytest.mark.skipif(not is_git_available(), reason="git not installed")
+def test_reload_closes_previous_packs(simple_repo):
+    """
+    Reload a repository read through packfiles.
+
+    Unmaps the packs of the previous commit access layer, which still reads commits through pygit2.
+    """
+    repo_path, commit_ids = simple_repo
+    pack_objects(repo_path)
+    repo = GitRepository(repo_path, backend="pack")
+    previous = repo.commits
+    packs = previous.objects.packs
+    assert packs
+
+    repo.reload()
+
+    assert all(pack._map.closed for pack in packs)
+    assert previous.get(commit_ids[0]).id == commit_ids[0]
+    assert repo.commits.objects.packs
+
+
+def test_ref_filter_merges_config_and_argument(simple_repo):
+    """
+    Test combining configured and given reference filters.
+
+    Verifies that patterns from git configuration and the constructor argument are both applied.
+    """
+    repo_path, _ = simple_repo
+    pygit2.Repository(str(repo_path)).config[RefFilter.EXCLUDE_CONFIG_KEY] = "refs/a/*"
+
+    repo = GitRepository(repo_path, RefFilter(exclude=("refs/b/*",)))
+
+    assert repo.ref_filter.exclude == ("refs/a/*", "refs/b/*")
+    assert repo.refs.ref_filter == repo.ref_filter
+
+
+def test_identity_pool_shared_and_kept_on_reload(simple_repo):
+    """
+    Test the identity pool shared by the access layers.
+
+    Verifies that reference and commit access use the repository's pool, and that reload keeps it.
+    """
+    repo_path, _ = simple_repo
+    repo = GitRepository(repo_path)
+    pool = repo.identities
+
+    repo.reload()
+
+    assert repo.identities is pool
+    assert repo.commits.identities is pool
+    assert repo.refs.pool is pool
+
+
+def test_backend_selection(simple_repo):
+    """
+    Test choosing the backend of a repository.
+
+    Uses the pygit2 backend by default, the gittergraph.backend setting if present, and an explicitly named backend over both.
+    """
+    repo_path, _ = simple_repo
+    assert GitRepository(repo_path).backend.name == "pygit2"
+
+    pygit2.Repository(str(repo_path)).config["gittergraph.backend"] = "git"
+    repo = GitRepository(repo_path)
+    assert repo.backend.name == "git"
+    assert isinstance(repo.commits, GitCliCommitAccess)
+    assert isinstance(repo.refs, GitCliRefAccess)
+
+    repo.reload()
+    assert isinstance(repo.commits, GitCliCommitAccess)
+    assert GitRepository(repo_path, backend="pygit2").backend.name == "pygit2"
+
+
+def test_unknown_backend(simple_repo):
+    """
+    Test opening a repository with an unknown backend.
+
+    Raises ValueError naming the available backends.
+    """
+    repo_path, _ = simple_repo
+    with pytest.raises(ValueError, match="pygit2"):
+        GitRepository(repo_path, backend="svn")
+
+
+def test_jobs_are_passed_to_commit_access(simple_repo):
+    """
+    Test opening a repository with several jobs.
+
+    The commit access layer decodes on that many threads, also after a reload.
+    """
+    repo_path, _ = simple_repo
+    repo = GitRepository(repo_path, jobs=4)
+    assert repo.commits.jobs == 4
+
+    repo.reload()
+    assert repo.commits.jobs == 4
@@ -0,0 +1,189 @@
+"""
+RepositoryWatcher tests.
+
+Unit tests for watching repositories, covering the inotify and polling backends, coalescing of event bursts, and stopping.
+"""
+
+import threading
+import time
+
+import pygit2
+import pytest
+
+from gittergraph.access.repository_watcher import RepositoryWatcher
+
+
+class _Recorder:
+    """
+    Callback that counts calls.
+
+    Sets an event on every call so tests can wait for it.
+    """
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.called: threading.Event = threading.Event()
+
+    def __call__(self) -> None:
+        self.count += 1
+        self.called.set()
+
+
+def _make_watcher(repo_path, recorder, use_inotify=True, **kwargs):
+    """
+    Create and start a fast-reacting watcher.
+
+    Uses short debounce and poll intervals to keep tests quick.
+    """
+    kwargs.setdefault("debounce", 0.1)
+    kwargs.setdefault("poll_interval", 0.05)
+    watcher = RepositoryWatcher(repo_path, recorder, use_inotify=use_inotify, **kwargs)
+    watcher.start()
+    return watcher
+
+
+class TestRepositoryWatcher:
+    """
+    Tests for watching a repository for reference changes.
+
+    Covers both backends and the watcher lifecycle.
+    """
+
+    @pytest.mark.parametrize("use_inotify", [True, False])
+    def test_detects_new_branch(self, repo_with_branches, use_inotify):
+        """
+        Create a branch while watching.
+
+        Calls the callback.
+        """
+        repo_path, commit_ids = repo_with_branches
+        recorder = _Recorder()
+        watcher = _make_watcher(repo_path, recorder, use_inotify)
+        try:
+            repo = pygit2.Repository(str(repo_path))
+            repo.references.create("refs/heads/topic", commit_ids[1])
+
+            assert recorder.called.wait(5)
+        finally:
+            watcher.stop()
+
+    @pytest.mark.parametrize("use_inotify", [True, False])
+    def test_detects_head_change(self, repo_with_branches, use_inotify):
+        """
+        Point HEAD to another branch while watching.
+
+        Calls the callback.
+        """
+        repo_path, _ = repo_with_branches
+        recorder = _Recorder()
+        watcher = _make_watcher(repo_path, recorder, use_inotify)
+        try:
+            pygit2.Repository(str(repo_path)).set_head("refs/heads/feature")
+
+            assert recorder.called.wait(5)
+        finally:
+            watcher.stop()
+
+    def test_detects_branch_in_new_directory(self, repo_with_branches):
+        """
+        Create a branch in a new refs/ subdirectory while watching.
+
+        Watches the new directory and reports changes made inside it later.
+        """
+        repo_path, commit_ids = repo_with_branches
+        recorder = _Recorder()
+        watcher = _make_watcher(repo_path, recorder)
+        try:
+            repo = pygit2.Repository(str(repo_path))
+            repo.references.create("refs/heads/team/topic", commit_ids[1])
+            assert recorder.called.wait(5)
+
+            recorder.called.clear()
+            repo.references["refs/heads/team/topic"].set_target(commit_ids[0])
+            assert recorder.called.wait(5)
+        finally:
+            watcher.stop()
+
+    def test_coalesces_bursts(self, repo_with_branches):
+        """
+        Create many branches in quick succession while watching.
+
+        Calls the callback once for the whole burst.
+        """
+        repo_path, commit_ids = repo_with_branches
+        recorder = _Recorder()
+        watcher = _make_watcher(repo_path, recorder, debounce=0.5, max_delay=30)
+        try:
+            repo = pygit2.Repository(str(repo_path))
+            for i in range(50):
+                repo.references.create(f"refs/heads/topic-{i}", commit_ids[1])
+
+            assert recorder.called.wait(5)
+            time.sleep(1)
+            assert recorder.count == 1
+        finally:
+            watcher.stop()
+
+    @pytest.mark.parametrize("use_inotify", [True, False])
+    def test_ignores_unrelated_files(self, repo_with_branches, use_inotify):
+        """
+        Write files outside of the watched references.
+
+        Does not call the callback.
+        """
+        repo_path, _ = repo_with_branches
+        recorder = _Recorder()
+        watcher = _make_watcher(repo_path, recorder, use_inotify)
+        try:
+            (repo_path / ".git" / "description").write_text("changed\n")
+
+            assert not recorder.called.wait(0.5)
+        finally:
+            watcher.stop()
+
+    def test_ignores_lock_files(self, repo_with_branches):
+        """
+        Create a reference lock file while watching with inotify.
+
+        Does not call the callback, since git only renames lock files into place once an update is complete.
+        """
+        repo_path, _ = repo_with_branches
+        recorder = _Recorder()
+        watcher = _make_watcher(repo_path, recorder)
+        if watcher.backend != "inotify":
+            watcher.stop()
+            pytest.skip("inotify is not available")
+        try:
+            (repo_path / ".git" / "refs" / "heads" / "main.lock").write_text("")
+
+            assert not recorder.called.wait(0.5)
+        finally:
+            watcher.stop()
+
+    def test_polling_backend(self, repo_with_branches):
+        """
+        Create a watcher without inotify.
+
+        Uses the polling backend.
+        """
+        repo_path, _ = repo_with_branches
+        watcher = RepositoryWatcher(repo_path, _Recorder(), use_inotify=False)
+
+        assert watcher.backend == "polling"
+
+    def test_start_and_stop(self, repo_with_branches):
+        """
+        Start and stop a watcher.
+
+        Runs only between start and stop, and stopping twice is harmless.
+        """
+        repo_path, _ = repo_with_branches
+        watcher = RepositoryWatcher(repo_path, _Recorder())
+        assert watcher.is_running is False
+
+        watcher.start()
+        assert watcher.is_running is True
+
+        watcher.stop()
+        watcher.stop()
+        assert watcher.is_running is False
@@ -9,8 +9,10 @@ Unit tests for the TagAccess class, covering tag lookup, retrieval, and edge cas
 import pygit2
 import pytest
 
+from gittergraph.access.ref_access import RefRecord
 from gittergraph.access.tag_access import TagAccess
 from gittergraph.models import Tag
+from tests.unit.access.access_helper import pack_refs
 
 
 class TestToModel:
@@ -301,3 +303,155 @@ class TestTagProperties:
         # All should point to same commit
         target_ids = [tag.target_id for tag in tags.values()]
         assert all(tid == str(commit_ids[0]) for tid in target_ids)
+
+
+class TestFromRecord:
+    """
+    Tests for from_record method.
+
+    Covers conversion of bulk-loaded reference records to Tag model objects.
+    """
+
+    def test_peeled_record_skips_object_lookup(self, simple_repo):
+        """
+        Convert a peeled record.
+
+        Returns the peeled ID without looking up the target object.
+        """
+        repo_path, _ = simple_repo
+        access = TagAccess(repo_path)
+        record = RefRecord("refs/tags/v1", "1" * 40, "2" * 40, True)
+
+        tag = access.from_record(record)
+
+        assert tag == Tag(target_id="2" * 40, name="refs/tags/v1", object_id="1" * 40)
+
+    def test_peeled_record_without_peeled_id(self, simple_repo):
+        """
+        Convert a peeled record of a lightweight tag.
+
+        Returns the record target as tag target.
+        """
+        repo_path, _ = simple_repo
+        access = TagAccess(repo_path)
+        record = RefRecord("refs/tags/v1", "1" * 40, None, True)
+
+        tag = access.from_record(record)
+
+        assert tag.target_id == "1" * 40
+        assert tag.is_annotated is False
+
+    def test_unpeeled_record_is_peeled_through_lookup(self, repo_with_annotated_tag):
+        """
+        Convert an unpeeled record of an annotated tag.
+
+        Returns the commit the tag object points to.
+        """
+        repo_path, commit_ids = repo_with_annotated_tag
+        repo = pygit2.Repository(str(repo_path))
+        tag_object_id = str(repo.references["refs/tags/v2.0.0"].target)
+        access = TagAccess(repo_path)
+
+        tag = access.from_record(RefRecord("refs/tags/v2.0.0", tag_object_id))
+
+        assert tag.target_id == commit_ids[0]
+
+    def test_get_all_with_packed_refs(self, repo_with_multiple_tags):
+        """
+        Get all tags from packed references.
+
+        Returns peeled commit IDs for lightweight and annotated tags.
+        """
+        repo_path, commit_ids = repo_with_multiple_tags
+        pack_refs(repo_path)
+        access = TagAccess(repo_path)
+
+        tags = access.get_all()
+
+        assert tags["refs/tags/v1.0.0"].target_id == commit_ids[0]
+        assert tags["refs/tags/v2.0.0"].target_id == commit_ids[1]
+        assert tags["refs/tags/latest"].target_id == commit_ids[1]
+
+    def test_get_all_with_given_records(self, simple_repo):
+        """
+        Get all tags from provided reference records.
+
+        Returns only tag references from the records.
+        """
+        repo_path, _ = simple_repo
+        access = TagAccess(repo_path)
+        refs = {
+            "refs/heads/main": RefRecord("refs/heads/main", "1" * 40, None, True),
+            "refs/tags/v1": RefRecord("refs/tags/v1", "2" * 40, None, True),
+        }
+
+        assert list(access.get_all(refs)) == ["refs/tags/v1"]
+
+
+class TestGetAnnotation:
+    """
+    Tests for get_annotation method.
+
+    Covers lazy loading of annotated tag metadata.
+    """
+
+    def test_annotated_tag(self, repo_with_annotated_tag):
+        """
+        Load metadata of an annotated tag.
+
+        Returns the tagger and message of the tag object.
+        """
+        repo_path, _ = repo_with_annotated_tag
+        access = TagAccess(repo_path)
+        tag = access.get("refs/tags/v2.0.0")
+
+        annotation = access.get_annotation(tag)
+
+        assert tag.is_annotated
+        assert annotation is not None
+        assert annotation.name == "refs/tags/v2.0.0"
+        assert annotation.message == "Release 2.0.0"
+        assert annotation.tagger is not None
+        assert annotation.tagger.name == "Test"
+
+    def test_packed_annotated_tag(self, repo_with_multiple_tags):
+        """
+        Load metadata of a tag read from packed-refs.
+
+        Returns the metadata of the tag object referenced by the packed ref.
+        """
+        repo_path, _ = repo_with_multiple_tags
+        pack_refs(repo_path)
+        access = TagAccess(repo_path)
+        tag = access.get_all()["refs/tags/v2.0.0"]
+
+        annotation = access.get_annotation(tag)
+
+        assert annotation is not None
+        assert annotation.message == "Release 2.0"
+
+    def test_lightweight_tag(self, repo_with_lightweight_tag):
+        """
+        Load metadata of a lightweight tag.
+
+        Returns None.
+        """
+        repo_path, _ = repo_with_lightweight_tag
+        access = TagAccess(repo_path)
+        tag = access.get("refs/tags/v1.0.0")
+
+        assert tag.is_annotated is False
+        assert access.get_annotation(tag) is None
+
+    def test_missing_tag_object_raises_keyerror(self, simple_repo):
+        """
+        Load metadata of a tag whose object is missing.
+
+        Ensures KeyError is raised.
+        """
+        repo_path, _ = simple_repo
+        access = TagAccess(repo_path)
+        tag = Tag(target_id="1" * 40, name="refs/tags/x", object_id="2" * 40)
+
+        with pytest.raises(KeyError):
+            access.get_annotation(tag)
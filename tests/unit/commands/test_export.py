@@ -0,0 +1,97 @@
+"""
+Tests for the write_columns function.
+
+Covers choosing formats by file suffix, and writing .npz archives and Arrow IPC files that load back with the same columns.
+"""
+
+import json
+
+import pytest
+
+from gittergraph.commands import get_format, write_columns
+from gittergraph.core import GitGraph
+
+
+@pytest.fixture
+def columns(repo_with_merge):
+    """Columns of a graph with a merge commit."""
+    repo_path, _ = repo_with_merge
+    return GitGraph.from_path(repo_path).to_columns()
+
+
+def test_get_format():
+    """
+    Choose formats for output files.
+
+    Arrow IPC suffixes select arrow, and anything else npz.
+    """
+    assert get_format("graph.npz") == "npz"
+    assert get_format("graph.ARROW") == "arrow"
+    assert get_format("graph.feather") == "arrow"
+    assert get_format("graph") == "npz"
+
+
+def test_unknown_format(columns, tmp_path):
+    """
+    Write columns in a format that does not exist.
+
+    Raises ValueError.
+    """
+    with pytest.raises(ValueError, match="parquet"):
+        write_columns(columns, tmp_path / "graph.parquet", "parquet")
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_write_npz(columns, repo_with_merge, tmp_path, compress):
+    """
+    Write columns to a .npz archive.
+
+    The archive loads without pickle and holds the same IDs, parent links, authors and reference tips.
+    """
+    numpy = pytest.importorskip("numpy")
+    _, commits = repo_with_merge
+
+    write_columns(columns, tmp_path / "graph.npz", "npz", compress)
+
+    with numpy.load(tmp_path / "graph.npz", allow_pickle=False) as archive:
+        oids = [bytes(oid).hex() for oid in archive["oids"]]
+        merge = oids.index(commits["merge"])
+        offsets = archive["parent_offsets"]
+        parents = archive["parent_rows"][offsets[merge] : offsets[merge + 1]]
+        refs = dict(zip(archive["ref_names"], archive["ref_rows"]))
+
+        assert archive["oids"].shape == (5, 20)
+        assert [oids[row] for row in parents] == [commits["main2"], commits["feature1"]]
+        assert list(archive["commit_times"]) == list(columns.commit_times)
+        assert archive["author_names"][archive["author_ids"][0]] == "Test"
+        assert refs["refs/heads/main"] == merge
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_write_arrow(columns, repo_with_merge, tmp_path, compress):
+    """
+    Write columns to an Arrow IPC file.
+
+    The file holds one row per commit with its parent rows, and the authors and reference tips in the schema metadata.
+    """
+    ipc = pytest.importorskip("pyarrow.ipc")
+    _, commits = repo_with_merge
+
+    write_columns(columns, tmp_path / "graph.arrow", "arrow", compress)
+
+    with ipc.open_file(tmp_path / "graph.arrow") as reader:
+        table = reader.read_all()
+    oids = [oid.hex() for oid in table.column("oid").to_pylist()]
+    merge = oids.index(commits["merge"])
+    metadata = table.schema.metadata
+
+    assert table.num_rows == 5
+    assert [oids[row] for row in table.column("parents")[merge].as_py()] == [
+        commits["main2"],
+        commits["feature1"],
+    ]
+    assert table.column("commit_time").to_pylist() == list(columns.commit_times)
+    assert json.loads(metadata[b"gittergraph.authors"]) == [
+        ["Test", "test@example.com"]
+    ]
+    assert json.loads(metadata[b"gittergraph.refs"])["refs/heads/main"] == merge
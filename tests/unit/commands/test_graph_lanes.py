@@ -0,0 +1,70 @@
+"""
+Tests for GraphLanes class.
+
+Covers lanes for linear history, branching off merged parents, and lanes converging into a shared parent.
+"""
+
+from gittergraph.commands import GraphLanes
+
+
+def _draw(commits):
+    """
+    Lay out commits and join the rows.
+
+    Commits are given as (ID, parent IDs) pairs, children first.
+    """
+    lanes = GraphLanes()
+    rows = []
+    for commit_id, parent_ids in commits:
+        before_rows, prefix, after_rows = lanes.layout(commit_id, parent_ids)
+        rows.extend(before_rows)
+        rows.append(f"{prefix} {commit_id}")
+        rows.extend(after_rows)
+    return rows
+
+
+def test_linear_history_uses_one_lane():
+    """
+    Lay out a linear history.
+
+    Draws every commit in the first lane with no rows in between.
+    """
+    assert _draw([("c", ["b"]), ("b", ["a"]), ("a", [])]) == ["* c", "* b", "* a"]
+
+
+def test_merge_branches_off_and_converges():
+    """
+    Lay out a merge of a branch that forked from the mainline.
+
+    Opens a lane for the merged parent next to the merge, and joins it back into the mainline at the fork point.
+    """
+    rows = _draw(
+        [
+            ("merge", ["main2", "feature"]),
+            ("main2", ["main1"]),
+            ("feature", ["base"]),
+            ("main1", ["base"]),
+            ("base", []),
+        ]
+    )
+
+    assert rows == [
+        "* merge",
+        "|\\",
+        "* | main2",
+        "| * feature",
+        "* | main1",
+        "|/",
+        "* base",
+    ]
+
+
+def test_unrelated_tips_get_own_lanes():
+    """
+    Lay out commits that no earlier commit leads to.
+
+    Puts a new tip in a free lane and keeps the other lanes in their columns.
+    """
+    rows = _draw([("a", ["root"]), ("b", ["other"]), ("root", []), ("other", [])])
+
+    assert rows == ["* a", "| * b", "* | root", "  * other"]
@@ -0,0 +1,248 @@
+"""
+Tests for the write_log function.
+
+Covers text, graph and JSON Lines output, ordering under clock skew, bounds, unknown revisions, and reading commits only as they are written.
+"""
+
+import io
+import json
+
+import pygit2
+import pytest
+
+from gittergraph.access import GitRepository
+from gittergraph.commands import write_log
+
+
+def test_first_parent_text(repo_with_history):
+    """
+    Write the first-parent history of a branch as text.
+
+    Writes one line per commit, newest first, with the author date in the author's timezone.
+    """
+    repo_path, commit_ids = repo_with_history
+    output = io.StringIO()
+
+    count = write_log(GitRepository(repo_path), "refs/heads/main", output)
+
+    lines = output.getvalue().splitlines()
+    assert count == 5
+    assert lines[0] == f"{commit_ids[4][:7]} 2009-02-14 Author4 Commit 4"
+    assert [line.split()[0] for line in lines] == [
+        commit_id[:7] for commit_id in reversed(commit_ids)
+    ]
+
+
+def test_first_parent_skips_merged_branches(repo_with_merge):
+    """
+    Write the first-parent history of a merge.
+
+    Leaves out the commits of the merged branch.
+    """
+    repo_path, commits = repo_with_merge
+    output = io.StringIO()
+
+    write_log(GitRepository(repo_path), "refs/heads/main", output)
+
+    assert "Feature commit 1" not in output.getvalue()
+    assert len(output.getvalue().splitlines()) == 4
+
+
+def test_full_history_with_graph(repo_with_merge):
+    """
+    Write the full history of a merge with graph lines.
+
+    Writes every commit once, with the merged branch in a second lane that joins the mainline at the fork point.
+    """
+    repo_path, commits = repo_with_merge
+    output = io.StringIO()
+
+    count = write_log(
+        GitRepository(repo_path),
+        "refs/heads/main",
+        output,
+        first_parent=False,
+        graph=True,
+    )
+
+    lines = output.getvalue().splitlines()
+    assert count == 5
+    assert lines[0].startswith(f"* {commits['merge'][:7]}")
+    assert lines[1] == "|\\"
+    assert lines[-2] == "|/"
+    assert lines[-1].startswith(f"* {commits['base'][:7]}")
+
+
+def test_graph_with_skewed_clocks(empty_repo):
+    """
+    Write the full history of a merged branch whose commits have wrong committer times.
+
+    Writes every commit after all of its children, so the merged branch joins the mainline below its oldest commit.
+    """
+    repo_path, repo = empty_repo
+    tree = repo.TreeBuilder().write()
+
+    def commit(message, time, parents):
+        signature = pygit2.Signature("Test", "test@example.com", time, 0)
+        return str(
+            repo.create_commit(None, signature, signature, message, tree, parents)
+        )
+
+    base = commit("Base", 100, [])
+    main = commit("Main", 200, [base])
+    feature1 = commit("Feature 1", 1000, [base])
+    feature2 = commit("Feature 2", 50, [feature1])
+    merge = commit("Merge", 300, [main, feature2])
+    output = io.StringIO()
+
+    count = write_log(
+        GitRepository(repo_path), merge, output, first_parent=False, graph=True
+    )
+
+    text = output.getvalue()
+    lines = text.splitlines()
+    positions = [
+        text.index(commit_id[:7])
+        for commit_id in (merge, main, feature2, feature1, base)
+    ]
+    assert count == 5
+    assert positions == sorted(positions)
+    assert lines[-2] == "|/"
+    assert lines[-1].startswith(f"* {base[:7]}")
+
+
+def test_json_lines(repo_with_history):
+    """
+    Write the history as JSON Lines.
+
+    Writes one object per commit with parents, raw signature times and the full message.
+    """
+    repo_path, commit_ids = repo_with_history
+    output = io.StringIO()
+
+    write_log(GitRepository(repo_path), commit_ids[1], output, json_lines=True)
+
+    objects = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [obj["id"] for obj in objects] == [commit_ids[1], commit_ids[0]]
+    assert objects[0]["parents"] == [commit_ids[0]]
+    assert objects[0]["author"] == {
+        "name": "Author1",
+        "email": "author1@example.com",
+        "time": 1234567891,
+        "offset": 60,
+    }
+    assert objects[0]["message"] == "Commit 1"
+
+
+def test_bounds(repo_with_history):
+    """
+    Write the history with count and date bounds.
+
+    Stops at the first bound reached, in both walk modes.
+    """
+    repo_path, commit_ids = repo_with_history
+    repo = GitRepository(repo_path)
+
+    assert write_log(repo, "refs/heads/main", io.StringIO(), max_count=2) == 2
+    assert write_log(repo, "refs/heads/main", io.StringIO(), since=1234567892) == 3
+    assert (
+        write_log(
+            repo,
+            "refs/heads/main",
+            io.StringIO(),
+            first_parent=False,
+            since=1234567893,
+        )
+        == 2
+    )
+
+
+def test_unknown_revision(repo_with_history):
+    """
+    Write the history of a revision that does not exist.
+
+    Raises ValueError before writing anything.
+    """
+    repo_path, _ = repo_with_history
+    output = io.StringIO()
+
+    with pytest.raises(ValueError, match="nope"):
+        write_log(GitRepository(repo_path), "nope", output)
+    assert output.getvalue() == ""
+
+
+def test_full_history_reads_commits_once(repo_with_merge, monkeypatch):
+    """
+    Write the full history of a merge.
+
+    Decodes every commit once, when it is written.
+    """
+    repo_path, commits = repo_with_merge
+    repo = GitRepository(repo_path)
+    reads = []
+    original = repo.commits.get
+
+    def counting_get(commit_id):
+        reads.append(commit_id)
+        return original(commit_id)
+
+    monkeypatch.setattr(repo.commits, "get", counting_get)
+
+    write_log(repo, "refs/heads/main", io.StringIO(), first_parent=False)
+
+    assert sorted(reads) == sorted(commits.values())
+
+
+def test_reads_given_commits(repo_with_history, monkeypatch):
+    """
+    Write the full history with some commits given as a mapping.
+
+    Reads the given commits from the mapping and only the others from the repository.
+    """
+    repo_path, commit_ids = repo_with_history
+    repo = GitRepository(repo_path)
+    given = {commit_id: repo.commits.get(commit_id) for commit_id in commit_ids[2:]}
+    reads = []
+    original = repo.commits.get
+
+    def counting_get(commit_id):
+        reads.append(commit_id)
+        return original(commit_id)
+
+    monkeypatch.setattr(repo.commits, "get", counting_get)
+
+    count = write_log(
+        repo, "refs/heads/main", io.StringIO(), first_parent=False, commits=given
+    )
+
+    assert count == 5
+    assert set(reads) == set(commit_ids[:2])
+
+
+def test_reads_commits_as_written(repo_with_history, monkeypatch):
+    """
+    Write the history to a stream that is closed after the first line.
+
+    Reads no further than the commit that failed to be written, so stopping early costs nothing.
+    """
+    repo_path, _ = repo_with_history
+    repo = GitRepository(repo_path)
+    reads = []
+    original = repo.commits.get
+
+    def counting_get(commit_id):
+        reads.append(commit_id)
+        return original(commit_id)
+
+    monkeypatch.setattr(repo.commits, "get", counting_get)
+
+    class ClosedAfterFirstLine(io.StringIO):
+        def write(self, text):
+            if self.getvalue():
+                raise BrokenPipeError
+            return super().write(text)
+
+    with pytest.raises(BrokenPipeError):
+        write_log(repo, "refs/heads/main", ClosedAfterFirstLine())
+
+    assert len(reads) == 2
@@ -0,0 +1,165 @@
+"""
+Tests for AsyncGitGraph class.
+
+Covers awaitable queries, coalescing of identical requests, backpressure on the thread pool, and cancellation.
+"""
+
+import asyncio
+import threading
+import time
+
+import pygit2
+import pytest
+
+from gittergraph.core import AsyncGitGraph, GraphOptions, GraphSnapshot
+
+
+class TestAsyncGitGraph:
+    """
+    AsyncGitGraph test cases.
+
+    Covers queries and the scheduling of blocking work.
+    """
+
+    @pytest.mark.asyncio
+    async def test_queries(self, repo_with_branches):
+        """
+        Load a repository with branches and run each kind of query.
+
+        Returns the same results as the graph itself, and picks up a new commit on reload.
+        """
+        repo_path, commit_ids = repo_with_branches
+
+        async with await AsyncGitGraph.from_path(repo_path) as graph:
+            history = await graph.get_linear_history(
+                "refs/heads/feature", offset=1, limit=1
+            )
+            assert [commit.id for commit in history] == [commit_ids[1]]
+            assert [commit.id for commit in await graph.search("feature commit")] == [
+                commit_ids[2]
+            ]
+            assert await graph.is_ancestor("refs/heads/main", "refs/heads/feature")
+            assert not await graph.is_ancestor("refs/heads/feature", "refs/heads/main")
+
+            repo = pygit2.Repository(str(repo_path))
+            author = pygit2.Signature("Test", "test@example.com")
+            new_id = repo.create_commit(
+                "refs/heads/main",
+                author,
+                author,
+                "New commit",
+                repo.TreeBuilder().write(),
+                [commit_ids[1]],
+            )
+            changes = await graph.reload()
+
+            assert changes.added_commits == {str(new_id)}
+            assert (await graph.get_linear_history("refs/heads/main", limit=1))[
+                0
+            ].message == "New commit"
+
+    @pytest.mark.asyncio
+    async def test_discover_without_repository(self, tmp_path):
+        """
+        Discover a repository in a directory outside any repository.
+
+        Returns None.
+        """
+        assert await AsyncGitGraph.discover(tmp_path) is None
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_coalesced(self, repo_with_history):
+        """
+        Request windows of the same history from many coroutines at once.
+
+        Walks the history once, and gives each coroutine its window.
+        """
+        repo_path, commit_ids = repo_with_history
+        graph = await AsyncGitGraph.from_path(repo_path, GraphOptions(lazy=False))
+        calls = []
+        original = graph.graph.get_linear_history
+
+        def counting_get_linear_history(start_ref):
+            calls.append(start_ref)
+            time.sleep(0.05)
+            return original(start_ref)
+
+        graph.graph.get_linear_history = counting_get_linear_history
+        try:
+            windows = await asyncio.gather(
+                *(
+                    graph.get_linear_history("refs/heads/main", offset=i % 5, limit=1)
+                    for i in range(200)
+                )
+            )
+        finally:
+            graph.close()
+
+        assert calls == ["refs/heads/main"]
+        assert [window[0].id for window in windows[:5]] == commit_ids[::-1]
+
+    @pytest.mark.asyncio
+    async def test_backpressure(self, repo_with_history, monkeypatch):
+        """
+        Run more distinct searches than there are workers.
+
+        Never runs more searches at once than there are workers, and answers all of them.
+        """
+        repo_path, _ = repo_with_history
+        running = []
+        peak = []
+        lock = threading.Lock()
+        original = GraphSnapshot.search
+
+        def slow_search(self, text, limit=None):
+            with lock:
+                running.append(text)
+                peak.append(len(running))
+            time.sleep(0.02)
+            with lock:
+                running.remove(text)
+            return original(self, text, limit)
+
+        monkeypatch.setattr(GraphSnapshot, "search", slow_search)
+
+        async with await AsyncGitGraph.from_path(repo_path, max_workers=2) as graph:
+            results = await asyncio.gather(
+                *(graph.search(f"Commit {i % 5}", limit=i) for i in range(1, 11))
+            )
+
+        assert max(peak) <= 2
+        assert len(peak) == 10
+        assert all(len(result) == 1 for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_request_never_runs(self, repo_with_history, monkeypatch):
+        """
+        Cancel a request waiting for the only worker.
+
+        Raises CancelledError for the caller, and the work is never started.
+        """
+        repo_path, _ = repo_with_history
+        release = threading.Event()
+        started = []
+        original = GraphSnapshot.is_ancestor
+
+        def blocking_is_ancestor(self, ancestor_ref, ref):
+            started.append(ancestor_ref)
+            release.wait(5)
+            return original(self, ancestor_ref, ref)
+
+        monkeypatch.setattr(GraphSnapshot, "is_ancestor", blocking_is_ancestor)
+
+        async with await AsyncGitGraph.from_path(repo_path, max_workers=1) as graph:
+            first = asyncio.ensure_future(graph.is_ancestor("first", "HEAD"))
+            second = asyncio.ensure_future(graph.is_ancestor("second", "HEAD"))
+            await asyncio.sleep(0.05)
+            second.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await second
+
+            release.set()
+            assert await first is False
+            assert await graph.is_ancestor("third", "HEAD") is False
+
+        assert started == ["first", "third"]
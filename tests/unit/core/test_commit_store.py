@@ -0,0 +1,390 @@
+"""
+Tests for CommitStore class.
+
+Covers resident binary topology, payload eviction, and re-fetching evicted commits from the object database.
+"""
+
+import pytest
+
+from gittergraph.access.commit_access import CommitAccess
+from gittergraph.core.commit_store import CommitStore
+from gittergraph.core.commit_table import CommitTable
+from tests.make_models_helper import make_commit
+
+
+class TestCommitStore:
+    """
+    CommitStore test cases.
+
+    Covers mapping behavior, bounded payload memory, copies, and comparison.
+    """
+
+    @pytest.fixture
+    def access(self, repo_with_history):
+        """Commit access for a repository with five linear commits."""
+        repo_path, _ = repo_with_history
+        return CommitAccess(repo_path)
+
+    def test_unbounded_store_keeps_payloads(self):
+        """
+        Create a store without access or budget.
+
+        Keeps every commit object as it was added.
+        """
+        commit = make_commit(id="a" * 40, parent_ids=[])
+        store = CommitStore.from_commits([commit])
+
+        assert store["a" * 40] is commit
+        assert "a" * 40 in store
+        assert list(store) == ["a" * 40]
+        assert len(store) == 1
+        assert store.max_bytes is None
+
+    def test_missing_commit_raises(self):
+        """
+        Get a commit that is not in the store.
+
+        Raises KeyError.
+        """
+        with pytest.raises(KeyError):
+            _ = CommitStore()["missing"]
+
+    def test_budget_evicts_and_refetches(self, access, repo_with_history):
+        """
+        Create a store with a budget smaller than all payloads.
+
+        Keeps all topology resident, evicts payloads, and re-fetches them on access.
+        """
+        _, commit_ids = repo_with_history
+        store = CommitStore.from_commits(access.iter_all(), access, max_bytes=1)
+
+        assert len(store) == 5
+        assert store.cached_count == 1
+        assert store.stats.evictions == 4
+        assert store.get_parent_ids(commit_ids[1]) == (commit_ids[0],)
+
+        messages = [store[commit_id].message for commit_id in commit_ids]
+
+        assert messages == [f"Commit {i}" for i in range(5)]
+        assert store.stats.misses == 4
+        assert store.cached_count == 1
+
+    def test_store_over_table_decodes_on_demand(
+        self, access, repo_with_history, tmp_path
+    ):
+        """
+        Create a store over a commit table with a budget smaller than all payloads.
+
+        Loads the topology without decoding anything, then decodes payloads from the table again after eviction.
+        """
+        _, commit_ids = repo_with_history
+        CommitTable.write(tmp_path / "commits.table", access.iter_all())
+        store = CommitStore.from_table(
+            CommitTable(tmp_path / "commits.table"), access, max_bytes=1
+        )
+
+        assert len(store) == 5
+        assert store.cached_count == 0
+        assert store.get_parent_ids(commit_ids[1]) == (commit_ids[0],)
+
+        messages = [store[commit_id].message for commit_id in commit_ids]
+
+        assert messages == [f"Commit {i}" for i in range(5)]
+        assert store[commit_ids[0]] == access.get(commit_ids[0])
+        assert store[commit_ids[0]].author_identity >= 0
+        assert store.cached_count == 1
+
+    def test_store_over_table_keeps_ids_in_table(self, tmp_path):
+        """
+        Look up commits of a store over a commit table.
+
+        Copies no table ID into the graph; only parents outside the table get nodes of their own, when first asked for.
+        """
+        commits = [
+            make_commit(id="a" * 40),
+            make_commit(id="b" * 40, parent_ids=["a" * 40]),
+            make_commit(id="c" * 40, parent_ids=["b" * 40]),
+        ]
+        CommitTable.write(tmp_path / "commits.table", commits[1:])
+        store = CommitStore.from_table(CommitTable(tmp_path / "commits.table"))
+
+        assert store._graph.oids == []
+        assert commits[2].id in store
+        assert list(store) == [commit.id for commit in commits[1:]]
+        assert store._graph.oids == []
+
+        assert store.get_parent_ids(commits[1].id) == (commits[0].id,)
+        assert store._graph.oids == [bytes.fromhex(commits[0].id)]
+        assert commits[0].id not in store
+
+    def test_store_over_table_adds_commits(self, tmp_path):
+        """
+        Add a commit to a store over a commit table.
+
+        The new commit is kept as added, while table commits stay decodable in copies.
+        """
+        CommitTable.write(
+            tmp_path / "commits.table", [make_commit(id="a" * 40, message="Root")]
+        )
+        store = CommitStore.from_table(CommitTable(tmp_path / "commits.table"))
+        child = make_commit(id="b" * 40, parent_ids=["a" * 40])
+
+        copy = store.copy()
+        copy.add(child)
+
+        assert copy["b" * 40] is child
+        assert copy["a" * 40].message == "Root"
+        assert "b" * 40 not in store
+
+    def test_store_over_table_with_repeated_commit(self, tmp_path):
+        """
+        Create a store over a commit table written from a list naming a commit twice.
+
+        Loads the commit once, with its parent as a placeholder.
+        """
+        commit = make_commit(id="a" * 40, parent_ids=["b" * 40])
+        CommitTable.write(tmp_path / "commits.table", [commit, commit])
+
+        store = CommitStore.from_table(CommitTable(tmp_path / "commits.table"))
+
+        assert list(store) == ["a" * 40]
+        assert "b" * 40 not in store
+        assert store.get_parent_ids("a" * 40) == ("b" * 40,)
+
+    def test_store_over_table_exports_columns(
+        self, access, repo_with_history, tmp_path
+    ):
+        """
+        Export the columns of a store over a commit table.
+
+        Takes commit times and authors from the table without decoding any payloads.
+        """
+        _, commit_ids = repo_with_history
+        CommitTable.write(tmp_path / "commits.table", access.iter_all())
+        store = CommitStore.from_table(
+            CommitTable(tmp_path / "commits.table"), access, max_bytes=1
+        )
+
+        columns = store.to_columns()
+        rows = [columns.get_oid(row).hex() for row in range(len(columns))]
+
+        assert store.cached_count == 0
+        assert sorted(rows) == sorted(commit_ids)
+        for row, commit_id in enumerate(rows):
+            number = commit_ids.index(commit_id)
+            assert columns.commit_times[row] == 1234567890 + number
+            assert columns.authors[columns.author_ids[row]] == (
+                f"Author{number}",
+                f"author{number}@example.com",
+            )
+        assert (
+            store[commit_ids[0]].author_identity
+            == columns.author_ids[rows.index(commit_ids[0])]
+        )
+
+    def test_copy_has_own_topology(self, access, repo_with_history):
+        """
+        Copy a store and add commits to the copy.
+
+        Leaves the original unchanged and shares the payload cache.
+        """
+        _, commit_ids = repo_with_history
+        store = CommitStore.from_commits([access.get(commit_ids[0])], access)
+
+        copy = store.copy()
+        copy.add(access.get(commit_ids[1]))
+
+        assert len(store) == 1
+        assert len(copy) == 2
+        assert copy.stats is store.stats
+
+    def test_add_keeps_existing_commit(self):
+        """
+        Add a commit that is already in the store.
+
+        Keeps the original commit object.
+        """
+        first = make_commit(id="a" * 40, parent_ids=[])
+        store = CommitStore.from_commits([first])
+
+        store.add(make_commit(id="a" * 40, parent_ids=[]))
+
+        assert store["a" * 40] is first
+
+    def test_equality_compares_ids(self, access):
+        """
+        Compare stores with different budgets.
+
+        Stores with the same commit IDs are equal, regardless of cached payloads.
+        """
+        bounded = CommitStore.from_commits(access.iter_all(), access, max_bytes=1)
+        unbounded = CommitStore.from_commits(access.iter_all(), access)
+
+        assert bounded == unbounded
+        assert bounded == dict.fromkeys(unbounded)
+        assert bounded != CommitStore()
+
+    def test_placeholder_parents_are_not_contained(self):
+        """
+        Add a commit whose parent is not loaded.
+
+        The parent is neither contained nor counted, and the commit is a boundary commit.
+        """
+        store = CommitStore.from_commits(
+            [make_commit(id="b" * 40, parent_ids=["a" * 40])]
+        )
+
+        assert "a" * 40 not in store
+        assert len(store) == 1
+        assert store.get_parent_ids("b" * 40) == ("a" * 40,)
+        assert store.get_boundary_ids() == frozenset({"b" * 40})
+        assert store.is_truncated("b" * 40) is True
+
+        store.add(make_commit(id="a" * 40, parent_ids=[]))
+
+        assert store.get_boundary_ids() == frozenset()
+        assert store.is_truncated("b" * 40) is False
+
+    @pytest.mark.parametrize("key", ["HEAD", "refs/heads/main", "abc1234", 42])
+    def test_non_object_ids_are_not_contained(self, key):
+        """
+        Check membership of keys that are not full object IDs.
+
+        Returns False instead of raising.
+        """
+        store = CommitStore.from_commits([make_commit(id="a" * 40, parent_ids=[])])
+
+        assert key not in store
+
+    def test_sha256_ids(self):
+        """
+        Store commits with SHA-256 object IDs.
+
+        Keeps 64-digit hex IDs at the mapping interface.
+        """
+        child = make_commit(id="c" * 64, parent_ids=["d" * 64])
+        store = CommitStore.from_commits(
+            [child, make_commit(id="d" * 64, parent_ids=[])]
+        )
+
+        assert list(store) == ["c" * 64, "d" * 64]
+        assert store["c" * 64] is child
+        assert store.get_parent_ids("c" * 64) == ("d" * 64,)
+
+
+class TestCommitStoreSnapshots:
+    """
+    CommitStore snapshot test cases.
+
+    Covers sharing topology between snapshots, removal, and change tracking.
+    """
+
+    IDS = [f"{i:040x}" for i in range(1, 6)]
+
+    @classmethod
+    def _make_chain(cls, count):
+        """Create a linear chain of commits, oldest first."""
+        return [
+            make_commit(id=commit_id, parent_ids=cls.IDS[i - 1 : i])
+            for i, commit_id in enumerate(cls.IDS[:count])
+        ]
+
+    def test_copy_shares_graph(self):
+        """
+        Copy a store and extend the copy.
+
+        The copy shares the graph, and the original does not see commits added later.
+        """
+        commits = self._make_chain(3)
+        store = CommitStore.from_commits(commits[:2])
+        copy = store.copy()
+        copy.add(commits[2])
+
+        assert copy._graph is store._graph
+        assert self.IDS[2] not in store
+        assert list(store) == self.IDS[:2]
+        assert store.get_boundary_ids() == frozenset()
+        assert copy.get_changes_since(store) == ([self.IDS[2]], [])
+
+    def test_adding_to_older_snapshot_forks(self):
+        """
+        Add different commits to two snapshots of the same store.
+
+        The older snapshot gets a graph of its own, and neither sees the other's commit.
+        """
+        commits = self._make_chain(2)
+        other = make_commit(id="f" * 40, parent_ids=[self.IDS[0]])
+        store = CommitStore.from_commits(commits[:1])
+        first = store.copy()
+        second = store.copy()
+
+        first.add(commits[1])
+        second.add(other)
+
+        assert second._graph is not first._graph
+        assert list(first) == self.IDS[:2]
+        assert list(second) == [self.IDS[0], "f" * 40]
+        assert second.get_changes_since(store) is None
+
+    def test_without_removes_commits(self):
+        """
+        Create a snapshot without some commits and re-add one of them.
+
+        Removed commits are not contained, and re-adding makes them visible again.
+        """
+        commits = self._make_chain(5)
+        store = CommitStore.from_commits(commits)
+
+        pruned = store.without([self.IDS[4]])
+
+        assert self.IDS[4] not in pruned
+        assert len(pruned) == 4
+        assert pruned._graph is store._graph
+        assert pruned.get_changes_since(store) == ([], [self.IDS[4]])
+        assert self.IDS[4] in store
+
+        restored = pruned.copy()
+        restored.add(commits[4])
+
+        assert self.IDS[4] in restored
+        assert restored.get_changes_since(pruned) == ([self.IDS[4]], [])
+        assert restored == store
+
+    def test_without_compacts_mostly_removed_graph(self):
+        """
+        Remove most commits of a store.
+
+        The snapshot gets a compacted graph of its own.
+        """
+        store = CommitStore.from_commits(self._make_chain(5))
+
+        pruned = store.without(self.IDS[2:])
+
+        assert pruned._graph is not store._graph
+        assert list(pruned) == self.IDS[:2]
+        assert pruned["0" * 39 + "2"].id == self.IDS[1]
+
+    def test_to_columns(self):
+        """
+        Export the columns of a snapshot without some commits.
+
+        Numbers commits in load order, links parents by row with -1 for missing ones, and keeps only references to exported commits.
+        """
+        commits = self._make_chain(5)
+        commits[0].parent_ids = ["f" * 40]
+        store = CommitStore.from_commits(commits).without([self.IDS[4]])
+
+        columns = store.to_columns({"main": self.IDS[3], "gone": self.IDS[4]})
+
+        assert len(columns) == 4
+        assert columns.oid_size == 20
+        assert columns.get_oid(2).hex() == self.IDS[2]
+        assert list(columns.parent_offsets) == [0, 1, 2, 3, 4]
+        assert list(columns.parent_rows) == [-1, 0, 1, 2]
+        assert list(columns.author_ids) == [-1] * 4
+        assert columns.ref_names == ("main",)
+        assert list(columns.ref_rows) == [3]
+        with pytest.raises(IndexError):
+            columns.get_oid(4)
+
+        assert len(CommitStore().to_columns()) == 0
@@ -0,0 +1,159 @@
+"""
+Tests for CommitTable class.
+
+Covers writing commits to a table file, lookups by ID, and decoding commits from the mapped file.
+"""
+
+import pytest
+
+from gittergraph.access.commit_access import CommitAccess
+from gittergraph.access.identity_pool import IdentityPool
+from gittergraph.core.commit_table import CommitTable
+from gittergraph.models import Signature
+from tests.make_models_helper import make_commit
+
+
+class TestCommitTable:
+    """
+    CommitTable test cases.
+
+    Covers round trips through a table file, lookups, identities, and invalid files.
+    """
+
+    def test_round_trip(self, repo_with_merge, tmp_path):
+        """
+        Write the commits of a repository with a merge and read them back.
+
+        Decodes every commit to an equal one, in the order written.
+        """
+        repo_path, _ = repo_with_merge
+        commits = list(CommitAccess(repo_path).iter_all())
+        path = tmp_path / "commits.table"
+
+        assert CommitTable.write(path, commits) == len(commits)
+
+        table = CommitTable(path)
+        identities = IdentityPool()
+        assert len(table) == len(commits)
+        assert [table.get_commit(index, identities) for index in range(len(table))] == (
+            commits
+        )
+
+    def test_find(self, tmp_path):
+        """
+        Look up commits by hex ID.
+
+        Finds the row of every commit and returns None for unknown IDs, parents outside the table, and malformed IDs.
+        """
+        ids = ["c" * 40, "a" * 40, "b" * 40]
+        CommitTable.write(
+            tmp_path / "commits.table",
+            [make_commit(id=commit_id, parent_ids=["f" * 40]) for commit_id in ids],
+        )
+        table = CommitTable(tmp_path / "commits.table")
+
+        assert [table.find(commit_id) for commit_id in ids] == [0, 1, 2]
+        assert table.find("f" * 40) is None
+        assert table.find("not an id") is None
+        assert table.get_parent_oids(1) == [bytes.fromhex("f" * 40)]
+
+    def test_repeated_commit_written_once(self, tmp_path):
+        """
+        Write a list naming a commit twice.
+
+        Writes a single row for the commit.
+        """
+        commit = make_commit(id="a" * 40)
+
+        assert CommitTable.write(tmp_path / "commits.table", [commit, commit]) == 1
+        assert len(CommitTable(tmp_path / "commits.table")) == 1
+
+    def test_identities_are_pooled(self, tmp_path):
+        """
+        Decode commits with the same author.
+
+        Stores the identity once, pools its strings, and shares one signature when author and committer are identical.
+        """
+        author = Signature(
+            name="Alice", email="alice@example.com", time=1, time_offset=0
+        )
+        commits = [
+            make_commit(id="a" * 40, author=author, committer=author),
+            make_commit(
+                id="b" * 40,
+                author=author,
+                committer=Signature(
+                    name="Bob", email="bob@example.com", time=2, time_offset=60
+                ),
+            ),
+        ]
+        CommitTable.write(tmp_path / "commits.table", commits)
+        table = CommitTable(tmp_path / "commits.table")
+        identities = IdentityPool()
+
+        first = table.get_commit(0, identities)
+        second = table.get_commit(1, identities)
+
+        assert first.committer is first.author
+        assert first.author.name is second.author.name
+        assert second.committer == commits[1].committer
+        assert second.committer_identity != second.author_identity
+
+    def test_sha256_ids(self, tmp_path):
+        """
+        Write commits with SHA-256 object IDs.
+
+        Keeps 64-digit hex IDs, and refuses to mix them with SHA-1 IDs.
+        """
+        CommitTable.write(
+            tmp_path / "commits.table",
+            [make_commit(id="c" * 64, parent_ids=["d" * 64])],
+        )
+        table = CommitTable(tmp_path / "commits.table")
+
+        assert table.find("c" * 64) == 0
+        assert table.get_commit(0, IdentityPool()).parent_ids == ["d" * 64]
+        with pytest.raises(ValueError):
+            CommitTable.write(
+                tmp_path / "mixed.table",
+                [make_commit(id="c" * 64, parent_ids=["d" * 40])],
+            )
+
+    def test_table_outlives_file(self, tmp_path):
+        """
+        Delete the table file right after opening it.
+
+        The mapping stays readable.
+        """
+        path = tmp_path / "commits.table"
+        CommitTable.write(path, [make_commit(id="a" * 40, message="Kept")])
+        table = CommitTable(path)
+        path.unlink()
+
+        assert table.get_commit(0, IdentityPool()).message == "Kept"
+
+    def test_empty_table(self, tmp_path):
+        """
+        Write a table without commits.
+
+        Opens as an empty table in which nothing is found.
+        """
+        CommitTable.write(tmp_path / "commits.table", [])
+        table = CommitTable(tmp_path / "commits.table")
+
+        assert len(table) == 0
+        assert table.find("a" * 40) is None
+        assert not table.get_oids()
+        assert table.get_parent_links() == ([], [0])
+
+    def test_invalid_file_raises(self, tmp_path):
+        """
+        Open a file that is not a commit table.
+
+        Raises ValueError.
+        """
+        path = tmp_path / "commits.table"
+        path.write_bytes(b"not a commit table at all, but long enough for a header")
+
+        with pytest.raises(ValueError):
+            CommitTable(path)
@@ -5,9 +5,17 @@ GitGraph tests.
 Unit tests for the GitGraph class, covering graph initialization, data loading, helper methods, and repository operations.
 """
 
+import threading
+
 import pygit2
+import pytest
 
+from gittergraph.access import RefFilter
 from gittergraph.core.graph import GitGraph
+from gittergraph.core.graph_change_set import GraphChangeSet, RefChanges
+from gittergraph.core.graph_data import GitGraphData
+from gittergraph.core.graph_options import GraphOptions
+from tests.unit.access.access_helper import pack_refs
 from tests.unit.core.core_helper import get_git_graph
 
 
@@ -264,6 +272,35 @@ class TestGitGraphOperations:
 
         assert graph.is_empty() is False
 
+    def test_is_ancestor(self, repo_with_branches):
+        """
+        Check ancestry of branches.
+
+        Resolves both references, and returns False for unknown ones.
+        """
+        repo_path, _ = repo_with_branches
+        graph = get_git_graph(repo_path)
+
+        assert graph.is_ancestor("refs/heads/main", "refs/heads/feature") is True
+        assert graph.is_ancestor("refs/heads/feature", "refs/heads/main") is False
+        assert graph.is_ancestor("nonexistent", "refs/heads/main") is False
+
+    def test_search(self, repo_with_history):
+        """
+        Search loaded commits.
+
+        Matches messages case-insensitively and ID prefixes, and stops at the limit.
+        """
+        repo_path, commit_ids = repo_with_history
+        graph = get_git_graph(repo_path)
+
+        assert [commit.id for commit in graph.search("commit 3")] == [commit_ids[3]]
+        assert [commit.id for commit in graph.search(commit_ids[1][:8])] == [
+            commit_ids[1]
+        ]
+        assert len(graph.search("COMMIT", limit=2)) == 2
+        assert not graph.search("no such text")
+
     def test_reload_updates_data(self, simple_repo):
         """
         Reload graph data after repository changes.
@@ -330,6 +367,93 @@ class TestGitGraphOperations:
         assert len(history) == 2
         assert history[0].id == new_commit_id
 
+    def test_reload_without_changes_is_noop(self, simple_repo, monkeypatch):
+        """
+        Reload an unchanged repository.
+
+        Returns an empty change set without reopening the repository or loading data.
+        """
+        repo_path, _ = simple_repo
+        graph = get_git_graph(repo_path)
+        data = graph.data
+
+        def fail(*_args, **_kwargs):
+            raise AssertionError("data reloaded")
+
+        monkeypatch.setattr(GitGraphData, "load_from", fail)
+        monkeypatch.setattr(graph.repo, "reload", fail)
+
+        assert graph.reload() == GraphChangeSet()
+        assert graph.data is data
+
+    def test_reload_with_changes_returns_change_set(self, simple_repo):
+        """
+        Reload after moving a branch.
+
+        Returns the moved branch and added commit, and a snapshot with a new fingerprint.
+        """
+        repo_path, commit_ids = simple_repo
+        graph = get_git_graph(repo_path)
+        old_fingerprint = graph.data.fingerprint
+
+        repo = pygit2.Repository(str(repo_path))
+        tree = repo.TreeBuilder().write()
+        author = pygit2.Signature("Test", "test@example.com")
+        new_id = repo.create_commit(
+            "refs/heads/main", author, author, "New", tree, [commit_ids[0]]
+        )
+
+        changes = graph.reload()
+
+        assert changes.branches == RefChanges(moved=("refs/heads/main",))
+        assert not changes.tags
+        assert changes.head_changed is False
+        assert changes.added_commits == {str(new_id)}
+        assert not changes.removed_commits
+        assert graph.data.fingerprint != old_fingerprint
+
+    def test_reload_with_invisible_changes(self, repo_with_branches):
+        """
+        Reload after a reference is rewritten to the same target.
+
+        Returns an empty change set but remembers the new fingerprint.
+        """
+        repo_path, commit_ids = repo_with_branches
+        graph = get_git_graph(repo_path)
+        data = graph.data
+
+        repo = pygit2.Repository(str(repo_path))
+        repo.references.create("refs/heads/main", commit_ids[1], force=True)
+        pack_refs(repo_path)
+
+        assert not graph.reload()
+        assert graph.data.commits is data.commits
+        assert graph.data.fingerprint != data.fingerprint
+        assert not graph.reload()
+
+    def test_watching_reloads_on_change(self, simple_repo):
+        """
+        Watch a graph and add a commit to its branch.
+
+        Reloads the graph in the background and calls the reload callback.
+        """
+        repo_path, commit_ids = simple_repo
+        graph = get_git_graph(repo_path)
+        reloaded = threading.Event()
+        graph.start_watching(lambda _: reloaded.set())
+        try:
+            repo = pygit2.Repository(str(repo_path))
+            tree = repo.TreeBuilder().write()
+            author = pygit2.Signature("Test", "test@example.com")
+            new_id = repo.create_commit(
+                "refs/heads/main", author, author, "New", tree, [commit_ids[0]]
+            )
+
+            assert reloaded.wait(5)
+            assert str(new_id) in graph.data.commits
+        finally:
+            graph.stop_watching()
+
     def test_graph_with_multiple_branches(self, repo_with_branches):
         """
         Initialize graph with multiple branches.
@@ -386,9 +510,9 @@ class TestGitGraphOperations:
         repo_path, _ = simple_repo
         graph = get_git_graph(repo_path)
 
-        assert hasattr(graph, "_ref_index")
-        assert hasattr(graph, "_history_walker")
-        assert hasattr(graph, "_ref_resolver")
+        assert hasattr(graph.snapshot, "_ref_index")
+        assert hasattr(graph.snapshot, "_history_walker")
+        assert hasattr(graph.snapshot, "_ref_resolver")
 
     def test_data_is_public(self, simple_repo):
         """
@@ -402,3 +526,280 @@ class TestGitGraphOperations:
         assert hasattr(graph, "data")
         assert commit_ids[0] in graph.data.commits
         assert "refs/heads/main" in graph.data.branches
+
+
+class TestGitGraphColumns:
+    """
+    GitGraph columnar export test cases.
+
+    Covers exporting the loaded graph with its reference tips.
+    """
+
+    def test_to_columns(self, repo_with_branches):
+        """
+        Export the columns of a graph with two branches.
+
+        Includes every loaded commit, and the tips of both branches with their rows.
+        """
+        repo_path, commit_ids = repo_with_branches
+        graph = GitGraph.from_path(repo_path)
+
+        columns = graph.to_columns()
+        rows = {columns.get_oid(row).hex(): row for row in range(len(columns))}
+        refs = dict(zip(columns.ref_names, columns.ref_rows))
+
+        assert set(rows) == set(commit_ids)
+        assert refs["refs/heads/main"] == rows[commit_ids[1]]
+        assert refs["refs/heads/feature"] == rows[commit_ids[2]]
+        assert "HEAD" not in refs
+        assert columns.authors[columns.author_ids[0]] == ("Test", "test@example.com")
+
+
+class TestGitGraphDiffStat:
+    """
+    GitGraph diff statistics test cases.
+
+    Covers diff statistics served through the graph.
+    """
+
+    def test_get_diff_stat(self, repo_with_files):
+        """
+        Get diff statistics for a commit.
+
+        Returns the changed paths of the commit against its first parent.
+        """
+        repo_path, commit_ids = repo_with_files
+        graph = get_git_graph(repo_path)
+
+        stat = graph.get_diff_stat(commit_ids[1])
+
+        assert sorted(stat.paths) == ["a.txt", "c.txt"]
+
+
+class TestGitGraphOptions:
+    """
+    GitGraph options test cases.
+
+    Covers passing graph options when opening a repository.
+    """
+
+    def test_from_path_applies_ref_filter(self, repo_with_branches):
+        """
+        Create graph with a reference filter.
+
+        Hides excluded branches from the graph.
+        """
+        repo_path, _ = repo_with_branches
+        options = GraphOptions(ref_filter=RefFilter(exclude=("refs/heads/feature",)))
+
+        graph = GitGraph.from_path(repo_path, options)
+
+        assert list(graph.data.branches) == ["refs/heads/main"]
+        assert graph.data.hidden_ref_count == 1
+
+    def test_discover_applies_ref_filter(self, repo_with_branches):
+        """
+        Discover graph with a reference filter.
+
+        Hides excluded branches from the discovered graph.
+        """
+        repo_path, _ = repo_with_branches
+        options = GraphOptions(ref_filter=RefFilter(include=("refs/heads/main",)))
+
+        graph = GitGraph.discover(repo_path, options)
+
+        assert graph is not None
+        assert list(graph.data.branches) == ["refs/heads/main"]
+
+
+class TestGitGraphTagAnnotation:
+    """
+    GitGraph tag annotation test cases.
+
+    Covers lazy loading and caching of annotated tag metadata.
+    """
+
+    def test_annotation_loaded_and_cached(self, repo_with_annotated_tag, monkeypatch):
+        """
+        Get metadata of an annotated tag twice.
+
+        Loads the tag object only once.
+        """
+        repo_path, _ = repo_with_annotated_tag
+        graph = get_git_graph(repo_path)
+        calls = []
+        original = graph.repo.tags.get_annotation
+
+        def counting_get_annotation(tag):
+            calls.append(tag.name)
+            return original(tag)
+
+        monkeypatch.setattr(graph.repo.tags, "get_annotation", counting_get_annotation)
+
+        first = graph.get_tag_annotation("refs/tags/v2.0.0")
+        second = graph.get_tag_annotation("refs/tags/v2.0.0")
+
+        assert first is not None
+        assert first.message == "Release 2.0.0"
+        assert second is first
+        assert calls == ["refs/tags/v2.0.0"]
+
+    def test_lightweight_and_unknown_tags(self, repo_with_lightweight_tag):
+        """
+        Get metadata of lightweight and unknown tags.
+
+        Returns None for both.
+        """
+        repo_path, _ = repo_with_lightweight_tag
+        graph = get_git_graph(repo_path)
+
+        assert graph.get_tag_annotation("refs/tags/v1.0.0") is None
+        assert graph.get_tag_annotation("refs/tags/missing") is None
+
+
+class TestGitGraphLazy:
+    """
+    GitGraph lazy loading test cases.
+
+    Covers loading history on demand and in a background pass.
+    """
+
+    @pytest.fixture
+    def graph(self, repo_with_branches):
+        """Lazily loaded graph with HEAD on main and an unloaded feature branch."""
+        repo_path, _ = repo_with_branches
+        pygit2.Repository(str(repo_path)).set_head("refs/heads/main")
+        return GitGraph.from_path(repo_path, GraphOptions(lazy=True))
+
+    def test_startup_loads_head_history(self, graph, repo_with_branches):
+        """
+        Create a lazy graph.
+
+        Loads only the commits reachable from HEAD.
+        """
+        _, commit_ids = repo_with_branches
+        assert commit_ids[2] not in graph.data.commits
+        assert len(graph.get_linear_history("HEAD")) == 2
+
+    def test_history_of_branch_loaded_on_demand(self, graph, repo_with_branches):
+        """
+        Get history of a branch that is not loaded yet.
+
+        Loads the branch history and returns it.
+        """
+        _, commit_ids = repo_with_branches
+
+        history = graph.get_linear_history("refs/heads/feature")
+
+        assert [c.id for c in history] == [commit_ids[2], commit_ids[1], commit_ids[0]]
+        assert graph.load_ref("refs/heads/feature") is False
+
+    def test_load_pending(self, graph):
+        """
+        Load all remaining references.
+
+        Returns the number of new commits and leaves nothing pending.
+        """
+        assert graph.load_pending() == 1
+        assert graph.data.pending_ids == []
+        assert graph.load_pending() == 0
+
+    def test_load_ref_unknown(self, graph):
+        """
+        Load history of an unknown reference.
+
+        Returns False.
+        """
+        assert graph.load_ref("refs/heads/missing") is False
+
+
+class TestGitGraphBounded:
+    """
+    GitGraph bounded loading test cases.
+
+    Covers truncated histories and loading more history on request.
+    """
+
+    @pytest.fixture
+    def graph(self, repo_with_history):
+        """Graph loading at most two commits per walk."""
+        repo_path, _ = repo_with_history
+        pygit2.Repository(str(repo_path)).set_head("refs/heads/main")
+        return GitGraph.from_path(repo_path, GraphOptions(max_commits=2))
+
+    def test_history_is_truncated(self, graph, repo_with_history):
+        """
+        Get history of a bounded graph.
+
+        Returns only loaded commits and reports the history as truncated.
+        """
+        _, commit_ids = repo_with_history
+
+        history = graph.get_linear_history("HEAD")
+
+        assert [c.id for c in history] == [commit_ids[4], commit_ids[3]]
+        assert graph.is_truncated("HEAD") is True
+        assert graph.is_truncated("refs/heads/missing") is False
+
+    def test_load_more(self, graph, repo_with_history):
+        """
+        Load more history past the boundary.
+
+        Loads chunks of max_commits commits until the root is reached.
+        """
+        _, commit_ids = repo_with_history
+
+        assert graph.load_more([commit_ids[3]]) == 2
+        assert len(graph.get_linear_history("HEAD")) == 4
+        assert graph.load_more() == 1
+        assert graph.is_truncated("HEAD") is False
+        assert graph.load_more() == 0
+
+    @pytest.mark.parametrize("max_commits", [0, -5])
+    def test_non_positive_bound_rejected(self, max_commits):
+        """
+        Create options with a commit count bound below one.
+
+        Raises ValueError, since no history could ever be loaded.
+        """
+        with pytest.raises(ValueError, match="max_commits"):
+            GraphOptions(max_commits=max_commits)
+
+
+class TestGitGraphMemoryBudget:
+    """
+    GitGraph memory budget test cases.
+
+    Covers bounded commit payload memory and memory usage reporting.
+    """
+
+    def test_history_with_tiny_budget(self, repo_with_history):
+        """
+        Get history from a graph whose budget fits a single commit.
+
+        Returns the full history by re-fetching evicted commits.
+        """
+        repo_path, commit_ids = repo_with_history
+        pygit2.Repository(str(repo_path)).set_head("refs/heads/main")
+        graph = GitGraph.from_path(repo_path, GraphOptions(memory_budget=1))
+
+        history = graph.get_linear_history("HEAD")
+
+        assert [c.id for c in history] == commit_ids[::-1]
+        assert graph.data.commits.cached_count == 1
+
+    def test_get_memory_usage(self, repo_with_history):
+        """
+        Get the memory usage of a graph.
+
+        Reports resident memory, the budget, and cached commit counts.
+        """
+        repo_path, _ = repo_with_history
+        graph = GitGraph.from_path(repo_path, GraphOptions(memory_budget=1 << 20))
+
+        usage = graph.get_memory_usage()
+
+        assert usage.resident_bytes > 0
+        assert usage.budget_bytes == 1 << 20
+        assert usage.cached_commits == usage.total_commits == 5
+        assert "of 5 commits" in str(usage)
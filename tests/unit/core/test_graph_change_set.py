@@ -0,0 +1,168 @@
+"""
+GraphChangeSet tests.
+
+Unit tests for comparing graph data snapshots, covering reference, HEAD, and commit changes.
+"""
+
+from dataclasses import replace
+
+from gittergraph.core.commit_store import CommitStore
+from gittergraph.core.graph_change_set import GraphChangeSet, RefChanges
+from gittergraph.core.graph_data import GitGraphData
+from gittergraph.models import HeadState
+from tests.make_models_helper import make_branch, make_commit, make_head, make_tag
+
+ROOT_ID = "1" * 40
+CHILD_ID = "2" * 40
+
+
+def make_data(**kwargs) -> GitGraphData:
+    """
+    Create a GitGraphData snapshot for testing.
+
+    Holds a root commit and its child unless other commits are given.
+    """
+    commits = kwargs.get(
+        "commits",
+        [make_commit(id=ROOT_ID), make_commit(id=CHILD_ID, parent_ids=[ROOT_ID])],
+    )
+    return GitGraphData(
+        commits=CommitStore.from_commits(commits),
+        branches=kwargs.get(
+            "branches", {"refs/heads/main": make_branch(target_id=CHILD_ID)}
+        ),
+        tags=kwargs.get("tags", {}),
+        head_info=kwargs.get("head_info", make_head(target_id=CHILD_ID)),
+    )
+
+
+class TestRefChanges:
+    """
+    Tests for comparing reference maps.
+
+    Covers added, removed, and moved references.
+    """
+
+    def test_between(self):
+        """
+        Compare reference maps with every kind of change.
+
+        Reports added, removed, and moved references by name.
+        """
+        old = {
+            "refs/heads/main": make_branch(name="refs/heads/main", target_id="a"),
+            "refs/heads/old": make_branch(name="refs/heads/old", target_id="a"),
+            "refs/heads/same": make_branch(name="refs/heads/same", target_id="a"),
+        }
+        new = {
+            "refs/heads/main": make_branch(name="refs/heads/main", target_id="b"),
+            "refs/heads/new": make_branch(name="refs/heads/new", target_id="a"),
+            "refs/heads/same": make_branch(name="refs/heads/same", target_id="a"),
+        }
+
+        assert RefChanges.between(old, new) == RefChanges(
+            added=("refs/heads/new",),
+            removed=("refs/heads/old",),
+            moved=("refs/heads/main",),
+        )
+
+    def test_retagged_annotated_tag_is_moved(self):
+        """
+        Recreate an annotated tag on the same commit.
+
+        Reports the tag as moved, since its tag object changed.
+        """
+        old = {"refs/tags/v1": make_tag(name="refs/tags/v1", object_id="a")}
+        new = {"refs/tags/v1": make_tag(name="refs/tags/v1", object_id="b")}
+
+        assert RefChanges.between(old, new).moved == ("refs/tags/v1",)
+
+    def test_empty_is_falsy(self):
+        """
+        Compare equal reference maps.
+
+        Returns falsy changes.
+        """
+        refs = {"refs/heads/main": make_branch()}
+
+        assert not RefChanges.between(refs, dict(refs))
+
+
+class TestGraphChangeSet:
+    """
+    Tests for comparing graph data snapshots.
+
+    Covers references, HEAD, and commits.
+    """
+
+    def test_unchanged(self):
+        """
+        Compare equal snapshots.
+
+        Returns an empty, falsy change set.
+        """
+        changes = GraphChangeSet.between(make_data(), make_data())
+
+        assert changes == GraphChangeSet()
+        assert not changes
+        assert changes.refs_changed is False
+
+    def test_added_commit(self):
+        """
+        Compare a snapshot with one that has an additional commit.
+
+        Reports the new commit and the moved branch.
+        """
+        old = make_data(commits=[make_commit(id=ROOT_ID)])
+        new = make_data()
+
+        changes = GraphChangeSet.between(old, new)
+
+        assert changes
+        assert changes.added_commits == {CHILD_ID}
+        assert not changes.removed_commits
+
+    def test_removed_commit(self):
+        """
+        Compare a snapshot with one that lost a commit.
+
+        Reports the removed commit.
+        """
+        old = make_data()
+        new = make_data(commits=[make_commit(id=ROOT_ID)])
+
+        assert GraphChangeSet.between(old, new).removed_commits == {CHILD_ID}
+
+    def test_head_changed(self):
+        """
+        Compare snapshots with a detached HEAD in the newer one.
+
+        Reports that HEAD changed.
+        """
+        old = make_data()
+        new = replace(
+            old,
+            head_info=make_head(
+                state=HeadState.DETACHED, target_id=ROOT_ID, branch_name=None
+            ),
+        )
+
+        changes = GraphChangeSet.between(old, new)
+
+        assert changes.head_changed is True
+        assert changes.refs_changed is True
+        assert not changes.branches
+
+    def test_tag_added(self):
+        """
+        Compare snapshots with a new tag in the newer one.
+
+        Reports the tag and no branch changes.
+        """
+        old = make_data()
+        new = replace(old, tags={"refs/tags/v1": make_tag(name="refs/tags/v1")})
+
+        changes = GraphChangeSet.between(old, new)
+
+        assert changes.tags.added == ("refs/tags/v1",)
+        assert not changes.branches
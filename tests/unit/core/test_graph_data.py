@@ -8,7 +8,8 @@ Unit tests for the GitGraphData dataclass, covering data loading, immutability,
 import pygit2
 import pytest
 
-from gittergraph.access import GitRepository
+from gittergraph.access import GitRepository, RefFilter
+from gittergraph.core.commit_store import CommitStore
 from gittergraph.core.graph_data import GitGraphData
 from tests.unit.core.core_helper import get_graph_data
 
@@ -291,3 +292,457 @@ class TestGitGraphData:
 
         assert data1 is not data2
         assert data1.commits is not data2.commits
+
+
+class TestGitGraphDataRefFilter:
+    """
+    GitGraphData reference filter test cases.
+
+    Covers loading data from a repository with a reference filter.
+    """
+
+    def test_excluded_refs_are_not_walked(self, repo_with_branches):
+        """
+        Load data with an excluded branch.
+
+        Skips the branch and commits reachable only from it, and counts it as hidden.
+        """
+        repo_path, commit_ids = repo_with_branches
+        git_repo = GitRepository(repo_path, RefFilter(exclude=("refs/heads/feature",)))
+
+        data = GitGraphData.load_from(git_repo)
+
+        assert list(data.branches) == ["refs/heads/main"]
+        assert commit_ids[2] not in data.commits
+        assert len(data.commits) == 2
+        assert data.hidden_ref_count == 1
+
+    def test_head_is_always_walked(self, repo_detached_head):
+        """
+        Load data with all references excluded.
+
+        Still walks the commit HEAD points to.
+        """
+        repo_path, commit_ids = repo_detached_head
+        git_repo = GitRepository(repo_path, RefFilter(exclude=("refs/*",)))
+
+        data = GitGraphData.load_from(git_repo)
+
+        assert not data.branches
+        assert commit_ids[0] in data.commits
+
+
+class TestGitGraphDataLazy:
+    """
+    GitGraphData lazy loading test cases.
+
+    Covers loading only the history of HEAD and extending snapshots.
+    """
+
+    @pytest.fixture
+    def repo_path(self, repo_with_branches):
+        """Repository with main and feature branches and HEAD on main."""
+        repo_path, _ = repo_with_branches
+        pygit2.Repository(str(repo_path)).set_head("refs/heads/main")
+        return repo_path
+
+    def test_lazy_loads_only_head_history(self, repo_path, repo_with_branches):
+        """
+        Load data in lazy mode.
+
+        Walks only the history of HEAD while still listing all branches.
+        """
+        _, commit_ids = repo_with_branches
+        data = GitGraphData.load_from(GitRepository(repo_path), lazy=True)
+
+        assert set(data.commits) == {commit_ids[0], commit_ids[1]}
+        assert len(data.branches) == 2
+        assert data.walked_ids == (commit_ids[1],)
+        assert data.pending_ids == [commit_ids[2]]
+
+    def test_full_load_has_no_pending_ids(self, repo_path):
+        """
+        Load data eagerly.
+
+        Leaves no pending references.
+        """
+        data = GitGraphData.load_from(GitRepository(repo_path))
+
+        assert data.pending_ids == []
+
+    def test_extend_adds_missing_history(self, repo_path, repo_with_branches):
+        """
+        Extend a lazy snapshot with a further branch.
+
+        Returns a new snapshot with the new commits and leaves the old one untouched.
+        """
+        _, commit_ids = repo_with_branches
+        git_repo = GitRepository(repo_path)
+        data = GitGraphData.load_from(git_repo, lazy=True)
+
+        extended = data.extend(git_repo, [commit_ids[2]])
+
+        assert len(extended.commits) == 3
+        assert len(data.commits) == 2
+        assert extended.pending_ids == []
+        assert extended.commits[commit_ids[0]] is data.commits[commit_ids[0]]
+
+    def test_extend_with_known_history_returns_same_snapshot(self, repo_path):
+        """
+        Extend a snapshot with already loaded history.
+
+        Returns the snapshot unchanged.
+        """
+        git_repo = GitRepository(repo_path)
+        data = GitGraphData.load_from(git_repo)
+
+        assert data.extend(git_repo, list(data.commits)[:1]) is data
+
+
+class TestGitGraphDataBounded:
+    """
+    GitGraphData bounded loading test cases.
+
+    Covers commit count and date bounds, boundary commits, and expanding past them.
+    """
+
+    @pytest.fixture
+    def repo_path(self, repo_with_history):
+        """Repository with five linear commits and HEAD on main."""
+        repo_path, _ = repo_with_history
+        pygit2.Repository(str(repo_path)).set_head("refs/heads/main")
+        return repo_path
+
+    def test_max_commits_marks_boundary(self, repo_path, repo_with_history):
+        """
+        Load data with a commit count bound.
+
+        Loads the newest commits and marks the oldest loaded commit as boundary.
+        """
+        _, commit_ids = repo_with_history
+        data = GitGraphData.load_from(GitRepository(repo_path), max_commits=2)
+
+        assert set(data.commits) == {commit_ids[4], commit_ids[3]}
+        assert data.boundary_ids == frozenset({commit_ids[3]})
+
+    def test_since_marks_boundary(self, repo_path, repo_with_history):
+        """
+        Load data with a date bound.
+
+        Loads commits not older than the bound.
+        """
+        _, commit_ids = repo_with_history
+        data = GitGraphData.load_from(GitRepository(repo_path), since=1234567893)
+
+        assert set(data.commits) == {commit_ids[4], commit_ids[3]}
+        assert data.boundary_ids == frozenset({commit_ids[3]})
+
+    def test_unbounded_has_no_boundary(self, repo_path):
+        """
+        Load data without bounds.
+
+        No commit is marked as boundary.
+        """
+        data = GitGraphData.load_from(GitRepository(repo_path))
+
+        assert data.boundary_ids == frozenset()
+
+    def test_expand_loads_next_chunk(self, repo_path, repo_with_history):
+        """
+        Expand a bounded snapshot.
+
+        Loads the next chunk past the boundary and keeps loaded commit objects.
+        """
+        _, commit_ids = repo_with_history
+        repo = GitRepository(repo_path)
+        data = GitGraphData.load_from(repo, max_commits=2)
+
+        expanded = data.expand(repo, 2)
+
+        assert set(expanded.commits) == set(commit_ids[1:])
+        assert expanded.boundary_ids == frozenset({commit_ids[1]})
+        assert expanded.commits[commit_ids[4]] is data.commits[commit_ids[4]]
+
+        complete = expanded.expand(repo, 2)
+        assert set(complete.commits) == set(commit_ids)
+        assert complete.boundary_ids == frozenset()
+        assert complete.expand(repo, 2) is complete
+
+    def test_expand_checks_only_new_commits(
+        self, repo_path, repo_with_history, monkeypatch
+    ):
+        """
+        Expand a bounded snapshot while recording boundary checks.
+
+        Checks only the previous boundary commits and the new chunk, never the whole store.
+        """
+        _, commit_ids = repo_with_history
+        repo = GitRepository(repo_path)
+        data = GitGraphData.load_from(repo, max_commits=2)
+        checked = []
+        original = CommitStore.get_boundary_ids
+
+        def recording_get_boundary_ids(store, checked_ids=None):
+            if checked_ids is not None:
+                checked_ids = list(checked_ids)
+            checked.append(None if checked_ids is None else set(checked_ids))
+            return original(store, checked_ids)
+
+        monkeypatch.setattr(CommitStore, "get_boundary_ids", recording_get_boundary_ids)
+
+        expanded = data.expand(repo, 2)
+
+        assert checked == [{commit_ids[3], commit_ids[2], commit_ids[1]}]
+        assert expanded.boundary_ids == frozenset({commit_ids[1]})
+
+
+class TestGitGraphDataEquality:
+    """
+    GitGraphData equality test cases.
+
+    Covers comparing snapshots by repository fingerprint.
+    """
+
+    def test_snapshots_of_same_state_are_equal(self, repo_with_branches):
+        """
+        Load the same repository twice.
+
+        Snapshots compare equal by fingerprint.
+        """
+        repo_path, _ = repo_with_branches
+        repo = GitRepository(repo_path)
+
+        first = GitGraphData.load_from(repo)
+        second = GitGraphData.load_from(repo)
+
+        assert first.fingerprint is not None
+        assert first == second
+
+    def test_snapshots_after_change_differ(self, repo_with_branches):
+        """
+        Load a repository before and after moving a branch.
+
+        Snapshots differ.
+        """
+        repo_path, commit_ids = repo_with_branches
+        repo = GitRepository(repo_path)
+        first = GitGraphData.load_from(repo)
+
+        pygit2.Repository(str(repo_path)).references["refs/heads/main"].set_target(
+            commit_ids[2]
+        )
+
+        assert GitGraphData.load_from(repo) != first
+
+    def test_extended_snapshot_differs(self, repo_with_branches):
+        """
+        Extend a lazily loaded snapshot.
+
+        The extended snapshot differs although the repository did not change.
+        """
+        repo_path, commit_ids = repo_with_branches
+        pygit2.Repository(str(repo_path)).set_head("refs/heads/main")
+        repo = GitRepository(repo_path)
+        data = GitGraphData.load_from(repo, lazy=True)
+
+        assert data.extend(repo, [commit_ids[2]]) != data
+
+
+class TestGitGraphDataRefresh:
+    """
+    GitGraphData refresh test cases.
+
+    Covers loading new snapshots that share unchanged data with the previous one, and agreement with loading from scratch.
+    """
+
+    @pytest.fixture
+    def repo_path(self, repo_with_branches):
+        """Repository with main and feature branches and HEAD on main."""
+        repo_path, _ = repo_with_branches
+        pygit2.Repository(str(repo_path)).set_head("refs/heads/main")
+        return repo_path
+
+    @staticmethod
+    def _commit(repo_path, parent_id, ref="refs/heads/main"):
+        """Create a commit on top of parent_id and point ref to it."""
+        repo = pygit2.Repository(str(repo_path))
+        tree = repo.TreeBuilder().write()
+        author = pygit2.Signature("Test", "test@example.com")
+        return str(repo.create_commit(ref, author, author, "New", tree, [parent_id]))
+
+    @staticmethod
+    def _assert_matches_scratch(data, repo, **kwargs):
+        """Check a refreshed snapshot against one loaded from scratch."""
+        scratch = GitGraphData.load_from(repo, **kwargs)
+        assert set(data.commits) == set(scratch.commits)
+        assert data.branches == scratch.branches
+        assert data.tags == scratch.tags
+        assert data.head_info == scratch.head_info
+        assert data.boundary_ids == scratch.boundary_ids
+
+    def test_refresh_shares_unchanged_data(self, repo_path, repo_with_branches):
+        """
+        Refresh after adding a commit to main.
+
+        Keeps commit objects and unchanged branches of the previous snapshot, which itself is unchanged.
+        """
+        _, commit_ids = repo_with_branches
+        repo = GitRepository(repo_path)
+        data = GitGraphData.load_from(repo)
+        new_id = self._commit(repo_path, commit_ids[1])
+        repo.reload()
+
+        refreshed = data.refresh(repo)
+
+        assert new_id in refreshed.commits
+        assert new_id not in data.commits
+        assert refreshed.commits[commit_ids[0]] is data.commits[commit_ids[0]]
+        feature = "refs/heads/feature"
+        assert refreshed.branches[feature] is data.branches[feature]
+        assert refreshed.commits.get_changes_since(data.commits) == ([new_id], [])
+        self._assert_matches_scratch(refreshed, repo)
+
+    def test_refresh_removes_unreachable_commits(self, repo_path, repo_with_branches):
+        """
+        Refresh after deleting a branch.
+
+        Removes the commits only reachable from the deleted branch.
+        """
+        _, commit_ids = repo_with_branches
+        repo = GitRepository(repo_path)
+        data = GitGraphData.load_from(repo)
+        pygit2.Repository(str(repo_path)).references.delete("refs/heads/feature")
+        repo.reload()
+
+        refreshed = data.refresh(repo)
+
+        assert commit_ids[2] not in refreshed.commits
+        assert commit_ids[2] in data.commits
+        assert refreshed.commits.get_changes_since(data.commits) == (
+            [],
+            [commit_ids[2]],
+        )
+        self._assert_matches_scratch(refreshed, repo)
+
+    def test_refresh_sequence_matches_scratch(self, repo_path, repo_with_branches):
+        """
+        Refresh after each of a series of reference updates.
+
+        Every refreshed snapshot has the same content as one loaded from scratch.
+        """
+        _, commit_ids = repo_with_branches
+        repo = GitRepository(repo_path)
+        raw = pygit2.Repository(str(repo_path))
+        data = GitGraphData.load_from(repo)
+
+        def reset_main():
+            raw.references["refs/heads/main"].set_target(commit_ids[0])
+
+        def restore_feature():
+            raw.references.create("refs/heads/feature", commit_ids[2], force=True)
+
+        updates = [
+            lambda: self._commit(repo_path, commit_ids[1]),
+            lambda: raw.references.delete("refs/heads/feature"),
+            reset_main,
+            lambda: raw.references.create("refs/tags/v1", commit_ids[0]),
+            restore_feature,
+            lambda: self._commit(repo_path, commit_ids[2], "refs/heads/feature"),
+        ]
+        for update in updates:
+            update()
+            repo.reload()
+            data = data.refresh(repo)
+            self._assert_matches_scratch(data, repo)
+
+    def test_refresh_bounded_history(self, repo_with_history):
+        """
+        Refresh a bounded snapshot after adding a commit.
+
+        Walks only the new commit and keeps the previous boundary.
+        """
+        repo_path, commit_ids = repo_with_history
+        repo = GitRepository(repo_path)
+        data = GitGraphData.load_from(repo, max_commits=2)
+        new_id = self._commit(repo_path, commit_ids[-1])
+        repo.reload()
+
+        refreshed = data.refresh(repo, max_commits=2)
+
+        assert set(refreshed.commits) == {new_id, commit_ids[4], commit_ids[3]}
+        assert refreshed.boundary_ids == {commit_ids[3]}
+
+    def test_refresh_lazy_keeps_loaded_refs(self, repo_path, repo_with_branches):
+        """
+        Refresh a lazily loaded snapshot whose feature history was loaded.
+
+        Keeps the loaded history without walking other references.
+        """
+        _, commit_ids = repo_with_branches
+        repo = GitRepository(repo_path)
+        data = GitGraphData.load_from(repo, lazy=True).extend(repo, [commit_ids[2]])
+        self._commit(repo_path, commit_ids[1])
+        repo.reload()
+
+        refreshed = data.refresh(repo, lazy=True)
+
+        assert commit_ids[2] in refreshed.commits
+        assert refreshed.pending_ids == []
+
+
+class TestGitGraphDataColumns:
+    """
+    GitGraphData columnar export test cases.
+
+    Covers loading columns straight from commit headers.
+    """
+
+    @pytest.mark.parametrize("bounds", [{}, {"max_commits": 3}, {"since": 1234567892}])
+    def test_load_columns_matches_loaded_data(self, repo_with_history, bounds):
+        """
+        Load the columns of a repository with and without history bounds.
+
+        Holds the same rows, parents, times, authors and reference tips as the columns of loaded graph data.
+        """
+        repo_path, _ = repo_with_history
+        repo = GitRepository(repo_path)
+
+        columns = GitGraphData.load_columns(repo, **bounds)
+        expected = GitGraphData.load_from(repo, **bounds).to_columns(repo.identities)
+
+        assert len(columns) == len(expected)
+        assert columns.oids == expected.oids
+        assert list(columns.parent_offsets) == list(expected.parent_offsets)
+        assert list(columns.parent_rows) == list(expected.parent_rows)
+        assert list(columns.commit_times) == list(expected.commit_times)
+        assert [columns.authors[i] for i in columns.author_ids] == [
+            expected.authors[i] for i in expected.author_ids
+        ]
+        assert dict(zip(columns.ref_names, columns.ref_rows)) == dict(
+            zip(expected.ref_names, expected.ref_rows)
+        )
+
+    def test_load_columns_builds_no_commits(self, repo_with_merge, monkeypatch):
+        """
+        Load the columns of a repository with a merge.
+
+        Never converts a commit to a model.
+        """
+        repo_path, commits = repo_with_merge
+        monkeypatch.setattr(
+            "gittergraph.access.commit_access.CommitAccess.to_model",
+            lambda *args: pytest.fail("Commit model built"),
+        )
+
+        columns = GitGraphData.load_columns(GitRepository(repo_path))
+
+        rows = {columns.get_oid(row).hex(): row for row in range(len(columns))}
+        merge_row = rows[commits["merge"]]
+        assert set(rows) == set(commits.values())
+        assert list(
+            columns.parent_rows[
+                columns.parent_offsets[merge_row] : columns.parent_offsets[
+                    merge_row + 1
+                ]
+            ]
+        ) == [rows[commits["main2"]], rows[commits["feature1"]]]
@@ -0,0 +1,124 @@
+"""
+Tests for loading graph data in a loader process.
+
+Covers handing commits over through a commit table and loading a GitGraph with the loader process option.
+"""
+
+import pygit2
+
+from gittergraph.access import GitRepository
+from gittergraph.core import GitGraph, GraphOptions
+from gittergraph.core.graph_data import GitGraphData
+from gittergraph.core.graph_loader import load_in_process, walk_in_process
+
+
+class TestLoadInProcess:
+    """
+    load_in_process test cases.
+
+    Covers equivalence with loading in the calling process and cleanup of the table file.
+    """
+
+    def test_matches_loading_in_process(
+        self, repo_with_branches, tmp_path, monkeypatch
+    ):
+        """
+        Load a repository with branches in a loader process.
+
+        Returns the same snapshot as loading in the calling process, with commits decoded from the table, and removes the table file.
+        """
+        repo_path, commit_ids = repo_with_branches
+        table_dir = tmp_path / "tables"
+        table_dir.mkdir()
+        monkeypatch.setattr(
+            "gittergraph.core.graph_loader._get_table_dir", lambda: str(table_dir)
+        )
+        repo = GitRepository(repo_path)
+
+        data = load_in_process(repo, GraphOptions())
+        expected = GitGraphData.load_from(GitRepository(repo_path))
+
+        assert list(data.commits) == list(expected.commits)
+        assert data.commits.cached_count == 0
+        assert [data.commits[commit_id] for commit_id in commit_ids] == [
+            expected.commits[commit_id] for commit_id in commit_ids
+        ]
+        assert data.branches == expected.branches
+        assert data.head_info == expected.head_info
+        assert data.walked_ids == expected.walked_ids
+        assert data == expected
+        assert not list(table_dir.iterdir())
+
+    def test_graph_with_loader_process(self, repo_with_history, monkeypatch):
+        """
+        Create a graph with the loader process option and add a commit.
+
+        Loads the history and picks up the new commit on reload, walking it in a loader process.
+        """
+        repo_path, commit_ids = repo_with_history
+        walks = []
+
+        def recording_walk(repo, *args):
+            walks.append(args)
+            return walk_in_process(repo, *args)
+
+        monkeypatch.setattr("gittergraph.core.graph.walk_in_process", recording_walk)
+        graph = GitGraph.from_path(repo_path, GraphOptions(loader_process=True))
+
+        assert [
+            commit.id for commit in graph.get_linear_history("refs/heads/main")
+        ] == list(reversed(commit_ids))
+
+        repo = pygit2.Repository(str(repo_path))
+        author = pygit2.Signature("Test", "test@example.com")
+        new_commit_id = str(
+            repo.create_commit(
+                "refs/heads/main",
+                author,
+                author,
+                "New commit",
+                repo.TreeBuilder().write(),
+                [commit_ids[-1]],
+            )
+        )
+        changes = graph.reload()
+
+        assert changes.added_commits == {new_commit_id}
+        assert len(walks) == 1
+        assert graph.data.commits[new_commit_id].message == "New commit"
+        assert graph.data.commits[commit_ids[0]].message == "Commit 0"
+
+
+class TestWalkInProcess:
+    """
+    walk_in_process test cases.
+
+    Covers equivalence with walking in the calling process.
+    """
+
+    def test_matches_walking_in_process(self, repo_with_merge):
+        """
+        Walk the history of a merge in a loader process, excluding the feature branch.
+
+        Returns the same commits as CommitAccess.iter_all, with identities from the repository's pool.
+        """
+        repo_path, commits = repo_with_merge
+        repo = GitRepository(repo_path)
+
+        walked = list(walk_in_process(repo, [commits["merge"]], [commits["feature1"]]))
+        expected = list(
+            GitRepository(repo_path).commits.iter_all(
+                [commits["merge"]], [commits["feature1"]]
+            )
+        )
+
+        assert sorted(commit.id for commit in walked) == sorted(
+            commit.id for commit in expected
+        )
+        assert {commit.id: commit for commit in walked} == {
+            commit.id: commit for commit in expected
+        }
+        assert repo.identities.get_identity(walked[0].author_identity) == (
+            "Test",
+            "test@example.com",
+        )
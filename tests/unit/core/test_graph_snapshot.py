@@ -0,0 +1,141 @@
+"""
+Tests for GraphSnapshot class.
+
+Covers pinning snapshots across reloads, snapshot versions, and readers running concurrently with reloads.
+"""
+
+import threading
+
+import pygit2
+
+from gittergraph.core import GitGraph, GraphOptions
+from tests.unit.core.core_helper import get_git_graph
+
+
+def _commit(repo: pygit2.Repository, ref: str, message: str, parent: str) -> str:
+    """
+    Create an empty commit on a reference.
+
+    Returns the new commit ID.
+    """
+    author = pygit2.Signature("Test", "test@example.com")
+    return str(
+        repo.create_commit(
+            ref, author, author, message, repo.TreeBuilder().write(), [parent]
+        )
+    )
+
+
+class TestGraphSnapshot:
+    """
+    GraphSnapshot test cases.
+
+    Covers isolation of pinned snapshots from later versions.
+    """
+
+    def test_pinned_snapshot_unchanged_by_reload(self, repo_with_branches):
+        """
+        Pin a snapshot, then move a branch, add a tag, and reload.
+
+        The pinned snapshot keeps its data and lookups, while the graph answers from the new version.
+        """
+        repo_path, commit_ids = repo_with_branches
+        graph = get_git_graph(repo_path)
+        pinned = graph.snapshot
+
+        repo = pygit2.Repository(str(repo_path))
+        new_id = _commit(repo, "refs/heads/main", "New commit", commit_ids[1])
+        repo.references.create("refs/tags/v1", commit_ids[0])
+
+        assert graph.reload()
+
+        assert pinned.resolve("refs/heads/main") == commit_ids[1]
+        assert [b.name for b in pinned.get_branches_at_commit(commit_ids[1])] == [
+            "refs/heads/main"
+        ]
+        assert pinned.get_branches_at_commit(new_id) == []
+        assert pinned.get_tags_at_commit(commit_ids[0]) == []
+        assert new_id not in pinned.data.commits
+        assert [c.id for c in pinned.get_linear_history("refs/heads/main")] == [
+            commit_ids[1],
+            commit_ids[0],
+        ]
+
+        assert graph.resolve("refs/heads/main") == new_id
+        assert graph.get_branches_at_commit(commit_ids[1]) == []
+        assert [t.name for t in graph.get_tags_at_commit(commit_ids[0])] == [
+            "refs/tags/v1"
+        ]
+
+    def test_versions_increase(self, repo_with_history):
+        """
+        Load more history and reload a bounded graph.
+
+        Publishes a new version for each change, and keeps the version when nothing was loaded.
+        """
+        repo_path, commit_ids = repo_with_history
+        graph = GitGraph.from_path(repo_path, GraphOptions(max_commits=2))
+        first = graph.snapshot
+
+        assert graph.load_more() == 2
+        second = graph.snapshot
+        assert graph.load_more() == 1
+        third = graph.snapshot
+        assert graph.load_more() == 0
+
+        assert (first.version, second.version, third.version) == (0, 1, 2)
+        assert graph.snapshot is third
+        assert len(first.data.commits) == 2
+        assert first.is_truncated("refs/heads/main")
+        assert not third.is_truncated("refs/heads/main")
+
+        repo = pygit2.Repository(str(repo_path))
+        _commit(repo, "refs/heads/main", "New commit", commit_ids[-1])
+        graph.reload()
+
+        assert graph.snapshot.version == 3
+
+    def test_readers_see_consistent_snapshots(self, repo_with_branches):
+        """
+        Query pinned snapshots on a thread while the main thread keeps committing and reloading.
+
+        Every snapshot resolves its branches to loaded commits indexed at their targets, and versions never go backwards.
+        """
+        repo_path, commit_ids = repo_with_branches
+        graph = get_git_graph(repo_path)
+        done = threading.Event()
+        errors = []
+
+        def read():
+            version = -1
+            while not done.is_set():
+                snapshot = graph.snapshot
+                try:
+                    assert snapshot.version >= version
+                    version = snapshot.version
+                    for name, branch in snapshot.data.branches.items():
+                        assert snapshot.resolve(name) == branch.target_id
+                        assert branch.target_id in snapshot.data.commits
+                        assert branch in snapshot.get_branches_at_commit(
+                            branch.target_id
+                        )
+                    history = snapshot.get_linear_history("refs/heads/main")
+                    assert history[-1].id == commit_ids[0]
+                except AssertionError as error:  # pragma: no cover
+                    errors.append(error)
+                    return
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        try:
+            repo = pygit2.Repository(str(repo_path))
+            parent = commit_ids[1]
+            for i in range(20):
+                parent = _commit(repo, "refs/heads/main", f"Commit {i}", parent)
+                assert graph.reload()
+        finally:
+            done.set()
+            reader.join()
+
+        assert not errors
+        assert graph.snapshot.version == 20
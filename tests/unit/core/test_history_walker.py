@@ -7,6 +7,7 @@ Tests commit history traversal functionality, including linear history walking a
 
 import pytest
 
+from gittergraph.core.history_walker import HistoryWalker
 from tests.unit.core.core_helper import get_history_walker
 
 
@@ -151,3 +152,42 @@ class TestHistoryWalker:
         assert len(history) == expected_length
         # First commit in history should be the starting commit
         assert history[0].id == commit_ids[start_index]
+
+    def test_is_truncated_at_root(self, repo_with_history):
+        """
+        Check truncation of a complete history.
+
+        Returns False when the chain ends at a root commit.
+        """
+        repo_path, commit_ids = repo_with_history
+        walker = get_history_walker(repo_path)
+
+        assert walker.is_truncated(commit_ids[4]) is False
+
+    def test_is_truncated_at_boundary(self, repo_with_history):
+        """
+        Check truncation of a partially loaded history.
+
+        Returns True when the chain ends at a commit whose parent is not loaded.
+        """
+        repo_path, commit_ids = repo_with_history
+        commits = get_history_walker(repo_path).commits
+        walker = HistoryWalker({cid: commits[cid] for cid in commit_ids[2:]})
+
+        assert walker.is_truncated(commit_ids[4]) is True
+        assert walker.is_truncated(commit_ids[0]) is False
+
+    def test_is_ancestor_through_merge(self, repo_with_merge):
+        """
+        Check ancestry in a repository with a merge.
+
+        Follows all parents, counts a commit as its own ancestor, and never walks towards descendants.
+        """
+        repo_path, commit_ids = repo_with_merge
+        walker = get_history_walker(repo_path)
+
+        assert walker.is_ancestor(commit_ids["feature1"], commit_ids["merge"])
+        assert walker.is_ancestor(commit_ids["base"], commit_ids["merge"])
+        assert walker.is_ancestor(commit_ids["main2"], commit_ids["main2"])
+        assert not walker.is_ancestor(commit_ids["merge"], commit_ids["base"])
+        assert not walker.is_ancestor(commit_ids["feature1"], commit_ids["main2"])
@@ -5,9 +5,15 @@ RefIndex tests.
 Unit tests for the RefIndex class, covering branch and tag indexing, lookup, and edge cases for various repository structures.
 """
 
+import random
+
+import pygit2
 import pytest
 
-from tests.unit.core.core_helper import get_ref_index
+from gittergraph.core.graph_change_set import GraphChangeSet, RefChanges
+from gittergraph.core.ref_index import RefIndex
+from tests.make_models_helper import make_branch, make_tag
+from tests.unit.core.core_helper import get_git_graph, get_ref_index
 
 
 class TestRefIndex:
@@ -209,3 +215,133 @@ class TestRefIndex:
         branch_names_c2 = {branch.name for branch in result_c2}
         assert "refs/heads/develop" in branch_names_c2
         assert "refs/remotes/origin/develop" in branch_names_c2
+
+
+def _assert_matches_scratch(index, branches, tags, commit_ids):
+    """
+    Check an index against one built from scratch.
+
+    Compares branch and tag lookups for every given commit ID.
+    """
+    scratch = RefIndex(branches, tags)
+    for commit_id in commit_ids:
+        assert index.get_branches_at_commit(
+            commit_id
+        ) == scratch.get_branches_at_commit(commit_id)
+        assert index.get_tags_at_commit(commit_id) == scratch.get_tags_at_commit(
+            commit_id
+        )
+
+
+def _mutate_refs(rng, refs, make_ref, prefix, commit_ids):
+    """
+    Randomly add, remove, and move references.
+
+    Returns a new map in name order, as references are listed by the repository.
+    """
+    refs = dict(refs)
+    for _ in range(rng.randint(1, 6)):
+        name = f"{prefix}{rng.randint(0, 24)}"
+        if name in refs and rng.random() < 0.5:
+            del refs[name]
+        else:
+            refs[name] = make_ref(name=name, target_id=rng.choice(commit_ids))
+    return dict(sorted(refs.items()))
+
+
+class TestRefIndexIncremental:
+    """
+    RefIndex incremental update test cases.
+
+    Checks that applying reference changes always gives the same index as a build from scratch.
+    """
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_random_changes_match_scratch(self, seed):
+        """
+        Apply random sequences of reference changes.
+
+        Returns the same lookups as an index built from the final references after every step.
+        """
+        rng = random.Random(seed)
+        commit_ids = [f"{i:040x}" for i in range(8)]
+        branches = {}
+        tags = {}
+        index = RefIndex(branches, tags)
+
+        for _ in range(30):
+            new_branches = _mutate_refs(
+                rng, branches, make_branch, "refs/heads/b", commit_ids
+            )
+            new_tags = _mutate_refs(rng, tags, make_tag, "refs/tags/t", commit_ids)
+            changes = GraphChangeSet(
+                branches=RefChanges.between(branches, new_branches),
+                tags=RefChanges.between(tags, new_tags),
+            )
+
+            index = index.updated(new_branches, new_tags, changes)
+            branches, tags = new_branches, new_tags
+
+            _assert_matches_scratch(index, branches, tags, commit_ids)
+
+    def test_updated_leaves_index_unchanged(self):
+        """
+        Move a branch away from a commit after looking it up.
+
+        Leaves the original index and the previously returned list unchanged.
+        """
+        main = make_branch(name="refs/heads/main", target_id="a")
+        index = RefIndex({main.name: main}, {})
+        before = index.get_branches_at_commit("a")
+
+        moved = make_branch(name="refs/heads/main", target_id="b")
+        updated = index.updated(
+            {moved.name: moved},
+            {},
+            GraphChangeSet(branches=RefChanges(moved=(moved.name,))),
+        )
+
+        assert before == [main]
+        assert index.get_branches_at_commit("a") == [main]
+        assert index.get_branches_at_commit("b") == []
+        assert updated.get_branches_at_commit("a") == []
+        assert updated.get_branches_at_commit("b") == [moved]
+
+    def test_refs_at_commit_are_ordered_by_name(self):
+        """
+        Index references listed out of name order.
+
+        Returns the references at a commit ordered by name.
+        """
+        tags = {
+            name: make_tag(name=name, target_id="a")
+            for name in ("refs/tags/v2", "refs/tags/v1", "refs/tags/v3")
+        }
+        index = RefIndex({}, tags)
+
+        assert [tag.name for tag in index.get_tags_at_commit("a")] == [
+            "refs/tags/v1",
+            "refs/tags/v2",
+            "refs/tags/v3",
+        ]
+
+    def test_graph_reload_matches_scratch(self, repo_with_branches):
+        """
+        Reload a graph after creating, moving, and deleting references.
+
+        Returns the same lookups as an index built from the reloaded data.
+        """
+        repo_path, commit_ids = repo_with_branches
+        graph = get_git_graph(repo_path)
+
+        repo = pygit2.Repository(str(repo_path))
+        repo.references.create("refs/heads/topic", commit_ids[0])
+        repo.references["refs/heads/main"].set_target(commit_ids[0])
+        repo.references.delete("refs/heads/feature")
+        repo.references.create("refs/tags/v1", commit_ids[1])
+
+        assert graph.reload()
+
+        _assert_matches_scratch(
+            graph.snapshot._ref_index, graph.data.branches, graph.data.tags, commit_ids
+        )
@@ -0,0 +1,193 @@
+"""
+Tests for Workspace class.
+
+Covers concurrent loading with progress, failures of single repositories, and dropping inactive graphs to their summaries.
+"""
+
+import threading
+import time
+
+import pygit2
+import pytest
+
+from gittergraph.core import GitGraph, LoadState, RepositorySummary, Workspace
+
+
+def _create_repo(path, commit_count):
+    """
+    Create a repository with a linear history on main.
+
+    HEAD points to main.
+    """
+    repo = pygit2.init_repository(str(path))
+    author = pygit2.Signature("Test", "test@example.com")
+    parents = []
+    for i in range(commit_count):
+        parents = [
+            repo.create_commit(
+                "refs/heads/main",
+                author,
+                author,
+                f"Commit {i}",
+                repo.TreeBuilder().write(),
+                parents,
+            )
+        ]
+    repo.set_head("refs/heads/main")
+
+
+class TestWorkspace:
+    """
+    Workspace test cases.
+
+    Covers loading all repositories of a workspace and opening single ones.
+    """
+
+    @pytest.fixture
+    def workspace_dir(self, tmp_path):
+        """Directory with three repositories, one of them broken."""
+        root = tmp_path / "workspace"
+        _create_repo(root / "alpha", 1)
+        _create_repo(root / "group" / "beta", 3)
+        (root / "broken" / ".git").mkdir(parents=True)
+        return root
+
+    def test_load_all_reports_progress(self, workspace_dir):
+        """
+        Load all repositories of a workspace.
+
+        Reports each repository as loading, then loaded with its summary or failed with its error, and keeps no graphs.
+        """
+        workspace = Workspace(workspace_dir)
+        progress = []
+        lock = threading.Lock()
+
+        def on_progress(summary):
+            with lock:
+                progress.append(summary)
+
+        assert workspace.summaries[workspace_dir / "alpha"] == RepositorySummary(
+            workspace_dir / "alpha"
+        )
+
+        workspace.load_all(on_progress)
+
+        assert workspace.paths == [
+            workspace_dir / "alpha",
+            workspace_dir / "broken",
+            workspace_dir / "group" / "beta",
+        ]
+        for path in workspace.paths:
+            states = [summary.state for summary in progress if summary.path == path]
+            assert states[0] == LoadState.LOADING
+            assert len(states) == 2
+        beta = workspace.summaries[workspace_dir / "group" / "beta"]
+        assert beta.state == LoadState.LOADED
+        assert beta.name == "beta"
+        assert (beta.head, beta.commit_count, beta.branch_count) == ("main", 3, 1)
+        broken = workspace.summaries[workspace_dir / "broken"]
+        assert broken.state == LoadState.FAILED
+        assert broken.error
+        assert not any(workspace.is_open(path) for path in workspace.paths)
+
+    def test_loads_are_bounded(self, workspace_dir, monkeypatch):
+        """
+        Load a workspace with a single worker.
+
+        Never loads more than one repository at a time.
+        """
+        running = []
+        peak = []
+        lock = threading.Lock()
+        original = GitGraph.from_path
+
+        def slow_from_path(path, options=None):
+            with lock:
+                running.append(path)
+                peak.append(len(running))
+            time.sleep(0.02)
+            with lock:
+                running.remove(path)
+            return original(path, options)
+
+        monkeypatch.setattr(GitGraph, "from_path", slow_from_path)
+
+        Workspace(workspace_dir, max_workers=1).load_all()
+
+        assert peak == [1, 1, 1]
+
+    def test_open_waits_for_load_in_progress(self, workspace_dir, monkeypatch):
+        """
+        Open a repository while loading all repositories is loading it.
+
+        Waits for that load instead of loading the repository again, and keeps its graph with the loaded summary.
+        """
+        alpha = workspace_dir / "alpha"
+        started = threading.Event()
+        release = threading.Event()
+        loads = []
+        original = GitGraph.from_path
+
+        def blocking_from_path(path, options=None):
+            loads.append(path)
+            if path == alpha:
+                started.set()
+                release.wait(5)
+            return original(path, options)
+
+        monkeypatch.setattr(GitGraph, "from_path", blocking_from_path)
+        workspace = Workspace(workspace_dir, max_workers=1)
+        opened = []
+
+        loader = threading.Thread(target=workspace.load_all)
+        loader.start()
+        assert started.wait(5)
+        opener = threading.Thread(target=lambda: opened.append(workspace.open(alpha)))
+        opener.start()
+        # Give the opener time to find the load in progress
+        time.sleep(0.05)
+        release.set()
+        opener.join(5)
+        loader.join(5)
+
+        assert loads.count(alpha) == 1
+        assert opened[0] is not None
+        assert workspace.is_open(alpha)
+        assert workspace.summaries[alpha].state == LoadState.LOADED
+
+    def test_open_drops_inactive_graphs(self, workspace_dir):
+        """
+        Open two repositories of a workspace keeping one graph, then the first again.
+
+        Keeps only the most recently opened graph, and loads a dropped one again when reopened.
+        """
+        alpha = workspace_dir / "alpha"
+        beta = workspace_dir / "group" / "beta"
+        workspace = Workspace(workspace_dir, max_open=1)
+        loads = []
+
+        alpha_graph = workspace.open(alpha, loads.append)
+        assert workspace.open(alpha) is alpha_graph
+        beta_graph = workspace.open(beta, loads.append)
+
+        assert not workspace.is_open(alpha)
+        assert workspace.is_open(beta)
+        assert workspace.summaries[alpha].state == LoadState.LOADED
+
+        reopened = workspace.open(alpha, loads.append)
+
+        assert reopened is not alpha_graph
+        assert not workspace.is_open(beta)
+        assert [(summary.path, summary.state) for summary in loads] == [
+            (alpha, LoadState.LOADING),
+            (alpha, LoadState.LOADED),
+            (beta, LoadState.LOADING),
+            (beta, LoadState.LOADED),
+            (alpha, LoadState.LOADING),
+            (alpha, LoadState.LOADED),
+        ]
+        assert beta_graph.data.commits
+        assert workspace.open(workspace_dir / "broken") is None
+
+        workspace.close()
+        assert not workspace.is_open(alpha)
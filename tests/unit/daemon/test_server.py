@@ -0,0 +1,266 @@
+"""
+Tests for GraphDaemon class.
+
+Covers answering queries over the daemon socket, taking over the daemon's graph data, and socket handling.
+"""
+
+import shutil
+import stat
+
+import pygit2
+import pytest
+
+from gittergraph.access.daemon_client import DaemonClient, get_socket_path
+from gittergraph.core import GitGraph, GraphOptions
+from gittergraph.daemon import GraphDaemon
+
+
+class TestGraphDaemon:
+    """
+    GraphDaemon test cases.
+
+    Covers queries, errors, snapshots, and stale or busy sockets.
+    """
+
+    @pytest.fixture
+    def daemon(self, repo_with_branches):
+        """Running daemon for a repository with main and feature branches."""
+        repo_path, _ = repo_with_branches
+        graph_daemon = GraphDaemon(
+            GitGraph.from_path(repo_path, GraphOptions(use_daemon=False))
+        )
+        graph_daemon.start()
+        yield graph_daemon
+        graph_daemon.stop()
+
+    @pytest.fixture
+    def client(self, daemon):
+        """Client connected to the running daemon."""
+        daemon_client = DaemonClient.connect(daemon.socket_path)
+        yield daemon_client
+        daemon_client.close()
+
+    def test_queries(self, client, repo_with_branches):
+        """
+        Send each kind of query.
+
+        Answers with the same results as the graph itself.
+        """
+        repo_path, commit_ids = repo_with_branches
+
+        assert client.ping()["path"] == str(repo_path)
+        assert client.resolve("refs/heads/feature") == commit_ids[2]
+        assert client.resolve("nonexistent") is None
+        assert [
+            commit.id
+            for commit in client.get_linear_history("refs/heads/feature", offset=1)
+        ] == [commit_ids[1], commit_ids[0]]
+        assert [
+            commit.message
+            for commit in client.get_linear_history("refs/heads/feature", limit=1)
+        ] == ["Feature commit"]
+        assert client.is_ancestor("refs/heads/main", "refs/heads/feature")
+        assert not client.is_ancestor("refs/heads/feature", "refs/heads/main")
+        assert [commit.id for commit in client.search("FEATURE")] == [commit_ids[2]]
+        assert client.get_decorations(commit_ids[2]) == (["refs/heads/feature"], [])
+
+    def test_errors_keep_connection_open(self, client):
+        """
+        Send an unknown operation and a request without parameters.
+
+        Raises ValueError for both, and later requests are still answered.
+        """
+        with pytest.raises(ValueError, match="Unknown operation"):
+            client.request("frobnicate")
+        with pytest.raises(ValueError, match="KeyError"):
+            client.request("resolve")
+
+        assert client.resolve("nonexistent") is None
+
+    def test_graph_takes_over_daemon_data(self, daemon, client, repo_with_branches):
+        """
+        Create a graph for the repository the daemon serves.
+
+        Maps the daemon's commit table instead of loading, and sees a new table after the daemon reloads.
+        """
+        repo_path, commit_ids = repo_with_branches
+
+        graph = GitGraph.from_path(repo_path)
+
+        assert graph.data == daemon.graph.data
+        assert graph.data.commits.cached_count == 0
+        assert graph.data.branches == daemon.graph.data.branches
+        assert graph.get_linear_history("refs/heads/feature")[0].message == (
+            "Feature commit"
+        )
+
+        table = client.get_snapshot()["table"]
+        self._add_commit(repo_path, commit_ids[1])
+        daemon._on_reload(daemon.graph.reload())
+
+        assert client.get_snapshot()["table"] != table
+        assert len(GitGraph.from_path(repo_path).data.commits) == 4
+
+    def test_snapshot_written_in_background(self, daemon, client, repo_with_branches):
+        """
+        Request the commit table after the graph data changed without a reload.
+
+        Answers with the previous table at once, while the new one is written in the background.
+        """
+        repo_path, commit_ids = repo_with_branches
+        table = client.get_snapshot()["table"]
+        self._add_commit(repo_path, commit_ids[1])
+        daemon.graph.reload()
+
+        assert client.get_snapshot()["table"] == table
+
+        daemon.publish()
+
+        assert client.get_snapshot()["table"] != table
+
+    def test_snapshot_copies_previous_table(self, repo_with_branches):
+        """
+        Rewrite the commit table of a daemon whose payloads do not fit its budget.
+
+        Copies the commits of the previous table instead of decoding them through the commit store again.
+        """
+        repo_path, commit_ids = repo_with_branches
+        graph_daemon = GraphDaemon(
+            GitGraph.from_path(
+                repo_path, GraphOptions(use_daemon=False, memory_budget=1)
+            )
+        )
+        graph_daemon.start()
+        try:
+            self._add_commit(repo_path, commit_ids[1])
+            graph_daemon.graph.reload()
+            misses = graph_daemon.graph.data.commits.stats.misses
+
+            graph_daemon.publish()
+
+            assert graph_daemon.graph.data.commits.stats.misses <= misses + 1
+            assert len(GitGraph.from_path(repo_path).data.commits) == 4
+        finally:
+            graph_daemon.stop()
+
+    def test_socket_is_private(self, daemon):
+        """
+        Check the permissions of a running daemon's socket.
+
+        Neither the socket nor its directory are accessible to others.
+        """
+        assert stat.S_IMODE(daemon.socket_path.stat().st_mode) & 0o077 == 0
+        assert stat.S_IMODE(daemon.socket_path.parent.stat().st_mode) == 0o700
+
+    def test_repository_must_match(self, daemon, repo_with_branches, tmp_path):
+        """
+        Create a graph while the daemon claims to serve another repository.
+
+        Loads the repository itself.
+        """
+        repo_path, _ = repo_with_branches
+        daemon._operations["ping"] = lambda _: {
+            **daemon._ping({}),
+            "path": str(tmp_path / "other"),
+        }
+
+        graph = GitGraph.from_path(repo_path)
+
+        assert graph.data == daemon.graph.data
+        assert graph.data.commits.cached_count > 0
+
+    def test_table_must_be_in_table_dir(self, daemon, repo_with_branches, tmp_path):
+        """
+        Create a graph while the daemon offers a table outside the table directory.
+
+        Loads the repository itself instead of mapping the table.
+        """
+        repo_path, _ = repo_with_branches
+        outside = tmp_path / "gittergraph-outside.table"
+
+        def get_snapshot(request):
+            snapshot = daemon._get_snapshot(request)
+            shutil.copy(snapshot["table"], outside)
+            return {**snapshot, "table": str(outside)}
+
+        daemon._operations["snapshot"] = get_snapshot
+
+        graph = GitGraph.from_path(repo_path)
+
+        assert graph.data == daemon.graph.data
+        assert graph.data.commits.cached_count > 0
+
+    def test_options_must_match(self, daemon, repo_with_branches):
+        """
+        Create a graph with a commit limit the daemon does not use.
+
+        Loads the repository itself.
+        """
+        repo_path, _ = repo_with_branches
+
+        graph = GitGraph.from_path(repo_path, GraphOptions(max_commits=1))
+
+        assert len(graph.data.commits) == 1
+
+    def test_second_daemon_refused(self, daemon):
+        """
+        Start another daemon on the same socket.
+
+        Raises FileExistsError.
+        """
+        with pytest.raises(FileExistsError):
+            GraphDaemon(daemon.graph).start()
+
+    def test_shared_socket_dir_refused(self, repo_with_branches):
+        """
+        Start a daemon whose socket directory others can write to.
+
+        Raises PermissionError without creating the socket.
+        """
+        repo_path, _ = repo_with_branches
+        socket_path = get_socket_path(repo_path)
+        socket_path.parent.mkdir(parents=True)
+        socket_path.parent.chmod(0o777)
+        graph_daemon = GraphDaemon(
+            GitGraph.from_path(repo_path, GraphOptions(use_daemon=False))
+        )
+
+        with pytest.raises(PermissionError):
+            graph_daemon.start()
+        assert not socket_path.exists()
+
+    def test_stale_socket_replaced(self, repo_with_branches):
+        """
+        Start a daemon where a stopped daemon left its socket behind.
+
+        Replaces the socket and removes it when stopped.
+        """
+        repo_path, _ = repo_with_branches
+        socket_path = get_socket_path(repo_path)
+        socket_path.parent.mkdir(mode=0o700, parents=True)
+        socket_path.touch()
+        graph_daemon = GraphDaemon(
+            GitGraph.from_path(repo_path, GraphOptions(use_daemon=False))
+        )
+
+        graph_daemon.start()
+        client = DaemonClient.connect(socket_path)
+
+        assert client is not None
+        client.close()
+        graph_daemon.stop()
+        assert not socket_path.exists()
+
+    @staticmethod
+    def _add_commit(repo_path, parent_id):
+        """Add a commit on top of a parent to the main branch."""
+        repo = pygit2.Repository(str(repo_path))
+        author = pygit2.Signature("Test", "test@example.com")
+        repo.create_commit(
+            "refs/heads/main",
+            author,
+            author,
+            "New commit",
+            repo.TreeBuilder().write(),
+            [parent_id],
+        )
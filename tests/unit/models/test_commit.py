@@ -106,3 +106,31 @@ def test_commit_author_is_committer(author, committer, expected):
         parent_ids=[],
     )
     assert c.author_is_committer is expected
+
+
+def test_commit_derived_fields_cached():
+    """
+    Test that derived display fields are computed once.
+
+    Checks that repeated access returns the cached objects and that caches are ignored by equality and repr.
+    """
+    c = Commit(
+        id="0123456789abcdef",
+        message="Subject\n\nBody",
+        author=make_signature(),
+        committer=make_signature(),
+        parent_ids=[],
+    )
+    short_message = c.short_message
+    short_id = c.short_id
+
+    assert c.short_message is short_message
+    assert c.short_id is short_id
+    assert c == Commit(
+        id="0123456789abcdef",
+        message="Subject\n\nBody",
+        author=make_signature(),
+        committer=make_signature(),
+        parent_ids=[],
+    )
+    assert "_short_message" not in repr(c)
@@ -0,0 +1,28 @@
+"""
+DiffStat model tests.
+
+Unit tests for the DiffStat dataclass and its properties.
+"""
+
+from gittergraph.models import DiffStat
+
+
+def test_files_changed_counts_paths():
+    """
+    Count changed files.
+
+    Returns the number of changed paths.
+    """
+    stat = DiffStat(insertions=1, deletions=2, paths=["a", "b", "c"])
+    assert stat.files_changed == 3
+
+
+def test_defaults_to_no_paths():
+    """
+    Create a DiffStat without paths.
+
+    Defaults to an empty path list.
+    """
+    stat = DiffStat(insertions=0, deletions=0)
+    assert stat.paths == []
+    assert stat.files_changed == 0
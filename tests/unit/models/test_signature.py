@@ -52,3 +52,18 @@ def test_signature_datetime(sig_args, expected_dt):
     dt = sig.datetime
     assert dt == expected_dt
     assert dt.tzinfo is not None
+
+
+def test_signature_derived_fields_cached():
+    """
+    Test that the datetime and date text are computed once.
+
+    Checks that repeated access returns the cached objects and that caches are ignored by equality.
+    """
+    sig = make_signature(time=3600, time_offset=60)
+    dt = sig.datetime
+
+    assert sig.datetime is dt
+    assert sig.date_text == "1970-01-01 02:00:00+01:00"
+    assert sig.date_text is sig.date_text
+    assert sig == make_signature(time=3600, time_offset=60)
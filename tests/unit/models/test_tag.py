@@ -1,13 +1,13 @@
 # @generated "all" ChatGPT-4.1
 """
-Tests for the Tag, LightweightTag, and AnnotatedTag models.
+Tests for the Tag and TagAnnotation models.
 
 Covers tag property logic including shorthand extraction and tag metadata.
 """
 
 import pytest
 
-from gittergraph.models import Tag
+from gittergraph.models import Tag, TagAnnotation
 
 
 @pytest.mark.parametrize(
@@ -26,3 +26,25 @@ def test_tag_shorthand(name, expected_shorthand):
     """
     t = Tag(target_id="id", name=name)
     assert t.shorthand == expected_shorthand
+
+
+def test_tag_is_annotated():
+    """
+    Test Tag is_annotated property.
+
+    Checks that only tags with a tag object ID are annotated.
+    """
+    assert Tag(target_id="id", name="refs/tags/v1", object_id="obj").is_annotated
+    assert not Tag(target_id="id", name="refs/tags/v1").is_annotated
+
+
+def test_tag_annotation_fields():
+    """
+    Test TagAnnotation fields.
+
+    Checks that name, tagger, and message are stored.
+    """
+    annotation = TagAnnotation(name="refs/tags/v1", tagger=None, message="Release")
+    assert annotation.name == "refs/tags/v1"
+    assert annotation.tagger is None
+    assert annotation.message == "Release"
@@ -12,6 +12,10 @@ import pytest
 
 from gittergraph import __version__
 from gittergraph.__main__ import main
+from gittergraph.access import RefFilter
+from gittergraph.access.commit_access import CommitAccess
+from gittergraph.core import GitGraph, GraphOptions
+from gittergraph.daemon import GraphDaemon
 
 
 def test_main_with_no_arguments(monkeypatch):
@@ -26,7 +30,7 @@ def test_main_with_no_arguments(monkeypatch):
     # Mock the run function
     run_called_with = None
 
-    def mock_run(repo_path=None):
+    def mock_run(repo_path=None, options=None):
         nonlocal run_called_with
         run_called_with = repo_path
 
@@ -49,7 +53,7 @@ def test_main_with_repo_path_argument(monkeypatch):
     # Mock the run function
     run_called_with = None
 
-    def mock_run(repo_path=None):
+    def mock_run(repo_path=None, options=None):
         nonlocal run_called_with
         run_called_with = repo_path
 
@@ -72,7 +76,7 @@ def test_main_with_relative_path(monkeypatch):
     # Mock the run function
     run_called_with = None
 
-    def mock_run(repo_path=None):
+    def mock_run(repo_path=None, options=None):
         nonlocal run_called_with
         run_called_with = repo_path
 
@@ -163,7 +167,7 @@ def test_main_calls_run_function(monkeypatch):
 
     run_called = False
 
-    def mock_run(repo_path=None):
+    def mock_run(repo_path=None, options=None):
         nonlocal run_called
         run_called = True
 
@@ -185,7 +189,7 @@ def test_main_handles_path_with_spaces(monkeypatch):
 
     run_called_with = None
 
-    def mock_run(repo_path=None):
+    def mock_run(repo_path=None, options=None):
         nonlocal run_called_with
         run_called_with = repo_path
 
@@ -207,7 +211,7 @@ def test_main_converts_string_to_path(monkeypatch):
 
     run_called_with = None
 
-    def mock_run(repo_path=None):
+    def mock_run(repo_path=None, options=None):
         nonlocal run_called_with
         run_called_with = repo_path
 
@@ -244,3 +248,425 @@ def test_main_if_name_main_block():
     source = inspect.getsource(main_module)
     assert 'if __name__ == "__main__"' in source
     assert "main()" in source
+
+
+def test_main_with_ref_filter_arguments(monkeypatch):
+    """
+    Test main() with reference filter arguments.
+
+    Checks that include and exclude globs are passed to run() as graph options.
+    """
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "gittergraph",
+            "--exclude-refs",
+            "refs/pull/*",
+            "--exclude-refs",
+            "refs/changes/*",
+            "--include-refs",
+            "refs/heads/*",
+        ],
+    )
+
+    run_options = None
+
+    def mock_run(repo_path=None, options=None):
+        nonlocal run_options
+        run_options = options
+
+    monkeypatch.setattr("gittergraph.__main__.run", mock_run)
+
+    main()
+
+    assert run_options == GraphOptions(
+        ref_filter=RefFilter(
+            include=("refs/heads/*",), exclude=("refs/pull/*", "refs/changes/*")
+        )
+    )
+
+
+def test_main_with_lazy_argument(monkeypatch):
+    """
+    Test main() with the --lazy flag.
+
+    Checks that lazy loading is enabled in the graph options.
+    """
+    monkeypatch.setattr(sys, "argv", ["gittergraph", "--lazy"])
+
+    run_options = None
+
+    def mock_run(repo_path=None, options=None):
+        nonlocal run_options
+        run_options = options
+
+    monkeypatch.setattr("gittergraph.__main__.run", mock_run)
+
+    main()
+
+    assert run_options is not None
+    assert run_options.lazy is True
+
+
+def test_main_with_history_bounds(monkeypatch):
+    """
+    Test main() with the --max-commits and --since options.
+
+    Checks that the bounds are parsed into the graph options.
+    """
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["gittergraph", "--max-commits", "100", "--since", "2021-01-01"],
+    )
+
+    run_options = None
+
+    def mock_run(repo_path=None, options=None):
+        nonlocal run_options
+        run_options = options
+
+    monkeypatch.setattr("gittergraph.__main__.run", mock_run)
+
+    main()
+
+    assert run_options is not None
+    assert run_options.max_commits == 100
+    assert run_options.since == 1609459200
+
+
+def test_main_with_invalid_since(monkeypatch):
+    """
+    Test main() with an invalid --since date.
+
+    Checks that argparse rejects the value.
+    """
+    monkeypatch.setattr(sys, "argv", ["gittergraph", "--since", "yesterday"])
+
+    with pytest.raises(SystemExit):
+        main()
+
+
+@pytest.mark.parametrize("max_commits", ["0", "-5", "ten"])
+def test_main_with_invalid_max_commits(monkeypatch, max_commits):
+    """
+    Test main() with a --max-commits value that is not a positive number.
+
+    Checks that argparse rejects the value.
+    """
+    monkeypatch.setattr(sys, "argv", ["gittergraph", "--max-commits", max_commits])
+
+    with pytest.raises(SystemExit):
+        main()
+
+
+def test_main_with_memory_budget(monkeypatch):
+    """
+    Test main() with the --memory-budget option.
+
+    Checks that the size is parsed into the graph options.
+    """
+    monkeypatch.setattr(sys, "argv", ["gittergraph", "--memory-budget", "64M"])
+
+    run_options = None
+
+    def mock_run(repo_path=None, options=None):
+        nonlocal run_options
+        run_options = options
+
+    monkeypatch.setattr("gittergraph.__main__.run", mock_run)
+
+    main()
+
+    assert run_options is not None
+    assert run_options.memory_budget == 64 * 1024 * 1024
+
+
+def test_main_with_watch(monkeypatch):
+    """
+    Test main() with the --watch option.
+
+    Checks that watch mode is enabled in the graph options.
+    """
+    monkeypatch.setattr(sys, "argv", ["gittergraph", "--watch"])
+
+    run_options = None
+
+    def mock_run(repo_path=None, options=None):
+        nonlocal run_options
+        run_options = options
+
+    monkeypatch.setattr("gittergraph.__main__.run", mock_run)
+
+    main()
+
+    assert run_options is not None
+    assert run_options.watch is True
+
+
+def test_main_with_backend(monkeypatch):
+    """
+    Test main() with the --backend option.
+
+    Checks that the backend name is passed in the graph options and defaults to the configured one.
+    """
+    run_options = []
+
+    def mock_run(repo_path=None, options=None):
+        run_options.append(options)
+
+    monkeypatch.setattr("gittergraph.__main__.run", mock_run)
+
+    monkeypatch.setattr(sys, "argv", ["gittergraph", "--backend", "git"])
+    main()
+    monkeypatch.setattr(sys, "argv", ["gittergraph"])
+    main()
+
+    assert [options.backend for options in run_options] == ["git", None]
+
+
+def test_main_with_jobs(monkeypatch):
+    """
+    Test main() with the --jobs option.
+
+    Checks that the thread count is passed in the graph options, and that 0 stands for one thread per CPU core.
+    """
+    run_options = []
+
+    def mock_run(repo_path=None, options=None):
+        run_options.append(options)
+
+    monkeypatch.setattr("gittergraph.__main__.run", mock_run)
+    monkeypatch.setattr("os.cpu_count", lambda: 32)
+
+    for jobs in ("4", "0"):
+        monkeypatch.setattr(sys, "argv", ["gittergraph", "--jobs", jobs])
+        main()
+
+    assert [options.jobs for options in run_options] == [4, 32]
+
+
+def test_main_with_loader_process(monkeypatch):
+    """
+    Test main() with the --loader-process option.
+
+    Checks that loading in a loader process is requested in the graph options, and off by default.
+    """
+    run_options = []
+
+    def mock_run(repo_path=None, options=None):
+        run_options.append(options)
+
+    monkeypatch.setattr("gittergraph.__main__.run", mock_run)
+
+    for argv in (["gittergraph", "--loader-process"], ["gittergraph"]):
+        monkeypatch.setattr(sys, "argv", argv)
+        main()
+
+    assert [options.loader_process for options in run_options] == [True, False]
+
+
+def test_main_with_daemon(monkeypatch):
+    """
+    Test main() with the --daemon and --no-daemon options.
+
+    Checks that --daemon serves the repository instead of running the interface, and that --no-daemon turns off taking over a daemon's data.
+    """
+    served = []
+    run_options = []
+
+    def mock_serve(repo_path, options):
+        served.append(repo_path)
+
+    def mock_run(repo_path=None, options=None):
+        run_options.append(options)
+
+    monkeypatch.setattr("gittergraph.__main__.serve", mock_serve)
+    monkeypatch.setattr("gittergraph.__main__.run", mock_run)
+
+    monkeypatch.setattr(sys, "argv", ["gittergraph", "--daemon"])
+    main()
+    monkeypatch.setattr(sys, "argv", ["gittergraph", "--no-daemon"])
+    main()
+
+    assert served == ["."]
+    assert [options.use_daemon for options in run_options] == [False]
+
+
+def test_main_with_workspace(monkeypatch):
+    """
+    Test main() with the --workspace option.
+
+    Checks that the workspace directory is passed to the interface.
+    """
+    run_calls = []
+
+    def mock_run(repo_path=None, options=None, workspace_path=None):
+        run_calls.append((repo_path, workspace_path))
+
+    monkeypatch.setattr("gittergraph.__main__.run", mock_run)
+    monkeypatch.setattr(sys, "argv", ["gittergraph", "--workspace", "/src"])
+
+    main()
+
+    assert run_calls == [(None, Path("/src"))]
+
+
+def test_main_log(monkeypatch, capsys, repo_with_history):
+    """
+    Test main() with the log subcommand.
+
+    Checks that history is written to standard output without starting the interface.
+    """
+    repo_path, commit_ids = repo_with_history
+    monkeypatch.setattr(
+        "gittergraph.__main__.run", lambda *args, **kwargs: pytest.fail()
+    )
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["gittergraph", "log", "refs/heads/main", "--repo", str(repo_path), "-n", "2"],
+    )
+
+    main()
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split()[0] for line in lines] == [
+        commit_ids[4][:7],
+        commit_ids[3][:7],
+    ]
+
+
+def test_main_help_lists_commands(monkeypatch, capsys):
+    """
+    Test that --help lists the commands.
+
+    Checks that log and export are shown along with how to open a directory named like a command.
+    """
+    monkeypatch.setattr(sys, "argv", ["gittergraph", "--help"])
+
+    with pytest.raises(SystemExit):
+        main()
+
+    captured = capsys.readouterr()
+    assert "gittergraph {log,export}" in captured.out
+    assert "  log " in captured.out
+    assert "  export " in captured.out
+    assert "'--'" in captured.out
+
+
+def test_main_with_repo_named_like_command(monkeypatch):
+    """
+    Test main() with a repository path named like a command after --.
+
+    Checks that run() is called with the path instead of running the command.
+    """
+    monkeypatch.setattr(sys, "argv", ["gittergraph", "--", "log"])
+    run_called_with = None
+
+    def mock_run(repo_path=None, options=None):
+        nonlocal run_called_with
+        run_called_with = repo_path
+
+    monkeypatch.setattr("gittergraph.__main__.run", mock_run)
+
+    main()
+
+    assert run_called_with == Path("log")
+
+
+def test_main_log_rejects_graph_with_json(monkeypatch, repo_with_history):
+    """
+    Test main() with the log subcommand and conflicting options.
+
+    Checks that graph lines cannot be combined with JSON output, and that unknown revisions are reported as usage errors.
+    """
+    repo_path, _ = repo_with_history
+    for arguments in (
+        ["--graph", "--format", "json"],
+        ["nope"],
+    ):
+        monkeypatch.setattr(
+            sys, "argv", ["gittergraph", "log", "--repo", str(repo_path), *arguments]
+        )
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+        assert exc_info.value.code == 2
+
+
+def test_main_log_reads_from_daemon(monkeypatch, capsys, repo_with_history):
+    """
+    Test main() with the log subcommand while a daemon serves the repository.
+
+    Checks that commits are read from the daemon's commit table rather than the repository, unless --no-daemon is given.
+    """
+    repo_path, commit_ids = repo_with_history
+    # Discovered like the log subcommand does, so both find the same socket
+    graph_daemon = GraphDaemon(
+        GitGraph.discover(repo_path, GraphOptions(use_daemon=False))
+    )
+    graph_daemon.start()
+    reads = []
+    original = CommitAccess.get
+
+    def counting_get(self, commit_id):
+        reads.append(commit_id)
+        return original(self, commit_id)
+
+    monkeypatch.setattr(CommitAccess, "get", counting_get)
+    try:
+        for arguments in ([], ["--no-daemon"]):
+            monkeypatch.setattr(
+                sys,
+                "argv",
+                [
+                    "gittergraph",
+                    "log",
+                    "refs/heads/main",
+                    "--full",
+                    "--repo",
+                    str(repo_path),
+                    *arguments,
+                ],
+            )
+            main()
+            lines = capsys.readouterr().out.splitlines()
+            assert [line.split()[0] for line in lines] == [
+                commit_id[:7] for commit_id in reversed(commit_ids)
+            ]
+            assert bool(reads) == bool(arguments)
+    finally:
+        graph_daemon.stop()
+
+
+def test_main_export(monkeypatch, capsys, repo_with_history):
+    """
+    Test main() with the export subcommand.
+
+    Checks that the commit graph is written to the output file in the format given by its suffix.
+    """
+    repo_path, _ = repo_with_history
+    exported = []
+
+    def mock_write_columns(columns, path, file_format, compress):
+        exported.append((len(columns), path, file_format, compress))
+
+    monkeypatch.setattr("gittergraph.__main__.write_columns", mock_write_columns)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "gittergraph",
+            "export",
+            "graph.arrow",
+            "--repo",
+            str(repo_path),
+            "--compress",
+        ],
+    )
+
+    main()
+
+    assert exported == [(5, Path("graph.arrow"), "arrow", True)]
+    assert "Exported 5 commits" in capsys.readouterr().err
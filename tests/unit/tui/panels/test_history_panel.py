@@ -182,3 +182,28 @@ async def test_history_panel_clears_detail_on_empty():
         panel.show([], {}, {})
         assert commit_detail.commit is None
         await pilot.pause()
+
+
+@pytest.mark.asyncio
+async def test_history_panel_show_keeps_selected_commit():
+    """
+    Test that show keeps a selected commit that is still in the history.
+
+    Checks that the commit stays highlighted and detailed, and that the first commit is used otherwise.
+    """
+    app = HistoryPanelTestApp()
+    async with app.run_test() as pilot:
+        panel = app.query_one(HistoryPanel)
+        commit1 = make_commit(id="abc1234567890abcdef", message="First commit")
+        commit2 = make_commit(id="def4567890abcdef123", message="Second commit")
+
+        panel.show([commit1, commit2], {}, {}, selected_id=commit2.id)
+        await pilot.pause()
+
+        commit_history = panel.query_one("#commit-history", CommitHistory)
+        commit_detail = panel.query_one("#commit-detail", CommitDetail)
+        assert commit_detail.commit == commit2
+        assert commit_history.query_one("ListView").index == 1
+
+        panel.show([commit1], {}, {}, selected_id=commit2.id)
+        assert commit_detail.commit == commit1
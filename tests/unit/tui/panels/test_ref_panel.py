@@ -7,7 +7,9 @@ Covers reference panel display and child widget composition.
 
 import pytest
 from textual.app import App, ComposeResult
+from textual.widgets import Static
 
+from gittergraph.core import GraphChangeSet, RefChanges
 from gittergraph.tui.panels.ref_panel import RefPanel
 from gittergraph.tui.widgets import BranchList, HeadDetail, TagList
 from tests.make_models_helper import make_branch, make_head, make_tag
@@ -144,3 +146,52 @@ async def test_ref_panel_show_updates_widgets():
         assert len(branch_list.branches) == 3
         assert len(tag_list.tags) == 1
         await pilot.pause()
+
+
+@pytest.mark.asyncio
+async def test_ref_panel_show_hidden_ref_count():
+    """
+    Test show method with hidden references.
+
+    Checks that the hidden reference count is displayed only when references were hidden.
+    """
+    app = RefPanelTestApp()
+    async with app.run_test() as pilot:
+        panel = app.query_one(RefPanel)
+        hidden_refs = panel.query_one("#hidden-refs", Static)
+
+        panel.show(make_head(), [], [], hidden_count=3)
+        assert hidden_refs.display is True
+        assert "3 refs hidden" in str(hidden_refs.render())
+
+        panel.show(make_head(), [], [])
+        assert hidden_refs.display is False
+        await pilot.pause()
+
+
+@pytest.mark.asyncio
+async def test_ref_panel_apply_updates_changed_widgets():
+    """
+    Test apply method with branch changes only.
+
+    Checks that branches are updated while HEAD and tags are left alone.
+    """
+    app = RefPanelTestApp()
+    async with app.run_test() as pilot:
+        panel = app.query_one(RefPanel)
+        head = make_head()
+        tags = [make_tag()]
+        panel.show(head, [make_branch(name="refs/heads/main")], tags)
+        await pilot.pause()
+
+        branches = [
+            make_branch(name="refs/heads/develop"),
+            make_branch(name="refs/heads/main"),
+        ]
+        changes = GraphChangeSet(branches=RefChanges(added=("refs/heads/develop",)))
+        panel.apply(make_head(target_id="def"), branches, [], 0, changes)
+        await pilot.pause()
+
+        assert panel.query_one("#branch-list", BranchList).branches == branches
+        assert panel.query_one("#head-detail", HeadDetail).head == head
+        assert panel.query_one("#tag-list", TagList).tags == tags
@@ -5,11 +5,12 @@ Tests for the RepositoryScreen.
 Covers screen composition, display, event handling, and keyboard shortcuts.
 """
 
+import pygit2
 import pytest
 from textual.app import App, ComposeResult
 from textual.widgets import ListView
 
-from gittergraph.core import GitGraph
+from gittergraph.core import GitGraph, GraphOptions
 from gittergraph.tui.panels import HistoryPanel, RefPanel
 from gittergraph.tui.screens import RepositoryScreen
 from gittergraph.tui.widgets import (
@@ -306,6 +307,129 @@ async def test_repository_screen_commit_selection_updates_detail(repo_with_histo
         await pilot.pause()
 
 
+@pytest.mark.asyncio
+async def test_repository_screen_tag_selection_shows_annotation(
+    repo_with_annotated_tag,
+):
+    """
+    Test that selecting an annotated tag shows its metadata.
+
+    Checks that the tag annotation is loaded and displayed with the tagged commit.
+    """
+    repo_path, commit_ids = repo_with_annotated_tag
+
+    app = RepositoryScreenTestApp()
+    async with app.run_test() as pilot:
+        screen = app.query_one(RepositoryScreen)
+        screen.show(GitGraph.from_path(repo_path))
+        await pilot.pause()
+
+        screen.on_tag_list_tag_selected(TagList.TagSelected("refs/tags/v2.0.0"))
+        await pilot.pause()
+
+        commit_detail = screen.query_one("#commit-detail", CommitDetail)
+        assert commit_detail.commit is not None
+        assert commit_detail.commit.id == commit_ids[0]
+        assert commit_detail.annotation is not None
+        assert commit_detail.annotation.message == "Release 2.0.0"
+
+
+@pytest.mark.asyncio
+async def test_repository_screen_load_more_extends_history(repo_with_history):
+    """
+    Test that a load more request extends a truncated history.
+
+    Checks that the next chunk is loaded and the current history is refreshed.
+    """
+    repo_path, commit_ids = repo_with_history
+
+    app = RepositoryScreenTestApp()
+    async with app.run_test() as pilot:
+        screen = app.query_one(RepositoryScreen)
+        screen.show(GitGraph.from_path(repo_path, GraphOptions(max_commits=2)))
+        screen._update_history_panel("refs/heads/main")
+        await pilot.pause()
+
+        commit_history = screen.query_one("#commit-history", CommitHistory)
+        assert commit_history.truncated is True
+
+        screen.on_commit_history_load_more_requested(
+            CommitHistory.LoadMoreRequested(commit_ids[3])
+        )
+        await pilot.pause()
+
+        assert screen.current_ref == "refs/heads/main"
+        assert len(commit_history.commits) == 4
+
+
+@pytest.mark.asyncio
+async def test_repository_screen_apply_changes_keeps_selection(repo_with_history):
+    """
+    Test that applying reload changes keeps the current view.
+
+    Checks that the current reference and selected commit survive a new commit on the branch.
+    """
+    repo_path, commit_ids = repo_with_history
+
+    app = RepositoryScreenTestApp()
+    async with app.run_test() as pilot:
+        screen = app.query_one(RepositoryScreen)
+        graph = GitGraph.from_path(repo_path)
+        screen.show(graph)
+        screen._update_history_panel("refs/heads/main")
+        screen.on_commit_history_commit_selected(
+            CommitHistory.CommitSelected(commit_ids[2])
+        )
+        await pilot.pause()
+
+        repo = pygit2.Repository(str(repo_path))
+        tree = repo.TreeBuilder().write()
+        author = pygit2.Signature("Test", "test@example.com")
+        repo.create_commit(
+            "refs/heads/main", author, author, "New", tree, [commit_ids[-1]]
+        )
+        changes = graph.reload()
+        assert changes
+
+        screen.apply_changes(changes)
+        await pilot.pause()
+
+        commit_history = screen.query_one("#commit-history", CommitHistory)
+        commit_detail = screen.query_one("#commit-detail", CommitDetail)
+        assert screen.current_ref == "refs/heads/main"
+        assert len(commit_history.commits) == 6
+        assert commit_detail.commit is not None
+        assert commit_detail.commit.id == commit_ids[2]
+
+
+@pytest.mark.asyncio
+async def test_repository_screen_apply_changes_falls_back_to_head(repo_with_branches):
+    """
+    Test that applying reload changes after the current branch was deleted shows HEAD.
+
+    Checks that the history panel falls back to HEAD.
+    """
+    repo_path, _ = repo_with_branches
+    pygit2.Repository(str(repo_path)).set_head("refs/heads/main")
+
+    app = RepositoryScreenTestApp()
+    async with app.run_test() as pilot:
+        screen = app.query_one(RepositoryScreen)
+        graph = GitGraph.from_path(repo_path)
+        screen.show(graph)
+        screen._update_history_panel("refs/heads/feature")
+        await pilot.pause()
+
+        pygit2.Repository(str(repo_path)).references.delete("refs/heads/feature")
+        changes = graph.reload()
+        assert changes
+
+        screen.apply_changes(changes)
+        await pilot.pause()
+
+        assert screen.current_ref == "HEAD"
+
+
 def test_repository_screen_bindings_defined():
     """
     Test that keyboard bindings are properly defined.
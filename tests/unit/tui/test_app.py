@@ -5,12 +5,16 @@ Tests for the GitterGraphApp.
 Covers application initialization, repository discovery, and app-level actions.
 """
 
+import threading
 from pathlib import Path
 
+import pygit2
 import pytest
+from textual.widgets import ListView
 
+from gittergraph.core import GitGraph, GraphChangeSet, GraphOptions, LoadState
 from gittergraph.tui.app import GitterGraphApp, run
-from gittergraph.tui.screens import RepositoryScreen
+from gittergraph.tui.screens import RepositoryScreen, WorkspaceScreen
 
 
 def test_app_initialization_with_no_path():
@@ -124,6 +128,7 @@ def test_app_bindings_defined():
 
     assert "q" in binding_keys  # Quit
     assert "r" in binding_keys  # Reload
+    assert "m" in binding_keys  # Memory
 
 
 def test_app_screens_defined():
@@ -134,6 +139,7 @@ def test_app_screens_defined():
     """
     app = GitterGraphApp()
     assert "repository-screen" in app.SCREENS
+    assert "workspace-screen" in app.SCREENS
     assert app.SCREENS["repository-screen"] == RepositoryScreen
 
 
@@ -161,6 +167,67 @@ async def test_app_action_reload(simple_repo):
         await pilot.pause()
 
 
+@pytest.mark.asyncio
+async def test_app_action_reload_without_changes(simple_repo):
+    """
+    Test reload action on an unchanged repository.
+
+    Checks that the user is told the graph is already up to date.
+    """
+    repo_path, _ = simple_repo
+    app = GitterGraphApp(repo_path=repo_path)
+    async with app.run_test() as pilot:
+        await pilot.press("r")
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        messages = [notification.message for notification in app._notifications]
+        assert "Already up to date" in messages
+
+
+@pytest.mark.asyncio
+async def test_app_action_reload_in_worker_thread(simple_repo, monkeypatch):
+    """
+    Test reload action on a changed repository.
+
+    Checks that the graph is reloaded off the event loop thread and the changes are shown.
+    """
+    repo_path, commit_ids = simple_repo
+    reload_threads = []
+    applied = []
+    original_reload = GitGraph.reload
+
+    def recording_reload(graph):
+        reload_threads.append(threading.current_thread())
+        return original_reload(graph)
+
+    monkeypatch.setattr(GitGraph, "reload", recording_reload)
+    monkeypatch.setattr(RepositoryScreen, "apply_changes", applied.append)
+
+    app = GitterGraphApp(repo_path=repo_path)
+    async with app.run_test() as pilot:
+        repo = pygit2.Repository(str(repo_path))
+        author = pygit2.Signature("Test", "test@example.com")
+        repo.create_commit(
+            "refs/heads/main",
+            author,
+            author,
+            "New",
+            repo.TreeBuilder().write(),
+            [commit_ids[0]],
+        )
+
+        await pilot.press("r")
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        messages = [notification.message for notification in app._notifications]
+        assert reload_threads
+        assert reload_threads[0] is not threading.main_thread()
+        assert len(applied) == 1
+        assert "Graph reloaded" in messages
+
+
 def test_app_action_reload_with_no_graph():
     """
     Test reload action handles missing graph gracefully.
@@ -176,6 +243,23 @@ def test_app_action_reload_with_no_graph():
     app.action_reload()
 
 
+@pytest.mark.asyncio
+async def test_app_action_memory(simple_repo):
+    """
+    Test memory action reports memory usage.
+
+    Checks that a notification with resident memory is shown.
+    """
+    repo_path, _ = simple_repo
+    app = GitterGraphApp(repo_path=repo_path)
+    async with app.run_test() as pilot:
+        await pilot.press("m")
+        await pilot.pause()
+
+        messages = [notification.message for notification in app._notifications]
+        assert any(message.startswith("Resident") for message in messages)
+
+
 @pytest.mark.asyncio
 async def test_app_action_quit(simple_repo):
     """
@@ -290,3 +374,134 @@ async def test_app_push_screen_by_name(simple_repo):
         # Screen should be pushed using "repository-screen" name
         assert isinstance(app.screen, RepositoryScreen)
         await pilot.pause()
+
+
+@pytest.mark.asyncio
+async def test_app_lazy_mode_loads_pending_history(repo_with_branches):
+    """
+    Test app startup in lazy mode.
+
+    Checks that history not reachable from HEAD is filled in by a background pass.
+    """
+    repo_path, commit_ids = repo_with_branches
+    pygit2.Repository(str(repo_path)).set_head("refs/heads/main")
+
+    app = GitterGraphApp(repo_path=repo_path, options=GraphOptions(lazy=True))
+    async with app.run_test() as pilot:
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        assert app.graph is not None
+        assert commit_ids[2] in app.graph.data.commits
+
+
+@pytest.mark.asyncio
+async def test_app_watch_mode_reloads_on_change(simple_repo):
+    """
+    Test app startup in watch mode.
+
+    Checks that a new commit is picked up without a manual reload and the user is notified.
+    """
+    repo_path, commit_ids = simple_repo
+
+    app = GitterGraphApp(repo_path=repo_path, options=GraphOptions(watch=True))
+    async with app.run_test() as pilot:
+        assert app.graph is not None
+
+        repo = pygit2.Repository(str(repo_path))
+        tree = repo.TreeBuilder().write()
+        author = pygit2.Signature("Test", "test@example.com")
+        new_id = repo.create_commit(
+            "refs/heads/main", author, author, "New", tree, [commit_ids[0]]
+        )
+
+        for _ in range(50):
+            messages = [notification.message for notification in app._notifications]
+            if "Repository changed, graph reloaded" in messages:
+                break
+            await pilot.pause(0.1)
+
+        assert "Repository changed, graph reloaded" in messages
+        assert str(new_id) in app.graph.data.commits
+
+
+@pytest.mark.asyncio
+async def test_app_drops_changes_of_other_graph(simple_repo, monkeypatch):
+    """
+    Test a reload message posted by a graph that is no longer shown.
+
+    Checks that its changes are not applied to the current screen.
+    """
+    repo_path, _ = simple_repo
+    applied = []
+    monkeypatch.setattr(RepositoryScreen, "apply_changes", applied.append)
+
+    app = GitterGraphApp(repo_path=repo_path)
+    async with app.run_test() as pilot:
+        assert app.graph is not None
+        stale_graph = GitGraph.from_path(repo_path)
+
+        app.post_message(
+            GitterGraphApp.RepositoryChanged(
+                stale_graph, GraphChangeSet(head_changed=True)
+            )
+        )
+        await pilot.pause()
+
+        assert not applied
+        assert not app._notifications
+
+
+@pytest.mark.asyncio
+async def test_app_workspace_mode(tmp_path, repo_with_history):
+    """
+    Test app startup in workspace mode.
+
+    Checks that all repositories load in the background, that a selected one opens on the repository screen, and that 'w' goes back to the switcher.
+    """
+    repo_path, _ = repo_with_history
+    pygit2.init_repository(str(tmp_path / "other"))
+
+    app = GitterGraphApp(workspace_path=tmp_path)
+    async with app.run_test() as pilot:
+        assert isinstance(app.screen, WorkspaceScreen)
+        assert app.workspace is not None
+        assert app.workspace.paths == [tmp_path / "other", repo_path]
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        assert all(
+            summary.state == LoadState.LOADED
+            for summary in app.workspace.summaries.values()
+        )
+
+        app.screen.query_one(ListView).index = 1
+        await pilot.press("enter")
+        for _ in range(50):
+            if isinstance(app.screen, RepositoryScreen):
+                break
+            await pilot.pause(0.05)
+
+        assert isinstance(app.screen, RepositoryScreen)
+        assert app.graph is not None
+        assert app.graph.repo.path == repo_path
+        assert app.workspace.is_open(repo_path)
+
+        await pilot.press("w")
+        await pilot.pause()
+
+        assert isinstance(app.screen, WorkspaceScreen)
+        assert app.graph is None
+
+
+@pytest.mark.asyncio
+async def test_app_workspace_without_repositories(tmp_path):
+    """
+    Test app startup in workspace mode in an empty directory.
+
+    Checks that the app exits.
+    """
+    app = GitterGraphApp(workspace_path=tmp_path)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        assert app.workspace is not None
+        assert not app.workspace.paths
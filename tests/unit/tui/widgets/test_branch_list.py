@@ -9,6 +9,7 @@ import pytest
 from textual.app import App, ComposeResult
 from textual.widgets import Label, ListView
 
+from gittergraph.core import RefChanges
 from gittergraph.tui.widgets.branch_list import BranchList
 from tests.make_models_helper import make_branch
 
@@ -265,3 +266,45 @@ def test_branch_list_on_list_view_selected_indices(index, expected_name):
 
     assert len(posted_messages) == 1
     assert posted_messages[0].name == expected_name
+
+
+@pytest.mark.asyncio
+async def test_branch_list_apply_changes():
+    """
+    Test apply method updates branches in place.
+
+    Checks that items of unchanged branches are kept and the list stays in branch order.
+    """
+    app = BranchListTestApp()
+    async with app.run_test() as pilot:
+        widget = app.query_one(BranchList)
+        list_view = widget.query_one(ListView)
+        widget.show(
+            [
+                make_branch(name="refs/heads/a"),
+                make_branch(name="refs/heads/c"),
+                make_branch(name="refs/heads/d"),
+            ]
+        )
+        await pilot.pause()
+        kept_item = list_view.children[1]
+
+        branches = [
+            make_branch(name="refs/heads/b"),
+            make_branch(name="refs/heads/c", target_id="def"),
+            make_branch(name="refs/heads/e"),
+        ]
+        widget.apply(
+            branches,
+            RefChanges(
+                added=("refs/heads/b", "refs/heads/e"),
+                removed=("refs/heads/a", "refs/heads/d"),
+                moved=("refs/heads/c",),
+            ),
+        )
+        await pilot.pause()
+
+        assert widget.branches == branches
+        assert list_view.children[1] is kept_item
+        labels = [str(item.query_one(Label).render()) for item in list_view.children]
+        assert [label.strip() for label in labels] == ["b", "c", "e"]
@@ -9,6 +9,7 @@ import pytest
 from rich.text import Text
 from textual.app import App, ComposeResult
 
+from gittergraph.models import TagAnnotation
 from gittergraph.tui.widgets.commit_detail import CommitDetail
 from tests.make_models_helper import make_commit, make_signature
 
@@ -142,6 +143,42 @@ def test_commit_detail_get_text_various_messages(message, expected_in_text):
     assert expected_in_text in text.plain
 
 
+def test_commit_detail_get_text_with_annotation():
+    """
+    Test _get_text method with an annotated tag.
+
+    Checks that tag name, tagger, and message are shown before the commit.
+    """
+    widget = CommitDetail()
+    widget.commit = make_commit(id="abcdef123456")
+    widget.annotation = TagAnnotation(
+        name="refs/tags/v1.0.0", tagger=make_signature(name="Tagger"), message="Notes"
+    )
+
+    text = widget._get_text().plain
+    assert "Tag: v1.0.0" in text
+    assert "Tagger: Tagger" in text
+    assert "Notes" in text
+    assert text.index("Notes") < text.index("Commit: abcdef123456")
+
+
+def test_commit_detail_get_text_with_annotation_without_tagger():
+    """
+    Test _get_text method with an annotated tag lacking a tagger.
+
+    Checks that the tagger line is omitted.
+    """
+    widget = CommitDetail()
+    widget.commit = make_commit()
+    widget.annotation = TagAnnotation(
+        name="refs/tags/v1.0.0", tagger=None, message="Notes"
+    )
+
+    text = widget._get_text().plain
+    assert "Tag: v1.0.0" in text
+    assert "Tagger:" not in text
+
+
 @pytest.mark.asyncio
 async def test_commit_detail_show_with_app():
     """
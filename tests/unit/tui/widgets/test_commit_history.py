@@ -505,3 +505,144 @@ def test_commit_list_get_label_various_messages(commit_message, author_name):
 
     assert isinstance(label, Label)
     assert label.has_class("commit-item")
+
+
+@pytest.mark.asyncio
+async def test_commit_list_show_truncated_appends_sentinel():
+    """
+    Test show method with a truncated history.
+
+    Checks that a sentinel item follows the commits.
+    """
+    app = CommitListTestApp()
+    async with app.run_test() as pilot:
+        widget = app.query_one(CommitHistory)
+        list_view = widget.query_one(ListView)
+
+        widget.show([make_commit(id="abc123")], {}, {}, truncated=True)
+        await pilot.pause()
+
+        assert widget.truncated is True
+        assert len(list_view) == 2
+        assert list_view.children[1].query_one(Label).has_class("truncated-item")
+
+
+def test_commit_list_sentinel_selection_requests_more():
+    """
+    Test on_list_view_selected with the truncation sentinel.
+
+    Checks that a LoadMoreRequested message is posted for the last commit.
+    """
+    widget = CommitHistory()
+    widget.commits = [make_commit(id="abc123"), make_commit(id="def456")]
+    widget.truncated = True
+
+    posted_messages = []
+    widget.post_message = posted_messages.append
+
+    class MockEvent:
+        def __init__(self, idx):
+            self.index = idx
+
+    widget.on_list_view_selected(MockEvent(2))
+
+    assert len(posted_messages) == 1
+    assert isinstance(posted_messages[0], CommitHistory.LoadMoreRequested)
+    assert posted_messages[0].id == "def456"
+
+
+@pytest.mark.asyncio
+async def test_commit_list_apply_prepends_new_commits():
+    """
+    Test apply method after a branch advanced.
+
+    Checks that only the new commit gets an item and the decorations move to it.
+    """
+    app = CommitListTestApp()
+    async with app.run_test() as pilot:
+        widget = app.query_one(CommitHistory)
+        list_view = widget.query_one(ListView)
+        old = [make_commit(id="b" * 40), make_commit(id="a" * 40)]
+        widget.show(old, {"b" * 40: [make_branch(name="refs/heads/main")]}, {})
+        await pilot.pause()
+        items = list(list_view.children)
+
+        new = [make_commit(id="c" * 40), *old]
+        widget.apply(new, {"c" * 40: [make_branch(name="refs/heads/main")]}, {})
+        await pilot.pause()
+
+        assert widget.commits == new
+        assert list(list_view.children)[1:] == items
+        labels = [str(item.query_one(Label).render()) for item in list_view.children]
+        assert "[main]" in labels[0]
+        assert "[main]" not in labels[1]
+
+
+@pytest.mark.asyncio
+async def test_commit_list_apply_removes_reset_commits():
+    """
+    Test apply method after a branch was reset.
+
+    Checks that the items of dropped commits are removed and the rest are kept.
+    """
+    app = CommitListTestApp()
+    async with app.run_test() as pilot:
+        widget = app.query_one(CommitHistory)
+        list_view = widget.query_one(ListView)
+        old = [make_commit(id="c" * 40), make_commit(id="b" * 40)]
+        widget.show(old, {}, {})
+        await pilot.pause()
+        kept_item = list_view.children[1]
+
+        widget.apply(old[1:], {}, {})
+        await pilot.pause()
+
+        assert list(list_view.children) == [kept_item]
+
+
+@pytest.mark.asyncio
+async def test_commit_list_apply_unrelated_history():
+    """
+    Test apply method with a history that shares no commits.
+
+    Checks that the list is rebuilt.
+    """
+    app = CommitListTestApp()
+    async with app.run_test() as pilot:
+        widget = app.query_one(CommitHistory)
+        list_view = widget.query_one(ListView)
+        widget.show([make_commit(id="a" * 40)], {}, {})
+        await pilot.pause()
+
+        new = [make_commit(id="b" * 40), make_commit(id="c" * 40)]
+        widget.apply(new, {}, {})
+        await pilot.pause()
+
+        assert widget.commits == new
+        assert len(list_view) == 2
+
+
+@pytest.mark.asyncio
+async def test_commit_list_apply_updates_sentinel():
+    """
+    Test apply method when truncation changes.
+
+    Checks that the sentinel is added and removed without touching commit items.
+    """
+    app = CommitListTestApp()
+    async with app.run_test() as pilot:
+        widget = app.query_one(CommitHistory)
+        list_view = widget.query_one(ListView)
+        commits = [make_commit(id="a" * 40)]
+        widget.show(commits, {}, {})
+        await pilot.pause()
+
+        widget.apply(commits, {}, {}, truncated=True)
+        await pilot.pause()
+        assert len(list_view) == 2
+        assert widget.truncated is True
+
+        widget.apply(commits, {}, {}, truncated=False)
+        await pilot.pause()
+        assert len(list_view) == 1
+        assert widget.truncated is False
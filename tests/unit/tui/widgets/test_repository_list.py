@@ -0,0 +1,87 @@
+"""
+Tests for the RepositoryList widget.
+
+Covers repository list display, in-place summary updates, and selection.
+"""
+
+from pathlib import Path
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.widgets import Label, ListView
+
+from gittergraph.core import LoadState, RepositorySummary
+from gittergraph.tui.widgets.repository_list import RepositoryList
+
+
+class RepositoryListTestApp(App):
+    """
+    Minimal test app for RepositoryList widget.
+
+    Provides a simple app context for testing widget behavior.
+    """
+
+    def compose(self) -> ComposeResult:
+        """Compose the test app with a RepositoryList widget."""
+        yield RepositoryList()
+
+
+@pytest.mark.asyncio
+async def test_repository_list_show_and_update():
+    """
+    Test showing repositories and updating one as it loads.
+
+    Checks that each repository gets one line, and that updates replace the line of the repository in place.
+    """
+    app = RepositoryListTestApp()
+    async with app.run_test() as pilot:
+        widget = app.query_one(RepositoryList)
+        list_view = widget.query_one(ListView)
+
+        widget.show(
+            [
+                RepositorySummary(Path("/src/alpha")),
+                RepositorySummary(Path("/src/beta")),
+            ]
+        )
+        await pilot.pause()
+        label = list_view.children[1].query_one(Label)
+        assert len(list_view) == 2
+        assert "beta" in str(label.render())
+        assert "pending" in str(label.render())
+
+        widget.update_summary(
+            RepositorySummary(Path("/src/beta"), LoadState.LOADED, "main", 12, 2, 1)
+        )
+        widget.update_summary(RepositorySummary(Path("/src/unknown")))
+        await pilot.pause()
+
+        assert len(list_view) == 2
+        assert "12 commits, 2 branches, 1 tags" in str(label.render())
+
+        widget.update_summary(
+            RepositorySummary(Path("/src/beta"), LoadState.FAILED, error="broken")
+        )
+        assert "broken" in str(label.render())
+
+
+def test_repository_list_on_list_view_selected_handler():
+    """
+    Test on_list_view_selected event handler.
+
+    Checks that handler posts the path of the selected repository.
+    """
+    widget = RepositoryList()
+    widget.paths = [Path("/src/alpha"), Path("/src/beta")]
+    posted_messages = []
+    widget.post_message = posted_messages.append
+
+    class MockEvent:
+        def __init__(self, idx):
+            self.index = idx
+
+    widget.on_list_view_selected(MockEvent(1))
+
+    assert len(posted_messages) == 1
+    assert isinstance(posted_messages[0], RepositoryList.RepositorySelected)
+    assert posted_messages[0].path == Path("/src/beta")
@@ -9,6 +9,7 @@ import pytest
 from textual.app import App, ComposeResult
 from textual.widgets import Label, ListView
 
+from gittergraph.core import RefChanges
 from gittergraph.tui.widgets.tag_list import TagList
 from tests.make_models_helper import make_tag
 
@@ -265,3 +266,32 @@ def test_tag_list_on_list_view_selected_indices(index, expected_name):
 
     assert len(posted_messages) == 1
     assert posted_messages[0].name == expected_name
+
+
+@pytest.mark.asyncio
+async def test_tag_list_apply_changes():
+    """
+    Test apply method updates tags in place.
+
+    Checks that a new tag is inserted in order and existing items are kept.
+    """
+    app = TagListTestApp()
+    async with app.run_test() as pilot:
+        widget = app.query_one(TagList)
+        list_view = widget.query_one(ListView)
+        widget.show([make_tag(name="refs/tags/v1"), make_tag(name="refs/tags/v3")])
+        await pilot.pause()
+        items = list(list_view.children)
+
+        tags = [
+            make_tag(name="refs/tags/v1"),
+            make_tag(name="refs/tags/v2"),
+            make_tag(name="refs/tags/v3"),
+        ]
+        widget.apply(tags, RefChanges(added=("refs/tags/v2",)))
+        await pilot.pause()
+
+        assert widget.tags == tags
+        assert len(list_view) == 3
+        assert list_view.children[0] is items[0]
+        assert list_view.children[2] is items[1]
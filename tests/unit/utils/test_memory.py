@@ -0,0 +1,66 @@
+"""
+Tests for memory utility functions.
+
+Covers measuring resident memory and parsing and formatting byte sizes.
+"""
+
+import pytest
+
+from gittergraph.utils.memory import format_size, get_resident_memory, parse_size
+
+
+def test_get_resident_memory():
+    """
+    Get the resident memory of the test process.
+
+    Checks that a positive byte count is returned.
+    """
+    assert get_resident_memory() > 0
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("1024", 1024),
+        ("64k", 64 * 1024),
+        ("256M", 256 * 1024**2),
+        ("1.5GiB", 3 * 1024**3 // 2),
+        ("2 gb", 2 * 1024**3),
+    ],
+)
+def test_parse_size(value, expected):
+    """
+    Parse byte size strings.
+
+    Checks plain byte counts and binary unit suffixes.
+    """
+    assert parse_size(value) == expected
+
+
+@pytest.mark.parametrize("value", ["", "M", "12X", "-5M"])
+def test_parse_size_invalid(value):
+    """
+    Parse invalid byte size strings.
+
+    Checks that ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        parse_size(value)
+
+
+@pytest.mark.parametrize(
+    "size, expected",
+    [
+        (512, "512 B"),
+        (1536, "1.5 KiB"),
+        (128 * 1024**2, "128.0 MiB"),
+        (3 * 1024**4, "3.0 TiB"),
+    ],
+)
+def test_format_size(size, expected):
+    """
+    Format byte sizes.
+
+    Checks that the largest fitting binary unit is used.
+    """
+    assert format_size(size) == expected
@@ -0,0 +1,49 @@
+"""
+Tests for object ID utility functions.
+
+Covers conversion between hex and binary object IDs for SHA-1 and SHA-256.
+"""
+
+import pytest
+
+from gittergraph.utils.oid import hex_to_oid, is_full_hex, oid_to_hex
+
+
+@pytest.mark.parametrize("length", [40, 64])
+def test_hex_round_trip(length):
+    """
+    Convert SHA-1 and SHA-256 hex IDs to binary and back.
+
+    Checks that binary IDs are half as long and convert back unchanged.
+    """
+    value = ("0123456789abcdef" * 4)[:length]
+
+    oid = hex_to_oid(value)
+
+    assert len(oid) == length // 2
+    assert oid_to_hex(oid) == value
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["", "abc1234", "g" * 40, "a" * 41, "ab " * 13 + "a", "refs/heads/main"],
+)
+def test_invalid_hex(value):
+    """
+    Convert strings that are not full hex object IDs.
+
+    Checks that ValueError is raised and is_full_hex returns False.
+    """
+    with pytest.raises(ValueError):
+        hex_to_oid(value)
+    assert is_full_hex(value) is False
+
+
+def test_is_full_hex():
+    """
+    Check full hex object IDs.
+
+    Checks that SHA-1 and SHA-256 IDs are accepted.
+    """
+    assert is_full_hex("a" * 40) is True
+    assert is_full_hex("A" * 64) is True
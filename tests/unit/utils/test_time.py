@@ -9,7 +9,11 @@ from datetime import datetime, timedelta, timezone
 
 import pytest
 
-from gittergraph.utils.time import unix_timestamp_to_datetime
+from gittergraph.utils.time import (
+    get_timezone,
+    parse_date,
+    unix_timestamp_to_datetime,
+)
 
 
 @pytest.mark.parametrize(
@@ -44,3 +48,41 @@ def test_unix_timestamp_to_datetime_parametrized(timestamp, offset, expected):
     else:
         result = unix_timestamp_to_datetime(timestamp, offset)
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2021-01-01", 1609459200),
+        ("2021-01-01T01:00:00", 1609462800),
+        ("2021-01-01T01:00:00+01:00", 1609459200),
+    ],
+)
+def test_parse_date(value, expected):
+    """
+    Parse ISO 8601 dates into Unix timestamps.
+
+    Checks dates, naive datetimes taken as UTC, and datetimes with an offset.
+    """
+    assert parse_date(value) == expected
+
+
+def test_parse_date_invalid():
+    """
+    Parse an invalid date string.
+
+    Checks that ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        parse_date("last week")
+
+
+def test_get_timezone_shared_per_offset():
+    """
+    Get timezones for offsets in minutes.
+
+    Checks that one timezone object is shared per offset.
+    """
+    assert get_timezone(90) is get_timezone(90)
+    assert get_timezone(90) == timezone(timedelta(minutes=90))
+    assert unix_timestamp_to_datetime(0, 90).tzinfo is get_timezone(90)